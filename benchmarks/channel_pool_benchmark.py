@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Measure search throughput through pooled channels.
+
+A local in-process gRPC server answers ``SearchAllResources`` with a canned
+page after an optional delay; the sync and asyncio clients then issue
+searches from many concurrent callers through pools of 1, 2 and 4
+channels::
+
+    python benchmarks/channel_pool_benchmark.py --concurrency 64 --seconds 5
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import grpc
+from grpc.experimental import aio
+
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.services.asset_service.transports import channel_pool
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+
+
+def _start_server(results_per_page, delay):
+    page = asset_service.SearchAllResourcesResponse.serialize(
+        asset_service.SearchAllResourcesResponse(
+            results=[
+                assets.ResourceSearchResult(
+                    name="//compute.googleapis.com/projects/p/instances/{}".format(i),
+                    asset_type="compute.googleapis.com/Instance",
+                    project="projects/p",
+                )
+                for i in range(results_per_page)
+            ]
+        )
+    )
+
+    def search_all_resources(request, context):
+        if delay:
+            time.sleep(delay)
+        return page
+
+    handler = grpc.method_handlers_generic_handler(
+        "google.cloud.asset.v1.AssetService",
+        {
+            "SearchAllResources": grpc.unary_unary_rpc_method_handler(
+                search_all_resources
+            )
+        },
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=64))
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, "localhost:{}".format(port)
+
+
+def _run_sync(address, pool_size, policy, concurrency, seconds):
+    channel = channel_pool.ChannelPool.create(
+        grpc.insecure_channel, pool_size, address, policy=policy
+    )
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=channel)
+    )
+    request = asset_service.SearchAllResourcesRequest(scope="projects/p")
+    deadline = time.perf_counter() + seconds
+    counts = [0] * concurrency
+
+    def worker(index):
+        while time.perf_counter() < deadline:
+            client.search_all_resources(request=request)
+            counts[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    channel.close()
+    return sum(counts) / seconds
+
+
+async def _run_async(address, pool_size, policy, concurrency, seconds):
+    channel = channel_pool.AsyncChannelPool.create(
+        aio.insecure_channel, pool_size, address, policy=policy
+    )
+    client = AssetServiceAsyncClient(
+        transport=transports.AssetServiceGrpcAsyncIOTransport(channel=channel)
+    )
+    request = asset_service.SearchAllResourcesRequest(scope="projects/p")
+    deadline = time.perf_counter() + seconds
+    count = 0
+
+    async def worker():
+        nonlocal count
+        while time.perf_counter() < deadline:
+            await client.search_all_resources(request=request)
+            count += 1
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    await channel.close()
+    return count / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument(
+        "--policy",
+        choices=[channel_pool.ROUND_ROBIN, channel_pool.LEAST_LOADED],
+        default=channel_pool.ROUND_ROBIN,
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--results-per-page", type=int, default=100)
+    parser.add_argument("--delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, address = _start_server(args.results_per_page, args.delay)
+    try:
+        print("{:>6} {:>6} {:>12}".format("mode", "pool", "calls/s"))
+        for size in args.sizes:
+            qps = _run_sync(address, size, args.policy, args.concurrency, args.seconds)
+            print("{:>6} {:>6} {:>12.1f}".format("sync", size, qps))
+        for size in args.sizes:
+            qps = asyncio.run(
+                _run_async(address, size, args.policy, args.concurrency, args.seconds)
+            )
+            print("{:>6} {:>6} {:>12.1f}".format("async", size, qps))
+    finally:
+        server.stop(None)
+
+
+if __name__ == "__main__":
+    main()
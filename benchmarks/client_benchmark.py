@@ -0,0 +1,608 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Measure the hot paths of the v1 clients.
+
+* ``construction``: building a client, with a transport on a given channel
+  and with a transport creating its own (lazily connecting) channel.
+* ``per_call``: ``get_feed`` through the client against the same call on
+  the bare channel. Both use a loopback channel answering in-process
+  without serialization round trips through a socket, so the difference
+  is the overhead of the client, its wrapped methods and the transport.
+* ``pager``: results per second of ``search_all_resources`` pagers of the
+  sync and asyncio clients against a :class:`FakeAssetServiceServer`.
+* ``decode``: the cost of deserializing ``ResourceSearchResult``, ``Asset``
+  and ``IamPolicySearchResult`` as proto-plus and as raw protobuf
+  messages, then reading a field.
+* ``structs``: reading one key of ``Resource.data`` payloads shaped like
+  Compute Engine instances and GKE clusters through proto-plus and through
+  a ``StructView``, and converting them to dicts through proto-plus
+  marshalling, ``to_dict``, ``MessageToDict`` and ``struct_to_dict``.
+* ``records``: the memory held per ``search_all_resources`` result, as
+  traced by :mod:`tracemalloc`, and the decoding time per result, of the
+  pages as proto-plus results and as ``ResourceRecord`` objects.
+* ``mirrors``: the memory held per message, the time to build it from its
+  serialized form and the time to read a field of it, for ``Asset``,
+  ``TemporalAsset``, ``IamPolicySearchResult`` and v1p4beta1
+  ``IamPolicyAnalysisResult`` as proto-plus messages and as mirrors.
+* ``resource_names``: parsing the full resource names of the assets with
+  a pattern matched by ``re.match`` per call, as the path helpers of the
+  clients do, and with ``resource_names.parse``, cached and not, and
+  ``parse_many``.
+
+Results print as a table and, with ``--output``, are written to a JSON
+file, so runs of different releases can be compared::
+
+    python benchmarks/client_benchmark.py --output results.json
+    nox -s benchmark -- --output results.json
+"""
+
+import argparse
+import asyncio
+import collections.abc
+import json
+import platform
+import re
+import statistics
+import time
+import tracemalloc
+
+import grpc
+import pkg_resources
+
+from google.auth import credentials
+from google.protobuf import json_format
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service import mirrors
+from google.cloud.asset_v1.services.asset_service import records
+from google.cloud.asset_v1.services.asset_service import resource_names
+from google.cloud.asset_v1.services.asset_service import structs
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+from google.cloud.asset_v1p4beta1.types import assets as assets_v1p4beta1
+
+_GET_FEED = "/google.cloud.asset.v1.AssetService/GetFeed"
+
+
+class _LoopbackChannel(grpc.Channel):
+    """A channel answering unary calls with canned serialized responses."""
+
+    def __init__(self, responses):
+        self._responses = responses
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None):
+        def call(request, timeout=None, metadata=None, **kwargs):
+            request_serializer(request)
+            return response_deserializer(self._responses[method])
+
+        return call
+
+    def subscribe(self, callback, try_to_connect=False):
+        raise NotImplementedError()
+
+    def unsubscribe(self, callback):
+        raise NotImplementedError()
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None):
+        raise NotImplementedError()
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None):
+        raise NotImplementedError()
+
+    def stream_stream(
+        self, method, request_serializer=None, response_deserializer=None
+    ):
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+
+def _median_seconds(fn, number, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings)
+
+
+def _construction(number, repeat):
+    channel = _LoopbackChannel({})
+    anonymous = credentials.AnonymousCredentials()
+    return {
+        "with_channel_us": _median_seconds(
+            lambda: AssetServiceClient(
+                transport=transports.AssetServiceGrpcTransport(channel=channel)
+            ),
+            number,
+            repeat,
+        )
+        * 1e6,
+        "with_credentials_us": _median_seconds(
+            lambda: AssetServiceClient(credentials=anonymous), number, repeat
+        )
+        * 1e6,
+    }
+
+
+def _per_call(number, repeat):
+    feed = asset_service.Feed(
+        name="projects/p/feeds/f", asset_types=["compute.googleapis.com/Instance"]
+    )
+    channel = _LoopbackChannel({_GET_FEED: asset_service.Feed.serialize(feed)})
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=channel)
+    )
+    request = asset_service.GetFeedRequest(name=feed.name)
+    stub = channel.unary_unary(
+        _GET_FEED,
+        request_serializer=asset_service.GetFeedRequest.serialize,
+        response_deserializer=asset_service.Feed.deserialize,
+    )
+    client_us = _median_seconds(lambda: client.get_feed(request), number, repeat) * 1e6
+    channel_us = _median_seconds(lambda: stub(request), number, repeat) * 1e6
+    return {
+        "client_us": client_us,
+        "channel_us": channel_us,
+        "overhead_us": client_us - channel_us,
+    }
+
+
+def _pager(server, page_size, repeat):
+    request = asset_service.SearchAllResourcesRequest(
+        scope=server.dataset.organization, page_size=page_size
+    )
+
+    channel = server.channel()
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=channel)
+    )
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in client.search_all_resources(request))
+        timings.append(time.perf_counter() - start)
+    channel.close()
+    sync_rate = count / statistics.median(timings)
+
+    async def iterate():
+        channel = server.async_channel()
+        client = AssetServiceAsyncClient(
+            transport=transports.AssetServiceGrpcAsyncIOTransport(channel=channel)
+        )
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = 0
+            async for _ in await client.search_all_resources(request):
+                count += 1
+            timings.append(time.perf_counter() - start)
+        await channel.close()
+        return count / statistics.median(timings)
+
+    async_rate = asyncio.new_event_loop().run_until_complete(iterate())
+    return {
+        "results": count,
+        "page_size": page_size,
+        "sync_items_per_second": sync_rate,
+        "async_items_per_second": async_rate,
+    }
+
+
+def _decode(server, number, repeat):
+    asset = server.dataset.assets[0]
+    channel = server.channel()
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=channel)
+    )
+    result = next(iter(client.search_all_resources(scope=asset.ancestors[0])))
+    channel.close()
+    messages = {
+        "ResourceSearchResult": result,
+        "Asset": asset,
+        "IamPolicySearchResult": assets.IamPolicySearchResult(
+            resource=asset.name, project=asset.ancestors[0], policy=asset.iam_policy
+        ),
+    }
+    results = {}
+    for name, message in messages.items():
+        message_type = type(message)
+        data = message_type.serialize(message)
+        raw_type = message_type.pb()
+        field = "resource" if name == "IamPolicySearchResult" else "name"
+        proto_plus = _median_seconds(
+            lambda: getattr(message_type.deserialize(data), field), number, repeat
+        )
+        raw = _median_seconds(
+            lambda: getattr(raw_type.FromString(data), field), number, repeat
+        )
+        results[name] = {
+            "bytes": len(data),
+            "proto_plus_us": proto_plus * 1e6,
+            "raw_us": raw * 1e6,
+            "ratio": proto_plus / raw,
+        }
+    return results
+
+
+def _compute_instance():
+    return {
+        "id": "4567890123456789012",
+        "name": "instance-1",
+        "status": "RUNNING",
+        "zone": "projects/p/zones/us-central1-a",
+        "machineType": "projects/p/zones/us-central1-a/machineTypes/n2-standard-8",
+        "labels": {"env": "prod", "team": "infra", "app": "web"},
+        "disks": [
+            {
+                "deviceName": "disk-{}".format(i),
+                "boot": i == 0,
+                "autoDelete": True,
+                "diskSizeGb": "100",
+                "interface": "SCSI",
+                "mode": "READ_WRITE",
+                "type": "PERSISTENT",
+                "source": "projects/p/zones/us-central1-a/disks/disk-{}".format(i),
+                "licenses": ["projects/debian-cloud/global/licenses/debian-11"],
+                "guestOsFeatures": [{"type": "VIRTIO_SCSI_MULTIQUEUE"}],
+            }
+            for i in range(4)
+        ],
+        "networkInterfaces": [
+            {
+                "name": "nic{}".format(i),
+                "network": "projects/p/global/networks/default",
+                "subnetwork": "projects/p/regions/us-central1/subnetworks/default",
+                "networkIP": "10.128.0.{}".format(i + 2),
+                "accessConfigs": [
+                    {
+                        "type": "ONE_TO_ONE_NAT",
+                        "natIP": "34.0.0.1",
+                        "networkTier": "PREMIUM",
+                    }
+                ],
+            }
+            for i in range(2)
+        ],
+        "metadata": {
+            "fingerprint": "9bYwZ8y3Ff0=",
+            "items": [
+                {"key": "startup-script-{}".format(i), "value": "#!/bin/bash\n" * 20}
+                for i in range(10)
+            ],
+        },
+        "serviceAccounts": [
+            {
+                "email": "123-compute@developer.gserviceaccount.com",
+                "scopes": ["https://www.googleapis.com/auth/cloud-platform"],
+            }
+        ],
+        "scheduling": {
+            "onHostMaintenance": "MIGRATE",
+            "automaticRestart": True,
+            "preemptible": False,
+        },
+        "shieldedInstanceConfig": {
+            "enableSecureBoot": False,
+            "enableVtpm": True,
+            "enableIntegrityMonitoring": True,
+        },
+    }
+
+
+def _gke_cluster():
+    return {
+        "name": "cluster-1",
+        "status": "RUNNING",
+        "location": "us-central1",
+        "currentMasterVersion": "1.27.3-gke.100",
+        "network": "default",
+        "clusterIpv4Cidr": "10.4.0.0/14",
+        "resourceLabels": {"env": "prod", "team": "platform"},
+        "addonsConfig": {
+            name: {"disabled": False}
+            for name in ("httpLoadBalancing", "horizontalPodAutoscaling", "dnsCache")
+        },
+        "nodePools": [
+            {
+                "name": "pool-{}".format(i),
+                "status": "RUNNING",
+                "version": "1.27.3-gke.100",
+                "initialNodeCount": 3,
+                "config": {
+                    "machineType": "e2-standard-4",
+                    "diskSizeGb": 100,
+                    "diskType": "pd-balanced",
+                    "imageType": "COS_CONTAINERD",
+                    "oauthScopes": [
+                        "https://www.googleapis.com/auth/devstorage.read_only",
+                        "https://www.googleapis.com/auth/logging.write",
+                        "https://www.googleapis.com/auth/monitoring",
+                    ],
+                    "metadata": {"disable-legacy-endpoints": "true"},
+                    "labels": {"pool": "pool-{}".format(i)},
+                },
+                "autoscaling": {"enabled": True, "minNodeCount": 1, "maxNodeCount": 10},
+                "management": {"autoUpgrade": True, "autoRepair": True},
+                "instanceGroupUrls": [
+                    "https://www.googleapis.com/compute/v1/projects/p/zones/"
+                    "us-central1-{}/instanceGroupManagers/gke-pool-{}".format(zone, i)
+                    for zone in "abc"
+                ],
+            }
+            for i in range(3)
+        ],
+    }
+
+
+def _to_python(value):
+    # Convert through proto-plus marshalling, as callers without the
+    # struct helpers do.
+    if isinstance(value, collections.abc.Mapping):
+        return {key: _to_python(item) for key, item in value.items()}
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return value
+    return [_to_python(item) for item in value]
+
+
+def _structs(number, repeat):
+    results = {}
+    for name, data in (
+        ("compute_instance", _compute_instance()),
+        ("gke_cluster", _gke_cluster()),
+    ):
+        resource = assets.Resource(data=data)
+        raw = assets.Resource.pb(resource).data
+        times = {
+            "get_proto_plus_us": lambda: resource.data["status"],
+            "get_view_us": lambda: structs.struct_view(resource, "data")["status"],
+            "to_dict_proto_plus_us": lambda: _to_python(resource.data),
+            "to_dict_message_us": lambda: assets.Resource.to_dict(resource)["data"],
+            "to_dict_json_format_us": lambda: json_format.MessageToDict(raw),
+            "to_dict_fast_us": lambda: structs.struct_to_dict(raw),
+        }
+        results[name] = {"bytes": raw.ByteSize()}
+        for key, fn in times.items():
+            count = number if key.startswith("get") else max(1, number // 10)
+            results[name][key] = _median_seconds(fn, count, repeat) * 1e6
+    return results
+
+
+def _traced_bytes(fn):
+    # Return the memory still allocated by ``fn`` once it has returned.
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        value = fn()
+        return value, tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+
+def _records(server, page_size, repeat):
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(
+            channel=server.channel(), passthrough=True
+        )
+    )
+    pager = client.search_all_resources(
+        request={"scope": "projects/project-0", "page_size": page_size}
+    )
+    pages = list(pager.pages)
+
+    def proto_plus():
+        return [
+            result
+            for page in pages
+            for result in page.decode(asset_service.SearchAllResourcesResponse).results
+        ]
+
+    def compact():
+        return list(records.records(pages))
+
+    results, proto_plus_bytes = _traced_bytes(proto_plus)
+    count = len(results)
+    del results
+    _, records_bytes = _traced_bytes(compact)
+    return {
+        "results": count,
+        "proto_plus_bytes": proto_plus_bytes / count,
+        "records_bytes": records_bytes / count,
+        "memory_ratio": proto_plus_bytes / records_bytes,
+        "proto_plus_us": _median_seconds(proto_plus, 1, repeat) * 1e6 / count,
+        "records_us": _median_seconds(compact, 1, repeat) * 1e6 / count,
+    }
+
+
+def _mirrors(server, number, repeat):
+    asset = server.dataset.assets[0]
+    messages = {
+        "Asset": (asset, "name"),
+        "TemporalAsset": (
+            assets.TemporalAsset(
+                window={"start_time": asset.update_time, "end_time": asset.update_time},
+                asset=asset,
+            ),
+            "asset",
+        ),
+        "IamPolicySearchResult": (
+            assets.IamPolicySearchResult(
+                resource=asset.name, project=asset.ancestors[0], policy=asset.iam_policy
+            ),
+            "resource",
+        ),
+        "IamPolicyAnalysisResult": (
+            assets_v1p4beta1.IamPolicyAnalysisResult(
+                attached_resource_full_name=asset.name,
+                iam_binding=asset.iam_policy.bindings[0],
+                access_control_lists=[
+                    {
+                        "resources": [{"full_resource_name": asset.name}],
+                        "accesses": [
+                            {"role": binding.role}
+                            for binding in asset.iam_policy.bindings
+                        ],
+                    }
+                ],
+                identity_list={
+                    "identities": [
+                        {"name": member}
+                        for binding in asset.iam_policy.bindings
+                        for member in binding.members
+                    ]
+                },
+                fully_explored=True,
+            ),
+            "attached_resource_full_name",
+        ),
+    }
+    count = max(1, number // 10)
+    results = {}
+    for name, (message, field) in messages.items():
+        message_type = type(message)
+        mirror = mirrors.mirror_type(message_type)
+        raw_type = message_type.pb()
+        data = message_type.serialize(message)
+        held = message_type.deserialize(data)
+        copy = mirror.from_pb(raw_type.FromString(data))
+
+        def proto_plus():
+            return [message_type.deserialize(data) for _ in range(count)]
+
+        def mirrored():
+            return [mirror.from_pb(raw_type.FromString(data)) for _ in range(count)]
+
+        _, proto_plus_bytes = _traced_bytes(proto_plus)
+        _, mirror_bytes = _traced_bytes(mirrored)
+        results[name] = {
+            "bytes": len(data),
+            "proto_plus_bytes": proto_plus_bytes / count,
+            "mirror_bytes": mirror_bytes / count,
+            "proto_plus_build_us": _median_seconds(
+                lambda: message_type.deserialize(data), count, repeat
+            )
+            * 1e6,
+            "mirror_build_us": _median_seconds(
+                lambda: mirror.from_pb(raw_type.FromString(data)), count, repeat
+            )
+            * 1e6,
+            "proto_plus_read_us": _median_seconds(
+                lambda: getattr(held, field), number, repeat
+            )
+            * 1e6,
+            "mirror_read_us": _median_seconds(
+                lambda: getattr(copy, field), number, repeat
+            )
+            * 1e6,
+        }
+    return results
+
+
+def _resource_names(server, repeat):
+    names = [asset.name for asset in server.dataset.assets]
+
+    def matched():
+        for name in names:
+            match = re.match(r"^//(?P<service>[^/]+)/(?P<path>.+)$", name)
+            segments = match.group("path").split("/")
+            dict(zip(segments[::2], segments[1::2]))
+
+    def cached():
+        for name in names:
+            resource_names.parse(name)
+
+    resource_names.parse.cache_clear()
+    cached()
+    return {
+        "names": len(names),
+        "re_match_us": _median_seconds(matched, 1, repeat) * 1e6 / len(names),
+        "parse_many_us": _median_seconds(
+            lambda: resource_names.parse_many(names), 1, repeat
+        )
+        * 1e6
+        / len(names),
+        "parse_cached_us": _median_seconds(cached, 1, repeat) * 1e6 / len(names),
+    }
+
+
+def _environment():
+    try:
+        version = pkg_resources.get_distribution("google-cloud-asset").version
+    except pkg_resources.DistributionNotFound:
+        version = None
+    return {
+        "google-cloud-asset": version,
+        "grpcio": grpc.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--assets", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--output", help="A JSON file to write the results to.")
+    args = parser.parse_args()
+
+    dataset = fake_server.FakeDataset(projects=1, assets_per_project=args.assets)
+    with fake_server.FakeAssetServiceServer(dataset) as server:
+        results = {
+            "environment": _environment(),
+            "construction": _construction(args.number // 10, args.repeat),
+            "per_call": _per_call(args.number, args.repeat),
+            "pager": _pager(server, args.page_size, args.repeat),
+            "decode": _decode(server, args.number, args.repeat),
+            "structs": _structs(args.number, args.repeat),
+            "records": _records(server, args.page_size, args.repeat),
+            "mirrors": _mirrors(server, args.number, args.repeat),
+            "resource_names": _resource_names(server, args.repeat),
+        }
+
+    for section, values in results.items():
+        if section == "environment":
+            continue
+        print(section)
+        for key, value in values.items():
+            if isinstance(value, dict):
+                value = "  ".join(
+                    (
+                        "{}={:.2f}".format(k, v)
+                        if isinstance(v, float)
+                        else "{}={}".format(k, v)
+                    )
+                    for k, v in value.items()
+                )
+            elif isinstance(value, float):
+                value = "{:.2f}".format(value)
+            print("  {:<24} {}".format(key, value))
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Measure bytes on the wire and client CPU per page with compression.
+
+A local gRPC server, in a separate process, pages through synthetic
+``SearchAllResources`` results compressed with the algorithm under test.
+It sits behind a TCP proxy that counts the bytes in each direction. The
+client pages through every result with the same algorithm for its
+requests and reports, per page, the bytes received and its own CPU and
+wall time::
+
+    python benchmarks/compression_benchmark.py --pages 200 --results-per-page 500
+"""
+
+import argparse
+import multiprocessing
+import socket
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import compression
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+from google.protobuf import struct_pb2 as struct  # type: ignore
+
+_ASSET_TYPES = (
+    "compute.googleapis.com/Instance",
+    "compute.googleapis.com/Disk",
+    "storage.googleapis.com/Bucket",
+    "iam.googleapis.com/ServiceAccount",
+)
+
+
+def _page(results_per_page):
+    results = []
+    for i in range(results_per_page):
+        asset_type = _ASSET_TYPES[i % len(_ASSET_TYPES)]
+        attributes = struct.Struct()
+        attributes.update(
+            {
+                "kind": asset_type.split("/")[-1].lower(),
+                "status": "RUNNING",
+                "machineType": "zones/us-central1-a/machineTypes/n1-standard-1",
+                "networkInterfaces": [{"network": "global/networks/default"}],
+            }
+        )
+        results.append(
+            assets.ResourceSearchResult(
+                name="//{}/projects/123456789012/resources/r{}".format(
+                    asset_type.split("/")[0], i
+                ),
+                asset_type=asset_type,
+                project="projects/123456789012",
+                display_name="resource-{}".format(i),
+                location="us-central1-a",
+                labels={"env": "prod", "team": "assets"},
+                additional_attributes=attributes,
+            )
+        )
+    return results
+
+
+def _pump(source, destination, counter):
+    try:
+        while True:
+            data = source.recv(65536)
+            if not data:
+                break
+            with counter.get_lock():
+                counter.value += len(data)
+            destination.sendall(data)
+    except OSError:
+        pass
+    finally:
+        destination.close()
+
+
+def _proxy(listener, upstream, sent, received):
+    while True:
+        client, _ = listener.accept()
+        server = socket.create_connection(upstream)
+        for args in ((client, server, sent), (server, client, received)):
+            threading.Thread(target=_pump, args=args, daemon=True).start()
+
+
+def _serve(algorithm, pages, results_per_page, sent, received, ready, stop):
+    results = _page(results_per_page)
+
+    def search_all_resources(request, context):
+        index = int(request.page_token or 0)
+        next_index = index + 1
+        return asset_service.SearchAllResourcesResponse(
+            results=results,
+            next_page_token=str(next_index) if next_index < pages else "",
+        )
+
+    handler = grpc.method_handlers_generic_handler(
+        "google.cloud.asset.v1.AssetService",
+        {
+            "SearchAllResources": grpc.unary_unary_rpc_method_handler(
+                search_all_resources,
+                request_deserializer=asset_service.SearchAllResourcesRequest.deserialize,
+                response_serializer=asset_service.SearchAllResourcesResponse.serialize,
+            )
+        },
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        compression=compression.CompressionConfig(default=algorithm).for_method(
+            "search_all_resources"
+        ),
+    )
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    listener = socket.socket()
+    listener.bind(("localhost", 0))
+    listener.listen()
+    threading.Thread(
+        target=_proxy,
+        args=(listener, ("localhost", port), sent, received),
+        daemon=True,
+    ).start()
+    ready.send(listener.getsockname()[1])
+    stop.wait()
+    server.stop(None)
+
+
+def _run(algorithm, pages, results_per_page):
+    sent = multiprocessing.Value("q", 0)
+    received = multiprocessing.Value("q", 0)
+    ready, ready_child = multiprocessing.Pipe()
+    stop = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_serve,
+        args=(algorithm, pages, results_per_page, sent, received, ready_child, stop),
+    )
+    process.start()
+    try:
+        address = "localhost:{}".format(ready.recv())
+        channel = grpc.insecure_channel(address)
+        client = AssetServiceClient(
+            transport=transports.AssetServiceGrpcTransport(
+                channel=channel,
+                compression=compression.CompressionConfig(default=algorithm),
+            )
+        )
+        request = asset_service.SearchAllResourcesRequest(scope="projects/p")
+
+        cpu, wall = time.process_time(), time.perf_counter()
+        count = sum(1 for _ in client.search_all_resources(request=request).pages)
+        cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+        channel.close()
+    finally:
+        stop.set()
+        process.join()
+    return count, sent.value, received.value, cpu, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=[compression.NONE, compression.GZIP, compression.DEFLATE],
+        default=[compression.NONE, compression.GZIP, compression.DEFLATE],
+    )
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--results-per-page", type=int, default=500)
+    args = parser.parse_args()
+
+    print(
+        "{:>8} {:>12} {:>14} {:>14} {:>12} {:>12}".format(
+            "codec", "sent B", "received B", "B/page", "cpu ms/page", "wall ms/page"
+        )
+    )
+    for algorithm in args.algorithms:
+        pages, sent, received, cpu, wall = _run(
+            algorithm, args.pages, args.results_per_page
+        )
+        print(
+            "{:>8} {:>12} {:>14} {:>14.0f} {:>12.2f} {:>12.2f}".format(
+                algorithm,
+                sent,
+                received,
+                received / pages,
+                cpu * 1000 / pages,
+                wall * 1000 / pages,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
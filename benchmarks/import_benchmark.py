@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Measure the import time of the asset packages.
+
+Every statement runs in fresh interpreters. The startup time of a bare
+interpreter is subtracted, and the median over ``--runs`` is reported.
+With ``--budget-ms``, the script exits with status 1 when importing
+``google.cloud.asset`` takes longer, which lets CI catch regressions.
+``--top`` lists the modules with the largest cumulative import time,
+taken from ``python -X importtime``::
+
+    python benchmarks/import_benchmark.py --runs 10 --budget-ms 150 --top 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = (
+    "import google.cloud.asset",
+    "import google.cloud.asset_v1",
+    "import google.cloud.asset_v1p5beta1",
+    "from google.cloud.asset import AssetServiceClient",
+    "from google.cloud.asset_v1 import *",
+)
+
+
+def _time(statement, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _top_modules(statement, count):
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        stderr=subprocess.PIPE,
+    ).stderr.decode()
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Only top-level imports, so nested modules are not counted twice.
+        if not name.startswith("  "):
+            modules.append((int(cumulative), name.strip()))
+    return sorted(modules, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float)
+    parser.add_argument("--top", type=int, default=0)
+    args = parser.parse_args()
+
+    baseline = _time("pass", args.runs)
+    results = {}
+    print("{:>10}  {}".format("ms", "statement"))
+    for statement in STATEMENTS:
+        results[statement] = (_time(statement, args.runs) - baseline) * 1000
+        print("{:>10.1f}  {}".format(results[statement], statement))
+
+    if args.top:
+        print()
+        print("{:>10}  {}".format("cum. ms", "module (import google.cloud.asset)"))
+        for cumulative, name in _top_modules(STATEMENTS[0], args.top):
+            print("{:>10.1f}  {}".format(cumulative / 1000, name))
+
+    if args.budget_ms is not None and results[STATEMENTS[0]] > args.budget_ms:
+        print(
+            "{!r} took {:.1f}ms, over the budget of {:.1f}ms.".format(
+                STATEMENTS[0], results[STATEMENTS[0]], args.budget_ms
+            )
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,37 +15,63 @@
 # limitations under the License.
 #
 
-from google.cloud.asset_v1.services.asset_service.async_client import (
-    AssetServiceAsyncClient,
-)
-from google.cloud.asset_v1.services.asset_service.client import AssetServiceClient
-from google.cloud.asset_v1.types.asset_service import BatchGetAssetsHistoryRequest
-from google.cloud.asset_v1.types.asset_service import BatchGetAssetsHistoryResponse
-from google.cloud.asset_v1.types.asset_service import BigQueryDestination
-from google.cloud.asset_v1.types.asset_service import ContentType
-from google.cloud.asset_v1.types.asset_service import CreateFeedRequest
-from google.cloud.asset_v1.types.asset_service import DeleteFeedRequest
-from google.cloud.asset_v1.types.asset_service import ExportAssetsRequest
-from google.cloud.asset_v1.types.asset_service import ExportAssetsResponse
-from google.cloud.asset_v1.types.asset_service import Feed
-from google.cloud.asset_v1.types.asset_service import FeedOutputConfig
-from google.cloud.asset_v1.types.asset_service import GcsDestination
-from google.cloud.asset_v1.types.asset_service import GetFeedRequest
-from google.cloud.asset_v1.types.asset_service import ListFeedsRequest
-from google.cloud.asset_v1.types.asset_service import ListFeedsResponse
-from google.cloud.asset_v1.types.asset_service import OutputConfig
-from google.cloud.asset_v1.types.asset_service import PubsubDestination
-from google.cloud.asset_v1.types.asset_service import SearchAllIamPoliciesRequest
-from google.cloud.asset_v1.types.asset_service import SearchAllIamPoliciesResponse
-from google.cloud.asset_v1.types.asset_service import SearchAllResourcesRequest
-from google.cloud.asset_v1.types.asset_service import SearchAllResourcesResponse
-from google.cloud.asset_v1.types.asset_service import UpdateFeedRequest
-from google.cloud.asset_v1.types.assets import Asset
-from google.cloud.asset_v1.types.assets import IamPolicySearchResult
-from google.cloud.asset_v1.types.assets import Resource
-from google.cloud.asset_v1.types.assets import ResourceSearchResult
-from google.cloud.asset_v1.types.assets import TemporalAsset
-from google.cloud.asset_v1.types.assets import TimeWindow
+import importlib as _importlib
+import sys as _sys
+
+# The module defining each public name, imported on first access.
+_LAZY_ATTRIBUTES = {
+    "Asset": "google.cloud.asset_v1.types.assets",
+    "AssetServiceAsyncClient": "google.cloud.asset_v1.services.asset_service.async_client",
+    "AssetServiceClient": "google.cloud.asset_v1.services.asset_service.client",
+    "BatchGetAssetsHistoryRequest": "google.cloud.asset_v1.types.asset_service",
+    "BatchGetAssetsHistoryResponse": "google.cloud.asset_v1.types.asset_service",
+    "BigQueryDestination": "google.cloud.asset_v1.types.asset_service",
+    "ContentType": "google.cloud.asset_v1.types.asset_service",
+    "CreateFeedRequest": "google.cloud.asset_v1.types.asset_service",
+    "DeleteFeedRequest": "google.cloud.asset_v1.types.asset_service",
+    "ExportAssetsRequest": "google.cloud.asset_v1.types.asset_service",
+    "ExportAssetsResponse": "google.cloud.asset_v1.types.asset_service",
+    "Feed": "google.cloud.asset_v1.types.asset_service",
+    "FeedOutputConfig": "google.cloud.asset_v1.types.asset_service",
+    "GcsDestination": "google.cloud.asset_v1.types.asset_service",
+    "GetFeedRequest": "google.cloud.asset_v1.types.asset_service",
+    "IamPolicySearchResult": "google.cloud.asset_v1.types.assets",
+    "ListFeedsRequest": "google.cloud.asset_v1.types.asset_service",
+    "ListFeedsResponse": "google.cloud.asset_v1.types.asset_service",
+    "OutputConfig": "google.cloud.asset_v1.types.asset_service",
+    "PubsubDestination": "google.cloud.asset_v1.types.asset_service",
+    "Resource": "google.cloud.asset_v1.types.assets",
+    "ResourceSearchResult": "google.cloud.asset_v1.types.assets",
+    "SearchAllIamPoliciesRequest": "google.cloud.asset_v1.types.asset_service",
+    "SearchAllIamPoliciesResponse": "google.cloud.asset_v1.types.asset_service",
+    "SearchAllResourcesRequest": "google.cloud.asset_v1.types.asset_service",
+    "SearchAllResourcesResponse": "google.cloud.asset_v1.types.asset_service",
+    "TemporalAsset": "google.cloud.asset_v1.types.assets",
+    "TimeWindow": "google.cloud.asset_v1.types.assets",
+    "UpdateFeedRequest": "google.cloud.asset_v1.types.asset_service",
+}
+
+
+def __getattr__(name):
+    # Resolve public names lazily (PEP 562) to keep importing the package
+    # cheap; only the modules actually used get imported.
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if _sys.version_info < (3, 7):  # pragma: NO COVER
+    # Module ``__getattr__`` requires Python 3.7; import eagerly instead.
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
+
 
 __all__ = (
     "Asset",
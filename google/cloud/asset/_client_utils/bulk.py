@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+
+from .deadline import Deadline
+
+
+class BulkResult:
+    """The outcome of one request of a bulk call.
+
+    Attributes:
+        index (int): The position of the request in the requests given.
+        request (Any): The request, as given.
+        response (Any): The response, or None if the call failed. For paged
+            methods, this is the response of the first page.
+        error (Optional[Exception]): The error raised by the call, or None
+            if it succeeded.
+    """
+
+    __slots__ = ("index", "request", "response", "error")
+
+    def __init__(
+        self,
+        index: int,
+        request: Any,
+        response: Any = None,
+        error: Optional[Exception] = None,
+    ):
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def result(self) -> Any:
+        """Return the response, or raise the error of the call."""
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def __repr__(self) -> str:
+        return "BulkResult(index={!r}, ok={!r})".format(self.index, self.ok)
+
+
+async def first_page(response: Any) -> Any:
+    """Return the response of the first page of ``response`` if it is a pager."""
+    if not hasattr(response, "__aiter__"):
+        return response
+    # The first page is the response the pager was created with, so this
+    # makes no further request.
+    pages = response.pages
+    try:
+        return await pages.__anext__()
+    finally:
+        await pages.aclose()
+
+
+async def gather(
+    call: Callable[[Any], Awaitable[Any]],
+    requests: Iterable[Any],
+    *,
+    concurrency: int = 32,
+    ordered: bool = False,
+    deadline: Deadline = None
+) -> AsyncIterator[BulkResult]:
+    """Run ``call`` on every request with bounded concurrency.
+
+    Requests are taken from ``requests`` only as calls complete, so at most
+    ``concurrency`` calls, and as many tasks, exist at any time however
+    many requests there are. Errors are reported per request, as the
+    :attr:`BulkResult.error` of its result, and do not stop the others.
+
+    Args:
+        call (Callable[[Any], Awaitable[Any]]): The coroutine function
+            making one call.
+        requests (Iterable[Any]): The requests, consumed lazily.
+        concurrency (int): The maximum number of calls in flight.
+        ordered (bool): Yield results in the order of ``requests`` rather
+            than as they complete. A slow call then holds back the results
+            after it, and the number of calls in flight drops until it
+            completes, as completed results count towards ``concurrency``
+            until they are yielded.
+        deadline (Optional[~.Deadline]): If provided, no request is sent
+            once it has expired; those not sent yet are left in
+            ``requests``, which a caller passing an iterator can resume
+            from.
+
+    Yields:
+        ~.BulkResult: The result of every request sent.
+
+    Raises:
+        ValueError: If ``concurrency`` is lower than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    requests = iter(requests)
+    pending = {}
+    completed = {}
+    next_index = 0
+    next_yield = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) + len(completed) < concurrency:
+                if deadline is not None and deadline.expired:
+                    exhausted = True
+                    break
+                try:
+                    request = next(requests)
+                except StopIteration:
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(call(request))
+                pending[task] = BulkResult(next_index, request)
+                next_index += 1
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda task: pending[task].index):
+                result = pending.pop(task)
+                error = task.exception()
+                if error is None:
+                    result.response = task.result()
+                else:
+                    result.error = error
+                if ordered:
+                    completed[result.index] = result
+                else:
+                    yield result
+            while next_yield in completed:
+                yield completed.pop(next_yield)
+                next_yield += 1
+    finally:
+        # The caller stopped iterating early: abandon the calls in flight.
+        for task in pending:
+            task.cancel()
+
+
+def gather_method(
+    client: Any,
+    method: str,
+    requests: Iterable[Any],
+    *,
+    concurrency: int = 32,
+    ordered: bool = False,
+    retry: retries.Retry = gapic_v1.method.DEFAULT,
+    timeout: float = None,
+    metadata: Sequence[Tuple[str, str]] = (),
+    deadline: Union[float, Deadline] = None
+) -> AsyncIterator[BulkResult]:
+    """Call one method of an async client for many requests.
+
+    This implements the ``gather`` method of the async clients of every
+    API version; see :func:`gather` for how requests are scheduled.
+
+    Args:
+        client (Any): The async client.
+        method (str): The name of the method of ``client`` to call, such
+            as ``"get_feed"``. Paged methods only fetch the first page of
+            each request.
+        requests (Iterable[Any]): The request objects, or dicts, of the
+            calls.
+        concurrency (int): The maximum number of calls in flight.
+        ordered (bool): Yield results in the order of ``requests`` rather
+            than as they complete.
+        retry (google.api_core.retry.Retry): Designation of what errors, if
+            any, should be retried.
+        timeout (float): The timeout for each request.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be sent
+            along with the requests as metadata.
+        deadline (Union[float, ~.Deadline]): An overall time budget, in
+            seconds or as a shared :class:`~.Deadline`, for all the
+            requests. Requests not sent before it expires are left in
+            ``requests``.
+
+    Returns:
+        AsyncIterator[~.BulkResult]: The result of every request sent,
+        holding the response or the error of the call.
+
+    Raises:
+        ValueError: If ``method`` is not a method of ``client``.
+    """
+    rpc = getattr(client, method, None)
+    if method.startswith("_") or not asyncio.iscoroutinefunction(rpc):
+        raise ValueError("Unknown method: {!r}".format(method))
+    deadline = Deadline.coerce(deadline)
+
+    async def call(request):
+        response = await rpc(
+            request,
+            retry=retry,
+            timeout=timeout if deadline is None else deadline.rpc_timeout(timeout),
+            metadata=metadata,
+        )
+        return await first_page(response)
+
+    return gather(
+        call, requests, concurrency=concurrency, ordered=ordered, deadline=deadline
+    )
+
+
+__all__ = (
+    "BulkResult",
+    "first_page",
+    "gather",
+    "gather_method",
+)
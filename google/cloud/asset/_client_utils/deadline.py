@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import functools
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Union
+
+from google.api_core import exceptions  # type: ignore
+from google.api_core import operation_async  # type: ignore
+
+
+class PageProgress:
+    """How far a pager got, and whether its deadline stopped it.
+
+    Attributes:
+        pages (int): The number of pages yielded so far.
+        next_page_token (str): The token of the page after the last one
+            yielded; pass it as ``page_token`` to resume. Empty once every
+            page was yielded.
+        deadline_exceeded (bool): Whether iteration stopped because the
+            deadline ran out.
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.next_page_token = ""
+        self.deadline_exceeded = False
+
+    def __repr__(self) -> str:
+        return "PageProgress(pages={!r}, next_page_token={!r}, deadline_exceeded={!r})".format(
+            self.pages, self.next_page_token, self.deadline_exceeded
+        )
+
+
+class Deadline:
+    """An end-to-end time budget shared by several calls.
+
+    Every call made under the deadline gets the time remaining as its
+    timeout, so a pager over hundreds of pages, or the polls of a
+    long-running operation, are bounded as a whole rather than per
+    request. Methods accepting a ``deadline`` take either a number of
+    seconds or a :class:`Deadline`; sharing one instance bounds several
+    calls together::
+
+        deadline = Deadline(5.0)
+        pager = client.search_all_resources(scope=scope, deadline=deadline)
+        results = list(pager)
+        if pager.progress.deadline_exceeded:
+            resume_from = pager.progress.next_page_token
+
+    Retries of a call get the time left when they start, and are not sent
+    once the deadline has expired.
+    """
+
+    def __init__(self, timeout: float, *, clock: Callable[[], float] = time.monotonic):
+        """Instantiate the deadline.
+
+        Args:
+            timeout (float): The budget, in seconds from now.
+            clock (Callable[[], float]): The time source.
+        """
+        self._clock = clock
+        self._expiry = clock() + timeout
+
+    @classmethod
+    def coerce(cls, deadline: Union[None, float, "Deadline"]) -> Optional["Deadline"]:
+        """Return ``deadline`` as a :class:`Deadline`, or None if it is None."""
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        """Return the number of seconds left, or 0 once expired."""
+        return max(0.0, self._expiry - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget ran out."""
+        return self._clock() >= self._expiry
+
+    def timeout(self, timeout: Optional[float] = None) -> float:
+        """Return the timeout of a call: ``timeout``, capped by the time left."""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def rpc_timeout(self, timeout: Optional[float] = None) -> "_DeadlineTimeout":
+        """Return a timeout for the ``timeout`` argument of wrapped methods.
+
+        Every attempt of the call, including retries, gets the remaining
+        time, capped by ``timeout``. Once the deadline has expired, further
+        attempts are not sent: the call fails with
+        :class:`google.api_core.exceptions.RetryError`, which retries do
+        not catch.
+        """
+        return _DeadlineTimeout(self, timeout)
+
+    def bind(self, method: Callable) -> Callable:
+        """Return ``method``, a wrapped method, bounded by the deadline.
+
+        Once the deadline has expired, the returned method raises
+        :class:`google.api_core.exceptions.RetryError` without calling
+        ``method``.
+        """
+
+        def call(request, **kwargs):
+            if self.expired:
+                raise exceptions.RetryError("The deadline has expired.", None)
+            kwargs["timeout"] = self.rpc_timeout(kwargs.get("timeout"))
+            return method(request, **kwargs)
+
+        return call
+
+    def pages(self, pages: Iterator, progress: PageProgress) -> Iterator:
+        """Yield ``pages`` until they run out or the deadline expires."""
+        while True:
+            try:
+                page = next(pages)
+            except StopIteration:
+                return
+            except (exceptions.DeadlineExceeded, exceptions.RetryError):
+                if not self.expired:
+                    raise
+                progress.deadline_exceeded = True
+                return
+            progress.pages += 1
+            progress.next_page_token = page.next_page_token
+            yield page
+
+    async def async_pages(
+        self, pages: AsyncIterator, progress: PageProgress
+    ) -> AsyncIterator:
+        """Yield async ``pages`` until they run out or the deadline expires."""
+        while True:
+            try:
+                page = await pages.__anext__()
+            except StopAsyncIteration:
+                return
+            except (exceptions.DeadlineExceeded, exceptions.RetryError):
+                if not self.expired:
+                    raise
+                progress.deadline_exceeded = True
+                return
+            progress.pages += 1
+            progress.next_page_token = page.next_page_token
+            yield page
+
+    def bind_operation(self, operation: Any) -> Any:
+        """Bound the polls and the ``result()`` wait of an operation.
+
+        Each poll gets the remaining time as its timeout and ``result()``
+        waits at most until the deadline, then raises like a ``result()``
+        call whose timeout ran out; ``operation.metadata`` still reports
+        the progress of the operation.
+
+        Args:
+            operation (Union[~.operation.Operation, ~.operation_async.AsyncOperation]):
+                The operation, which is modified in place.
+
+        Returns:
+            The operation.
+        """
+        refresh = operation._refresh
+        result = operation.result
+
+        def bounded_refresh(*args, **kwargs):
+            kwargs["timeout"] = self.rpc_timeout(kwargs.get("timeout"))
+            return refresh(*args, **kwargs)
+
+        if isinstance(operation, operation_async.AsyncOperation):
+
+            async def bounded_result(timeout=None):
+                return await result(timeout=self.timeout(timeout))
+
+        else:
+
+            def bounded_result(timeout=None, **kwargs):
+                return result(timeout=self.timeout(timeout), **kwargs)
+
+        operation._refresh = bounded_refresh
+        operation.result = bounded_result
+        return operation
+
+
+class _DeadlineTimeout:
+    # A timeout decorator, like those of ``google.api_core.timeout``, giving
+    # each attempt the time left before the deadline.
+
+    def __init__(self, deadline: Deadline, timeout: Optional[float] = None):
+        self._deadline = deadline
+        self._timeout = timeout
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def func_with_timeout(*args, **kwargs):
+            if self._deadline.expired:
+                raise exceptions.RetryError("The deadline has expired.", None)
+            kwargs["timeout"] = self._deadline.timeout(self._timeout)
+            return func(*args, **kwargs)
+
+        return func_with_timeout
+
+
+__all__ = (
+    "Deadline",
+    "PageProgress",
+)
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+from concurrent import futures
+import threading
+import time
+from typing import Any, Callable, Deque, Iterable, Iterator
+
+from google.api_core import exceptions  # type: ignore
+
+
+class RateLimiter:
+    """A token bucket bounding the rate of calls, shared between threads.
+
+    Calls may be made at ``rate`` per second on average, with bursts of up
+    to ``burst`` calls. :meth:`acquire` blocks the calling thread until its
+    call may be made; waiting threads are served in the order they called.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Instantiate the rate limiter.
+
+        Args:
+            rate (float): The number of calls allowed per second.
+            burst (int): The number of calls allowed at once after a pause,
+                the capacity of the bucket, which starts full.
+            clock (Callable[[], float]): The time source.
+            sleep (Callable[[float], None]): The function waiting for a
+                number of seconds.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """Wait until a call may be made.
+
+        Returns:
+            float: The number of seconds waited.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            # Take the token now, even if it is only refilled later, so that
+            # threads arriving later wait behind this one.
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class ClientExecutor:
+    """A thread pool running client calls, optionally rate limited.
+
+    The ``*_future`` methods of the synchronous clients submit their call
+    to an executor and return a :class:`concurrent.futures.Future`, so that
+    synchronous code can have many calls in flight:
+
+    .. code-block:: python
+
+        executor = ClientExecutor(max_workers=64, rate_limiter=RateLimiter(100))
+        client = AssetServiceClient(executor=executor)
+        futures = [client.get_feed_future(name=name) for name in names]
+        feeds = [future.result() for future in futures]
+
+    An executor, and its rate limiter, may be shared by several clients.
+    Clients given no executor share a default one of 32 workers without
+    rate limit.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        *,
+        rate_limiter: RateLimiter = None,
+        thread_name_prefix: str = "AssetServiceClient"
+    ):
+        """Instantiate the executor.
+
+        Args:
+            max_workers (int): The maximum number of calls run at once.
+            rate_limiter (Optional[~.RateLimiter]): If provided, every call
+                waits for it before it starts.
+            thread_name_prefix (str): The prefix of the names of the
+                threads of the pool.
+        """
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._rate_limiter = rate_limiter
+
+    def __enter__(self) -> "ClientExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
+
+    def submit(self, fn: Callable, *args, **kwargs) -> futures.Future:
+        """Run ``fn(*args, **kwargs)`` in the pool.
+
+        Returns:
+            concurrent.futures.Future: The future of its result.
+        """
+        if self._rate_limiter is None:
+            return self._pool.submit(fn, *args, **kwargs)
+        return self._pool.submit(self._rate_limited, fn, *args, **kwargs)
+
+    def page_futures(
+        self, pages: Iterable[Any], prefetch: int = 1
+    ) -> Iterator[futures.Future]:
+        """Yield the future of every page of a pager's ``pages``.
+
+        Pages are requested in the pool ahead of the caller, so that the
+        next pages are fetched while the caller handles the current one,
+        but at most ``prefetch`` pages ahead: a slow caller does not get
+        the whole result set fetched into memory. Iteration stops after
+        the last page, or after the future of a page which failed.
+
+        Args:
+            pages (Iterable[Any]): The ``pages`` of a synchronous pager.
+                The first page, which the pager already holds, is yielded
+                as a completed future.
+            prefetch (int): The number of pages fetched ahead of the page
+                the caller was last given.
+
+        Yields:
+            concurrent.futures.Future: The future of every page.
+
+        Raises:
+            ValueError: If ``prefetch`` is lower than 1.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        pages = iter(pages)
+        lock = threading.Lock()
+        # The futures of the pages requested but not yielded yet, in order.
+        ahead = collections.deque()  # type: Deque[futures.Future]
+        # Whether the last page fetched has a successor not requested yet,
+        # for lack of room ahead of the caller.
+        stalled = [False]
+
+        def fetch() -> Any:
+            try:
+                page = next(pages)
+            except StopIteration:
+                # Pagers only stop early when their deadline expired.
+                raise exceptions.DeadlineExceeded(
+                    "The deadline expired before the page was fetched."
+                )
+            if page.next_page_token:
+                with lock:
+                    if len(ahead) < prefetch:
+                        ahead.append(self.submit(fetch))
+                    else:
+                        stalled[0] = True
+            return page
+
+        future = futures.Future()  # type: futures.Future
+        try:
+            future.set_result(fetch())
+        except Exception as exc:
+            future.set_exception(exc)
+        while True:
+            yield future
+            if future.exception() is not None:
+                return
+            with lock:
+                if stalled[0]:
+                    stalled[0] = False
+                    ahead.append(self.submit(fetch))
+                if not ahead:
+                    return
+                future = ahead.popleft()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting calls and free the threads of the pool.
+
+        Args:
+            wait (bool): Whether to wait for the calls already submitted.
+        """
+        self._pool.shutdown(wait=wait)
+
+    def _rate_limited(self, fn: Callable, *args, **kwargs) -> Any:
+        self._rate_limiter.acquire()
+        return fn(*args, **kwargs)
+
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+def default_executor() -> ClientExecutor:
+    """Return the executor of the clients given none, creating it if needed."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ClientExecutor()
+        return _default_executor
+
+
+_FUTURE_METHOD_DOC = """Call :meth:`{name}` on the executor of this client.
+
+        Takes the same arguments as :meth:`{name}`.
+
+        Returns:
+            concurrent.futures.Future: The future of {returns}.
+        """
+
+_FUTURE_RETURNS = {
+    "result": "its result",
+    "operation": "its operation",
+    "pager": (
+        "its pager, whose\n            ``page_futures()`` fetches the further "
+        "pages on the same executor"
+    ),
+}
+
+
+def future_method(name: str, returns: str = "result") -> Callable[..., futures.Future]:
+    """Make the ``*_future`` method of a client's method.
+
+    The method made calls the client's method ``name`` with its arguments on
+    the executor of the client, or on the default executor if the client has
+    none.
+
+    Args:
+        name (str): The name of the client's method.
+        returns (str): What the method ``name`` returns, for the
+            docstring: ``"result"``, ``"operation"`` or ``"pager"``.
+
+    Returns:
+        Callable[..., concurrent.futures.Future]: The method, to be assigned
+        to the class attribute ``<name>_future``.
+    """
+
+    def method(self, *args, **kwargs) -> futures.Future:
+        executor = self._executor or default_executor()
+        return executor.submit(getattr(self, name), *args, **kwargs)
+
+    method.__name__ = method.__qualname__ = name + "_future"
+    method.__doc__ = _FUTURE_METHOD_DOC.format(
+        name=name, returns=_FUTURE_RETURNS[returns]
+    )
+    return method
+
+
+__all__ = (
+    "ClientExecutor",
+    "RateLimiter",
+    "default_executor",
+    "future_method",
+)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+from typing import Any, Optional
+
+# The number of recently failed requests remembered to detect retries.
+_RETRY_WINDOW = 1024
+
+
+class FailedAttempts:
+    """The requests whose last attempt failed, to recognize their retries.
+
+    ``google.api_core.retry.Retry`` sends the same request object again, so
+    an attempt whose request is remembered here is a retry. Requests are
+    remembered by identity, without copying them; only the most recent
+    ``window`` ones are kept.
+
+    The instances are not thread safe: their users hold their own lock.
+    """
+
+    def __init__(self, window: int = _RETRY_WINDOW):
+        """Instantiate the record.
+
+        Args:
+            window (int): The number of failed requests remembered.
+        """
+        self._window = window
+        # (request, error) pairs by the id of the request.
+        self._failed = collections.OrderedDict()  # type: collections.OrderedDict
+
+    def add(self, request: Any, error: Any) -> None:
+        """Remember that an attempt sending ``request`` failed with ``error``."""
+        self._failed[id(request)] = (request, error)
+        if len(self._failed) > self._window:
+            self._failed.popitem(last=False)
+
+    def pop(self, request: Any) -> Optional[Any]:
+        """Forget ``request``, returning its error if it is a retry.
+
+        Returns:
+            Optional[Any]: The error of the previous attempt sending
+                ``request``, or None if this is not a retry.
+        """
+        failed, error = self._failed.pop(id(request), (None, None))
+        return error if failed is request else None
+
+
+__all__ = ("FailedAttempts",)
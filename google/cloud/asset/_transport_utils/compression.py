@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import re
+from typing import Any, Callable, Mapping, Optional
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import AsyncForwardingChannel
+from .forwarding import AsyncUnaryUnaryWrapper
+from .forwarding import ForwardingChannel
+
+GZIP = "gzip"
+DEFLATE = "deflate"
+NONE = "none"
+
+_ALGORITHMS = {
+    GZIP: grpc.Compression.Gzip,
+    DEFLATE: grpc.Compression.Deflate,
+    NONE: grpc.Compression.NoCompression,
+}
+
+
+def _method_name(path: str) -> str:
+    # "/google.cloud.asset.v1.AssetService/SearchAllResources" becomes
+    # "search_all_resources", the name of the transport property.
+    rpc = path.rpartition("/")[2]
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", rpc).lower()
+
+
+def _algorithm(name: Optional[str]) -> Optional[grpc.Compression]:
+    if name is None:
+        return None
+    try:
+        return _ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(
+            "Unsupported compression {!r}; expected one of {}.".format(
+                name, ", ".join(sorted(_ALGORITHMS))
+            )
+        )
+
+
+class CompressionConfig:
+    """Per-method compression of the messages sent by a transport.
+
+    The configured algorithm compresses the requests of a call and is
+    passed as the ``compression`` argument of the gRPC stub, unless the
+    caller already set one. gRPC clients always accept gzip and deflate
+    responses; whether responses are compressed is up to the server.
+
+    A config is passed to a gRPC transport with its ``compression``
+    argument::
+
+        transport = AssetServiceGrpcTransport(
+            compression=CompressionConfig(
+                default=GZIP, methods={"create_feed": NONE}
+            )
+        )
+    """
+
+    def __init__(
+        self, default: Optional[str] = None, methods: Mapping[str, str] = None
+    ):
+        """Instantiate the config.
+
+        Args:
+            default (Optional[str]): The compression of methods not listed
+                in ``methods``: ``"gzip"``, ``"deflate"``, ``"none"``, or
+                None to leave the channel default.
+            methods (Mapping[str, str]): The compression of individual
+                methods, keyed by the transport method name, such as
+                ``"search_all_resources"``.
+        """
+        self._default = _algorithm(default)
+        self._methods = {
+            method: _algorithm(name) for method, name in (methods or {}).items()
+        }
+
+    def for_method(self, method: str) -> Optional[grpc.Compression]:
+        """Return the compression of ``method``.
+
+        Args:
+            method (str): A transport method name, such as
+                ``"search_all_resources"``, or a full RPC path.
+
+        Returns:
+            Optional[grpc.Compression]: The algorithm, or None to leave the
+                channel default.
+        """
+        if method.startswith("/"):
+            method = _method_name(method)
+        return self._methods.get(method, self._default)
+
+    def wrap_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Return a channel applying the config to its unary calls."""
+        return _CompressedChannel(self, channel)
+
+    def wrap_async_channel(self, channel: aio.Channel) -> aio.Channel:
+        """Return an AsyncIO channel applying the config to its unary calls."""
+        return _AsyncCompressedChannel(self, channel)
+
+
+class _CompressedUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, compression: grpc.Compression, callable_: Callable):
+        self._compression = compression
+        self._callable = callable_
+
+    def __call__(self, request, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._callable(request, **kwargs)
+
+    def with_call(self, request, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._callable.with_call(request, **kwargs)
+
+    def future(self, request, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._callable.future(request, **kwargs)
+
+
+class _AsyncCompressedUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(self, compression: grpc.Compression, callable_: Callable):
+        self._compression = compression
+        self._callable = callable_
+
+    def __call__(self, request, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._callable(request, **kwargs)
+
+
+class _CompressedChannelBase:
+    _multicallable_class = None  # type: type
+
+    def __init__(self, config: CompressionConfig, channel: Any):
+        super().__init__(channel)
+        self._config = config
+
+    def _wrap_unary_unary(self, method, stub):
+        compression = self._config.for_method(method)
+        if compression is None:
+            return stub
+        return self._multicallable_class(compression, stub)
+
+
+class _CompressedChannel(_CompressedChannelBase, ForwardingChannel):
+    _multicallable_class = _CompressedUnaryUnaryMultiCallable
+
+
+class _AsyncCompressedChannel(_CompressedChannelBase, AsyncForwardingChannel):
+    _multicallable_class = _AsyncCompressedUnaryUnaryMultiCallable
+
+
+__all__ = (
+    "CompressionConfig",
+    "DEFLATE",
+    "GZIP",
+    "NONE",
+)
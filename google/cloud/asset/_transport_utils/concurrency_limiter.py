@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from google.api_core import exceptions  # type: ignore
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import AsyncForwardingChannel
+from .forwarding import AsyncUnaryUnaryWrapper
+from .forwarding import ForwardingChannel
+
+
+class _Waiter:
+    __slots__ = ("event", "future", "loop", "granted")
+
+    def __init__(self, future=None, loop=None):
+        self.event = None if future is not None else threading.Event()
+        self.future = future
+        self.loop = loop
+        self.granted = False
+
+    def wake(self):
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Limit:
+    __slots__ = ("limit", "in_flight", "epoch", "throttled", "waiters")
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        # Incremented on every decrease, so that a burst of errors from
+        # calls started under the same limit only shrinks it once.
+        self.epoch = 0
+        self.throttled = 0
+        self.waiters = collections.deque()
+
+
+class ConcurrencyLimiter:
+    """An adaptive limit on concurrent calls per method and quota project.
+
+    The limit follows an additive-increase, multiplicative-decrease (AIMD)
+    rule. Each successful call raises the limit by ``1 / limit``, so about
+    one more concurrent call is allowed per round of calls. A call that
+    fails with ``RESOURCE_EXHAUSTED``, or that takes longer than
+    ``latency_threshold``, multiplies the limit by ``backoff_ratio``; only
+    one decrease happens per round, however many calls of the round fail.
+
+    Calls over the limit wait for a slot, in first-come, first-served
+    order. The wait counts towards the timeout of the call; a call still
+    waiting when its timeout runs out fails with ``DeadlineExceeded``. Retries go through the limiter like any other call, so a burst
+    of throttling errors slows every caller down instead of each one
+    retrying on its own.
+
+    A limiter is passed to a gRPC or gRPC AsyncIO transport with its
+    ``concurrency_limiter`` argument and may be shared between transports;
+    limits are kept separately per RPC and per quota project.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: float = 20,
+        min_limit: float = 1,
+        max_limit: float = 1000,
+        backoff_ratio: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Instantiate the limiter.
+
+        Args:
+            initial_limit (float): The starting limit of every key.
+            min_limit (float): The lowest limit, at least 1.
+            max_limit (float): The highest limit.
+            backoff_ratio (float): The factor applied to the limit on
+                throttling, between 0 and 1.
+            latency_threshold (Optional[float]): If set, calls slower than
+                this many seconds shrink the limit like throttling errors.
+            clock (Callable[[], float]): The time source.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min <= initial <= max")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        self._initial_limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._latency_threshold = latency_threshold
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limits = {}  # type: Dict[Hashable, _Limit]
+
+    def limit(self, method: str, quota_project_id: Optional[str] = None) -> int:
+        """Return the current concurrency limit of a method.
+
+        Args:
+            method (str): The full RPC path, such as
+                ``"/google.cloud.asset.v1.AssetService/SearchAllResources"``.
+            quota_project_id (Optional[str]): The quota project of the calls.
+
+        Returns:
+            int: The number of calls allowed in flight.
+        """
+        with self._lock:
+            return int(self._get((method, quota_project_id)).limit)
+
+    def stats(self) -> Dict[Tuple[str, Optional[str]], Dict[str, Any]]:
+        """Return the limit, calls in flight and throttled count per key."""
+        with self._lock:
+            return {
+                key: {
+                    "limit": int(state.limit),
+                    "in_flight": state.in_flight,
+                    "waiting": len(state.waiters),
+                    "throttled": state.throttled,
+                }
+                for key, state in self._limits.items()
+            }
+
+    def wrap_channel(
+        self, channel: grpc.Channel, quota_project_id: Optional[str] = None
+    ) -> grpc.Channel:
+        """Return a channel whose unary calls go through the limiter.
+
+        Args:
+            channel (grpc.Channel): The channel to wrap.
+            quota_project_id (Optional[str]): The quota project of the calls.
+
+        Returns:
+            grpc.Channel: The wrapped channel.
+        """
+        return _LimitedChannel(self, channel, quota_project_id)
+
+    def wrap_async_channel(
+        self, channel: aio.Channel, quota_project_id: Optional[str] = None
+    ) -> aio.Channel:
+        """Return an AsyncIO channel whose unary calls go through the limiter.
+
+        Args:
+            channel (aio.Channel): The channel to wrap.
+            quota_project_id (Optional[str]): The quota project of the calls.
+
+        Returns:
+            aio.Channel: The wrapped channel.
+        """
+        return _AsyncLimitedChannel(self, channel, quota_project_id)
+
+    def _get(self, key: Hashable) -> _Limit:
+        state = self._limits.get(key)
+        if state is None:
+            state = self._limits[key] = _Limit(self._initial_limit)
+        return state
+
+    def _try_acquire(self, key: Hashable, waiter: _Waiter) -> Tuple[_Limit, bool]:
+        state = self._get(key)
+        if state.in_flight < int(state.limit) and not state.waiters:
+            state.in_flight += 1
+            return state, True
+        state.waiters.append(waiter)
+        return state, False
+
+    def acquire(self, key: Hashable, timeout: Optional[float] = None) -> int:
+        """Block until a call for ``key`` may start.
+
+        Args:
+            key (Hashable): The key of the call.
+            timeout (Optional[float]): The longest time to wait, in
+                seconds, or None to wait for as long as it takes.
+
+        Returns:
+            int: A token to pass to :meth:`release`.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If no slot was
+                free within ``timeout``.
+        """
+        waiter = _Waiter()
+        with self._lock:
+            state, acquired = self._try_acquire(key, waiter)
+            if acquired:
+                return state.epoch
+        if not waiter.event.wait(timeout):
+            self._abandon(state, waiter, timeout)
+        return state.epoch
+
+    async def acquire_async(
+        self, key: Hashable, timeout: Optional[float] = None
+    ) -> int:
+        """Wait until a call for ``key`` may start.
+
+        Args:
+            key (Hashable): The key of the call.
+            timeout (Optional[float]): The longest time to wait, in
+                seconds, or None to wait for as long as it takes.
+
+        Returns:
+            int: A token to pass to :meth:`release`.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If no slot was
+                free within ``timeout``.
+        """
+        loop = asyncio.get_event_loop()
+        waiter = _Waiter(loop.create_future(), loop)
+        with self._lock:
+            state, acquired = self._try_acquire(key, waiter)
+            if acquired:
+                return state.epoch
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            self._abandon(state, waiter, timeout)
+        except asyncio.CancelledError:
+            with self._lock:
+                if not waiter.granted:
+                    state.waiters.remove(waiter)
+                    raise
+            # The slot was handed over just as the wait was cancelled.
+            self.release(key, state.epoch)
+            raise
+        return state.epoch
+
+    def _abandon(self, state: _Limit, waiter: _Waiter, timeout: float) -> None:
+        # Stop waiting for a slot, unless one was handed over just as the
+        # wait timed out.
+        with self._lock:
+            if waiter.granted:
+                return
+            state.waiters.remove(waiter)
+        raise exceptions.DeadlineExceeded(
+            "No concurrency slot was free within {}s".format(timeout)
+        )
+
+    def release(
+        self,
+        key: Hashable,
+        token: int,
+        latency: Optional[float] = None,
+        throttled: bool = False,
+    ) -> None:
+        """Finish a call for ``key`` and adapt the limit to its outcome.
+
+        Args:
+            key (Hashable): The key passed to :meth:`acquire`.
+            token (int): The token returned by :meth:`acquire`.
+            latency (Optional[float]): The duration of a completed call, or
+                None if it failed for a reason other than throttling.
+            throttled (bool): Whether the call was rejected for quota.
+        """
+        with self._lock:
+            state = self._limits[key]
+            state.in_flight -= 1
+            slow = (
+                latency is not None
+                and self._latency_threshold is not None
+                and latency > self._latency_threshold
+            )
+            if throttled:
+                state.throttled += 1
+            if throttled or slow:
+                if token == state.epoch:
+                    state.epoch += 1
+                    state.limit = max(
+                        self._min_limit, state.limit * self._backoff_ratio
+                    )
+            elif latency is not None:
+                state.limit = min(self._max_limit, state.limit + 1.0 / state.limit)
+            # Hand free slots over to the oldest waiters.
+            while state.waiters and state.in_flight < int(state.limit):
+                state.in_flight += 1
+                state.waiters.popleft().wake()
+
+
+def _is_throttled(error: Optional[BaseException]) -> bool:
+    return (
+        isinstance(error, grpc.RpcError)
+        and callable(getattr(error, "code", None))
+        and error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    )
+
+
+class _LimitedUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, limiter: ConcurrencyLimiter, key: Hashable, callable_: Callable):
+        self._limiter = limiter
+        self._key = key
+        self._callable = callable_
+
+    def _acquire(self, kwargs):
+        # Waiting for a slot uses up the timeout of the call.
+        timeout = kwargs.get("timeout")
+        start = self._limiter._clock()
+        token = self._limiter.acquire(self._key, timeout)
+        if timeout is not None:
+            kwargs["timeout"] = max(0.0, timeout - (self._limiter._clock() - start))
+        return token
+
+    def _invoke(self, fn, request, kwargs):
+        token = self._acquire(kwargs)
+        start = self._limiter._clock()
+        try:
+            response = fn(request, **kwargs)
+        except BaseException as exc:
+            self._limiter.release(self._key, token, throttled=_is_throttled(exc))
+            raise
+        self._limiter.release(self._key, token, self._limiter._clock() - start)
+        return response
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(self._callable, request, kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._invoke(self._callable.with_call, request, kwargs)
+
+    def future(self, request, **kwargs):
+        token = self._acquire(kwargs)
+        start = self._limiter._clock()
+        try:
+            future = self._callable.future(request, **kwargs)
+        except BaseException as exc:
+            self._limiter.release(self._key, token, throttled=_is_throttled(exc))
+            raise
+
+        def done(future):
+            error = None if future.cancelled() else future.exception()
+            if future.cancelled() or error is not None:
+                self._limiter.release(self._key, token, throttled=_is_throttled(error))
+            else:
+                self._limiter.release(self._key, token, self._limiter._clock() - start)
+
+        future.add_done_callback(done)
+        return future
+
+
+class _AsyncLimitedUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(self, limiter: ConcurrencyLimiter, key: Hashable, callable_: Callable):
+        self._limiter = limiter
+        self._key = key
+        self._callable = callable_
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(request, kwargs)
+
+    async def _invoke(self, request, kwargs):
+        timeout = kwargs.get("timeout")
+        start = self._limiter._clock()
+        token = await self._limiter.acquire_async(self._key, timeout)
+        if timeout is not None:
+            kwargs["timeout"] = max(0.0, timeout - (self._limiter._clock() - start))
+        start = self._limiter._clock()
+        try:
+            response = await self._callable(request, **kwargs)
+        except BaseException as exc:
+            self._limiter.release(self._key, token, throttled=_is_throttled(exc))
+            raise
+        self._limiter.release(self._key, token, self._limiter._clock() - start)
+        return response
+
+
+class _LimitedChannelBase:
+    _multicallable_class = None  # type: type
+
+    def __init__(
+        self,
+        limiter: ConcurrencyLimiter,
+        channel: Any,
+        quota_project_id: Optional[str],
+    ):
+        super().__init__(channel)
+        self._limiter = limiter
+        self._quota_project_id = quota_project_id
+
+    def _wrap_unary_unary(self, method, stub):
+        return self._multicallable_class(
+            self._limiter, (method, self._quota_project_id), stub
+        )
+
+
+class _LimitedChannel(_LimitedChannelBase, ForwardingChannel):
+    _multicallable_class = _LimitedUnaryUnaryMultiCallable
+
+
+class _AsyncLimitedChannel(_LimitedChannelBase, AsyncForwardingChannel):
+    _multicallable_class = _AsyncLimitedUnaryUnaryMultiCallable
+
+
+__all__ = ("ConcurrencyLimiter",)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Any
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+
+class AsyncUnaryUnaryWrapper(aio.UnaryUnaryMultiCallable):
+    """The base class of wrappers of gRPC AsyncIO unary-unary stubs.
+
+    Subclassing ``UnaryUnaryMultiCallable`` lets ``grpc_helpers_async``
+    recognize a wrapper as a unary stub when mapping errors.
+    """
+
+
+class _ForwardingChannelBase:
+    # Forwards every call to ``self._channel``; subclasses wrap the
+    # unary-unary stubs it creates by overriding ``_wrap_unary_unary``.
+
+    def __init__(self, channel: Any):
+        self._channel = channel
+
+    def _wrap_unary_unary(self, method: str, stub: Any) -> Any:
+        return stub
+
+    def unary_unary(self, method, *args, **kwargs):
+        return self._wrap_unary_unary(
+            method, self._channel.unary_unary(method, *args, **kwargs)
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self._channel.unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self._channel.stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self._channel.stream_stream(method, *args, **kwargs)
+
+
+class ForwardingChannel(_ForwardingChannelBase, grpc.Channel):
+    """A ``grpc.Channel`` forwarding every call to another channel.
+
+    Subclasses override ``_wrap_unary_unary(method, stub)`` to wrap the
+    unary-unary stubs of the channel.
+    """
+
+    def subscribe(self, callback, try_to_connect=False):
+        self._channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self._channel.unsubscribe(callback)
+
+    def close(self):
+        self._channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class AsyncForwardingChannel(_ForwardingChannelBase, aio.Channel):
+    """An ``aio.Channel`` forwarding every call to another channel.
+
+    This is the asyncio counterpart of :class:`ForwardingChannel`.
+    """
+
+    async def close(self, grace=None):
+        await self._channel.close(grace)
+
+    def get_state(self, try_to_connect: bool = False):
+        return self._channel.get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self._channel.wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await self._channel.channel_ready()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+__all__ = (
+    "AsyncForwardingChannel",
+    "AsyncUnaryUnaryWrapper",
+    "ForwardingChannel",
+)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import collections
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import AsyncUnaryUnaryWrapper
+
+
+class HedgingPolicy:
+    """Sends a duplicate of slow idempotent calls and keeps the first response.
+
+    The latency of successful calls is tracked per method over a sliding
+    window. Once ``min_samples`` latencies are known, a call still pending
+    after the ``percentile`` latency of its method is hedged: an identical
+    call is sent, the first successful response is returned and the other
+    call is cancelled.
+
+    Hedges are paid for from a budget: every call adds ``budget_ratio``
+    tokens, up to ``max_budget``, and every hedge spends one. Hedging
+    therefore adds at most ``budget_ratio`` extra calls per call, even when
+    the backend slows down as a whole.
+
+    A policy is passed to a gRPC transport with its ``hedging_policy``
+    argument and only applies to the read-only methods of the transport.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        min_delay: float = 0.01,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+        window: int = 1000,
+        budget_ratio: float = 0.1,
+        max_budget: float = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Instantiate the policy.
+
+        Args:
+            percentile (float): The latency percentile, between 0 and 100,
+                after which a call is hedged.
+            min_delay (float): The shortest hedging delay, in seconds.
+            max_delay (float): The longest hedging delay, in seconds.
+            min_samples (int): The number of latencies of a method observed
+                before its calls are hedged.
+            window (int): The number of recent latencies kept per method.
+            budget_ratio (float): The hedge tokens earned per call.
+            max_budget (float): The maximum number of hedge tokens.
+            clock (Callable[[], float]): The time source.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._min_samples = min_samples
+        self._window = window
+        self._budget_ratio = budget_ratio
+        self._max_budget = max_budget
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._samples = {}  # type: Dict[str, int]
+        self._delays = {}  # type: Dict[str, float]
+        self._refresh_every = max(1, window // 50)
+        self._budget = 0.0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.hedges_denied = 0
+
+    def delay(self, method: str) -> Optional[float]:
+        """Return the hedging delay of ``method``.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None while too few
+                latencies of the method have been observed.
+        """
+        return self._delays.get(method)
+
+    def record(self, method: str, latency: float) -> None:
+        """Record the latency of a successful call to ``method``."""
+        with self._lock:
+            latencies = self._latencies.get(method)
+            if latencies is None:
+                latencies = self._latencies[method] = collections.deque(
+                    maxlen=self._window
+                )
+            latencies.append(latency)
+            samples = self._samples[method] = self._samples.get(method, 0) + 1
+            if samples < self._min_samples:
+                return
+            # Sorting the window is cheap next to an RPC, but only refresh
+            # the delay every few samples.
+            if method in self._delays and samples % self._refresh_every:
+                return
+            ordered = sorted(latencies)
+            index = min(len(ordered) - 1, int(len(ordered) * self._percentile / 100.0))
+            self._delays[method] = min(
+                self._max_delay, max(self._min_delay, ordered[index])
+            )
+
+    def _deposit(self) -> None:
+        with self._lock:
+            self._budget = min(self._max_budget, self._budget + self._budget_ratio)
+
+    def _withdraw(self) -> bool:
+        with self._lock:
+            if self._budget < 1.0:
+                self.hedges_denied += 1
+                return False
+            self._budget -= 1.0
+            self.hedges_sent += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hedging counters and current per-method delays."""
+        return {
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "hedges_denied": self.hedges_denied,
+            "budget": self._budget,
+            "delays": dict(self._delays),
+        }
+
+    def wrap_stub(
+        self, method: str, stub: grpc.UnaryUnaryMultiCallable
+    ) -> grpc.UnaryUnaryMultiCallable:
+        """Wrap a gRPC stub so that slow calls are hedged.
+
+        Args:
+            method (str): The name of the RPC.
+            stub (grpc.UnaryUnaryMultiCallable): The stub to wrap.
+
+        Returns:
+            grpc.UnaryUnaryMultiCallable: A stub with the same signature.
+        """
+        return _HedgingUnaryUnaryMultiCallable(self, method, stub)
+
+    def wrap_async_stub(
+        self, method: str, stub: aio.UnaryUnaryMultiCallable
+    ) -> aio.UnaryUnaryMultiCallable:
+        """Wrap a gRPC AsyncIO stub so that slow calls are hedged.
+
+        Args:
+            method (str): The name of the RPC.
+            stub (aio.UnaryUnaryMultiCallable): The stub to wrap.
+
+        Returns:
+            aio.UnaryUnaryMultiCallable: A stub with the same signature.
+        """
+        return _AsyncHedgingUnaryUnaryMultiCallable(self, method, stub)
+
+
+def _remaining(kwargs: Dict[str, Any], elapsed: float) -> Dict[str, Any]:
+    # A hedge must not outlive the deadline of the original call.
+    timeout = kwargs.get("timeout")
+    if timeout is None:
+        return kwargs
+    return dict(kwargs, timeout=max(0.0, timeout - elapsed))
+
+
+class _HedgingUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(
+        self, policy: HedgingPolicy, method: str, stub: grpc.UnaryUnaryMultiCallable
+    ):
+        self._policy = policy
+        self._method = method
+        self._stub = stub
+
+    def __call__(self, request, **kwargs):
+        policy = self._policy
+        policy._deposit()
+        delay = policy.delay(self._method)
+        start = policy._clock()
+        if delay is None:
+            response = self._stub(request, **kwargs)
+            policy.record(self._method, policy._clock() - start)
+            return response
+
+        finished = queue.Queue()  # type: queue.Queue
+        calls = [(self._stub.future(request, **kwargs), start)]
+        calls[0][0].add_done_callback(finished.put)
+        try:
+            first = finished.get(timeout=delay)
+        except queue.Empty:
+            first = None
+            if policy._withdraw():
+                elapsed = policy._clock() - start
+                hedge = self._stub.future(request, **_remaining(kwargs, elapsed))
+                calls.append((hedge, start + elapsed))
+                hedge.add_done_callback(finished.put)
+
+        error = None
+        for _ in calls:
+            future = first if first is not None else finished.get()
+            first = None
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            for other, started in calls:
+                if other is not future:
+                    other.cancel()
+                else:
+                    policy.record(self._method, policy._clock() - started)
+            if future is not calls[0][0]:
+                policy.hedges_won += 1
+            return future.result()
+        raise error
+
+    def with_call(self, request, **kwargs):
+        return self._stub.with_call(request, **kwargs)
+
+    def future(self, request, **kwargs):
+        return self._stub.future(request, **kwargs)
+
+
+class _AsyncHedgingUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(
+        self, policy: HedgingPolicy, method: str, stub: aio.UnaryUnaryMultiCallable
+    ):
+        self._policy = policy
+        self._method = method
+        self._stub = stub
+
+    def __call__(self, request, **kwargs):
+        return self._hedge(request, kwargs)
+
+    async def _invoke(self, request, kwargs):
+        start = self._policy._clock()
+        response = await self._stub(request, **kwargs)
+        self._policy.record(self._method, self._policy._clock() - start)
+        return response
+
+    async def _hedge(self, request, kwargs):
+        policy = self._policy
+        policy._deposit()
+        delay = policy.delay(self._method)
+        if delay is None:
+            return await self._invoke(request, kwargs)
+
+        start = policy._clock()
+        primary = asyncio.ensure_future(self._invoke(request, kwargs))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and policy._withdraw():
+                elapsed = policy._clock() - start
+                tasks.append(
+                    asyncio.ensure_future(
+                        self._invoke(request, _remaining(kwargs, elapsed))
+                    )
+                )
+
+            error = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    if task is not primary:
+                        policy.hedges_won += 1
+                    return task.result()
+            raise error
+        finally:
+            # Cancel the loser, or every call if the caller was cancelled.
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+__all__ = ("HedgingPolicy",)
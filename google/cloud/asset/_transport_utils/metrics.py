@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import abc
+import bisect
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+import proto  # type: ignore
+
+from .attempts import FailedAttempts
+from .forwarding import AsyncForwardingChannel
+from .forwarding import AsyncUnaryUnaryWrapper
+from .forwarding import ForwardingChannel
+
+# Upper bounds of the latency buckets, in seconds: 1ms to about 65s.
+LATENCY_BUCKETS = tuple(0.001 * 2**i for i in range(17))
+
+# Upper bounds of the size buckets, in bytes: 64B to 256MiB.
+SIZE_BUCKETS = tuple(64 * 4**i for i in range(12))
+
+
+class Histogram:
+    """A histogram over fixed bucket boundaries."""
+
+    def __init__(self, bounds: Sequence[float]):
+        """Instantiate the histogram.
+
+        Args:
+            bounds (Sequence[float]): The sorted upper bounds of the
+                buckets. Larger values fall into an overflow bucket.
+        """
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None  # type: Optional[float]
+        self.max = None  # type: Optional[float]
+
+    def record(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding ``percentile``.
+
+        Returns:
+            Optional[float]: The bound, the maximum value for the overflow
+                bucket, or None if the histogram is empty.
+        """
+        if not self.count:
+            return None
+        rank = self.count * percentile / 100.0
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank and count:
+                return self._bounds[index] if index < len(self._bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the state of the histogram as a dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "bounds": self._bounds,
+            "counts": list(self._counts),
+        }
+
+
+class _MethodMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.pages = 0
+        self.errors = collections.Counter()  # type: collections.Counter
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.request_bytes = Histogram(SIZE_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        self.failed = FailedAttempts()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "pages": self.pages,
+                "errors": dict(self.errors),
+                "latency": self.latency.snapshot(),
+                "request_bytes": self.request_bytes.snapshot(),
+                "response_bytes": self.response_bytes.snapshot(),
+            }
+
+
+class MetricsExporter(abc.ABC):
+    """Receives snapshots of a :class:`MetricsRegistry`."""
+
+    @abc.abstractmethod
+    def export(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """Export a snapshot, as returned by :meth:`MetricsRegistry.snapshot`."""
+        raise NotImplementedError()
+
+
+class InMemoryExporter(MetricsExporter):
+    """Keeps every exported snapshot in memory, for tests and debugging."""
+
+    def __init__(self):
+        self.snapshots = []
+
+    def export(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        self.snapshots.append(snapshot)
+
+
+class MetricsRegistry:
+    """Per-RPC metrics recorded by the gRPC transports.
+
+    For each RPC path, such as
+    ``"/google.cloud.asset.v1.AssetService/SearchAllResources"``, the
+    registry records:
+
+    -  ``attempts``: calls sent over the wire, including retries.
+    -  ``retries``: attempts re-sending a request whose previous attempt
+       failed.
+    -  ``errors``: failed attempts, by gRPC status code name.
+    -  ``pages``: responses of paginated methods.
+    -  ``latency``: a histogram of attempt latencies, in seconds.
+    -  ``request_bytes`` and ``response_bytes``: histograms of serialized
+       message sizes.
+
+    A registry is passed to a transport with its ``metrics`` argument and
+    may be shared between transports of any version. Transports without a
+    registry are not instrumented at all.
+    """
+
+    def __init__(
+        self,
+        exporters: Sequence[MetricsExporter] = (),
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """Instantiate the registry.
+
+        Args:
+            exporters (Sequence[~.MetricsExporter]): Exporters receiving a
+                snapshot on every call to :meth:`export`.
+            clock (Callable[[], float]): The time source.
+        """
+        self._exporters = list(exporters)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._methods = {}  # type: Dict[str, _MethodMetrics]
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        """Attach an exporter to the registry."""
+        self._exporters.append(exporter)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics recorded so far, by RPC path."""
+        with self._lock:
+            methods = dict(self._methods)
+        return {method: metrics.snapshot() for method, metrics in methods.items()}
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        """Send a snapshot to every exporter and return it."""
+        snapshot = self.snapshot()
+        for exporter in self._exporters:
+            exporter.export(snapshot)
+        return snapshot
+
+    def reset(self) -> None:
+        """Discard every metric recorded so far."""
+        with self._lock:
+            self._methods = {}
+
+    def wrap_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Return a channel whose unary calls are recorded in the registry."""
+        return _MeteredChannel(self, channel)
+
+    def wrap_async_channel(self, channel: aio.Channel) -> aio.Channel:
+        """Return an AsyncIO channel whose unary calls are recorded."""
+        return _AsyncMeteredChannel(self, channel)
+
+    def _method(self, method: str) -> _MethodMetrics:
+        metrics = self._methods.get(method)
+        if metrics is None:
+            with self._lock:
+                metrics = self._methods.setdefault(method, _MethodMetrics())
+        return metrics
+
+
+def _start(metrics: _MethodMetrics, request: Any) -> None:
+    with metrics.lock:
+        metrics.attempts += 1
+        if metrics.failed.pop(request) is not None:
+            metrics.retries += 1
+
+
+def _finish(
+    metrics: _MethodMetrics, request: Any, latency: float, error: Any = None
+) -> None:
+    with metrics.lock:
+        metrics.latency.record(latency)
+        if error is None:
+            return
+        code = error.code() if callable(getattr(error, "code", None)) else None
+        metrics.errors[code.name if code is not None else "UNKNOWN"] += 1
+        metrics.failed.add(request, error)
+
+
+class _MeteredUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(
+        self, registry: MetricsRegistry, metrics: _MethodMetrics, callable_: Callable
+    ):
+        self._clock = registry._clock
+        self._metrics = metrics
+        self._callable = callable_
+
+    def _invoke(self, fn, request, kwargs):
+        _start(self._metrics, request)
+        start = self._clock()
+        try:
+            response = fn(request, **kwargs)
+        except grpc.RpcError as exc:
+            _finish(self._metrics, request, self._clock() - start, exc)
+            raise
+        _finish(self._metrics, request, self._clock() - start)
+        return response
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(self._callable, request, kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._invoke(self._callable.with_call, request, kwargs)
+
+    def future(self, request, **kwargs):
+        _start(self._metrics, request)
+        start = self._clock()
+        future = self._callable.future(request, **kwargs)
+
+        def done(future):
+            error = None if future.cancelled() else future.exception()
+            _finish(self._metrics, request, self._clock() - start, error)
+
+        future.add_done_callback(done)
+        return future
+
+
+class _AsyncMeteredUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(
+        self, registry: MetricsRegistry, metrics: _MethodMetrics, callable_: Callable
+    ):
+        self._clock = registry._clock
+        self._metrics = metrics
+        self._callable = callable_
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(request, kwargs)
+
+    async def _invoke(self, request, kwargs):
+        _start(self._metrics, request)
+        start = self._clock()
+        try:
+            response = await self._callable(request, **kwargs)
+        except grpc.RpcError as exc:
+            _finish(self._metrics, request, self._clock() - start, exc)
+            raise
+        _finish(self._metrics, request, self._clock() - start)
+        return response
+
+
+class _MeteredChannelBase:
+    _multicallable_class = None  # type: type
+
+    def __init__(self, registry: MetricsRegistry, channel: Any):
+        super().__init__(channel)
+        self._registry = registry
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        metrics = self._registry._method(method)
+        if request_serializer is not None:
+            request_serializer = _measure_serializer(metrics, request_serializer)
+        if response_deserializer is not None:
+            response_deserializer = _measure_deserializer(
+                metrics, response_deserializer, _is_paged(response_deserializer)
+            )
+        return super().unary_unary(
+            method,
+            request_serializer=request_serializer,
+            response_deserializer=response_deserializer,
+            **kwargs
+        )
+
+    def _wrap_unary_unary(self, method, stub):
+        return self._multicallable_class(
+            self._registry, self._registry._method(method), stub
+        )
+
+
+def _measure_serializer(metrics: _MethodMetrics, serializer: Callable) -> Callable:
+    def serialize(message):
+        payload = serializer(message)
+        with metrics.lock:
+            metrics.request_bytes.record(len(payload))
+        return payload
+
+    return serialize
+
+
+def _is_paged(deserializer: Callable) -> bool:
+    # Whether the responses of a stub are pages, from the descriptor of the
+    # response type: either the one a passthrough deserializer is made for,
+    # or the message class of a ``deserialize`` or ``FromString`` method.
+    response_type = getattr(deserializer, "response_type", None)
+    if response_type is None:
+        response_type = getattr(deserializer, "__self__", None)
+    if isinstance(response_type, proto.message.MessageMeta):
+        response_type = response_type.pb()
+    descriptor = getattr(response_type, "DESCRIPTOR", None)
+    fields = getattr(descriptor, "fields_by_name", {})
+    return "next_page_token" in fields
+
+
+def _measure_deserializer(
+    metrics: _MethodMetrics, deserializer: Callable, paged: bool
+) -> Callable:
+    def deserialize(payload):
+        message = deserializer(payload)
+        with metrics.lock:
+            metrics.response_bytes.record(len(payload))
+            if paged:
+                metrics.pages += 1
+        return message
+
+    return deserialize
+
+
+class _MeteredChannel(_MeteredChannelBase, ForwardingChannel):
+    _multicallable_class = _MeteredUnaryUnaryMultiCallable
+
+
+class _AsyncMeteredChannel(_MeteredChannelBase, AsyncForwardingChannel):
+    _multicallable_class = _AsyncMeteredUnaryUnaryMultiCallable
+
+
+__all__ = (
+    "Histogram",
+    "InMemoryExporter",
+    "MetricsExporter",
+    "MetricsRegistry",
+)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Any, Callable, Type
+
+import proto  # type: ignore
+
+from .wire import read_string_field
+
+
+class RawResponse:
+    """A response left serialized by a transport in passthrough mode.
+
+    Only the ``next_page_token`` of the response is read, from its wire
+    format, so that pagers can request the following pages; ``data`` is
+    the response exactly as received, ready to be written out or decoded
+    later, possibly elsewhere.
+
+    The fields of the response are not available as attributes, so the
+    items of a pager cannot be iterated over in passthrough mode; only its
+    ``pages`` can.
+
+    Attributes:
+        data (bytes): The serialized response.
+        next_page_token (str): The token of the next page, or an empty
+            string if this is the last page or the response is not paged.
+    """
+
+    __slots__ = ("data", "next_page_token")
+
+    def __init__(self, data: bytes, next_page_token: str = ""):
+        self.data = data
+        self.next_page_token = next_page_token
+
+    def decode(self, response_type: Type[proto.Message]) -> proto.Message:
+        """Return the response deserialized as ``response_type``."""
+        return response_type.deserialize(self.data)
+
+    def __getattr__(self, name: str) -> Any:
+        # Called for the fields of the response, such as the ``results``
+        # a pager iterates over.
+        raise AttributeError(
+            "{!r} is not available from a serialized response; in passthrough "
+            "mode, iterate over the pages of a pager and decode() them".format(name)
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RawResponse):
+            return NotImplemented
+        return self.data == other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return "RawResponse(<{} bytes>, next_page_token={!r})".format(
+            len(self.data), self.next_page_token
+        )
+
+
+def passthrough_deserializer(
+    response_type: Type[proto.Message],
+) -> Callable[[bytes], RawResponse]:
+    """Return a response deserializer leaving the responses serialized.
+
+    Args:
+        response_type (Type[proto.Message]): The response message type,
+            whose ``next_page_token`` field, if any, is extracted.
+
+    Returns:
+        Callable[[bytes], RawResponse]: The deserializer. Its
+            ``response_type`` attribute is ``response_type``.
+    """
+    field = response_type.pb().DESCRIPTOR.fields_by_name.get("next_page_token")
+    number = field.number if field is not None else None
+
+    def deserialize(data: bytes) -> RawResponse:
+        if number is None:
+            return RawResponse(data)
+        return RawResponse(data, read_string_field(data, number))
+
+    deserialize.response_type = response_type
+    return deserialize
+
+
+__all__ = (
+    "RawResponse",
+    "passthrough_deserializer",
+)
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable
+
+from google.api_core import exceptions  # type: ignore
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .attempts import FailedAttempts
+from .forwarding import AsyncForwardingChannel
+from .forwarding import AsyncUnaryUnaryWrapper
+from .forwarding import ForwardingChannel
+
+# The status codes of the errors the generated retry settings retry on.
+_RETRYABLE_CODES = frozenset(
+    (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+)
+
+
+class RetryBudgetExhausted(exceptions.GoogleAPICallError):
+    """A retry was not sent because the retry budget had no tokens left.
+
+    The error of the previous attempt is available as ``errors[0]`` and as
+    the ``__cause__`` of the exception. It is not one of the retryable
+    exception types, so the call's ``Retry`` gives up instead of sleeping
+    and trying again.
+    """
+
+
+class RetryBudget:
+    """A token bucket bounding retries to a share of successful calls.
+
+    Every successful attempt deposits ``ratio`` tokens and the bucket
+    refills at ``min_retries_per_second`` on its own, so that a client
+    with little traffic can still retry; it holds at most ``max_tokens``.
+    Each retry takes a token. When the bucket is empty, the retry is not
+    sent and the call fails with :class:`RetryBudgetExhausted` chained to
+    the previous error, so that a degraded backend sees at most about
+    ``ratio`` extra calls per successful one instead of every caller
+    retrying until its deadline.
+
+    Retries are recognized as attempts re-sending the request object of an
+    attempt which failed with one of the ``retryable_codes``, which is what
+    ``google.api_core.retry.Retry`` does, so retry settings given per call
+    are budgeted too. First attempts are never held back, nor is a request
+    sent again by the caller after a non-retryable error.
+
+    A budget is passed to a gRPC or gRPC AsyncIO transport with its
+    ``retry_budget`` argument; sharing one between transports, or between
+    the transports of several clients, makes them draw from one bucket.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 100.0,
+        retryable_codes: Iterable[grpc.StatusCode] = _RETRYABLE_CODES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Instantiate the budget.
+
+        Args:
+            ratio (float): The tokens deposited by each successful attempt:
+                the share of successful traffic that may be retried.
+            min_retries_per_second (float): The rate at which the bucket
+                refills regardless of traffic.
+            max_tokens (float): The capacity of the bucket, which starts
+                full.
+            retryable_codes (Iterable[grpc.StatusCode]): The status codes
+                of the failed attempts whose next attempt is a retry;
+                ``UNAVAILABLE`` and ``DEADLINE_EXCEEDED`` by default, as in
+                the retry settings of the clients.
+            clock (Callable[[], float]): The time source.
+        """
+        if ratio < 0 or min_retries_per_second < 0:
+            raise ValueError("ratio and min_retries_per_second must not be negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self._ratio = ratio
+        self._min_retries_per_second = min_retries_per_second
+        self._max_tokens = max_tokens
+        self._retryable_codes = frozenset(retryable_codes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = max_tokens
+        self._updated = clock()
+        self._retries = collections.Counter()  # type: collections.Counter
+        self._denied = collections.Counter()  # type: collections.Counter
+        self._failed = FailedAttempts()
+
+    @property
+    def tokens(self) -> float:
+        """The number of retries currently allowed."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    @property
+    def denied(self) -> int:
+        """The number of retries denied so far, over every method."""
+        with self._lock:
+            return sum(self._denied.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the tokens left and the retries sent and denied per method."""
+        with self._lock:
+            self._refill()
+            return {
+                "tokens": self._tokens,
+                "retries": dict(self._retries),
+                "denied": dict(self._denied),
+            }
+
+    def wrap_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Return a channel whose unary retries draw from the budget."""
+        return _BudgetedChannel(self, channel)
+
+    def wrap_async_channel(self, channel: aio.Channel) -> aio.Channel:
+        """Return an AsyncIO channel whose unary retries draw from the budget."""
+        return _AsyncBudgetedChannel(self, channel)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._max_tokens,
+            self._tokens + (now - self._updated) * self._min_retries_per_second,
+        )
+        self._updated = now
+
+    def _start(self, method: str, request: Any) -> None:
+        with self._lock:
+            error = self._failed.pop(request)
+            if error is None:
+                return
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._retries[method] += 1
+                return
+            self._denied[method] += 1
+        cause = exceptions.from_grpc_error(error)
+        raise RetryBudgetExhausted(
+            "Retry budget exhausted: {}".format(cause.message), errors=(cause,)
+        ) from cause
+
+    def _finish(self, request: Any, error: Any = None) -> None:
+        with self._lock:
+            if error is None:
+                self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+                return
+            code = error.code() if callable(getattr(error, "code", None)) else None
+            if code in self._retryable_codes:
+                self._failed.add(request, error)
+
+
+class _BudgetedUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, budget: RetryBudget, method: str, callable_: Callable):
+        self._budget = budget
+        self._method = method
+        self._callable = callable_
+
+    def _invoke(self, fn, request, kwargs):
+        self._budget._start(self._method, request)
+        try:
+            response = fn(request, **kwargs)
+        except grpc.RpcError as exc:
+            self._budget._finish(request, exc)
+            raise
+        self._budget._finish(request)
+        return response
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(self._callable, request, kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._invoke(self._callable.with_call, request, kwargs)
+
+    def future(self, request, **kwargs):
+        self._budget._start(self._method, request)
+        future = self._callable.future(request, **kwargs)
+
+        def done(future):
+            error = None if future.cancelled() else future.exception()
+            self._budget._finish(request, error)
+
+        future.add_done_callback(done)
+        return future
+
+
+class _AsyncBudgetedUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(self, budget: RetryBudget, method: str, callable_: Callable):
+        self._budget = budget
+        self._method = method
+        self._callable = callable_
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(request, kwargs)
+
+    async def _invoke(self, request, kwargs):
+        self._budget._start(self._method, request)
+        try:
+            response = await self._callable(request, **kwargs)
+        except grpc.RpcError as exc:
+            self._budget._finish(request, exc)
+            raise
+        self._budget._finish(request)
+        return response
+
+
+class _BudgetedChannelBase:
+    _multicallable_class = None  # type: type
+
+    def __init__(self, budget: RetryBudget, channel: Any):
+        super().__init__(channel)
+        self._budget = budget
+
+    def _wrap_unary_unary(self, method, stub):
+        return self._multicallable_class(self._budget, method, stub)
+
+
+class _BudgetedChannel(_BudgetedChannelBase, ForwardingChannel):
+    _multicallable_class = _BudgetedUnaryUnaryMultiCallable
+
+
+class _AsyncBudgetedChannel(_BudgetedChannelBase, AsyncForwardingChannel):
+    _multicallable_class = _AsyncBudgetedUnaryUnaryMultiCallable
+
+
+__all__ = (
+    "RetryBudget",
+    "RetryBudgetExhausted",
+)
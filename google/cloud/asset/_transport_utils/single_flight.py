@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Optional, Sequence, Tuple
+
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import AsyncUnaryUnaryWrapper
+
+
+def request_key(
+    method: str, request: Any, metadata: Optional[Sequence[Tuple[str, str]]]
+) -> Tuple[str, bytes, Tuple[Tuple[str, str], ...]]:
+    """Return the key identifying a call for coalescing.
+
+    Two calls share a key when they target the same method with the same
+    serialized request bytes and the same metadata.
+    """
+    serialize = getattr(type(request), "serialize", None)
+    payload = serialize(request) if serialize else request.SerializeToString()
+    return method, payload, tuple(metadata or ())
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None  # type: Any
+        self.error = None  # type: Optional[BaseException]
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls into a single call.
+
+    The first caller for a key runs the call; callers that arrive with the
+    same key while it is in flight block until it finishes and receive the
+    same response, or the same exception. Responses are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``fn(*args, **kwargs)`` unless a call for ``key`` is in flight.
+
+        Args:
+            key (Hashable): The identity of the call.
+            fn (Callable): The function to run.
+
+        Returns:
+            Any: The result of the call for ``key``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def wrap(self, method: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a transport method so that identical calls are coalesced.
+
+        Args:
+            method (str): The name of the RPC.
+            fn (Callable): The wrapped method, called as
+                ``fn(request, retry=..., timeout=..., metadata=...)``.
+
+        Returns:
+            Callable: A callable with the same signature as ``fn``.
+        """
+
+        @functools.wraps(fn)
+        def coalesced(request, *args, **kwargs):
+            key = request_key(method, request, kwargs.get("metadata"))
+            return self.do(key, fn, request, *args, **kwargs)
+
+        return coalesced
+
+
+class _LeaderCancelled(Exception):
+    # Set on the shared future of a call whose leader was cancelled, so
+    # that its followers retry instead of failing.
+    pass
+
+
+class AsyncSingleFlight:
+    """Coalesces identical concurrent coroutine calls into a single call.
+
+    This is the asyncio counterpart of :class:`SingleFlight`; it must only
+    be used from a single event loop. If the caller running a call is
+    cancelled, the callers waiting for it are not: one of them runs the
+    call again for the others.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """Await ``fn(*args, **kwargs)`` unless a call for ``key`` is in flight.
+
+        Args:
+            key (Hashable): The identity of the call.
+            fn (Callable): The coroutine function to run.
+
+        Returns:
+            Any: The result of the call for ``key``.
+        """
+        future = self._calls.get(key)
+        while future is not None:
+            try:
+                # Shield the shared future so that a cancelled waiter does
+                # not cancel the call for everyone else.
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # The first waiter to resume finds no call in flight and
+                # runs it; the others wait for that one.
+                future = self._calls.get(key)
+
+        future = self._calls[key] = asyncio.get_event_loop().create_future()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved in case nobody else waits.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def wrap_stub(
+        self, method: str, stub: aio.UnaryUnaryMultiCallable
+    ) -> aio.UnaryUnaryMultiCallable:
+        """Wrap a gRPC AsyncIO stub so that identical calls are coalesced.
+
+        Args:
+            method (str): The name of the RPC.
+            stub (aio.UnaryUnaryMultiCallable): The stub to wrap.
+
+        Returns:
+            aio.UnaryUnaryMultiCallable: A stub with the same signature.
+        """
+        return _CoalescingUnaryUnaryMultiCallable(self, method, stub)
+
+
+class _CoalescingUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(
+        self, group: AsyncSingleFlight, method: str, stub: aio.UnaryUnaryMultiCallable
+    ):
+        self._group = group
+        self._method = method
+        self._stub = stub
+
+    def __call__(self, request, *, metadata=None, **kwargs):
+        key = request_key(self._method, request, metadata)
+        return self._group.do(key, self._invoke, request, metadata=metadata, **kwargs)
+
+    async def _invoke(self, request, **kwargs):
+        return await self._stub(request, **kwargs)
+
+
+__all__ = (
+    "AsyncSingleFlight",
+    "SingleFlight",
+    "request_key",
+)
@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import abc
+import contextlib
+import functools
+import itertools
+import threading
+import time
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional
+
+from google.api_core import operation_async  # type: ignore
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .forwarding import AsyncForwardingChannel
+from .forwarding import AsyncUnaryUnaryWrapper
+from .forwarding import ForwardingChannel
+
+try:
+    import contextvars
+except ImportError:  # pragma: NO COVER
+    # Python 3.6: keep the active span per thread. Spans opened in
+    # concurrent tasks of one event loop are then not told apart.
+    contextvars = None
+
+
+class _ThreadLocalSpan(threading.local):
+    # The subset of ``contextvars.ContextVar`` used for the active span.
+
+    value = None
+
+    def get(self) -> Optional["Span"]:
+        return self.value
+
+    def set(self, value: Optional["Span"]) -> Optional["Span"]:
+        token, self.value = self.value, value
+        return token
+
+    def reset(self, token: Optional["Span"]) -> None:
+        self.value = token
+
+
+if contextvars is not None:
+    _current_span = contextvars.ContextVar("asset_service_span", default=None)
+else:  # pragma: NO COVER
+    _current_span = _ThreadLocalSpan()
+
+
+class Span:
+    """A timed unit of work. This base class is the no-op span."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Mark the span as failed with ``exception``."""
+
+    def end(self) -> None:
+        """Finish the span."""
+
+
+_NOOP_SPAN = Span()
+
+
+def current_span() -> Optional[Span]:
+    """Return the span active in the current thread or task, if any."""
+    return _current_span.get()
+
+
+class Tracer:
+    """Creates spans. This base class is the no-op tracer.
+
+    Subclasses override :meth:`start_span` to plug in a tracing system.
+    The active span is kept in a :mod:`contextvars` variable, so spans
+    opened while awaiting the AsyncIO client are parented to the span of
+    the calling task. On Python 3.6, which lacks :mod:`contextvars`, it
+    is kept per thread instead.
+
+    A tracer is passed to a gRPC transport with its ``tracer`` argument.
+    The transport then opens a span around every unary call, pagers of
+    clients using the transport open spans around the fetch of every page
+    and the time the caller spends consuming it, and long-running
+    operations open a span around every poll.
+    """
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Span:
+        """Start a span. It becomes active only within :meth:`span`.
+
+        Args:
+            name (str): The name of the span.
+            parent (Optional[~.Span]): The parent span.
+            attributes (Optional[Dict[str, Any]]): The initial attributes.
+
+        Returns:
+            ~.Span: The started span; the caller must end it.
+        """
+        return _NOOP_SPAN
+
+    @contextlib.contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """Start a span as a child of the active span and activate it.
+
+        Exceptions raised within the block are recorded on the span.
+        """
+        span = self.start_span(name, parent=current_span(), attributes=attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def wrap_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Return a channel opening a span around every unary call."""
+        return _TracedChannel(self, channel)
+
+    def wrap_async_channel(self, channel: aio.Channel) -> aio.Channel:
+        """Return an AsyncIO channel opening a span around every unary call."""
+        return _AsyncTracedChannel(self, channel)
+
+
+class RecordedSpan(Span):
+    """A span recorded by a :class:`RecordingTracer`."""
+
+    def __init__(
+        self,
+        tracer: "RecordingTracer",
+        name: str,
+        parent: Optional[Span],
+        attributes: Optional[Dict[str, Any]],
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.span_id = next(tracer._ids)
+        if isinstance(parent, RecordedSpan):
+            self.parent_id = parent.span_id  # type: Optional[int]
+            self.trace_id = parent.trace_id
+        else:
+            self.parent_id = None
+            self.trace_id = self.span_id
+        self.attributes = dict(attributes or {})
+        self.exception = None  # type: Optional[BaseException]
+        self.start_time = tracer._clock()
+        self.end_time = None  # type: Optional[float]
+
+    @property
+    def duration(self) -> Optional[float]:
+        """The duration of the span in seconds, once it has ended."""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exception = exception
+
+    def end(self) -> None:
+        if self.end_time is None:
+            self.end_time = self._tracer._clock()
+            self._tracer._exporter.export(self)
+
+    def __repr__(self) -> str:
+        return "RecordedSpan(name={!r}, span_id={}, parent_id={})".format(
+            self.name, self.span_id, self.parent_id
+        )
+
+
+class SpanExporter(abc.ABC):
+    """Receives the spans of a :class:`RecordingTracer` as they end."""
+
+    @abc.abstractmethod
+    def export(self, span: RecordedSpan) -> None:
+        """Export a finished span."""
+        raise NotImplementedError()
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in memory, for tests and debugging."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans = []  # type: List[RecordedSpan]
+
+    def export(self, span: RecordedSpan) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List[RecordedSpan]:
+        """The finished spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Discard the finished spans."""
+        with self._lock:
+            self._spans = []
+
+
+class RecordingTracer(Tracer):
+    """A tracer handing its spans to a :class:`SpanExporter`."""
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """Instantiate the tracer.
+
+        Args:
+            exporter (~.SpanExporter): Receives every span as it ends.
+            clock (Callable[[], float]): The time source.
+        """
+        self._exporter = exporter
+        self._clock = clock
+        self._ids = itertools.count(1)
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Span:
+        return RecordedSpan(self, name, parent, attributes)
+
+
+def _rpc_attributes(method: str) -> Dict[str, Any]:
+    service, _, name = method.lstrip("/").rpartition("/")
+    return {"rpc.system": "grpc", "rpc.service": service, "rpc.method": name}
+
+
+def _set_status(span: Span, exc: BaseException) -> None:
+    code = getattr(exc, "code", None)
+    if callable(code) and code() is not None:
+        span.set_attribute("rpc.grpc.status_code", code().name)
+
+
+class _TracedUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, tracer: Tracer, method: str, callable_: Callable):
+        self._tracer = tracer
+        self._name = method.lstrip("/")
+        self._attributes = _rpc_attributes(method)
+        self._callable = callable_
+
+    def _invoke(self, fn, request, kwargs):
+        with self._tracer.span(self._name, self._attributes) as span:
+            try:
+                return fn(request, **kwargs)
+            except grpc.RpcError as exc:
+                _set_status(span, exc)
+                raise
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(self._callable, request, kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._invoke(self._callable.with_call, request, kwargs)
+
+    def future(self, request, **kwargs):
+        span = self._tracer.start_span(
+            self._name, parent=current_span(), attributes=self._attributes
+        )
+        future = self._callable.future(request, **kwargs)
+
+        def done(future):
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                _set_status(span, error)
+                span.record_exception(error)
+            span.end()
+
+        future.add_done_callback(done)
+        return future
+
+
+class _AsyncTracedUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(self, tracer: Tracer, method: str, callable_: Callable):
+        self._tracer = tracer
+        self._name = method.lstrip("/")
+        self._attributes = _rpc_attributes(method)
+        self._callable = callable_
+
+    def __call__(self, request, **kwargs):
+        return self._invoke(request, kwargs)
+
+    async def _invoke(self, request, kwargs):
+        with self._tracer.span(self._name, self._attributes) as span:
+            try:
+                return await self._callable(request, **kwargs)
+            except grpc.RpcError as exc:
+                _set_status(span, exc)
+                raise
+
+
+class _TracedChannelBase:
+    _multicallable_class = None  # type: type
+
+    def __init__(self, tracer: Tracer, channel: Any):
+        super().__init__(channel)
+        self._tracer = tracer
+
+    def _wrap_unary_unary(self, method, stub):
+        return self._multicallable_class(self._tracer, method, stub)
+
+
+class _TracedChannel(_TracedChannelBase, ForwardingChannel):
+    _multicallable_class = _TracedUnaryUnaryMultiCallable
+
+
+class _AsyncTracedChannel(_TracedChannelBase, AsyncForwardingChannel):
+    _multicallable_class = _AsyncTracedUnaryUnaryMultiCallable
+
+
+def trace_pages(tracer: Tracer, name: str, pages: Iterable) -> Iterable:
+    """Open spans around fetching and consuming each page of ``pages``.
+
+    The first page is already fetched when a pager is created, so only the
+    pages following one with a ``next_page_token`` get a
+    ``"<name>.page.fetch"`` span; it is active while the page is fetched,
+    so the RPC spans of the fetch are its children.
+    Every page gets a ``"<name>.page.consume"`` span covering the time the
+    caller holds it.
+
+    Args:
+        tracer (~.Tracer): The tracer.
+        name (str): The RPC name, such as ``"SearchAllResources"``.
+        pages (Iterable): The pages to trace.
+
+    Returns:
+        Iterable: The same pages.
+    """
+    pages = iter(pages)
+    page = None
+    for index in itertools.count():
+        if getattr(page, "next_page_token", None):
+            with tracer.span(name + ".page.fetch", {"page.index": index}):
+                page = next(pages, None)
+        else:
+            page = next(pages, None)
+        if page is None:
+            return
+        span = tracer.start_span(
+            name + ".page.consume",
+            parent=current_span(),
+            attributes={"page.index": index},
+        )
+        try:
+            yield page
+        finally:
+            span.end()
+
+
+async def trace_async_pages(
+    tracer: Tracer, name: str, pages: AsyncIterable
+) -> AsyncIterable:
+    """Open spans around fetching and consuming each page of async ``pages``.
+
+    See :func:`trace_pages`.
+    """
+    pages = pages.__aiter__()
+    page = None
+    for index in itertools.count():
+        try:
+            if getattr(page, "next_page_token", None):
+                with tracer.span(name + ".page.fetch", {"page.index": index}):
+                    page = await pages.__anext__()
+            else:
+                page = await pages.__anext__()
+        except StopAsyncIteration:
+            return
+        span = tracer.start_span(
+            name + ".page.consume",
+            parent=current_span(),
+            attributes={"page.index": index},
+        )
+        try:
+            yield page
+        finally:
+            span.end()
+
+
+def trace_operation(tracer: Optional[Tracer], operation: Any) -> Any:
+    """Open a span around every poll of a long-running operation.
+
+    Args:
+        tracer (Optional[~.Tracer]): The tracer; without one ``operation``
+            is returned unchanged.
+        operation (Union[~.operation.Operation, ~.operation_async.AsyncOperation]):
+            The operation to trace.
+
+    Returns:
+        Union[~.operation.Operation, ~.operation_async.AsyncOperation]: The
+            same operation.
+    """
+    if tracer is None:
+        return operation
+    # Operations poll through their ``_refresh`` callable; wrapping it
+    # covers ``done()``, ``result()`` and ``metadata`` alike.
+    refresh = operation._refresh
+    attributes = {"operation.name": operation.operation.name}
+
+    def finish(span, polled):
+        span.set_attribute("operation.done", polled.done)
+
+    if isinstance(operation, operation_async.AsyncOperation):
+
+        @functools.wraps(refresh)
+        async def traced_async_refresh(*args, **kwargs):
+            with tracer.span("operation.poll", attributes) as span:
+                polled = await refresh(*args, **kwargs)
+                finish(span, polled)
+                return polled
+
+        operation._refresh = traced_async_refresh
+    else:
+
+        @functools.wraps(refresh)
+        def traced_refresh(*args, **kwargs):
+            with tracer.span("operation.poll", attributes) as span:
+                polled = refresh(*args, **kwargs)
+                finish(span, polled)
+                return polled
+
+        operation._refresh = traced_refresh
+    return operation
+
+
+__all__ = (
+    "InMemorySpanExporter",
+    "RecordedSpan",
+    "RecordingTracer",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "current_span",
+    "trace_async_pages",
+    "trace_operation",
+    "trace_pages",
+)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Tuple
+
+# Wire types of the protocol buffers encoding.
+VARINT = 0
+FIXED64 = 1
+LENGTH_DELIMITED = 2
+FIXED32 = 5
+
+
+def read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """Read a varint.
+
+    Args:
+        data (bytes): The serialized message.
+        position (int): The offset of the varint in ``data``.
+
+    Returns:
+        Tuple[int, int]: The value and the offset following the varint.
+
+    Raises:
+        IndexError: If ``data`` ends within the varint.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def skip_field(data: bytes, position: int, wire_type: int) -> int:
+    """Skip the value of a field.
+
+    Args:
+        data (bytes): The serialized message.
+        position (int): The offset of the value, following its tag.
+        wire_type (int): The wire type of the field, from its tag.
+
+    Returns:
+        int: The offset following the value, which may lie past the end
+        of a truncated ``data``.
+
+    Raises:
+        ValueError: If ``wire_type`` is not supported.
+        IndexError: If ``data`` ends within a varint.
+    """
+    if wire_type == VARINT:
+        return read_varint(data, position)[1]
+    if wire_type == FIXED64:
+        return position + 8
+    if wire_type == FIXED32:
+        return position + 4
+    if wire_type == LENGTH_DELIMITED:
+        length, position = read_varint(data, position)
+        return position + length
+    raise ValueError("Unsupported wire type {}".format(wire_type))
+
+
+def read_string_field(data: bytes, number: int) -> str:
+    """Return a top-level string field of a serialized message.
+
+    The other fields are skipped without being decoded.
+
+    Args:
+        data (bytes): The serialized message.
+        number (int): The number of the string field.
+
+    Returns:
+        str: The value of the field, or an empty string if it is not set.
+
+    Raises:
+        ValueError: If ``data`` is not a valid serialized message.
+    """
+    value = b""
+    position = 0
+    end = len(data)
+    try:
+        while position < end:
+            tag, position = read_varint(data, position)
+            if tag == (number << 3 | LENGTH_DELIMITED):
+                length, position = read_varint(data, position)
+                # The last occurrence of a field wins.
+                value = data[position : position + length]
+                position += length
+            else:
+                position = skip_field(data, position, tag & 0x7)
+    except IndexError:
+        raise ValueError("Truncated message")
+    if position > end:
+        raise ValueError("Truncated message")
+    return value.decode("utf-8")
+
+
+__all__ = (
+    "FIXED32",
+    "FIXED64",
+    "LENGTH_DELIMITED",
+    "VARINT",
+    "read_string_field",
+    "read_varint",
+    "skip_field",
+)
@@ -18,7 +18,7 @@
 from collections import OrderedDict
 import functools
 import re
-from typing import Dict, Sequence, Tuple, Type, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Sequence, Tuple, Type, Union
 import pkg_resources
 
 import google.api_core.client_options as ClientOptions  # type: ignore
@@ -30,7 +30,11 @@ from google.oauth2 import service_account  # type: ignore
 
 from google.api_core import operation
 from google.api_core import operation_async
+from google.cloud.asset._client_utils import bulk
+from google.cloud.asset._client_utils.deadline import Deadline
+from google.cloud.asset._transport_utils import tracing
 from google.cloud.asset_v1.services.asset_service import pagers
+from google.cloud.asset_v1.services.asset_service.response_cache import ResponseCache
 from google.cloud.asset_v1.types import asset_service
 from google.cloud.asset_v1.types import assets
 from google.type import expr_pb2 as expr  # type: ignore
@@ -63,6 +67,7 @@ class AssetServiceAsyncClient:
         credentials: credentials.Credentials = None,
         transport: Union[str, AssetServiceTransport] = "grpc_asyncio",
         client_options: ClientOptions = None,
+        response_cache: ResponseCache = None,
     ) -> None:
         """Instantiate the asset service client.
 
@@ -88,6 +93,9 @@ class AssetServiceAsyncClient:
                 (2) The ``client_cert_source`` property is used to provide client
                 SSL credentials for mutual TLS transport. If not provided, the
                 default SSL credentials will be used if present.
+            response_cache (Optional[~.ResponseCache]): A cache consulted by
+                ``search_all_resources`` and ``search_all_iam_policies``
+                before calling the API. Caching is disabled if not provided.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -95,7 +103,10 @@ class AssetServiceAsyncClient:
         """
 
         self._client = AssetServiceClient(
-            credentials=credentials, transport=transport, client_options=client_options,
+            credentials=credentials,
+            transport=transport,
+            client_options=client_options,
+            response_cache=response_cache,
         )
 
     async def export_assets(
@@ -105,6 +116,7 @@ class AssetServiceAsyncClient:
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> operation_async.AsyncOperation:
         r"""Exports assets with time and resource types to a given Cloud
         Storage location/BigQuery table. For Cloud Storage location
@@ -129,6 +141,9 @@ class AssetServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request, the polls of the operation
+                and waiting on its ``result()``.
 
         Returns:
             ~.operation_async.AsyncOperation:
@@ -161,6 +176,11 @@ class AssetServiceAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -171,6 +191,9 @@ class AssetServiceAsyncClient:
             asset_service.ExportAssetsResponse,
             metadata_type=asset_service.ExportAssetsRequest,
         )
+        response = tracing.trace_operation(self._client._transport._tracer, response)
+        if deadline is not None:
+            response = deadline.bind_operation(response)
 
         # Done; return the response.
         return response
@@ -650,6 +673,7 @@ class AssetServiceAsyncClient:
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllResourcesAsyncPager:
         r"""Searches all the resources within the given
         accessible scope (e.g., a project, a folder or an
@@ -729,6 +753,10 @@ class AssetServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllResourcesAsyncPager:
@@ -775,12 +803,25 @@ class AssetServiceAsyncClient:
             client_info=_client_info,
         )
 
+        # Serve repeated pages from the response cache, if one is configured.
+        if self._client._response_cache is not None:
+            rpc = self._client._response_cache.wrap_async(
+                rpc,
+                asset_service.SearchAllResourcesResponse,
+                passthrough=self._client._transport._passthrough,
+            )
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -788,6 +829,8 @@ class AssetServiceAsyncClient:
         # an `__aiter__` convenience method.
         response = pagers.SearchAllResourcesAsyncPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._client._transport._tracer,
+            deadline=deadline,
         )
 
         # Done; return the response.
@@ -802,6 +845,7 @@ class AssetServiceAsyncClient:
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllIamPoliciesAsyncPager:
         r"""Searches all the IAM policies within the given
         accessible scope (e.g., a project, a folder or an
@@ -859,6 +903,10 @@ class AssetServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllIamPoliciesAsyncPager:
@@ -903,12 +951,25 @@ class AssetServiceAsyncClient:
             client_info=_client_info,
         )
 
+        # Serve repeated pages from the response cache, if one is configured.
+        if self._client._response_cache is not None:
+            rpc = self._client._response_cache.wrap_async(
+                rpc,
+                asset_service.SearchAllIamPoliciesResponse,
+                passthrough=self._client._transport._passthrough,
+            )
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -916,11 +977,47 @@ class AssetServiceAsyncClient:
         # an `__aiter__` convenience method.
         response = pagers.SearchAllIamPoliciesAsyncPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._client._transport._tracer,
+            deadline=deadline,
         )
 
         # Done; return the response.
         return response
 
+    def gather(
+        self, method: str, requests: Iterable[Any], **kwargs
+    ) -> AsyncIterator[bulk.BulkResult]:
+        r"""Call one method for many requests, with bounded concurrency.
+
+        Requests are taken lazily, so that a generator of any number of
+        them can be given, and failures are reported per request:
+
+        .. code-block:: python
+
+            requests = ({"name": "projects/p/feeds/{}".format(i)} for i in range(100000))
+            async for result in client.gather("get_feed", requests):
+                if not result.ok:
+                    print(result.index, result.error)
+
+        Args:
+            method (str): The name of the method of this client to call,
+                such as ``"get_feed"``. Paged methods only fetch the first
+                page of each request.
+            requests (Iterable[Any]): The request objects, or dicts, of
+                the calls.
+            kwargs: The ``concurrency``, ``ordered``, ``retry``,
+                ``timeout``, ``metadata`` and ``deadline`` options of
+                :func:`~google.cloud.asset._client_utils.bulk.gather_method`.
+
+        Returns:
+            AsyncIterator[~.BulkResult]: The result of every request sent,
+            holding the response or the error of the call.
+
+        Raises:
+            ValueError: If ``method`` is not a method of this client.
+        """
+        return bulk.gather_method(self, method, requests, **kwargs)
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
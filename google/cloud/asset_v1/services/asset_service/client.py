@@ -32,7 +32,12 @@ from google.oauth2 import service_account  # type: ignore
 
 from google.api_core import operation
 from google.api_core import operation_async
+from google.cloud.asset._client_utils.deadline import Deadline
+from google.cloud.asset._client_utils.executor import ClientExecutor
+from google.cloud.asset._client_utils.executor import future_method
+from google.cloud.asset._transport_utils import tracing
 from google.cloud.asset_v1.services.asset_service import pagers
+from google.cloud.asset_v1.services.asset_service.response_cache import ResponseCache
 from google.cloud.asset_v1.types import asset_service
 from google.cloud.asset_v1.types import assets
 from google.type import expr_pb2 as expr  # type: ignore
@@ -147,6 +152,8 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         credentials: credentials.Credentials = None,
         transport: Union[str, AssetServiceTransport] = None,
         client_options: ClientOptions = None,
+        response_cache: ResponseCache = None,
+        executor: ClientExecutor = None,
     ) -> None:
         """Instantiate the asset service client.
 
@@ -172,6 +179,12 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 (2) The ``client_cert_source`` property is used to provide client
                 SSL credentials for mutual TLS transport. If not provided, the
                 default SSL credentials will be used if present.
+            response_cache (Optional[~.ResponseCache]): A cache consulted by
+                ``search_all_resources`` and ``search_all_iam_policies``
+                before calling the API. Caching is disabled if not provided.
+            executor (Optional[~.ClientExecutor]): The executor running
+                the calls of the ``*_future`` methods. A default executor,
+                shared by the clients given none, is used if not provided.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -231,6 +244,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 quota_project_id=client_options.quota_project_id,
             )
 
+        self._response_cache = response_cache
+        self._executor = executor
+
     def export_assets(
         self,
         request: asset_service.ExportAssetsRequest = None,
@@ -238,6 +254,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> operation.Operation:
         r"""Exports assets with time and resource types to a given Cloud
         Storage location/BigQuery table. For Cloud Storage location
@@ -262,6 +279,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request, the polls of the operation
+                and waiting on its ``result()``.
 
         Returns:
             ~.operation.Operation:
@@ -295,6 +315,11 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -305,6 +330,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             asset_service.ExportAssetsResponse,
             metadata_type=asset_service.ExportAssetsRequest,
         )
+        response = tracing.trace_operation(self._transport._tracer, response)
+        if deadline is not None:
+            response = deadline.bind_operation(response)
 
         # Done; return the response.
         return response
@@ -763,6 +791,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllResourcesPager:
         r"""Searches all the resources within the given
         accessible scope (e.g., a project, a folder or an
@@ -842,6 +871,10 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllResourcesPager:
@@ -882,12 +915,25 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.search_all_resources]
 
+        # Serve repeated pages from the response cache, if one is configured.
+        if self._response_cache is not None:
+            rpc = self._response_cache.wrap(
+                rpc,
+                asset_service.SearchAllResourcesResponse,
+                passthrough=self._transport._passthrough,
+            )
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -895,6 +941,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         # an `__iter__` convenience method.
         response = pagers.SearchAllResourcesPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._transport._tracer,
+            deadline=deadline,
+            executor=self._executor,
         )
 
         # Done; return the response.
@@ -909,6 +958,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllIamPoliciesPager:
         r"""Searches all the IAM policies within the given
         accessible scope (e.g., a project, a folder or an
@@ -966,6 +1016,10 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllIamPoliciesPager:
@@ -1004,12 +1058,25 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.search_all_iam_policies]
 
+        # Serve repeated pages from the response cache, if one is configured.
+        if self._response_cache is not None:
+            rpc = self._response_cache.wrap(
+                rpc,
+                asset_service.SearchAllIamPoliciesResponse,
+                passthrough=self._transport._passthrough,
+            )
+
         # Certain fields should be provided within the metadata header;
         # add these here.
         metadata = tuple(metadata) + (
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -1017,11 +1084,24 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         # an `__iter__` convenience method.
         response = pagers.SearchAllIamPoliciesPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._transport._tracer,
+            deadline=deadline,
+            executor=self._executor,
         )
 
         # Done; return the response.
         return response
 
+    export_assets_future = future_method("export_assets", "operation")
+    batch_get_assets_history_future = future_method("batch_get_assets_history")
+    create_feed_future = future_method("create_feed")
+    get_feed_future = future_method("get_feed")
+    list_feeds_future = future_method("list_feeds")
+    update_feed_future = future_method("update_feed")
+    delete_feed_future = future_method("delete_feed")
+    search_all_resources_future = future_method("search_all_resources", "pager")
+    search_all_iam_policies_future = future_method("search_all_iam_policies", "pager")
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
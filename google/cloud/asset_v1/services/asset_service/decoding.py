@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+import collections.abc
+from concurrent import futures
+import multiprocessing
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Type, Union
+
+import proto  # type: ignore
+
+from google.protobuf import json_format  # type: ignore
+from google.protobuf import message  # type: ignore
+
+from google.cloud.asset._transport_utils.passthrough import (
+    RawResponse,
+)
+
+# The repeated field holding the items of a response, by response type.
+_ITEMS = {
+    "google.cloud.asset.v1.SearchAllResourcesResponse": "results",
+    "google.cloud.asset.v1.SearchAllIamPoliciesResponse": "results",
+    "google.cloud.asset.v1p1beta1.SearchAllResourcesResponse": "results",
+    "google.cloud.asset.v1p1beta1.SearchAllIamPoliciesResponse": "results",
+    "google.cloud.asset.v1p4beta1.AnalyzeIamPolicyResponse": (
+        "main_analysis.analysis_results"
+    ),
+    "google.cloud.asset.v1p5beta1.ListAssetsResponse": "assets",
+}
+
+
+def _to_python(value: Any) -> Any:
+    if isinstance(value, message.Message):
+        return json_format.MessageToDict(value, preserving_proto_field_name=True)
+    if isinstance(value, (str, bytes, bool, int, float)):
+        return value
+    if isinstance(value, collections.abc.Mapping):
+        return {key: _to_python(item) for key, item in value.items()}
+    return [_to_python(item) for item in value]
+
+
+def _get(value: Any, path: Sequence[str]) -> Any:
+    for name in path:
+        value = getattr(value, name)
+    return value
+
+
+def _resolve(descriptor: Any, path: str) -> Any:
+    # Check that ``path`` names a field, and return its descriptor.
+    field = None
+    for name in path.split("."):
+        if descriptor is None or name not in descriptor.fields_by_name:
+            raise ValueError("Unknown field: {!r}".format(path))
+        field = descriptor.fields_by_name[name]
+        descriptor = field.message_type
+    return field
+
+
+def project(item: message.Message, fields: Sequence[str]) -> Dict[str, Any]:
+    """Return the given fields of a protobuf message as plain Python values.
+
+    Args:
+        item (google.protobuf.message.Message): The raw protobuf message,
+            such as a ``ResourceSearchResult``.
+        fields (Sequence[str]): The names of the fields, dotted for nested
+            fields, such as ``"iam_binding.role"``.
+
+    Returns:
+        Dict[str, Any]: The value of every field, by name. Messages are
+        converted as by :func:`google.protobuf.json_format.MessageToDict`
+        with their proto field names, repeated fields to lists and maps to
+        dicts.
+    """
+    return {field: _to_python(_get(item, field.split("."))) for field in fields}
+
+
+def _decode_page(
+    response_type: Type[proto.Message],
+    items: str,
+    fields: Sequence[str],
+    predicate: Callable[[message.Message], bool],
+    data: bytes,
+) -> List[Dict[str, Any]]:
+    # Runs in the worker processes.
+    response = response_type.pb().FromString(data)
+    return [
+        project(item, fields)
+        for item in _get(response, items.split("."))
+        if predicate is None or predicate(item)
+    ]
+
+
+class DecodingPipeline:
+    """Decode raw response pages in a pool of processes.
+
+    Decoding large responses is bound by the CPU and holds the GIL, so a
+    process decoding its own pages uses one core at most. Used with a
+    transport in passthrough mode, whose pagers yield the pages as
+    received, the pipeline sends every page to a worker process, which
+    decodes it, drops the items rejected by ``predicate`` and returns the
+    projected ``fields`` of the others as plain Python values; the next
+    pages are fetched meanwhile.
+
+    .. code-block:: python
+
+        client = AssetServiceClient(
+            transport=AssetServiceGrpcTransport(passthrough=True)
+        )
+        pager = client.search_all_resources(scope=scope, page_size=500)
+        with DecodingPipeline() as pipeline:
+            for items in pipeline.decode(
+                pager.pages,
+                asset_service.SearchAllResourcesResponse,
+                fields=("name", "location", "labels"),
+            ):
+                for item in items:
+                    print(item["name"])
+
+    Workers are started with the ``"spawn"`` method by default, as forking
+    a process using gRPC is not supported; the values the pipeline sends
+    to them, including ``predicate``, must be picklable.
+    """
+
+    def __init__(
+        self,
+        executor: futures.ProcessPoolExecutor = None,
+        *,
+        max_workers: int = None,
+        max_pending: int = None
+    ):
+        """Instantiate the pipeline.
+
+        Args:
+            executor (Optional[concurrent.futures.ProcessPoolExecutor]): The
+                pool decoding the pages. A pool of ``max_workers`` processes
+                is created, and shut down with the pipeline, if not
+                provided.
+            max_workers (Optional[int]): The number of worker processes of
+                the pool created; the number of CPUs if None.
+            max_pending (Optional[int]): The maximum number of pages being
+                decoded or waiting to be yielded; twice ``max_workers``, or
+                twice the number of CPUs, if None.
+        """
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self._executor = executor
+        self._max_pending = max_pending or 2 * (max_workers or os.cpu_count() or 1)
+
+    def __enter__(self) -> "DecodingPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
+
+    def decode(
+        self,
+        pages: Iterable[Union[RawResponse, bytes]],
+        response_type: Type[proto.Message],
+        fields: Sequence[str],
+        *,
+        items: str = None,
+        predicate: Callable[[message.Message], bool] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Decode pages in the pool, yielding the projected items in order.
+
+        Args:
+            pages (Iterable[Union[~.RawResponse, bytes]]): The serialized
+                pages, such as the ``pages`` of a pager of a transport in
+                passthrough mode. They are consumed as the pages decoded
+                are yielded, at most ``max_pending`` pages ahead.
+            response_type (Type[proto.Message]): The type of the pages,
+                such as ``SearchAllResourcesResponse``.
+            fields (Sequence[str]): The fields of every item to return,
+                dotted for nested fields.
+            items (Optional[str]): The repeated field of the response
+                holding the items, dotted if nested. Known for the
+                responses of ``search_all_resources``,
+                ``search_all_iam_policies``, v1p5beta1 ``list_assets`` and
+                v1p4beta1 ``analyze_iam_policy``, and required otherwise.
+            predicate (Optional[Callable[[google.protobuf.message.Message], bool]]):
+                A picklable function, called in the workers with every raw
+                protobuf item, selecting the items to return.
+
+        Yields:
+            List[Dict[str, Any]]: The projected items of every page, in
+            the order of ``pages``.
+
+        Raises:
+            ValueError: If ``items`` or one of ``fields`` is not a field.
+        """
+        descriptor = response_type.pb().DESCRIPTOR
+        if items is None:
+            if descriptor.full_name not in _ITEMS:
+                raise ValueError(
+                    "The items field of {} must be given".format(descriptor.full_name)
+                )
+            items = _ITEMS[descriptor.full_name]
+        field = _resolve(descriptor, items)
+        if field.message_type is None or field.label != field.LABEL_REPEATED:
+            raise ValueError("Not a repeated message field: {!r}".format(items))
+        fields = tuple(fields)
+        for path in fields:
+            _resolve(field.message_type, path)
+
+        pending = collections.deque()  # type: collections.deque
+        try:
+            for page in pages:
+                data = page.data if isinstance(page, RawResponse) else page
+                pending.append(
+                    self._executor.submit(
+                        _decode_page, response_type, items, fields, predicate, data
+                    )
+                )
+                if len(pending) >= self._max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the pool down, if the pipeline created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+
+__all__ = (
+    "DecodingPipeline",
+    "project",
+)
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+import hashlib
+import heapq
+import math
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+import proto  # type: ignore
+
+from google.cloud.asset._transport_utils.passthrough import RawResponse
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+
+# The raw protobuf response types whose pages hold each result type, to
+# read the pages a transport left serialized in passthrough mode.
+_RESPONSE_TYPES = {
+    assets.ResourceSearchResult: asset_service.SearchAllResourcesResponse.pb(),
+    assets.IamPolicySearchResult: asset_service.SearchAllIamPoliciesResponse.pb(),
+}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch estimating the number of distinct strings.
+
+    The sketch uses ``2 ** precision`` one-byte registers; the standard
+    error of the estimate is about ``1.04 / sqrt(2 ** precision)``, or
+    0.8% at the default precision of 14 (16 KiB of registers).
+    """
+
+    def __init__(self, precision: int = 14):
+        """Instantiate the sketch.
+
+        Args:
+            precision (int): The number of hash bits used to pick a
+                register, between 4 and 18.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, value: str) -> None:
+        """Add a value to the sketch."""
+        hashed = _hash64(value)
+        index = hashed >> (64 - self._precision)
+        rest = hashed & ((1 << (64 - self._precision)) - 1)
+        rank = (64 - self._precision) - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Fold another sketch of the same precision into this one."""
+        if other._precision != self._precision:
+            raise ValueError("Cannot merge sketches of different precision")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct values added."""
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small range correction: fall back to linear counting.
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """A Space-Saving summary of the most frequent values of a stream.
+
+    At most ``capacity`` counters are kept. A value seen for the first
+    time when the summary is full replaces the least frequent value and
+    inherits its count, so reported counts may overestimate the true
+    count by at most the count that was inherited; any value whose true
+    frequency exceeds ``total / capacity`` is guaranteed to be reported.
+
+    The least frequent value is found with a min-heap of counters, so
+    counting a value takes logarithmic time in ``capacity``.
+    """
+
+    def __init__(self, capacity: int):
+        """Instantiate the summary.
+
+        Args:
+            capacity (int): The maximum number of values tracked.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._counts = {}
+        self._errors = {}
+        # (count, value) pairs; a pair is stale once the count of its
+        # value has changed, and is dropped when it reaches the top.
+        self._heap = []  # type: List[Tuple[int, str]]
+
+    def add(self, value: str, count: int = 1) -> None:
+        """Count ``count`` more occurrences of ``value``."""
+        counts = self._counts
+        if value in counts:
+            counts[value] += count
+        elif len(counts) < self._capacity:
+            counts[value] = count
+            self._errors[value] = 0
+        else:
+            heap = self._heap
+            while counts.get(heap[0][1]) != heap[0][0]:
+                heapq.heappop(heap)
+            floor, evicted = heapq.heappop(heap)
+            del counts[evicted]
+            del self._errors[evicted]
+            counts[value] = floor + count
+            self._errors[value] = floor
+        heapq.heappush(self._heap, (counts[value], value))
+        if len(self._heap) > 2 * self._capacity:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._heap = [(count, value) for value, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Fold another summary into this one.
+
+        Counts of common values are summed and the ``capacity`` largest
+        counters are kept, so values that are frequent in the combined
+        stream are retained.
+        """
+        counts = collections.Counter(self._counts)
+        counts.update(other._counts)
+        errors = collections.Counter(self._errors)
+        errors.update(other._errors)
+        top = counts.most_common(self._capacity)
+        self._counts = dict(top)
+        self._errors = {value: errors[value] for value, _ in top}
+        self._rebuild()
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return the ``n`` most frequent values and their counts."""
+        return collections.Counter(self._counts).most_common(n)
+
+    def error(self, value: str) -> int:
+        """Return the maximum overestimate of the count of ``value``."""
+        return self._errors.get(value, 0)
+
+
+def _check_facet(descriptor: Any, facet: str) -> None:
+    name = "labels" if facet.startswith("labels.") and facet != "labels." else facet
+    field = descriptor.fields_by_name.get(name)
+    if field is None:
+        raise ValueError("Unknown field: {!r}".format(facet))
+    if name == "labels" and field.message_type is not None:
+        entry = field.message_type
+        if entry.GetOptions().map_entry and all(
+            item.type == item.TYPE_STRING for item in entry.fields
+        ):
+            return
+    if facet == name and field.type == field.TYPE_STRING:
+        return
+    raise ValueError("Not a string field: {!r}".format(facet))
+
+
+class FacetAggregator:
+    """Streaming group-by counts over search results.
+
+    The aggregator consumes pages of a ``search_all_resources`` or
+    ``search_all_iam_policies`` pager as they arrive and reads the
+    underlying protobuf messages directly, so no proto-plus result object
+    is ever created. A facet is one of:
+
+    -  A scalar field name, such as ``asset_type``, ``location`` or
+       ``project``; results are counted by the field value.
+    -  A repeated string field, such as ``network_tags``; each element is
+       counted.
+    -  ``labels``; each label is counted as ``"key=value"``.
+    -  ``labels.KEY``; results are counted by the value of label ``KEY``.
+
+    Counts are exact by default. If ``heavy_hitters`` is set, each facet
+    instead keeps a :class:`SpaceSaving` summary of that many values, so
+    memory stays bounded however many distinct values appear. Fields
+    listed in ``distinct`` get a :class:`HyperLogLog` distinct count.
+
+    Facets and ``distinct`` fields are checked against ``result_type``,
+    ``ResourceSearchResult`` by default; pass ``IamPolicySearchResult``
+    to aggregate ``search_all_iam_policies`` pages.
+
+    Aggregators built with the same arguments over disjoint shards of a
+    search can be combined with :meth:`merge`.
+
+    .. code-block:: python
+
+        aggregator = FacetAggregator(["asset_type", "labels.env"])
+        aggregator.consume_pages(client.search_all_resources(scope=scope).pages)
+        aggregator.counts("asset_type")
+    """
+
+    def __init__(
+        self,
+        facets: Sequence[str],
+        *,
+        heavy_hitters: Optional[int] = None,
+        distinct: Sequence[str] = (),
+        precision: int = 14,
+        result_type: Type[proto.Message] = assets.ResourceSearchResult,
+    ):
+        """Instantiate the aggregator.
+
+        Args:
+            facets (Sequence[str]): The facets to count.
+            heavy_hitters (Optional[int]): If set, the number of values
+                tracked approximately per facet; otherwise counts are exact.
+            distinct (Sequence[str]): Fields whose distinct values are
+                estimated, such as ``name`` or ``project``.
+            precision (int): The :class:`HyperLogLog` precision.
+            result_type (Type[proto.Message]): The type of the results.
+
+        Raises:
+            ValueError: If a facet or a ``distinct`` field is not a string,
+                repeated string or ``labels`` field of ``result_type``.
+        """
+        descriptor = result_type.pb().DESCRIPTOR
+        for facet in (*facets, *distinct):
+            _check_facet(descriptor, facet)
+        self._result_type = result_type
+        self._facets = tuple(facets)
+        self._heavy_hitters = heavy_hitters
+        self.total = 0
+        self._counters = {
+            facet: (
+                SpaceSaving(heavy_hitters) if heavy_hitters else collections.Counter()
+            )
+            for facet in self._facets
+        }
+        self._distinct = {field: HyperLogLog(precision) for field in distinct}
+
+    def consume(self, page: Any) -> None:
+        """Count the results of one response page.
+
+        Args:
+            page: A search response, such as an element of ``pager.pages``,
+                or a :class:`~.RawResponse` of a transport in passthrough
+                mode, which is parsed straight into the protobuf message.
+
+        Raises:
+            TypeError: If ``page`` is a ``RawResponse`` and ``result_type``
+                is not the result type of a search.
+        """
+        if not isinstance(page, RawResponse):
+            self.consume_results(type(page).pb(page).results)
+            return
+        response_type = _RESPONSE_TYPES.get(self._result_type)
+        if response_type is None:
+            raise TypeError(
+                "Cannot read serialized pages of {} results".format(
+                    self._result_type.__name__
+                )
+            )
+        self.consume_results(response_type.FromString(page.data).results)
+
+    def consume_pages(self, pages: Iterable[Any]) -> None:
+        """Count the results of every page of ``pages``."""
+        for page in pages:
+            self.consume(page)
+
+    async def consume_async_pages(self, pages: Any) -> None:
+        """Count the results of every page of an async pager's ``pages``."""
+        async for page in pages:
+            self.consume(page)
+
+    def consume_results(self, results: Iterable[Any]) -> None:
+        """Count an iterable of raw protobuf result messages."""
+        counters = self._counters
+        distinct = self._distinct
+        exact = not self._heavy_hitters
+        for result in results:
+            self.total += 1
+            for facet, counter in counters.items():
+                if exact:
+                    counter.update(self._values(result, facet))
+                    continue
+                for value in self._values(result, facet):
+                    counter.add(value)
+            for field, sketch in distinct.items():
+                for value in self._values(result, field):
+                    sketch.add(value)
+
+    def merge(self, other: "FacetAggregator") -> None:
+        """Fold the counts of an aggregator over another shard into this one."""
+        if other._facets != self._facets or set(other._distinct) != set(self._distinct):
+            raise ValueError("Cannot merge aggregators with different facets")
+        if other._heavy_hitters != self._heavy_hitters:
+            raise ValueError("Cannot merge aggregators with different heavy_hitters")
+        self.total += other.total
+        for facet, counter in self._counters.items():
+            if self._heavy_hitters:
+                counter.merge(other._counters[facet])
+            else:
+                counter.update(other._counters[facet])
+        for field, sketch in self._distinct.items():
+            sketch.merge(other._distinct[field])
+
+    def counts(self, facet: str, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return the ``n`` most common values of ``facet`` and their counts."""
+        return self._counters[facet].most_common(n)
+
+    def distinct(self, field: str) -> int:
+        """Return the estimated number of distinct values of ``field``."""
+        return self._distinct[field].estimate()
+
+    @staticmethod
+    def _values(result: Any, facet: str) -> Iterator[str]:
+        if facet.startswith("labels."):
+            value = result.labels.get(facet[len("labels.") :])
+            if value is not None:
+                yield value
+        elif facet == "labels":
+            for key, value in result.labels.items():
+                yield "{}={}".format(key, value)
+        else:
+            value = getattr(result, facet)
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+
+__all__ = (
+    "FacetAggregator",
+    "HyperLogLog",
+    "SpaceSaving",
+)
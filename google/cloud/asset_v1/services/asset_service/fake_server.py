@@ -0,0 +1,711 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+import os
+import random
+import threading
+import time
+from concurrent import futures
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.cloud.asset_v1.services.asset_service.transports import (
+    AssetServiceGrpcAsyncIOTransport,
+    AssetServiceGrpcTransport,
+)
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+from google.iam.v1 import policy_pb2 as policy  # type: ignore
+from google.longrunning import operations_pb2 as operations  # type: ignore
+from google.protobuf import any_pb2 as any_  # type: ignore
+from google.protobuf import empty_pb2 as empty  # type: ignore
+from google.protobuf import struct_pb2 as struct  # type: ignore
+from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
+
+_SERVICE = "google.cloud.asset.v1.AssetService"
+_OPERATIONS_SERVICE = "google.longrunning.Operations"
+
+# Search methods serve at most this many results per page.
+_MAX_PAGE_SIZE = 500
+_DEFAULT_PAGE_SIZE = 100
+
+DEFAULT_ASSET_TYPES = (
+    "compute.googleapis.com/Instance",
+    "compute.googleapis.com/Disk",
+    "storage.googleapis.com/Bucket",
+    "iam.googleapis.com/ServiceAccount",
+)
+
+
+class FakeDataset:
+    """A deterministic synthetic inventory served by :class:`FakeAssetServiceServer`.
+
+    Assets are spread round-robin over ``asset_types`` in each of
+    ``projects`` projects. Projects alternate between two folders of a
+    single organization, and every fifth asset carries an IAM policy.
+    """
+
+    def __init__(
+        self,
+        *,
+        projects: int = 3,
+        assets_per_project: int = 100,
+        asset_types: Sequence[str] = DEFAULT_ASSET_TYPES,
+        organization: str = "organizations/123456",
+        history_versions: int = 3,
+        update_time: float = 1577836800.0
+    ):
+        """Instantiate the dataset.
+
+        Args:
+            projects (int): The number of projects.
+            assets_per_project (int): The number of assets in each project.
+            asset_types (Sequence[str]): The asset types to generate.
+            organization (str): The organization owning every project.
+            history_versions (int): The number of versions per asset
+                returned by ``batch_get_assets_history``.
+            update_time (float): The last update time of every asset, in
+                seconds since the epoch.
+        """
+        self.organization = organization
+        self.history_versions = history_versions
+        self._update_time = update_time
+        self.assets = []  # type: List[assets.Asset]
+        self._scopes = []  # type: List[Set[str]]
+        for p in range(projects):
+            project_id = "project-{}".format(p)
+            number = "projects/{}".format(100000000000 + p)
+            folder = "folders/{}".format(1000 + p % 2)
+            for i in range(assets_per_project):
+                asset_type = asset_types[i % len(asset_types)]
+                self.assets.append(
+                    self._asset(project_id, number, folder, asset_type, i)
+                )
+                self._scopes.append(
+                    {"projects/" + project_id, number, folder, organization}
+                )
+        self._by_name = {asset.name: asset for asset in self.assets}
+
+    def _asset(self, project_id, number, folder, asset_type, index):
+        service, _, kind = asset_type.partition("/")
+        name = "//{}/projects/{}/{}s/{}-{}".format(
+            service, project_id, kind.lower(), kind.lower(), index
+        )
+        data = struct.Struct()
+        data.update(
+            {
+                "name": "{}-{}".format(kind.lower(), index),
+                "status": "RUNNING" if index % 3 else "STOPPED",
+                "labels": {"env": "prod" if index % 2 else "dev"},
+            }
+        )
+        asset = assets.Asset(
+            update_time=timestamp.Timestamp(seconds=int(self._update_time)),
+            name=name,
+            asset_type=asset_type,
+            resource=assets.Resource(
+                version="v1",
+                discovery_name=kind,
+                parent="//cloudresourcemanager.googleapis.com/" + number,
+                data=data,
+                location="us-central1",
+            ),
+            ancestors=[number, folder, self.organization],
+        )
+        if index % 5 == 0:
+            asset.iam_policy = policy.Policy(
+                bindings=[
+                    policy.Binding(
+                        role="roles/viewer",
+                        members=["user:user-{}@example.com".format(index)],
+                    )
+                ]
+            )
+        return asset
+
+    def get(self, name: str) -> Optional[assets.Asset]:
+        """Return the asset named ``name``, if any."""
+        return self._by_name.get(name)
+
+    def in_scope(self, scope: str, asset_types: Sequence[str] = ()):
+        """Yield the assets within ``scope`` of the given types, if any."""
+        for asset, scopes in zip(self.assets, self._scopes):
+            if scope in scopes and (not asset_types or asset.asset_type in asset_types):
+                yield asset
+
+    def history(
+        self, name: str, window: Optional[assets.TimeWindow]
+    ) -> List[assets.TemporalAsset]:
+        """Return the versions of an asset, one hour apart, ending at ``window``."""
+        asset = self.get(name)
+        if asset is None:
+            return []
+        end = self._update_time
+        if window is not None and window.end_time:
+            end = window.end_time.timestamp()
+        history = []
+        for version in range(self.history_versions):
+            start = end - 3600 * (self.history_versions - version)
+            history.append(
+                assets.TemporalAsset(
+                    window=assets.TimeWindow(
+                        start_time=timestamp.Timestamp(seconds=int(start)),
+                        end_time=timestamp.Timestamp(seconds=int(start + 3600)),
+                    ),
+                    asset=asset,
+                )
+            )
+        return history
+
+
+def _search_result(asset: assets.Asset) -> assets.ResourceSearchResult:
+    data = asset.resource.data
+    attributes = struct.Struct()
+    attributes.update({"status": data["status"]})
+    return assets.ResourceSearchResult(
+        name=asset.name,
+        asset_type=asset.asset_type,
+        project=asset.ancestors[0],
+        display_name=data["name"],
+        location=asset.resource.location,
+        labels={key: value for key, value in data["labels"].items()},
+        additional_attributes=attributes,
+    )
+
+
+def _matches(query: str, fields: Mapping[str, str]) -> bool:
+    # A small subset of the search syntax: ``field:value`` terms match
+    # when the field contains the value, other terms when any field does,
+    # all case-insensitively.
+    for term in query.lower().split():
+        field, _, value = term.rpartition(":")
+        if field:
+            candidates = [fields.get(field, "")]
+        else:
+            candidates = list(fields.values())
+        if not any(value in candidate.lower() for candidate in candidates):
+            return False
+    return True
+
+
+class Fault:
+    """Latency, errors and throttling injected into calls to the fake server."""
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        qps_limit: Optional[float] = None
+    ):
+        """Instantiate the fault.
+
+        Args:
+            latency (float): The delay added to every call, in seconds.
+            jitter (float): The maximum random delay added on top of
+                ``latency``, in seconds.
+            error_rate (float): The fraction of calls, between 0 and 1,
+                failing with ``error_code``.
+            error_code (grpc.StatusCode): The status of injected errors.
+            qps_limit (Optional[float]): If set, calls beyond this rate
+                fail with ``RESOURCE_EXHAUSTED``.
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be in [0, 1]")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.qps_limit = qps_limit
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, clock: Callable[[], float]):
+        self._rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def take(self) -> bool:
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+def _pack(message) -> any_.Any:
+    packed = any_.Any()
+    packed.Pack(type(message).pb(message))
+    return packed
+
+
+class FakeAssetServiceServer:
+    """An in-process gRPC server implementing the v1 ``AssetService``.
+
+    Search methods page through a :class:`FakeDataset`; ``export_assets``
+    starts a long-running operation writing newline-delimited JSON assets
+    below ``export_dir``, polled through ``google.longrunning.Operations``;
+    feeds live in memory. :class:`Fault` instances inject latency, errors
+    and throttling, for every method or per method.
+
+    The server listens without TLS. Clients reach it through its
+    :attr:`address` as the ``api_endpoint`` client option together with
+    :class:`~.transports.InsecureCredentials`, which ask for a plaintext
+    channel, or through a transport from :meth:`transport` or
+    :meth:`async_transport`, or a channel from :meth:`channel` or
+    :meth:`async_channel`::
+
+        with FakeAssetServiceServer(FakeDataset(assets_per_project=1000)) as server:
+            client = AssetServiceClient(
+                credentials=transports.InsecureCredentials(),
+                client_options={"api_endpoint": server.address},
+            )
+            results = list(client.search_all_resources(scope="projects/project-0"))
+    """
+
+    def __init__(
+        self,
+        dataset: FakeDataset = None,
+        *,
+        fault: Fault = None,
+        method_faults: Mapping[str, Fault] = None,
+        export_dir: str = None,
+        export_delay: float = 0.0,
+        max_workers: int = 16,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Instantiate the server.
+
+        Args:
+            dataset (Optional[~.FakeDataset]): The inventory to serve; a
+                default :class:`FakeDataset` if not provided.
+            fault (Optional[~.Fault]): The fault injected into every method.
+            method_faults (Mapping[str, ~.Fault]): Faults of individual
+                methods, keyed by method name such as
+                ``"search_all_resources"``, replacing ``fault``.
+            export_dir (Optional[str]): The directory standing in for Cloud
+                Storage: ``gs://bucket/object`` is written to
+                ``<export_dir>/bucket/object``. Defaults to the current
+                directory.
+            export_delay (float): How long export operations run, in
+                seconds.
+            max_workers (int): The number of server threads.
+            seed (int): The seed of injected errors and jitter.
+            clock (Callable[[], float]): The time source.
+        """
+        self.dataset = dataset or FakeDataset()
+        self._search_results = {
+            asset.name: _search_result(asset) for asset in self.dataset.assets
+        }
+        self._fault = fault or Fault()
+        self._method_faults = dict(method_faults or {})
+        self._export_dir = export_dir or os.getcwd()
+        self._export_delay = export_delay
+        self._max_workers = max_workers
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets = {}  # type: Dict[str, _TokenBucket]
+        self._feeds = {}  # type: Dict[str, asset_service.Feed]
+        self._operations = {}  # type: Dict[str, operations.Operation]
+        self._server = None  # type: Optional[grpc.Server]
+        self._address = None  # type: Optional[str]
+        self.calls = collections.Counter()  # type: collections.Counter
+        self.rejected = collections.Counter()  # type: collections.Counter
+
+    @property
+    def address(self) -> str:
+        """The ``host:port`` the server listens on."""
+        if self._address is None:
+            raise RuntimeError("The server is not running.")
+        return self._address
+
+    def start(self) -> "FakeAssetServiceServer":
+        """Start serving on a free local port."""
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        )
+        self._server.add_generic_rpc_handlers(self._handlers())
+        port = self._server.add_insecure_port("localhost:0")
+        self._server.start()
+        self._address = "localhost:{}".format(port)
+        return self
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        """Stop serving, waiting up to ``grace`` seconds for pending calls."""
+        if self._server is None:
+            return
+        self._server.stop(grace).wait()
+        self._server = self._address = None
+
+    def channel(self) -> grpc.Channel:
+        """Return a new channel to the server."""
+        return grpc.insecure_channel(self.address)
+
+    def async_channel(self) -> aio.Channel:
+        """Return a new AsyncIO channel to the server."""
+        return aio.insecure_channel(self.address)
+
+    def transport(self, **kwargs: Any) -> AssetServiceGrpcTransport:
+        """Return a new gRPC transport connected to the server.
+
+        Args:
+            kwargs: The other arguments of the transport, such as
+                ``passthrough``.
+        """
+        return AssetServiceGrpcTransport(channel=self.channel(), **kwargs)
+
+    def async_transport(self, **kwargs: Any) -> AssetServiceGrpcAsyncIOTransport:
+        """Return a new gRPC AsyncIO transport connected to the server.
+
+        Args:
+            kwargs: The other arguments of the transport, such as
+                ``passthrough``.
+        """
+        return AssetServiceGrpcAsyncIOTransport(channel=self.async_channel(), **kwargs)
+
+    def set_fault(self, method: Optional[str], fault: Optional[Fault]) -> None:
+        """Replace the fault of ``method``, or of every method if None."""
+        with self._lock:
+            if method is None:
+                self._fault = fault or Fault()
+            elif fault is None:
+                self._method_faults.pop(method, None)
+            else:
+                self._method_faults[method] = fault
+            self._buckets.pop(method, None)
+
+    def __enter__(self) -> "FakeAssetServiceServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def _handlers(self):
+        def handler(method, fn, request_type, response_serializer):
+            return grpc.unary_unary_rpc_method_handler(
+                self._faulty(method, fn),
+                request_deserializer=request_type.deserialize,
+                response_serializer=response_serializer,
+            )
+
+        def serialize(message):
+            return type(message).serialize(message)
+
+        def serialize_pb(message):
+            return message.SerializeToString()
+
+        rpcs = {
+            "ExportAssets": handler(
+                "export_assets",
+                self._export_assets,
+                asset_service.ExportAssetsRequest,
+                serialize_pb,
+            ),
+            "BatchGetAssetsHistory": handler(
+                "batch_get_assets_history",
+                self._batch_get_assets_history,
+                asset_service.BatchGetAssetsHistoryRequest,
+                serialize,
+            ),
+            "CreateFeed": handler(
+                "create_feed",
+                self._create_feed,
+                asset_service.CreateFeedRequest,
+                serialize,
+            ),
+            "GetFeed": handler(
+                "get_feed", self._get_feed, asset_service.GetFeedRequest, serialize
+            ),
+            "ListFeeds": handler(
+                "list_feeds",
+                self._list_feeds,
+                asset_service.ListFeedsRequest,
+                serialize,
+            ),
+            "UpdateFeed": handler(
+                "update_feed",
+                self._update_feed,
+                asset_service.UpdateFeedRequest,
+                serialize,
+            ),
+            "DeleteFeed": handler(
+                "delete_feed",
+                self._delete_feed,
+                asset_service.DeleteFeedRequest,
+                serialize_pb,
+            ),
+            "SearchAllResources": handler(
+                "search_all_resources",
+                self._search_all_resources,
+                asset_service.SearchAllResourcesRequest,
+                serialize,
+            ),
+            "SearchAllIamPolicies": handler(
+                "search_all_iam_policies",
+                self._search_all_iam_policies,
+                asset_service.SearchAllIamPoliciesRequest,
+                serialize,
+            ),
+        }
+        get_operation = grpc.unary_unary_rpc_method_handler(
+            self._faulty("get_operation", self._get_operation),
+            request_deserializer=operations.GetOperationRequest.FromString,
+            response_serializer=serialize_pb,
+        )
+        return (
+            grpc.method_handlers_generic_handler(_SERVICE, rpcs),
+            grpc.method_handlers_generic_handler(
+                _OPERATIONS_SERVICE, {"GetOperation": get_operation}
+            ),
+        )
+
+    def _faulty(self, method: str, fn: Callable) -> Callable:
+        def behavior(request, context):
+            with self._lock:
+                self.calls[method] += 1
+                fault = self._method_faults.get(method, self._fault)
+                throttled = False
+                if fault.qps_limit is not None:
+                    bucket = self._buckets.get(method)
+                    if bucket is None:
+                        bucket = self._buckets[method] = _TokenBucket(
+                            fault.qps_limit, self._clock
+                        )
+                    throttled = not bucket.take()
+                failed = self._random.random() < fault.error_rate
+                delay = fault.latency + self._random.random() * fault.jitter
+                if throttled or failed:
+                    self.rejected[method] += 1
+            if delay:
+                time.sleep(delay)
+            if throttled:
+                context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Quota exceeded.")
+            if failed:
+                context.abort(fault.error_code, "Injected error.")
+            return fn(request, context)
+
+        return behavior
+
+    def _page(self, items: List, request, context) -> Tuple[List, str]:
+        if request.page_size < 0:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Negative page_size.")
+        size = min(request.page_size or _DEFAULT_PAGE_SIZE, _MAX_PAGE_SIZE)
+        try:
+            offset = int(request.page_token or 0)
+        except ValueError:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid page_token.")
+        end = offset + size
+        return items[offset:end], str(end) if end < len(items) else ""
+
+    def _search_all_resources(self, request, context):
+        results = [
+            self._search_results[asset.name]
+            for asset in self.dataset.in_scope(request.scope, request.asset_types)
+        ]
+        if request.query:
+            results = [
+                result
+                for result in results
+                if _matches(
+                    request.query,
+                    {
+                        "name": result.name,
+                        "displayname": result.display_name,
+                        "location": result.location,
+                        "assettype": result.asset_type,
+                        "labels": " ".join(
+                            "{}={}".format(k, v) for k, v in result.labels.items()
+                        ),
+                    },
+                )
+            ]
+        if request.order_by:
+            field = request.order_by.split()[0]
+            results.sort(
+                key=lambda result: getattr(result, field, ""),
+                reverse=request.order_by.lower().endswith(" desc"),
+            )
+        page, token = self._page(results, request, context)
+        return asset_service.SearchAllResourcesResponse(
+            results=page, next_page_token=token
+        )
+
+    def _search_all_iam_policies(self, request, context):
+        results = [
+            assets.IamPolicySearchResult(
+                resource=asset.name, project=asset.ancestors[0], policy=asset.iam_policy
+            )
+            for asset in self.dataset.in_scope(request.scope)
+            if asset.iam_policy.bindings
+        ]
+        if request.query:
+            results = [
+                result
+                for result in results
+                if _matches(
+                    request.query,
+                    {
+                        "resource": result.resource,
+                        "policy": " ".join(
+                            " ".join([binding.role] + list(binding.members))
+                            for binding in result.policy.bindings
+                        ),
+                    },
+                )
+            ]
+        page, token = self._page(results, request, context)
+        return asset_service.SearchAllIamPoliciesResponse(
+            results=page, next_page_token=token
+        )
+
+    def _batch_get_assets_history(self, request, context):
+        if request.content_type == asset_service.ContentType.CONTENT_TYPE_UNSPECIFIED:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Missing content_type.")
+        if len(request.asset_names) > 100:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "At most 100 asset_names allowed."
+            )
+        window = request.read_time_window if "read_time_window" in request else None
+        return asset_service.BatchGetAssetsHistoryResponse(
+            assets=[
+                temporal
+                for name in request.asset_names
+                for temporal in self.dataset.history(name, window)
+            ]
+        )
+
+    def _export_assets(self, request, context):
+        destination = request.output_config.gcs_destination
+        if not (destination.uri or destination.uri_prefix):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "The fake server only exports to gcs_destination.",
+            )
+        with self._lock:
+            name = "{}/operations/ExportAssets/{}".format(
+                request.parent, len(self._operations)
+            )
+            operation = self._operations[name] = operations.Operation(
+                name=name, metadata=_pack(request)
+            )
+        if self._export_delay:
+            timer = threading.Timer(self._export_delay, self._export, (name, request))
+            timer.daemon = True
+            timer.start()
+            return operation
+        self._export(name, request)
+        return self._operations[name]
+
+    def _export(self, name: str, request: asset_service.ExportAssetsRequest) -> None:
+        destination = request.output_config.gcs_destination
+        uri = destination.uri or destination.uri_prefix.rstrip("/") + "/0"
+        path = os.path.join(self._export_dir, *uri[len("gs://") :].split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as output:
+            for asset in self.dataset.in_scope(request.parent, request.asset_types):
+                output.write(assets.Asset.to_json(asset, indent=None) + "\n")
+        response = asset_service.ExportAssetsResponse(
+            read_time=timestamp.Timestamp(seconds=int(time.time())),
+            output_config=request.output_config,
+        )
+        with self._lock:
+            operation = self._operations[name]
+            self._operations[name] = operations.Operation(
+                name=name,
+                metadata=operation.metadata,
+                done=True,
+                response=_pack(response),
+            )
+
+    def _get_operation(self, request, context):
+        with self._lock:
+            operation = self._operations.get(request.name)
+        if operation is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Operation not found.")
+        return operation
+
+    def _create_feed(self, request, context):
+        if not request.feed_id:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Missing feed_id.")
+        feed = asset_service.Feed(request.feed)
+        feed.name = "{}/feeds/{}".format(request.parent, request.feed_id)
+        with self._lock:
+            if feed.name in self._feeds:
+                context.abort(grpc.StatusCode.ALREADY_EXISTS, "Feed already exists.")
+            self._feeds[feed.name] = feed
+        return feed
+
+    def _get_feed(self, request, context):
+        with self._lock:
+            feed = self._feeds.get(request.name)
+        if feed is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Feed not found.")
+        return feed
+
+    def _list_feeds(self, request, context):
+        prefix = request.parent + "/feeds/"
+        with self._lock:
+            feeds = [
+                feed for name, feed in self._feeds.items() if name.startswith(prefix)
+            ]
+        return asset_service.ListFeedsResponse(feeds=feeds)
+
+    def _update_feed(self, request, context):
+        if not request.update_mask.paths:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Missing update_mask.")
+        with self._lock:
+            feed = self._feeds.get(request.feed.name)
+            if feed is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, "Feed not found.")
+            updated = asset_service.Feed(feed)
+            for path in request.update_mask.paths:
+                if path not in asset_service.Feed.meta.fields or path == "name":
+                    context.abort(
+                        grpc.StatusCode.INVALID_ARGUMENT,
+                        "Invalid update_mask path {!r}.".format(path),
+                    )
+                setattr(updated, path, getattr(request.feed, path))
+            self._feeds[feed.name] = updated
+        return updated
+
+    def _delete_feed(self, request, context):
+        with self._lock:
+            if self._feeds.pop(request.name, None) is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, "Feed not found.")
+        return empty.Empty()
+
+
+__all__ = (
+    "DEFAULT_ASSET_TYPES",
+    "FakeAssetServiceServer",
+    "FakeDataset",
+    "Fault",
+)
@@ -0,0 +1,446 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import abc
+import keyword
+import operator
+import threading
+from types import ModuleType
+from typing import Any, Dict, List, Tuple, Type, Union
+
+import proto  # type: ignore
+from proto import datetime_helpers  # type: ignore
+
+from google.protobuf import message  # type: ignore
+from google.protobuf import struct_pb2 as struct  # type: ignore
+from google.protobuf import descriptor_pool  # type: ignore
+from google.protobuf import message_factory  # type: ignore
+
+from google.cloud.asset_v1.services.asset_service.structs import _to_python
+from google.cloud.asset_v1.services.asset_service.structs import struct_to_dict
+
+_lock = threading.RLock()
+_mirrors = {}  # type: Dict[type, Type[Mirror]]
+
+
+def _write_struct(target: struct.Struct, value: Dict[str, Any]) -> None:
+    target.SetInParent()
+    target.update(value)
+
+
+def _write_list(target: struct.ListValue, value: List[Any]) -> None:
+    target.SetInParent()
+    target.extend(value)
+
+
+def _write_value(target: struct.Value, value: Any) -> None:
+    wrapper = struct.Struct()
+    wrapper.update({"value": value})
+    target.CopyFrom(wrapper.fields["value"])
+
+
+def _write_timestamp(target: message.Message, value: Any) -> None:
+    if isinstance(value, datetime_helpers.DatetimeWithNanoseconds):
+        target.CopyFrom(value.timestamp_pb())
+    else:
+        target.FromDatetime(value)
+
+
+def _write_duration(target: message.Message, value: Any) -> None:
+    target.FromTimedelta(value)
+
+
+# Well-known types held as the Python values proto-plus marshals them to,
+# with the functions reading them from and writing them to protobuf.
+_WELL_KNOWN = {
+    "google.protobuf.Struct": (struct_to_dict, _write_struct),
+    "google.protobuf.ListValue": (
+        lambda value: [_to_python(item) for item in value.values],
+        _write_list,
+    ),
+    "google.protobuf.Value": (_to_python, _write_value),
+    "google.protobuf.Timestamp": (
+        datetime_helpers.DatetimeWithNanoseconds.from_timestamp_pb,
+        _write_timestamp,
+    ),
+    "google.protobuf.Duration": (lambda value: value.ToTimedelta(), _write_duration),
+}
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _message_class(descriptor: Any) -> type:
+    # The raw protobuf class of a message descriptor; proto-plus does not
+    # register those of its messages in the default symbol database.
+    get_message_class = getattr(message_factory, "GetMessageClass", None)
+    if get_message_class is not None:
+        return get_message_class(descriptor)
+    factory = message_factory.MessageFactory(descriptor.file.pool)
+    return factory.GetPrototype(descriptor)
+
+
+def _rebuild(message_type: Union[type, str], values: Tuple[Any, ...]) -> "Mirror":
+    # Raw protobuf types are pickled by full name, as nested ones cannot
+    # be pickled by reference.
+    if isinstance(message_type, str):
+        message_type = _message_class(
+            descriptor_pool.Default().FindMessageTypeByName(message_type)
+        )
+    cls = mirror_type(message_type)
+    return cls(**dict(zip(cls.__slots__, values)))
+
+
+class Mirror(abc.ABC):
+    """The base class of the mirrors generated by :func:`mirror_type`.
+
+    Attributes:
+        full_name (str): The full name of the mirrored protobuf message.
+    """
+
+    __slots__ = ()
+
+    full_name = ""  # type: str
+    _message_type = None  # type: type
+    _pb_type = None  # type: type
+    _values = None
+
+    @classmethod
+    @abc.abstractmethod
+    def from_pb(cls, pb: message.Message) -> "Mirror":
+        """Build a mirror from a raw protobuf message."""
+
+    @classmethod
+    def from_message(cls, value: Union[proto.Message, message.Message]) -> "Mirror":
+        """Build a mirror from a proto-plus or a raw protobuf message."""
+        if isinstance(value, proto.Message):
+            value = type(value).pb(value)
+        return cls.from_pb(value)
+
+    @abc.abstractmethod
+    def _write(self, pb: message.Message) -> None:
+        """Write the fields of the mirror to a raw protobuf message."""
+
+    def to_pb(self) -> message.Message:
+        """Return the mirror as a raw protobuf message."""
+        pb = self._pb_type()
+        self._write(pb)
+        return pb
+
+    def to_message(self) -> Union[proto.Message, message.Message]:
+        """Return the mirror as the message type it was generated from."""
+        pb = self.to_pb()
+        if issubclass(self._message_type, proto.Message):
+            return self._message_type.wrap(pb)
+        return pb
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(tuple(_freeze(value) for value in self._values()))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __reduce__(self):
+        message_type = self._message_type
+        if not issubclass(message_type, proto.Message):
+            message_type = self.full_name
+        return (_rebuild, (message_type, self._values()))
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={!r}".format(name, value)
+                for name, value in zip(self.__slots__, self._values())
+            ),
+        )
+
+
+def _pb_type(message_type: type) -> type:
+    if issubclass(message_type, proto.Message):
+        return message_type.pb()
+    return message_type
+
+
+def _field_types(message_type: type) -> Dict[str, type]:
+    # The message type of every message field, the value type for maps,
+    # as proto-plus types where the message is defined with proto-plus.
+    descriptor = _pb_type(message_type).DESCRIPTOR
+    types = {}
+    for field in descriptor.fields:
+        if field.message_type is None:
+            continue
+        entry = field.message_type.GetOptions().map_entry
+        if issubclass(message_type, proto.Message):
+            field_type = message_type.meta.fields[field.name].message
+            if entry:
+                field_type = field_type.meta.fields["value"].message
+        else:
+            value = field.message_type
+            if entry:
+                value = value.fields_by_name["value"].message_type
+            field_type = value and _message_class(value)
+        if field_type is not None:
+            types[field.name] = field_type
+    return types
+
+
+def _attribute(name: str) -> str:
+    # The attribute of a field, renamed like proto-plus does when the name
+    # is a Python keyword, such as ``from``.
+    return name + "_" if keyword.iskeyword(name) else name
+
+
+def _generate(cls: Type[Mirror], message_type: type) -> None:
+    # Generate the __init__, from_pb and _write methods of ``cls``.
+    descriptor = _pb_type(message_type).DESCRIPTOR
+    types = _field_types(message_type)
+    namespace = {"_new": object.__new__, "_set": object.__setattr__}
+    params = []
+    init = []
+    read = ["    self = _new(cls)"]
+    write = []
+    oneofs = set()
+    for field in descriptor.fields:
+        name = field.name
+        attr = _attribute(name)
+        # The field of the message, read or written.
+        value = "getattr(pb, {!r})".format(name) if attr != name else "pb." + name
+        repeated = field.label == field.LABEL_REPEATED
+        entry = (
+            repeated
+            and field.message_type is not None
+            and field.message_type.GetOptions().map_entry
+        )
+        oneof = field.containing_oneof
+        if oneof is not None and oneof.name not in oneofs:
+            oneofs.add(oneof.name)
+            read.insert(0, "    _{0} = pb.WhichOneof({0!r})".format(oneof.name))
+        converter = None
+        if name in types:
+            full_name = _pb_type(types[name]).DESCRIPTOR.full_name
+            if full_name in _WELL_KNOWN:
+                namespace["_r_" + attr], namespace["_w_" + attr] = _WELL_KNOWN[
+                    full_name
+                ]
+                converter = "_r_" + attr
+                writer = "_w_{0}({{}}, {{}})".format(attr)
+            else:
+                namespace["_m_" + attr] = mirror_type(types[name])
+                converter = "_m_{}.from_pb".format(attr)
+                writer = "{1}._write({0})"
+
+        set_ = "    _set(self, {!r}, {{}})".format(attr)
+        if entry:
+            params.append("{}=None".format(attr))
+            init.append(
+                "    _set(self, {0!r}, {{}} if {0} is None else {0})".format(attr)
+            )
+            if converter:
+                read.append(
+                    set_.format(
+                        "{{key: {}(item) for key, item in {}.items()}}".format(
+                            converter, value
+                        )
+                    )
+                )
+                write.append("    for key, item in self.{}.items():".format(attr))
+                write.append(
+                    "        " + writer.format("{}[key]".format(value), "item")
+                )
+            else:
+                read.append(set_.format("dict({})".format(value)))
+                write.append("    {}.update(self.{})".format(value, attr))
+            continue
+
+        if repeated:
+            params.append("{}=()".format(attr))
+            init.append("    _set(self, {0!r}, {0})".format(attr))
+            if converter:
+                read.append(
+                    set_.format(
+                        "tuple([{}(item) for item in {}])".format(converter, value)
+                    )
+                )
+                write.append("    for item in self.{}:".format(attr))
+                write.append("        " + writer.format(value + ".add()", "item"))
+            else:
+                read.append(set_.format("tuple({})".format(value)))
+                write.append("    {}.extend(self.{})".format(value, attr))
+            continue
+
+        if converter or oneof is not None:
+            params.append("{}=None".format(attr))
+        else:
+            params.append("{}={!r}".format(attr, field.default_value))
+        init.append("    _set(self, {0!r}, {0})".format(attr))
+        if oneof is not None:
+            test = "_{} == {!r}".format(oneof.name, name)
+        else:
+            test = "pb.HasField({!r})".format(name)
+        if converter:
+            read.append(
+                set_.format("{}({}) if {} else None".format(converter, value, test))
+            )
+            write.append("    if self.{} is not None:".format(attr))
+            write.append("        " + writer.format(value, "self." + attr))
+            continue
+
+        if oneof is not None:
+            read.append(set_.format("{} if {} else None".format(value, test)))
+            write.append("    if self.{} is not None:".format(attr))
+        else:
+            read.append(set_.format(value))
+            write.append("    if self.{}:".format(attr))
+        if attr != name:
+            write.append("        setattr(pb, {!r}, self.{})".format(name, attr))
+        else:
+            write.append("        pb.{0} = self.{0}".format(name))
+
+    names = [_attribute(field.name) for field in descriptor.fields]
+    source = [
+        "def __init__(self{}):".format(", *, " + ", ".join(params) if params else ""),
+        *(init or ["    pass"]),
+        "def from_pb(cls, pb):",
+        *read,
+        "    return self",
+        "def _write(self, pb):",
+        "    pb.SetInParent()",
+        *write,
+    ]
+    exec("\n".join(source), namespace)
+    cls.__init__ = namespace["__init__"]
+    cls.from_pb = classmethod(namespace["from_pb"])
+    cls._write = namespace["_write"]
+    # The methods are generated once the class exists, so that messages
+    # nesting themselves find it; it is no longer abstract.
+    cls.__abstractmethods__ = frozenset()
+    if len(names) > 1:
+        get = operator.attrgetter(*names)
+        cls._values = lambda self: get(self)
+    else:
+        cls._values = lambda self: tuple(getattr(self, name) for name in names)
+
+
+def mirror_type(message_type: type) -> Type[Mirror]:
+    """Return the lightweight mirror class of a message type.
+
+    A mirror holds the fields of a message as plain Python values, in
+    ``__slots__``, and cannot be modified. It is built from a protobuf
+    message with ``from_pb`` or ``from_message`` and converted back with
+    ``to_pb`` or ``to_message``:
+
+    .. code-block:: python
+
+        AssetMirror = mirror_type(assets.Asset)
+        inventory = [AssetMirror.from_message(asset) for asset in assets]
+        name = inventory[0].name
+        roles = [binding.role for binding in inventory[0].iam_policy.bindings]
+
+    Repeated fields are tuples, maps are dicts and message fields are
+    mirrors in turn, or None when not set; so are the fields of a oneof
+    other than the one set. Enums are ints, which compare equal to the
+    members of the proto-plus enums. ``Struct``, ``Value``,
+    ``ListValue``, ``Timestamp`` and ``Duration`` fields hold the values
+    proto-plus returns for them, as dicts, lists, scalars, datetimes and
+    timedeltas. A field named after a Python keyword, such as ``from``,
+    is held with a trailing underscore, as ``from_``, as in proto-plus.
+    Mirrors compare equal when their fields are equal, and are hashable.
+
+    Classes are generated on first use, and cached; the messages nested
+    in the message type get theirs at the same time. A proto-plus type
+    and its raw protobuf type get distinct classes, each converting back
+    to the type it was generated from.
+
+    Args:
+        message_type (type): The proto-plus message type, or raw protobuf
+            message type, such as ``assets.Asset``.
+
+    Returns:
+        Type[~.Mirror]: The mirror class.
+    """
+    descriptor = _pb_type(message_type).DESCRIPTOR
+    with _lock:
+        cls = _mirrors.get(message_type)
+        if cls is None:
+            cls = type(
+                descriptor.name,
+                (Mirror,),
+                {
+                    "__slots__": tuple(
+                        _attribute(field.name) for field in descriptor.fields
+                    ),
+                    "__doc__": "A mirror of ``{}``.".format(descriptor.full_name),
+                    "full_name": descriptor.full_name,
+                    "_message_type": message_type,
+                    "_pb_type": _pb_type(message_type),
+                },
+            )
+            # Cache the class before generating its methods, as messages
+            # may nest themselves.
+            _mirrors[message_type] = cls
+            try:
+                _generate(cls, message_type)
+            except BaseException:
+                del _mirrors[message_type]
+                raise
+        return cls
+
+
+def mirror_types(module: ModuleType) -> Dict[str, Type[Mirror]]:
+    """Return the mirror classes of every message of a types module.
+
+    .. code-block:: python
+
+        from google.cloud.asset_v1p4beta1.types import assets
+
+        mirrors = mirror_types(assets)
+        Result = mirrors["IamPolicyAnalysisResult"]
+
+    Args:
+        module (module): A module of proto-plus messages, such as
+            ``google.cloud.asset_v1.types.assets``.
+
+    Returns:
+        Dict[str, Type[~.Mirror]]: The mirror classes, by message name.
+    """
+    return {
+        name: mirror_type(getattr(module, name))
+        for name in sorted(module.__protobuf__.manifest)
+        if isinstance(getattr(module, name), type)
+        and issubclass(getattr(module, name), proto.Message)
+    }
+
+
+__all__ = (
+    "Mirror",
+    "mirror_type",
+    "mirror_types",
+)
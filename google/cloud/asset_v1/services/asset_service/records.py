@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from google.cloud.asset_v1.services.asset_service.structs import StructView
+from google.cloud.asset._transport_utils.passthrough import (
+    RawResponse,
+)
+from google.cloud.asset._transport_utils.wire import (
+    LENGTH_DELIMITED,
+    read_varint,
+    skip_field,
+)
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+from google.protobuf import message  # type: ignore
+from google.protobuf import struct_pb2 as struct  # type: ignore
+
+_T = TypeVar("_T", bound=Hashable)
+
+
+class InternPool:
+    """A pool sharing one instance of every distinct value added to it.
+
+    Unlike :func:`sys.intern`, the pool holds any hashable value, such as
+    the tuples of labels of a record, and its values are released with it.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self):
+        self._values = {}
+
+    def intern(self, value: _T) -> _T:
+        """Return the instance of the pool equal to ``value``, adding it
+        if there is none."""
+        return self._values.setdefault(value, value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Remove every value from the pool."""
+        self._values.clear()
+
+
+class ResourceRecord:
+    """A compact, immutable copy of a ``ResourceSearchResult``.
+
+    The fields of a record are plain Python values: ``labels`` is a tuple
+    of ``(key, value)`` pairs sorted by key, ``network_tags`` a tuple and
+    ``additional_attributes`` the serialized ``Struct``, decoded on access.
+    Records built by :func:`records` share equal strings and tuples
+    through an :class:`InternPool`, so the asset types, projects,
+    locations and label sets repeated across an inventory are held once.
+
+    Records compare equal when their fields are equal, the additional
+    attributes being compared decoded, are hashable and convert back to
+    the proto with :meth:`to_message` or :meth:`to_pb`.
+    """
+
+    __slots__ = (
+        "name",
+        "asset_type",
+        "project",
+        "display_name",
+        "description",
+        "location",
+        "labels",
+        "network_tags",
+        "_additional_attributes",
+    )
+
+    def __init__(
+        self,
+        name: str = "",
+        asset_type: str = "",
+        project: str = "",
+        display_name: str = "",
+        description: str = "",
+        location: str = "",
+        labels: Tuple[Tuple[str, str], ...] = (),
+        network_tags: Tuple[str, ...] = (),
+        additional_attributes: bytes = b"",
+    ):
+        """Instantiate the record.
+
+        Args:
+            name (str): The full resource name.
+            asset_type (str): The type of the resource.
+            project (str): The project of the resource.
+            display_name (str): The display name of the resource.
+            description (str): The description of the resource.
+            location (str): The location of the resource.
+            labels (Tuple[Tuple[str, str], ...]): The labels, as
+                ``(key, value)`` pairs sorted by key.
+            network_tags (Tuple[str, ...]): The network tags.
+            additional_attributes (bytes): The serialized ``Struct`` of
+                additional attributes.
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, "name", name)
+        setattr_(self, "asset_type", asset_type)
+        setattr_(self, "project", project)
+        setattr_(self, "display_name", display_name)
+        setattr_(self, "description", description)
+        setattr_(self, "location", location)
+        setattr_(self, "labels", labels)
+        setattr_(self, "network_tags", network_tags)
+        setattr_(self, "_additional_attributes", additional_attributes)
+
+    @classmethod
+    def from_pb(
+        cls, result: message.Message, pool: InternPool = None
+    ) -> "ResourceRecord":
+        """Build a record from a raw protobuf ``ResourceSearchResult``.
+
+        Args:
+            result (google.cloud.asset_v1.types.assets_pb2.ResourceSearchResult):
+                The raw protobuf result.
+            pool (Optional[~.InternPool]): The pool sharing the repeated
+                values of the record, if any.
+
+        Returns:
+            ~.ResourceRecord: The record.
+        """
+        intern = pool.intern if pool is not None else _identity
+        additional_attributes = b""
+        if result.HasField("additional_attributes"):
+            additional_attributes = result.additional_attributes.SerializeToString()
+        return cls(
+            result.name,
+            intern(result.asset_type),
+            intern(result.project),
+            result.display_name,
+            result.description,
+            intern(result.location),
+            intern(
+                tuple(
+                    (intern(key), intern(value))
+                    for key, value in sorted(result.labels.items())
+                )
+            ),
+            intern(tuple(intern(tag) for tag in result.network_tags)),
+            additional_attributes,
+        )
+
+    @classmethod
+    def from_message(
+        cls, result: assets.ResourceSearchResult, pool: InternPool = None
+    ) -> "ResourceRecord":
+        """Build a record from a ``ResourceSearchResult``.
+
+        Args:
+            result (~.assets.ResourceSearchResult): The result.
+            pool (Optional[~.InternPool]): The pool sharing the repeated
+                values of the record, if any.
+
+        Returns:
+            ~.ResourceRecord: The record.
+        """
+        return cls.from_pb(assets.ResourceSearchResult.pb(result), pool)
+
+    @property
+    def additional_attributes(self) -> StructView:
+        """StructView: The additional attributes, decoded on access."""
+        return StructView(struct.Struct.FromString(self._additional_attributes))
+
+    def to_pb(self) -> message.Message:
+        """Return the record as a raw protobuf ``ResourceSearchResult``."""
+        result = assets.ResourceSearchResult.pb()(
+            name=self.name,
+            asset_type=self.asset_type,
+            project=self.project,
+            display_name=self.display_name,
+            description=self.description,
+            location=self.location,
+            labels=dict(self.labels),
+            network_tags=self.network_tags,
+        )
+        if self._additional_attributes:
+            result.additional_attributes.MergeFromString(self._additional_attributes)
+        return result
+
+    def to_message(self) -> assets.ResourceSearchResult:
+        """Return the record as a ``ResourceSearchResult``."""
+        return assets.ResourceSearchResult.wrap(self.to_pb())
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (
+            self.name,
+            self.asset_type,
+            self.project,
+            self.display_name,
+            self.description,
+            self.location,
+            self.labels,
+            self.network_tags,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ResourceRecord):
+            return NotImplemented
+        if self._key() != other._key():
+            return False
+        # The same struct may be serialized with its keys in any order.
+        return self._additional_attributes == other._additional_attributes or (
+            struct.Struct.FromString(self._additional_attributes)
+            == struct.Struct.FromString(other._additional_attributes)
+        )
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ResourceRecord is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ResourceRecord is immutable")
+
+    def __reduce__(self):
+        return (ResourceRecord, self._key() + (self._additional_attributes,))
+
+    def __repr__(self) -> str:
+        return "ResourceRecord(name={!r}, asset_type={!r})".format(
+            self.name, self.asset_type
+        )
+
+
+def _identity(value: _T) -> _T:
+    return value
+
+
+def _read_entry(data: bytes, position: int, end: int) -> Tuple[str, str]:
+    # Read a ``labels`` map entry, whose key is field 1 and value field 2.
+    key = value = b""
+    while position < end:
+        tag, position = read_varint(data, position)
+        if tag & 0x7 != LENGTH_DELIMITED:
+            position = skip_field(data, position, tag & 0x7)
+            continue
+        length, position = read_varint(data, position)
+        if tag >> 3 == 1:
+            key = data[position : position + length]
+        elif tag >> 3 == 2:
+            value = data[position : position + length]
+        position += length
+    return key.decode("utf-8"), value.decode("utf-8")
+
+
+def _read_record(
+    data: bytes, position: int, end: int, intern: Callable[[Any], Any]
+) -> ResourceRecord:
+    # Read a serialized ``ResourceSearchResult`` directly from the wire
+    # format, leaving the additional attributes serialized.
+    strings = [b""] * 6
+    labels = {}
+    network_tags = []
+    additional_attributes = []
+    while position < end:
+        tag, position = read_varint(data, position)
+        if tag & 0x7 != LENGTH_DELIMITED:
+            position = skip_field(data, position, tag & 0x7)
+            continue
+        length, position = read_varint(data, position)
+        number = tag >> 3
+        stop = position + length
+        if number <= 6:
+            strings[number - 1] = data[position:stop]
+        elif number == 7:
+            key, value = _read_entry(data, position, stop)
+            labels[key] = value
+        elif number == 8:
+            network_tags.append(intern(data[position:stop].decode("utf-8")))
+        elif number == 9:
+            # Occurrences of a message field are merged, as are their
+            # concatenated serializations.
+            additional_attributes.append(data[position:stop])
+        position = stop
+    if position != end:
+        raise ValueError("Truncated message")
+    name, asset_type, project, display_name, description, location = (
+        value.decode("utf-8") for value in strings
+    )
+    return ResourceRecord(
+        name,
+        intern(asset_type),
+        intern(project),
+        display_name,
+        description,
+        intern(location),
+        intern(
+            tuple((intern(key), intern(value)) for key, value in sorted(labels.items()))
+        ),
+        intern(tuple(network_tags)),
+        b"".join(additional_attributes),
+    )
+
+
+def _read_records(data: bytes, pool: InternPool) -> Iterator[ResourceRecord]:
+    # Read the ``results``, field 1, of a serialized
+    # ``SearchAllResourcesResponse``.
+    position = 0
+    end = len(data)
+    try:
+        while position < end:
+            tag, position = read_varint(data, position)
+            if tag != (1 << 3 | LENGTH_DELIMITED):
+                position = skip_field(data, position, tag & 0x7)
+                continue
+            length, position = read_varint(data, position)
+            if position + length > end:
+                raise ValueError("Truncated message")
+            yield _read_record(data, position, position + length, pool.intern)
+            position += length
+    except IndexError:
+        raise ValueError("Truncated message")
+    if position > end:
+        raise ValueError("Truncated message")
+
+
+def records(
+    pages: Iterable[Union[asset_service.SearchAllResourcesResponse, RawResponse]],
+    pool: InternPool = None,
+) -> Iterator[ResourceRecord]:
+    """Convert pages of ``search_all_resources`` results to records.
+
+    .. code-block:: python
+
+        pager = client.search_all_resources(scope=scope, page_size=500)
+        inventory = list(records(pager.pages))
+
+    Args:
+        pages (Iterable[Union[~.SearchAllResourcesResponse, ~.RawResponse]]):
+            The pages, such as the ``pages`` of a pager. The serialized
+            pages of a transport in passthrough mode are read directly
+            from their wire format, which is faster than decoding them.
+        pool (Optional[~.InternPool]): The pool sharing the repeated
+            values of the records; a new pool is used if None. Pass the
+            same pool to several calls to share values across them.
+
+    Yields:
+        ~.ResourceRecord: The record of every result, in order.
+
+    Raises:
+        ValueError: If a serialized page is not a valid message.
+    """
+    if pool is None:
+        pool = InternPool()
+    for page in pages:
+        if isinstance(page, RawResponse):
+            yield from _read_records(page.data, pool)
+            continue
+        for result in asset_service.SearchAllResourcesResponse.pb(page).results:
+            yield ResourceRecord.from_pb(result, pool)
+
+
+__all__ = (
+    "InternPool",
+    "ResourceRecord",
+    "records",
+)
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import functools
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+# The size of the cache of :func:`parse`.
+CACHE_SIZE = 65536
+
+# Builds named tuples without the argument handling of their constructor.
+_new = tuple.__new__
+
+# Segments standing alone, without an id, where a collection is expected,
+# as in ``projects/p/global/networks/n`` or
+# ``projects/p/locations/l/clusters/c/k8s/namespaces/ns``.
+_SINGLETONS = frozenset(("global", "k8s"))
+
+# The services whose full resource names start with a bare id, such as
+# ``//storage.googleapis.com/my-bucket/objects/my-object``.
+_BARE_ID_SERVICES = frozenset(("storage.googleapis.com",))
+
+
+class ResourceName(NamedTuple):
+    """A parsed resource name.
+
+    The segments of the name following the service are paired from the
+    left into ``(collection, id)`` pairs. A segment standing alone where
+    a collection is expected, such as ``global`` in
+    ``projects/p/global/networks/n`` or ``k8s`` in the names of GKE
+    objects, makes a pair with an empty id. The bare id leading the
+    names of Cloud Storage, such as the bucket of
+    ``//storage.googleapis.com/my-bucket/objects/my-object``, makes a
+    pair with an empty collection.
+
+    Attributes:
+        name (str): The name parsed.
+        service (str): The service of a full resource name, such as
+            ``"compute.googleapis.com"``; empty for a relative name.
+        collections (Tuple[Tuple[str, str], ...]): The
+            ``(collection, id)`` pairs, such as
+            ``(("projects", "p"), ("zones", "z"), ("instances", "i"))``.
+    """
+
+    name: str
+    service: str
+    collections: Tuple[Tuple[str, str], ...]
+
+    def _find(self, collection: str) -> Optional[str]:
+        for key, value in self.collections:
+            if key == collection:
+                return value
+        return None
+
+    @property
+    def project(self) -> Optional[str]:
+        """Optional[str]: The id of the project in the name, if any."""
+        return self._find("projects")
+
+    @property
+    def folder(self) -> Optional[str]:
+        """Optional[str]: The id of the first folder in the name, if any."""
+        return self._find("folders")
+
+    @property
+    def organization(self) -> Optional[str]:
+        """Optional[str]: The id of the organization in the name, if any."""
+        return self._find("organizations")
+
+    @property
+    def collection(self) -> str:
+        """str: The collection of the resource, such as ``"instances"``."""
+        return self.collections[-1][0]
+
+    @property
+    def id(self) -> str:
+        """str: The id of the resource, such as ``"i"``."""
+        return self.collections[-1][1]
+
+    @property
+    def relative_name(self) -> str:
+        """str: The name without its service, such as ``"projects/p"``."""
+        if not self.service:
+            return self.name
+        return self.name[len(self.service) + 3 :]
+
+
+def _parse(name: str) -> ResourceName:
+    segments = name.split("/")
+    service = ""
+    if name.startswith("//"):
+        service = segments[2]
+        del segments[:3]
+        if not service:
+            segments = []
+    if not segments or "" in segments:
+        raise ValueError("Invalid resource name: {!r}".format(name))
+    if (
+        not len(segments) % 2
+        and service not in _BARE_ID_SERVICES
+        and _SINGLETONS.isdisjoint(segments)
+    ):
+        pairs = iter(segments)
+        return _new(ResourceName, (name, service, tuple(zip(pairs, pairs))))
+
+    collections = []
+    position = 0
+    if service in _BARE_ID_SERVICES:
+        collections.append(("", segments[0]))
+        position = 1
+    end = len(segments)
+    while position < end:
+        collection = segments[position]
+        if collection in _SINGLETONS:
+            collections.append((collection, ""))
+            position += 1
+        elif position + 1 < end:
+            collections.append((collection, segments[position + 1]))
+            position += 2
+        else:
+            # Which segment lacks its pair cannot be told.
+            raise ValueError("Ambiguous resource name: {!r}".format(name))
+    return _new(ResourceName, (name, service, tuple(collections)))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse(name: str) -> ResourceName:
+    """Parse a full or relative resource name.
+
+    .. code-block:: python
+
+        name = parse("//compute.googleapis.com/projects/p/zones/z/instances/i")
+        assert name.service == "compute.googleapis.com"
+        assert name.project == "p"
+        assert name.collections[-1] == ("instances", "i")
+
+    Results are cached, up to :data:`CACHE_SIZE` names, as the same
+    names, such as those of projects, folders and parents, recur through
+    an inventory; ``parse.cache_info()`` reports the use of the cache.
+
+    Args:
+        name (str): The name, such as
+            ``"//compute.googleapis.com/projects/p/zones/z/instances/i"``
+            or ``"projects/p"``.
+
+    Returns:
+        ~.ResourceName: The parsed name.
+
+    Raises:
+        ValueError: If ``name`` is not a resource name, or its segments
+            cannot be paired.
+    """
+    return _parse(name)
+
+
+def parse_many(names: Iterable[str], *, cache: bool = False) -> List[ResourceName]:
+    """Parse many resource names.
+
+    Repeated names within ``names`` are parsed once.
+
+    Args:
+        names (Iterable[str]): The names.
+        cache (bool): Whether to parse through the cache of :func:`parse`.
+            Leave it unset for a large batch of distinct names, such as
+            the names of an inventory, so as not to evict the names
+            parsed through :func:`parse` from its cache.
+
+    Returns:
+        List[~.ResourceName]: The parsed names, in the order of ``names``.
+
+    Raises:
+        ValueError: If one of ``names`` is not a resource name.
+    """
+    parser = parse if cache else _parse
+    parsed = {}
+    results = []
+    for name in names:
+        result = parsed.get(name)
+        if result is None:
+            result = parsed[name] = parser(name)
+        results.append(result)
+    return results
+
+
+class Hierarchy(NamedTuple):
+    """The project, folders and organization an asset belongs to.
+
+    Attributes:
+        project (Optional[str]): The id of the project, usually its
+            number, if any.
+        folders (Tuple[str, ...]): The ids of the folders, from the
+            closest to the asset.
+        organization (Optional[str]): The id of the organization, if any.
+    """
+
+    project: Optional[str]
+    folders: Tuple[str, ...]
+    organization: Optional[str]
+
+
+def hierarchy(asset: Any) -> Hierarchy:
+    """Return the hierarchy of an asset from its ``ancestors``.
+
+    Args:
+        asset (Any): The ``Asset``, of any version with ``ancestors``, as
+            a proto-plus message, a raw protobuf message or a mirror.
+
+    Returns:
+        ~.Hierarchy: The hierarchy of the asset.
+
+    Raises:
+        ValueError: If one of the ancestors is not a resource name.
+    """
+    project = organization = None
+    folders = []
+    for ancestor in asset.ancestors:
+        for collection, value in parse(ancestor).collections:
+            if collection == "projects":
+                project = project or value
+            elif collection == "folders":
+                folders.append(value)
+            elif collection == "organizations":
+                organization = organization or value
+    return Hierarchy(project, tuple(folders), organization)
+
+
+def parent(resource: Any) -> Optional[ResourceName]:
+    """Return the parsed ``parent`` of a ``Resource``.
+
+    Args:
+        resource (Any): The ``Resource``, such as the ``resource`` of an
+            ``Asset``, as a proto-plus message, a raw protobuf message or
+            a mirror.
+
+    Returns:
+        Optional[~.ResourceName]: The parent, such as
+        ``//cloudresourcemanager.googleapis.com/projects/p``, or None if
+        the resource has none.
+
+    Raises:
+        ValueError: If the parent is not a resource name.
+    """
+    return parse(resource.parent) if resource.parent else None
+
+
+__all__ = (
+    "CACHE_SIZE",
+    "Hierarchy",
+    "ResourceName",
+    "hierarchy",
+    "parent",
+    "parse",
+    "parse_many",
+)
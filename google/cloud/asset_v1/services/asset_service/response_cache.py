@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import OrderedDict
+import functools
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+import proto  # type: ignore
+
+from google.protobuf import message  # type: ignore
+
+from google.cloud.asset._transport_utils.passthrough import (
+    RawResponse,
+    passthrough_deserializer,
+)
+
+# Disk entries are prefixed with their absolute expiry time.
+_DISK_HEADER = struct.Struct("!d")
+
+
+class ResponseCache:
+    """A page-level cache for read-only AssetService responses.
+
+    Responses are stored serialized, keyed on the request message type and
+    the deterministic serialization of the request, which includes the
+    ``page_token``; every page of a search is therefore cached separately
+    and a pager replays cached pages without calling the API. Each entry
+    lives for ``ttl`` seconds. The in-memory tier is a least-recently-used
+    map bounded by the total size of the stored responses; if
+    ``disk_dir`` is set, entries are also written there and survive
+    eviction from memory and process restarts until they expire.
+
+    A cache is opt-in and is passed to the client::
+
+        cache = ResponseCache(ttl=30.0)
+        client = AssetServiceClient(response_cache=cache)
+
+    Only ``search_all_resources`` and ``search_all_iam_policies`` consult
+    the cache. The serialized pages of a transport in passthrough mode
+    are cached as received.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Instantiate the cache.
+
+        Args:
+            ttl (float): The number of seconds a response stays fresh.
+            max_bytes (int): The maximum total size, in bytes, of the
+                serialized responses held in memory.
+            disk_dir (Optional[str]): A directory for the on-disk tier. It
+                is created if it does not exist. If not set, the cache is
+                memory-only.
+            clock (Callable[[], float]): The time source, in seconds since
+                the epoch.
+        """
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._disk_dir = disk_dir
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expiry, payload), least recently used first.
+        self._entries = OrderedDict()  # type: OrderedDict[bytes, Tuple[float, bytes]]
+        self._size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @property
+    def size(self) -> int:
+        """The total size, in bytes, of the responses held in memory."""
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Return the fresh payload stored under ``key``, if any."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self._pop(key)
+
+        entry = self._disk_get(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            # Promote the entry back into memory, keeping its original expiry.
+            self.disk_hits += 1
+            self._remember(key, *entry)
+        return entry[1]
+
+    def put(self, key: bytes, payload: bytes) -> None:
+        """Store ``payload`` under ``key`` for ``ttl`` seconds."""
+        expiry = self._clock() + self._ttl
+        with self._lock:
+            self._remember(key, expiry, payload)
+        self._disk_put(key, expiry, payload)
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self._disk_dir is not None:
+            for filename in os.listdir(self._disk_dir):
+                if filename.endswith(".pb"):
+                    os.remove(os.path.join(self._disk_dir, filename))
+
+    def wrap(
+        self,
+        rpc: Callable[..., Any],
+        response_type: Type[proto.Message],
+        *,
+        passthrough: bool = False,
+    ) -> Callable[..., Any]:
+        """Wrap a read-only RPC so that its responses are cached.
+
+        Args:
+            rpc (Callable): The wrapped method, as called by the client and
+                its pagers.
+            response_type (Type[proto.Message]): The response message type.
+            passthrough (bool): Whether the transport is in passthrough
+                mode, where ``rpc`` returns ``RawResponse`` objects; cached
+                responses are then returned as such.
+
+        Returns:
+            Callable: A callable with the same signature as ``rpc``.
+        """
+
+        deserialize = self._deserializer(response_type, passthrough)
+
+        @functools.wraps(rpc)
+        def cached_rpc(request, *args, **kwargs):
+            key = self._key(request)
+            response = self._load(key, deserialize)
+            if response is not None:
+                return response
+            response = rpc(request, *args, **kwargs)
+            self.put(key, self._serialize(response, response_type))
+            return response
+
+        return cached_rpc
+
+    def wrap_async(
+        self,
+        rpc: Callable[..., Awaitable[Any]],
+        response_type: Type[proto.Message],
+        *,
+        passthrough: bool = False,
+    ) -> Callable[..., Awaitable[Any]]:
+        """Wrap a read-only asynchronous RPC so that its responses are cached.
+
+        Args:
+            rpc (Callable): The wrapped coroutine method, as called by the
+                async client and its pagers.
+            response_type (Type[proto.Message]): The response message type.
+            passthrough (bool): Whether the transport is in passthrough
+                mode, where ``rpc`` returns ``RawResponse`` objects; cached
+                responses are then returned as such.
+
+        Returns:
+            Callable: A coroutine function with the same signature as ``rpc``.
+        """
+
+        deserialize = self._deserializer(response_type, passthrough)
+
+        @functools.wraps(rpc)
+        async def cached_rpc(request, *args, **kwargs):
+            key = self._key(request)
+            response = self._load(key, deserialize)
+            if response is not None:
+                return response
+            response = await rpc(request, *args, **kwargs)
+            self.put(key, self._serialize(response, response_type))
+            return response
+
+        return cached_rpc
+
+    @staticmethod
+    def _deserializer(
+        response_type: Type[proto.Message], passthrough: bool
+    ) -> Callable[[bytes], Any]:
+        if passthrough:
+            return passthrough_deserializer(response_type)
+        return response_type.deserialize
+
+    @staticmethod
+    def _serialize(response: Any, response_type: Type[proto.Message]) -> bytes:
+        if isinstance(response, RawResponse):
+            return response.data
+        return response_type.serialize(response)
+
+    def _load(self, key: bytes, deserialize: Callable[[bytes], Any]) -> Any:
+        payload = self.get(key)
+        if payload is None:
+            return None
+        try:
+            return deserialize(payload)
+        except (message.DecodeError, ValueError):
+            # A corrupt entry is a miss; drop it so that it is refetched.
+            self._discard(key)
+            return None
+
+    def _discard(self, key: bytes) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+        if self._disk_dir is not None:
+            try:
+                os.remove(self._disk_path(key))
+            except OSError:
+                pass
+
+    @staticmethod
+    def _key(request: proto.Message) -> bytes:
+        # Deterministic serialization makes equal requests map to equal keys
+        # regardless of map field insertion order.
+        pb = type(request).pb(request)
+        return b"%s\x00%s" % (
+            pb.DESCRIPTOR.full_name.encode("utf-8"),
+            pb.SerializeToString(deterministic=True),
+        )
+
+    def _remember(self, key: bytes, expiry: float, payload: bytes) -> None:
+        if key in self._entries:
+            self._pop(key)
+        if len(payload) > self._max_bytes:
+            return
+        self._entries[key] = (expiry, payload)
+        self._size += len(payload)
+        while self._size > self._max_bytes:
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _pop(self, key: bytes) -> None:
+        _, payload = self._entries.pop(key)
+        self._size -= len(payload)
+
+    def _disk_path(self, key: bytes) -> str:
+        return os.path.join(self._disk_dir, hashlib.sha256(key).hexdigest() + ".pb")
+
+    def _disk_get(self, key: bytes, now: float) -> Optional[Tuple[float, bytes]]:
+        if self._disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return None
+        try:
+            (expiry,) = _DISK_HEADER.unpack_from(data)
+        except struct.error:
+            # A truncated entry, such as one left by an interrupted copy.
+            expiry = now
+        if expiry <= now:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return expiry, data[_DISK_HEADER.size :]
+
+    def _disk_put(self, key: bytes, expiry: float, payload: bytes) -> None:
+        if self._disk_dir is None:
+            return
+        # Write to a temporary file and rename it into place, so readers in
+        # other processes never observe a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self._disk_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_DISK_HEADER.pack(expiry))
+            fh.write(payload)
+        os.replace(tmp_path, self._disk_path(key))
+
+
+__all__ = ("ResponseCache",)
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from array import array
+import bisect
+import re
+import shlex
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from google.cloud.asset_v1.types import assets
+from google.protobuf import struct_pb2 as struct  # type: ignore
+
+# Query field names accepted by the service, mapped to the attribute they
+# search on a ``ResourceSearchResult``.
+_FIELD_ALIASES = {
+    "name": "name",
+    "displayName": "display_name",
+    "display_name": "display_name",
+    "description": "description",
+    "labels": "labels",
+    "networkTags": "network_tags",
+    "network_tags": "network_tags",
+    "additionalAttributes": "additional_attributes",
+    "additional_attributes": "additional_attributes",
+}
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+
+def _tokenize(text: str, chunk_size: int) -> Iterator[str]:
+    """Yield the lower-cased word tokens of ``text``.
+
+    The text is lower-cased and scanned ``chunk_size`` characters at a time,
+    so no full-size copy of a large field is ever made. A token that
+    straddles a chunk boundary is carried over into the next chunk.
+    """
+    carry = ""
+    for start in range(0, len(text), chunk_size):
+        chunk = carry + text[start : start + chunk_size].lower()
+        carry = ""
+        end = len(chunk)
+        for match in _TOKEN_RE.finditer(chunk):
+            if match.end() == end:
+                carry = match.group()
+            else:
+                yield match.group()
+    if carry:
+        yield carry
+
+
+def _struct_strings(value: struct.Value) -> Iterator[str]:
+    """Yield every string and number found in a ``Struct`` value."""
+    kind = value.WhichOneof("kind")
+    if kind == "string_value":
+        yield value.string_value
+    elif kind == "number_value":
+        yield repr(value.number_value)
+    elif kind == "bool_value":
+        yield "true" if value.bool_value else "false"
+    elif kind == "struct_value":
+        for key, item in value.struct_value.fields.items():
+            yield key
+            yield from _struct_strings(item)
+    elif kind == "list_value":
+        for item in value.list_value.values:
+            yield from _struct_strings(item)
+
+
+class SearchIndex:
+    """An in-memory inverted index over ``ResourceSearchResult`` objects.
+
+    The index tokenizes the ``name``, ``display_name``, ``description``,
+    ``labels``, ``network_tags`` and ``additional_attributes`` fields of
+    each result and keeps, for every token, a sorted array of the ids of
+    the results that contain it. Results are keyed on their ``name``, so
+    adding a result with a name that is already indexed replaces it; this
+    lets the index be kept fresh from feed notifications with
+    :meth:`add` and :meth:`remove`.
+
+    Queries follow the word semantics of ``search_all_resources``:
+
+    -  ``Important`` matches results containing "important" as a word.
+    -  ``Impor*`` matches results containing a word prefixed by "impor".
+    -  ``*por*`` matches results containing "por" as a substring.
+    -  ``displayName:Impor*`` restricts a term to a single field.
+    -  ``labels.env:prod`` matches results with label "env" set to "prod",
+       and ``labels.env:*`` matches results that have the "env" label.
+
+    Terms separated by whitespace must all match. Matching is case
+    insensitive.
+    """
+
+    def __init__(self, *, chunk_size: int = 64 * 1024):
+        """Instantiate the index.
+
+        Args:
+            chunk_size (int): The number of characters of a text field that
+                are tokenized at a time.
+        """
+        self._chunk_size = chunk_size
+        self._next_id = 0
+        self._ids = {}  # type: Dict[str, int]
+        self._results = {}  # type: Dict[int, assets.ResourceSearchResult]
+        self._doc_tokens = {}  # type: Dict[int, Tuple[Tuple[str, str], ...]]
+        # token -> field -> sorted array of result ids.
+        self._postings = {}  # type: Dict[str, Dict[str, array]]
+        # Sorted list of every token in the index, for prefix lookups.
+        self._vocabulary = []  # type: List[str]
+        # label key -> label value token -> sorted array of result ids.
+        self._label_postings = {}  # type: Dict[str, Dict[str, array]]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def get(self, name: str) -> Optional[assets.ResourceSearchResult]:
+        """Return the indexed result with the given ``name``, if any."""
+        doc_id = self._ids.get(name)
+        return None if doc_id is None else self._results[doc_id]
+
+    def add(self, result: assets.ResourceSearchResult) -> None:
+        """Index a result, replacing any result with the same ``name``.
+
+        Args:
+            result (:class:`~.assets.ResourceSearchResult`): The result to
+                index.
+        """
+        self.remove(result.name)
+
+        doc_id = self._next_id
+        self._next_id += 1
+        self._ids[result.name] = doc_id
+        self._results[doc_id] = result
+
+        pairs = set()  # type: Set[Tuple[str, str]]
+        for field, text in self._field_texts(result):
+            for token in _tokenize(text, self._chunk_size):
+                pairs.add((field, token))
+        for field, token in pairs:
+            fields = self._postings.get(token)
+            if fields is None:
+                fields = self._postings[token] = {}
+                bisect.insort(self._vocabulary, token)
+            fields.setdefault(field, array("Q")).append(doc_id)
+
+        # Keys differing only in case share their postings, so the pairs
+        # are deduplicated before any doc id is appended.
+        labels = set()  # type: Set[Tuple[str, str]]
+        for key, value in result.labels.items():
+            for token in set(_tokenize(value, self._chunk_size)) or {""}:
+                labels.add((key.lower(), token))
+        for key, token in labels:
+            values = self._label_postings.setdefault(key, {})
+            values.setdefault(token, array("Q")).append(doc_id)
+
+        self._doc_tokens[doc_id] = tuple(pairs) + tuple(
+            ("labels." + key, token) for key, token in labels
+        )
+
+    def add_all(self, results: Iterable[assets.ResourceSearchResult]) -> None:
+        """Index every result in ``results``, such as a pager."""
+        for result in results:
+            self.add(result)
+
+    def remove(self, name: str) -> bool:
+        """Remove the result with the given ``name`` from the index.
+
+        Args:
+            name (str): The full resource name of the result.
+
+        Returns:
+            bool: Whether a result was removed.
+        """
+        doc_id = self._ids.pop(name, None)
+        if doc_id is None:
+            return False
+        del self._results[doc_id]
+
+        for field, token in self._doc_tokens.pop(doc_id):
+            if field.startswith("labels."):
+                key = field[len("labels.") :]
+                values = self._label_postings[key]
+                self._discard(values, token, doc_id)
+                if not values:
+                    del self._label_postings[key]
+                continue
+            fields = self._postings[token]
+            self._discard(fields, field, doc_id)
+            if not fields:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+        return True
+
+    def search(self, query: str) -> List[assets.ResourceSearchResult]:
+        """Return the indexed results matching ``query``.
+
+        Args:
+            query (str): The query statement; see the class docstring for
+                the supported syntax.
+
+        Returns:
+            List[~.assets.ResourceSearchResult]: The matching results, in
+            the order they were added.
+        """
+        matched = None  # type: Optional[Set[int]]
+        for term in shlex.split(query):
+            field, _, value = term.rpartition(":")
+            ids = self._match_term(field.strip(), value.strip())
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                return []
+        if matched is None:
+            return []
+        return [self._results[doc_id] for doc_id in sorted(matched)]
+
+    def _match_term(self, field: str, value: str) -> Set[int]:
+        if field.startswith("labels."):
+            return self._match_label(field[len("labels.") :].lower(), value)
+
+        if field:
+            try:
+                fields = (_FIELD_ALIASES[field],)  # type: Optional[Tuple[str, ...]]
+            except KeyError:
+                raise ValueError("Unsupported search field: {}".format(field))
+        else:
+            fields = None
+
+        matched = None  # type: Optional[Set[int]]
+        for token, wildcard in self._query_tokens(value):
+            ids = set()  # type: Set[int]
+            for candidate in self._expand(token, wildcard):
+                for name, postings in self._postings[candidate].items():
+                    if fields is None or name in fields:
+                        ids.update(postings)
+            matched = ids if matched is None else matched & ids
+        if matched is None:
+            # A bare ``*`` matches any result with a value in the field.
+            matched = set()
+            for postings in self._postings.values():
+                for name, ids_ in postings.items():
+                    if fields is None or name in fields:
+                        matched.update(ids_)
+        return matched
+
+    def _match_label(self, key: str, value: str) -> Set[int]:
+        values = self._label_postings.get(key, {})
+        matched = None  # type: Optional[Set[int]]
+        for token, wildcard in self._query_tokens(value):
+            ids = set()  # type: Set[int]
+            for candidate in values:
+                if self._token_matches(candidate, token, wildcard):
+                    ids.update(values[candidate])
+            matched = ids if matched is None else matched & ids
+        if matched is None:
+            matched = set()
+            for ids_ in values.values():
+                matched.update(ids_)
+        return matched
+
+    def _query_tokens(self, value: str) -> Iterator[Tuple[str, Tuple[bool, bool]]]:
+        """Split a query value into tokens and their wildcard flags.
+
+        The flags record whether the value had a leading and a trailing
+        ``*``; they only apply to the first and last token respectively.
+        """
+        leading = value.startswith("*")
+        trailing = value.endswith("*")
+        tokens = list(_tokenize(value, self._chunk_size))
+        for position, token in enumerate(tokens):
+            yield token, (
+                leading and position == 0,
+                trailing and position == len(tokens) - 1,
+            )
+
+    def _expand(self, token: str, wildcard: Tuple[bool, bool]) -> Iterator[str]:
+        """Yield the indexed tokens matching a query token."""
+        leading, trailing = wildcard
+        if not leading and not trailing:
+            if token in self._postings:
+                yield token
+        elif not leading:
+            start = bisect.bisect_left(self._vocabulary, token)
+            for candidate in self._vocabulary[start:]:
+                if not candidate.startswith(token):
+                    break
+                yield candidate
+        else:
+            for candidate in self._vocabulary:
+                if self._token_matches(candidate, token, wildcard):
+                    yield candidate
+
+    @staticmethod
+    def _token_matches(candidate: str, token: str, wildcard: Tuple[bool, bool]) -> bool:
+        leading, trailing = wildcard
+        if leading and trailing:
+            return token in candidate
+        if leading:
+            return candidate.endswith(token)
+        if trailing:
+            return candidate.startswith(token)
+        return candidate == token
+
+    @staticmethod
+    def _discard(postings: Dict[str, array], key: str, doc_id: int) -> None:
+        ids = postings[key]
+        del ids[bisect.bisect_left(ids, doc_id)]
+        if not ids:
+            del postings[key]
+
+    @staticmethod
+    def _field_texts(result: assets.ResourceSearchResult) -> Iterator[Tuple[str, str]]:
+        pb = assets.ResourceSearchResult.pb(result)
+        yield "name", pb.name
+        yield "display_name", pb.display_name
+        yield "description", pb.description
+        for key, value in pb.labels.items():
+            yield "labels", key
+            yield "labels", value
+        for tag in pb.network_tags:
+            yield "network_tags", tag
+        for key, value in pb.additional_attributes.fields.items():
+            yield "additional_attributes", key
+            for text in _struct_strings(value):
+                yield "additional_attributes", text
+
+
+__all__ = ("SearchIndex",)
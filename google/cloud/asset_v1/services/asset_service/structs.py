@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections.abc
+from typing import Any, Dict, Iterator, List, Union
+
+import proto  # type: ignore
+
+from google.protobuf import struct_pb2 as struct  # type: ignore
+
+
+def _view(value: struct.Value) -> Any:
+    kind = value.WhichOneof("kind")
+    if kind == "string_value":
+        return value.string_value
+    if kind == "number_value":
+        return value.number_value
+    if kind == "bool_value":
+        return value.bool_value
+    if kind == "struct_value":
+        return StructView(value.struct_value)
+    if kind == "list_value":
+        return ListView(value.list_value)
+    return None
+
+
+def _to_python(value: struct.Value) -> Any:
+    kind = value.WhichOneof("kind")
+    if kind == "string_value":
+        return value.string_value
+    if kind == "number_value":
+        return value.number_value
+    if kind == "bool_value":
+        return value.bool_value
+    if kind == "struct_value":
+        return {
+            key: _to_python(item) for key, item in value.struct_value.fields.items()
+        }
+    if kind == "list_value":
+        return [_to_python(item) for item in value.list_value.values]
+    return None
+
+
+def struct_to_dict(value: struct.Struct) -> Dict[str, Any]:
+    """Convert a ``Struct`` to plain Python values in one pass.
+
+    Numbers are floats, as in the ``Struct`` itself.
+
+    Args:
+        value (google.protobuf.struct_pb2.Struct): The raw protobuf struct.
+
+    Returns:
+        Dict[str, Any]: The struct as nested dicts, lists and scalars.
+    """
+    return {key: _to_python(item) for key, item in value.fields.items()}
+
+
+class StructView(collections.abc.Mapping):
+    """A read-only mapping over a ``Struct``, decoding values on access.
+
+    Reading a key only converts the value of that key, and nested structs
+    and lists are returned as views in turn, so reading a few keys of a
+    large ``Resource.data`` costs a few lookups rather than a conversion
+    of the whole struct. The view reads the underlying protobuf message
+    and reflects changes made to it.
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, value: struct.Struct):
+        """Instantiate the view.
+
+        Args:
+            value (google.protobuf.struct_pb2.Struct): The raw protobuf
+                struct.
+        """
+        self._fields = value.fields
+
+    def __getitem__(self, key: str) -> Any:
+        # Indexing the map of a protobuf message inserts missing keys.
+        if key not in self._fields:
+            raise KeyError(key)
+        return _view(self._fields[key])
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the struct as nested dicts, lists and scalars."""
+        return {key: _to_python(item) for key, item in self._fields.items()}
+
+    def __repr__(self) -> str:
+        return "StructView({!r})".format(self.to_dict())
+
+
+class ListView(collections.abc.Sequence):
+    """A read-only sequence over a ``ListValue``, decoding values on access."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, value: struct.ListValue):
+        """Instantiate the view.
+
+        Args:
+            value (google.protobuf.struct_pb2.ListValue): The raw protobuf
+                list.
+        """
+        self._values = value.values
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [_view(item) for item in self._values[index]]
+        return _view(self._values[index])
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def to_list(self) -> List[Any]:
+        """Return the list as nested dicts, lists and scalars."""
+        return [_to_python(item) for item in self._values]
+
+    def __repr__(self) -> str:
+        return "ListView({!r})".format(self.to_list())
+
+
+def struct_view(message: proto.Message, field: str) -> StructView:
+    """Return a view over a ``Struct`` field of a proto-plus message.
+
+    The view reads the protobuf message underlying ``message``, bypassing
+    the marshalling of proto-plus:
+
+    .. code-block:: python
+
+        data = struct_view(asset.resource, "data")
+        status = data["status"]
+        attributes = struct_view(result, "additional_attributes").to_dict()
+
+    Args:
+        message (proto.Message): The message, such as a ``Resource`` or a
+            ``ResourceSearchResult``.
+        field (str): The name of the ``Struct`` field, such as ``"data"``
+            or ``"additional_attributes"``.
+
+    Returns:
+        ~.StructView: The view.
+
+    Raises:
+        TypeError: If ``field`` is not a ``Struct`` field.
+    """
+    value = getattr(type(message).pb(message), field)
+    if not isinstance(value, struct.Struct):
+        raise TypeError("{} is not a Struct field".format(field))
+    return StructView(value)
+
+
+__all__ = (
+    "ListView",
+    "StructView",
+    "struct_to_dict",
+    "struct_view",
+)
@@ -18,7 +18,7 @@
 from collections import OrderedDict
 from typing import Dict, Type
 
-from .base import AssetServiceTransport
+from .base import AssetServiceTransport, InsecureCredentials
 from .grpc import AssetServiceGrpcTransport
 from .grpc_asyncio import AssetServiceGrpcAsyncIOTransport
 
@@ -33,4 +33,5 @@ __all__ = (
     "AssetServiceTransport",
     "AssetServiceGrpcTransport",
     "AssetServiceGrpcAsyncIOTransport",
+    "InsecureCredentials",
 )
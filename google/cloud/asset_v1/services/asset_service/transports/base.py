@@ -26,6 +26,7 @@ from google.api_core import retry as retries  # type: ignore
 from google.api_core import operations_v1  # type: ignore
 from google.auth import credentials  # type: ignore
 
+from google.cloud.asset._transport_utils.single_flight import SingleFlight
 from google.cloud.asset_v1.types import asset_service
 from google.longrunning import operations_pb2 as operations  # type: ignore
 from google.protobuf import empty_pb2 as empty  # type: ignore
@@ -39,11 +40,36 @@ except pkg_resources.DistributionNotFound:
     _client_info = gapic_v1.client_info.ClientInfo()
 
 
+class InsecureCredentials(credentials.AnonymousCredentials):
+    """Anonymous credentials asking for a channel without TLS.
+
+    A client or transport given these credentials connects to its
+    ``api_endpoint`` in plaintext, which local servers such as
+    :class:`~.fake_server.FakeAssetServiceServer` expect. They attach no
+    token, so no secret is sent over the channel.
+    """
+
+
 class AssetServiceTransport(abc.ABC):
     """Abstract transport class for AssetService."""
 
     AUTH_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
 
+    # The tracer of the pagers and operations of clients using the transport.
+    _tracer = None
+
+    # Whether the responses of the large read methods are left serialized.
+    _passthrough = False
+
+    # Read-only methods which are safe to coalesce or issue more than once.
+    _IDEMPOTENT_METHODS = (
+        "batch_get_assets_history",
+        "get_feed",
+        "list_feeds",
+        "search_all_resources",
+        "search_all_iam_policies",
+    )
+
     def __init__(
         self,
         *,
@@ -52,6 +78,7 @@ class AssetServiceTransport(abc.ABC):
         credentials_file: typing.Optional[str] = None,
         scopes: typing.Optional[typing.Sequence[str]] = AUTH_SCOPES,
         quota_project_id: typing.Optional[str] = None,
+        single_flight: bool = False,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -69,6 +96,9 @@ class AssetServiceTransport(abc.ABC):
             scope (Optional[Sequence[str]]): A list of scopes.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            single_flight (bool): Whether identical concurrent calls to the
+                idempotent read methods are coalesced into a single RPC
+                whose response is shared by every caller.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -95,6 +125,8 @@ class AssetServiceTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        self._single_flight = SingleFlight() if single_flight else None
+
         # Lifted into its own function so it can be stubbed out during tests.
         self._prep_wrapped_messages()
 
@@ -190,6 +222,14 @@ class AssetServiceTransport(abc.ABC):
             ),
         }
 
+        # Coalesce identical concurrent calls to the idempotent read methods.
+        if self._single_flight is not None:
+            for name in self._IDEMPOTENT_METHODS:
+                method = getattr(self, name)
+                self._wrapped_methods[method] = self._single_flight.wrap(
+                    name, self._wrapped_methods[method]
+                )
+
     @property
     def operations_client(self) -> operations_v1.OperationsClient:
         """Return the client designed to process long-running operations."""
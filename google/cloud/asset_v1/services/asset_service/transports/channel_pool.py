@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import itertools
+import threading
+from typing import Any, Callable, List, Sequence
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.cloud.asset._transport_utils.forwarding import AsyncUnaryUnaryWrapper
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+# Channel option giving each channel its own subchannel pool. Without it,
+# gRPC shares one connection between channels with identical arguments,
+# which would defeat the pool.
+LOCAL_SUBCHANNEL_POOL = ("grpc.use_local_subchannel_pool", 1)
+
+
+class _Balancer:
+    """Picks the channel for each call and tracks in-flight calls."""
+
+    def __init__(self, size: int, policy: str):
+        if size < 1:
+            raise ValueError("A channel pool needs at least one channel.")
+        if policy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError("Unsupported channel pool policy: {}".format(policy))
+        self._policy = policy
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.in_flight = [0] * size
+
+    def acquire(self) -> int:
+        if self._policy == ROUND_ROBIN:
+            index = next(self._counter) % len(self.in_flight)
+            with self._lock:
+                self.in_flight[index] += 1
+            return index
+        with self._lock:
+            # Break ties in round-robin order so idle pools spread calls.
+            start = next(self._counter) % len(self.in_flight)
+            order = self.in_flight[start:] + self.in_flight[:start]
+            index = (start + order.index(min(order))) % len(self.in_flight)
+            self.in_flight[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self.in_flight[index] -= 1
+
+
+class _ChannelPoolBase:
+    _multicallable_class = None  # type: type
+
+    def __init__(self, channels: Sequence[Any], *, policy: str = ROUND_ROBIN):
+        """Instantiate the pool.
+
+        Args:
+            channels (Sequence): The channels to pool.
+            policy (str): ``"round_robin"`` or ``"least_loaded"``.
+        """
+        self._channels = list(channels)
+        self._balancer = _Balancer(len(self._channels), policy)
+
+    @classmethod
+    def create(
+        cls,
+        factory: Callable[..., Any],
+        size: int,
+        *args,
+        policy: str = ROUND_ROBIN,
+        **kwargs
+    ) -> Any:
+        """Create ``size`` channels with ``factory`` and pool them.
+
+        Args:
+            factory (Callable): Creates a channel from ``args``, ``kwargs``
+                and an ``options`` list of channel arguments.
+            size (int): The number of channels. A single channel is
+                returned as is.
+            policy (str): ``"round_robin"`` or ``"least_loaded"``.
+
+        Returns:
+            The channel or pool of channels.
+        """
+        if size == 1:
+            return factory(*args, **kwargs)
+        options = list(kwargs.pop("options", ())) + [LOCAL_SUBCHANNEL_POOL]
+        return cls(
+            [factory(*args, options=options, **kwargs) for _ in range(size)],
+            policy=policy,
+        )
+
+    @property
+    def channels(self) -> List[Any]:
+        """The pooled channels."""
+        return list(self._channels)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """The number of unary calls in flight on each channel."""
+        return list(self._balancer.in_flight)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return self._multicallable_class(
+            self._balancer,
+            [
+                channel.unary_unary(method, *args, **kwargs)
+                for channel in self._channels
+            ],
+        )
+
+    # Streaming calls are pinned to one channel when the stub is created.
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self._next_channel().unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self._next_channel().stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self._next_channel().stream_stream(method, *args, **kwargs)
+
+    def _next_channel(self) -> Any:
+        index = self._balancer.acquire()
+        self._balancer.release(index)
+        return self._channels[index]
+
+
+class _PooledUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, balancer: _Balancer, callables: List[Callable]):
+        self._balancer = balancer
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index](request, *args, **kwargs)
+        finally:
+            self._balancer.release(index)
+
+    def with_call(self, request, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index].with_call(request, *args, **kwargs)
+        finally:
+            self._balancer.release(index)
+
+    def future(self, request, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            future = self._callables[index].future(request, *args, **kwargs)
+        except BaseException:
+            self._balancer.release(index)
+            raise
+        future.add_done_callback(lambda _: self._balancer.release(index))
+        return future
+
+
+class _AsyncPooledUnaryUnaryMultiCallable(AsyncUnaryUnaryWrapper):
+    def __init__(self, balancer: _Balancer, callables: List[Callable]):
+        self._balancer = balancer
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            call = self._callables[index](request, *args, **kwargs)
+        except BaseException:
+            self._balancer.release(index)
+            raise
+        call.add_done_callback(lambda _: self._balancer.release(index))
+        return call
+
+
+class ChannelPool(_ChannelPoolBase, grpc.Channel):
+    """A ``grpc.Channel`` spreading calls over several channels.
+
+    Each unary call is sent on one of the pooled channels, picked either in
+    round-robin order or as the channel with the fewest calls in flight.
+    At high concurrency this avoids queueing behind the concurrent stream
+    limit of a single HTTP/2 connection.
+
+    The pool can be passed anywhere a channel is accepted, such as the
+    ``channel`` argument of :class:`~.AssetServiceGrpcTransport`.
+    """
+
+    _multicallable_class = _PooledUnaryUnaryMultiCallable
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class AsyncChannelPool(_ChannelPoolBase, aio.Channel):
+    """An ``aio.Channel`` spreading calls over several channels.
+
+    This is the asyncio counterpart of :class:`ChannelPool`, for use with
+    :class:`~.AssetServiceGrpcAsyncIOTransport`.
+    """
+
+    _multicallable_class = _AsyncPooledUnaryUnaryMultiCallable
+
+    async def close(self, grace=None):
+        for channel in self._channels:
+            await channel.close(grace)
+
+    def get_state(self, try_to_connect: bool = False):
+        # The pool is ready once every channel is; otherwise report the state
+        # of the first channel that is not.
+        for channel in self._channels:
+            state = channel.get_state(try_to_connect)
+            if state != grpc.ChannelConnectivity.READY:
+                return state
+        return grpc.ChannelConnectivity.READY
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self._channels[0].wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        for channel in self._channels:
+            await channel.channel_ready()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+__all__ = (
+    "AsyncChannelPool",
+    "ChannelPool",
+    "LEAST_LOADED",
+    "ROUND_ROBIN",
+)
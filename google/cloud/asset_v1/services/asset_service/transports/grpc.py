@@ -26,11 +26,19 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
 
+from google.cloud.asset._transport_utils.compression import CompressionConfig
+from google.cloud.asset._transport_utils.concurrency_limiter import ConcurrencyLimiter
+from google.cloud.asset._transport_utils.hedging import HedgingPolicy
+from google.cloud.asset._transport_utils.metrics import MetricsRegistry
+from google.cloud.asset._transport_utils.passthrough import passthrough_deserializer
+from google.cloud.asset._transport_utils.retry_budget import RetryBudget
+from google.cloud.asset._transport_utils.tracing import Tracer
 from google.cloud.asset_v1.types import asset_service
 from google.longrunning import operations_pb2 as operations  # type: ignore
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
-from .base import AssetServiceTransport
+from .base import AssetServiceTransport, InsecureCredentials
+from .channel_pool import ChannelPool
 
 
 class AssetServiceGrpcTransport(AssetServiceTransport):
@@ -58,7 +66,17 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
         channel: grpc.Channel = None,
         api_mtls_endpoint: str = None,
         client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
-        quota_project_id: Optional[str] = None
+        quota_project_id: Optional[str] = None,
+        single_flight: bool = False,
+        channel_pool_size: int = 1,
+        channel_pool_policy: str = "round_robin",
+        hedging_policy: HedgingPolicy = None,
+        concurrency_limiter: ConcurrencyLimiter = None,
+        metrics: MetricsRegistry = None,
+        tracer: Tracer = None,
+        compression: CompressionConfig = None,
+        retry_budget: RetryBudget = None,
+        passthrough: bool = False
     ) -> None:
         """Instantiate the transport.
 
@@ -87,6 +105,40 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
                 is None.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            single_flight (bool): Whether identical concurrent calls to the
+                idempotent read methods are coalesced into a single RPC
+                whose response is shared by every caller.
+            channel_pool_size (int): The number of channels to open. With
+                more than one, each call is sent on one of the channels,
+                spreading concurrent calls over several connections.
+                This argument is ignored if ``channel`` is provided.
+            channel_pool_policy (str): How the channel of each call is
+                picked from the pool: ``"round_robin"`` or
+                ``"least_loaded"`` (the channel with the fewest calls in
+                flight).
+            hedging_policy (Optional[~.HedgingPolicy]): If provided, slow calls
+                to the idempotent read methods are hedged with a duplicate
+                call according to this policy.
+            concurrency_limiter (Optional[~.ConcurrencyLimiter]): If provided,
+                unary calls wait for a slot of this adaptive limiter, which
+                shrinks on quota errors and grows back on success.
+            metrics (Optional[~.MetricsRegistry]): If provided, the latency,
+                message sizes, retries and pages of unary calls are recorded
+                in this registry.
+            tracer (Optional[~.Tracer]): If provided, unary calls, pages of
+                pagers and polls of long-running operations are traced with
+                this tracer.
+            compression (Optional[~.CompressionConfig]): If provided, the
+                per-method compression of the requests of unary calls.
+            retry_budget (Optional[~.RetryBudget]): If provided, retries of
+                unary calls draw tokens from this budget and fail with
+                ``RetryBudgetExhausted`` when it runs out.
+            passthrough (bool): Whether the responses of
+                ``batch_get_assets_history``, ``search_all_resources`` and
+                ``search_all_iam_policies`` are left serialized, and returned as
+                ``RawResponse`` objects holding the bytes received and the
+                ``next_page_token`` read from them. Pagers then yield these from
+                their ``pages``; iterating their items raises AttributeError.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -94,6 +146,17 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        self._channel_pool_size = channel_pool_size
+        self._channel_pool_policy = channel_pool_policy
+        self._hedging_policy = hedging_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._metrics = metrics
+        self._tracer = tracer
+        self._compression = compression
+        self._retry_budget = retry_budget
+        self._passthrough = passthrough
+        self._quota_project_id = quota_project_id
+
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
@@ -124,8 +187,11 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
                 ssl_credentials = SslCredentials().ssl_credentials
 
             # create a new channel. The provided one is ignored.
-            self._grpc_channel = type(self).create_channel(
+            self._grpc_channel = ChannelPool.create(
+                type(self).create_channel,
+                channel_pool_size,
                 host,
+                policy=channel_pool_policy,
                 credentials=credentials,
                 credentials_file=credentials_file,
                 ssl_credentials=ssl_credentials,
@@ -133,6 +199,9 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
+        if hasattr(self, "_grpc_channel"):
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
+
         self._stubs = {}  # type: Dict[str, Callable]
 
         # Run the base constructor.
@@ -142,6 +211,7 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
             credentials_file=credentials_file,
             scopes=scopes or self.AUTH_SCOPES,
             quota_project_id=quota_project_id,
+            single_flight=single_flight,
         )
 
     @classmethod
@@ -161,7 +231,8 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
                 authorization credentials to attach to requests. These
                 credentials identify this application to the service. If
                 none are specified, the client will attempt to ascertain
-                the credentials from the environment.
+                the credentials from the environment. With
+                ``InsecureCredentials``, the channel is opened without TLS.
             credentials_file (Optional[str]): A file with credentials that can
                 be loaded with :func:`google.auth.load_credentials_from_file`.
                 This argument is mutually exclusive with credentials.
@@ -179,6 +250,8 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
             google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        if isinstance(credentials, InsecureCredentials):
+            return grpc.insecure_channel(host, options=kwargs.get("options"))
         scopes = scopes or cls.AUTH_SCOPES
         return grpc_helpers.create_channel(
             host,
@@ -199,13 +272,49 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
         # Sanity check: Only create a new channel if we do not already
         # have one.
         if not hasattr(self, "_grpc_channel"):
-            self._grpc_channel = self.create_channel(
-                self._host, credentials=self._credentials,
+            self._grpc_channel = ChannelPool.create(
+                self.create_channel,
+                self._channel_pool_size,
+                self._host,
+                policy=self._channel_pool_policy,
+                credentials=self._credentials,
             )
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
 
         # Return the channel from cache.
         return self._grpc_channel
 
+    def _wrap_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        # Compress requests, record metrics, trace calls and apply the
+        # concurrency limiter and the retry budget, if configured.
+        if self._compression is not None:
+            channel = self._compression.wrap_channel(channel)
+        if self._metrics is not None:
+            channel = self._metrics.wrap_channel(channel)
+        if self._tracer is not None:
+            channel = self._tracer.wrap_channel(channel)
+        if self._concurrency_limiter is not None:
+            channel = self._concurrency_limiter.wrap_channel(
+                channel, self._quota_project_id
+            )
+        if self._retry_budget is not None:
+            channel = self._retry_budget.wrap_channel(channel)
+        return channel
+
+    def _wrap_stub(
+        self, name: str, stub: grpc.UnaryUnaryMultiCallable
+    ) -> grpc.UnaryUnaryMultiCallable:
+        # Hedge slow calls to the idempotent read methods.
+        if self._hedging_policy is None or name not in self._IDEMPOTENT_METHODS:
+            return stub
+        return self._hedging_policy.wrap_stub(name, stub)
+
+    def _response_deserializer(self, response_type):
+        # Leave the responses serialized in passthrough mode.
+        if self._passthrough:
+            return passthrough_deserializer(response_type)
+        return response_type.deserialize
+
     @property
     def operations_client(self) -> operations_v1.OperationsClient:
         """Create the client designed to process long-running operations.
@@ -288,10 +397,15 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "batch_get_assets_history" not in self._stubs:
-            self._stubs["batch_get_assets_history"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/BatchGetAssetsHistory",
-                request_serializer=asset_service.BatchGetAssetsHistoryRequest.serialize,
-                response_deserializer=asset_service.BatchGetAssetsHistoryResponse.deserialize,
+            self._stubs["batch_get_assets_history"] = self._wrap_stub(
+                "batch_get_assets_history",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/BatchGetAssetsHistory",
+                    request_serializer=asset_service.BatchGetAssetsHistoryRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.BatchGetAssetsHistoryResponse
+                    ),
+                ),
             )
         return self._stubs["batch_get_assets_history"]
 
@@ -340,10 +454,13 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "get_feed" not in self._stubs:
-            self._stubs["get_feed"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/GetFeed",
-                request_serializer=asset_service.GetFeedRequest.serialize,
-                response_deserializer=asset_service.Feed.deserialize,
+            self._stubs["get_feed"] = self._wrap_stub(
+                "get_feed",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/GetFeed",
+                    request_serializer=asset_service.GetFeedRequest.serialize,
+                    response_deserializer=asset_service.Feed.deserialize,
+                ),
             )
         return self._stubs["get_feed"]
 
@@ -367,10 +484,13 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "list_feeds" not in self._stubs:
-            self._stubs["list_feeds"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/ListFeeds",
-                request_serializer=asset_service.ListFeedsRequest.serialize,
-                response_deserializer=asset_service.ListFeedsResponse.deserialize,
+            self._stubs["list_feeds"] = self._wrap_stub(
+                "list_feeds",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/ListFeeds",
+                    request_serializer=asset_service.ListFeedsRequest.serialize,
+                    response_deserializer=asset_service.ListFeedsResponse.deserialize,
+                ),
             )
         return self._stubs["list_feeds"]
 
@@ -450,10 +570,15 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "search_all_resources" not in self._stubs:
-            self._stubs["search_all_resources"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/SearchAllResources",
-                request_serializer=asset_service.SearchAllResourcesRequest.serialize,
-                response_deserializer=asset_service.SearchAllResourcesResponse.deserialize,
+            self._stubs["search_all_resources"] = self._wrap_stub(
+                "search_all_resources",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/SearchAllResources",
+                    request_serializer=asset_service.SearchAllResourcesRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.SearchAllResourcesResponse
+                    ),
+                ),
             )
         return self._stubs["search_all_resources"]
 
@@ -483,10 +608,15 @@ class AssetServiceGrpcTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "search_all_iam_policies" not in self._stubs:
-            self._stubs["search_all_iam_policies"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/SearchAllIamPolicies",
-                request_serializer=asset_service.SearchAllIamPoliciesRequest.serialize,
-                response_deserializer=asset_service.SearchAllIamPoliciesResponse.deserialize,
+            self._stubs["search_all_iam_policies"] = self._wrap_stub(
+                "search_all_iam_policies",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/SearchAllIamPolicies",
+                    request_serializer=asset_service.SearchAllIamPoliciesRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.SearchAllIamPoliciesResponse
+                    ),
+                ),
             )
         return self._stubs["search_all_iam_policies"]
 
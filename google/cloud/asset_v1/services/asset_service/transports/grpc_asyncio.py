@@ -25,11 +25,20 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 import grpc  # type: ignore
 from grpc.experimental import aio  # type: ignore
 
+from google.cloud.asset._transport_utils.compression import CompressionConfig
+from google.cloud.asset._transport_utils.concurrency_limiter import ConcurrencyLimiter
+from google.cloud.asset._transport_utils.hedging import HedgingPolicy
+from google.cloud.asset._transport_utils.metrics import MetricsRegistry
+from google.cloud.asset._transport_utils.passthrough import passthrough_deserializer
+from google.cloud.asset._transport_utils.retry_budget import RetryBudget
+from google.cloud.asset._transport_utils.single_flight import AsyncSingleFlight
+from google.cloud.asset._transport_utils.tracing import Tracer
 from google.cloud.asset_v1.types import asset_service
 from google.longrunning import operations_pb2 as operations  # type: ignore
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
-from .base import AssetServiceTransport
+from .base import AssetServiceTransport, InsecureCredentials
+from .channel_pool import AsyncChannelPool
 from .grpc import AssetServiceGrpcTransport
 
 
@@ -66,7 +75,8 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 authorization credentials to attach to requests. These
                 credentials identify this application to the service. If
                 none are specified, the client will attempt to ascertain
-                the credentials from the environment.
+                the credentials from the environment. With
+                ``InsecureCredentials``, the channel is opened without TLS.
             credentials_file (Optional[str]): A file with credentials that can
                 be loaded with :func:`google.auth.load_credentials_from_file`.
                 This argument is ignored if ``channel`` is provided.
@@ -80,6 +90,8 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         Returns:
             aio.Channel: A gRPC AsyncIO channel object.
         """
+        if isinstance(credentials, InsecureCredentials):
+            return aio.insecure_channel(host, options=kwargs.get("options"))
         scopes = scopes or cls.AUTH_SCOPES
         return grpc_helpers_async.create_channel(
             host,
@@ -101,6 +113,16 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         api_mtls_endpoint: str = None,
         client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
         quota_project_id=None,
+        single_flight: bool = False,
+        channel_pool_size: int = 1,
+        channel_pool_policy: str = "round_robin",
+        hedging_policy: HedgingPolicy = None,
+        concurrency_limiter: ConcurrencyLimiter = None,
+        metrics: MetricsRegistry = None,
+        tracer: Tracer = None,
+        compression: CompressionConfig = None,
+        retry_budget: RetryBudget = None,
+        passthrough: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -130,6 +152,40 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 is None.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            single_flight (bool): Whether identical concurrent calls to the
+                idempotent read methods are coalesced into a single RPC
+                whose response is shared by every caller.
+            channel_pool_size (int): The number of channels to open. With
+                more than one, each call is sent on one of the channels,
+                spreading concurrent calls over several connections.
+                This argument is ignored if ``channel`` is provided.
+            channel_pool_policy (str): How the channel of each call is
+                picked from the pool: ``"round_robin"`` or
+                ``"least_loaded"`` (the channel with the fewest calls in
+                flight).
+            hedging_policy (Optional[~.HedgingPolicy]): If provided, slow calls
+                to the idempotent read methods are hedged with a duplicate
+                call according to this policy.
+            concurrency_limiter (Optional[~.ConcurrencyLimiter]): If provided,
+                unary calls wait for a slot of this adaptive limiter, which
+                shrinks on quota errors and grows back on success.
+            metrics (Optional[~.MetricsRegistry]): If provided, the latency,
+                message sizes, retries and pages of unary calls are recorded
+                in this registry.
+            tracer (Optional[~.Tracer]): If provided, unary calls, pages of
+                pagers and polls of long-running operations are traced with
+                this tracer.
+            compression (Optional[~.CompressionConfig]): If provided, the
+                per-method compression of the requests of unary calls.
+            retry_budget (Optional[~.RetryBudget]): If provided, retries of
+                unary calls draw tokens from this budget and fail with
+                ``RetryBudgetExhausted`` when it runs out.
+            passthrough (bool): Whether the responses of
+                ``batch_get_assets_history``, ``search_all_resources`` and
+                ``search_all_iam_policies`` are left serialized, and returned as
+                ``RawResponse`` objects holding the bytes received and the
+                ``next_page_token`` read from them. Pagers then yield these from
+                their ``pages``; iterating their items raises AttributeError.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -137,6 +193,17 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        self._channel_pool_size = channel_pool_size
+        self._channel_pool_policy = channel_pool_policy
+        self._hedging_policy = hedging_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._metrics = metrics
+        self._tracer = tracer
+        self._compression = compression
+        self._retry_budget = retry_budget
+        self._passthrough = passthrough
+        self._quota_project_id = quota_project_id
+
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
@@ -162,8 +229,11 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 ssl_credentials = SslCredentials().ssl_credentials
 
             # create a new channel. The provided one is ignored.
-            self._grpc_channel = type(self).create_channel(
+            self._grpc_channel = AsyncChannelPool.create(
+                type(self).create_channel,
+                channel_pool_size,
                 host,
+                policy=channel_pool_policy,
                 credentials=credentials,
                 credentials_file=credentials_file,
                 ssl_credentials=ssl_credentials,
@@ -171,7 +241,13 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
-        # Run the base constructor.
+        if hasattr(self, "_grpc_channel"):
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
+
+        self._async_single_flight = AsyncSingleFlight() if single_flight else None
+
+        # Run the base constructor. The calls are coalesced by the stubs,
+        # not by the base class, whose wrappers only handle synchronous calls.
         super().__init__(
             host=host,
             credentials=credentials,
@@ -192,13 +268,54 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # Sanity check: Only create a new channel if we do not already
         # have one.
         if not hasattr(self, "_grpc_channel"):
-            self._grpc_channel = self.create_channel(
-                self._host, credentials=self._credentials,
+            self._grpc_channel = AsyncChannelPool.create(
+                self.create_channel,
+                self._channel_pool_size,
+                self._host,
+                policy=self._channel_pool_policy,
+                credentials=self._credentials,
             )
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
 
         # Return the channel from cache.
         return self._grpc_channel
 
+    def _wrap_channel(self, channel: aio.Channel) -> aio.Channel:
+        # Compress requests, record metrics, trace calls and apply the
+        # concurrency limiter and the retry budget, if configured.
+        if self._compression is not None:
+            channel = self._compression.wrap_async_channel(channel)
+        if self._metrics is not None:
+            channel = self._metrics.wrap_async_channel(channel)
+        if self._tracer is not None:
+            channel = self._tracer.wrap_async_channel(channel)
+        if self._concurrency_limiter is not None:
+            channel = self._concurrency_limiter.wrap_async_channel(
+                channel, self._quota_project_id
+            )
+        if self._retry_budget is not None:
+            channel = self._retry_budget.wrap_async_channel(channel)
+        return channel
+
+    def _wrap_stub(
+        self, name: str, stub: aio.UnaryUnaryMultiCallable
+    ) -> aio.UnaryUnaryMultiCallable:
+        # Hedge slow calls to the idempotent read methods, then coalesce
+        # identical concurrent calls.
+        if name not in self._IDEMPOTENT_METHODS:
+            return stub
+        if self._hedging_policy is not None:
+            stub = self._hedging_policy.wrap_async_stub(name, stub)
+        if self._async_single_flight is not None:
+            stub = self._async_single_flight.wrap_stub(name, stub)
+        return stub
+
+    def _response_deserializer(self, response_type):
+        # Leave the responses serialized in passthrough mode.
+        if self._passthrough:
+            return passthrough_deserializer(response_type)
+        return response_type.deserialize
+
     @property
     def operations_client(self) -> operations_v1.OperationsAsyncClient:
         """Create the client designed to process long-running operations.
@@ -281,10 +398,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "batch_get_assets_history" not in self._stubs:
-            self._stubs["batch_get_assets_history"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/BatchGetAssetsHistory",
-                request_serializer=asset_service.BatchGetAssetsHistoryRequest.serialize,
-                response_deserializer=asset_service.BatchGetAssetsHistoryResponse.deserialize,
+            self._stubs["batch_get_assets_history"] = self._wrap_stub(
+                "batch_get_assets_history",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/BatchGetAssetsHistory",
+                    request_serializer=asset_service.BatchGetAssetsHistoryRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.BatchGetAssetsHistoryResponse
+                    ),
+                ),
             )
         return self._stubs["batch_get_assets_history"]
 
@@ -335,10 +457,13 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "get_feed" not in self._stubs:
-            self._stubs["get_feed"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/GetFeed",
-                request_serializer=asset_service.GetFeedRequest.serialize,
-                response_deserializer=asset_service.Feed.deserialize,
+            self._stubs["get_feed"] = self._wrap_stub(
+                "get_feed",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/GetFeed",
+                    request_serializer=asset_service.GetFeedRequest.serialize,
+                    response_deserializer=asset_service.Feed.deserialize,
+                ),
             )
         return self._stubs["get_feed"]
 
@@ -364,10 +489,13 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "list_feeds" not in self._stubs:
-            self._stubs["list_feeds"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/ListFeeds",
-                request_serializer=asset_service.ListFeedsRequest.serialize,
-                response_deserializer=asset_service.ListFeedsResponse.deserialize,
+            self._stubs["list_feeds"] = self._wrap_stub(
+                "list_feeds",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/ListFeeds",
+                    request_serializer=asset_service.ListFeedsRequest.serialize,
+                    response_deserializer=asset_service.ListFeedsResponse.deserialize,
+                ),
             )
         return self._stubs["list_feeds"]
 
@@ -449,10 +577,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "search_all_resources" not in self._stubs:
-            self._stubs["search_all_resources"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/SearchAllResources",
-                request_serializer=asset_service.SearchAllResourcesRequest.serialize,
-                response_deserializer=asset_service.SearchAllResourcesResponse.deserialize,
+            self._stubs["search_all_resources"] = self._wrap_stub(
+                "search_all_resources",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/SearchAllResources",
+                    request_serializer=asset_service.SearchAllResourcesRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.SearchAllResourcesResponse
+                    ),
+                ),
             )
         return self._stubs["search_all_resources"]
 
@@ -482,10 +615,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "search_all_iam_policies" not in self._stubs:
-            self._stubs["search_all_iam_policies"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1.AssetService/SearchAllIamPolicies",
-                request_serializer=asset_service.SearchAllIamPoliciesRequest.serialize,
-                response_deserializer=asset_service.SearchAllIamPoliciesResponse.deserialize,
+            self._stubs["search_all_iam_policies"] = self._wrap_stub(
+                "search_all_iam_policies",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1.AssetService/SearchAllIamPolicies",
+                    request_serializer=asset_service.SearchAllIamPoliciesRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.SearchAllIamPoliciesResponse
+                    ),
+                ),
             )
         return self._stubs["search_all_iam_policies"]
 
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+from typing import Any, Optional, Sequence
+
+from google.api_core import client_options as client_options_lib  # type: ignore
+from google.api_core import exceptions  # type: ignore
+from google.api_core import grpc_helpers  # type: ignore
+from google.api_core import grpc_helpers_async  # type: ignore
+from google import auth  # type: ignore
+from google.auth import credentials  # type: ignore
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from .channel_pool import AsyncChannelPool
+from .channel_pool import ChannelPool
+from .channel_pool import ROUND_ROBIN
+
+
+class AssetServiceSession:
+    """Credentials and channels shared by clients of every API version.
+
+    The session resolves credentials once and lazily opens one channel, or
+    one pool of channels, to the Cloud Asset API. Clients of any version,
+    sync or async, are bound to the session with :meth:`client`; they all
+    send their calls over the shared channel, so connections, TLS
+    handshakes and token refreshes are not repeated per client.
+
+    .. code-block:: python
+
+        session = AssetServiceSession()
+        client = session.client(asset_v1.AssetServiceClient)
+        iam_client = session.client(asset_v1p4beta1.AssetServiceClient)
+        async_client = session.client(asset_v1p5beta1.AssetServiceAsyncClient)
+    """
+
+    AUTH_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
+    def __init__(
+        self,
+        *,
+        host: str = "cloudasset.googleapis.com",
+        credentials: credentials.Credentials = None,
+        credentials_file: str = None,
+        scopes: Sequence[str] = None,
+        quota_project_id: Optional[str] = None,
+        ssl_credentials: grpc.ChannelCredentials = None,
+        channel_pool_size: int = 1,
+        channel_pool_policy: str = ROUND_ROBIN
+    ) -> None:
+        """Instantiate the session.
+
+        Args:
+            host (Optional[str]): The hostname to connect to.
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. If none
+                are specified, the session will attempt to ascertain the
+                credentials from the environment.
+            credentials_file (Optional[str]): A file with credentials that can
+                be loaded with :func:`google.auth.load_credentials_from_file`.
+                This argument is mutually exclusive with credentials.
+            scopes (Optional[Sequence[str]]): A list of scopes.
+            quota_project_id (Optional[str]): An optional project to use for billing
+                and quota.
+            ssl_credentials (Optional[grpc.ChannelCredentials]): SSL
+                credentials for the channels, such as client certificates
+                for mutual TLS.
+            channel_pool_size (int): The number of channels to open.
+            channel_pool_policy (str): How the channel of each call is
+                picked from the pool: ``"round_robin"`` or
+                ``"least_loaded"``.
+
+        Raises:
+          google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
+              and ``credentials_file`` are passed.
+        """
+        if credentials and credentials_file:
+            raise exceptions.DuplicateCredentialArgs(
+                "'credentials_file' and 'credentials' are mutually exclusive"
+            )
+        if ":" not in host:
+            host += ":443"
+        self._host = host
+        self._credentials = credentials
+        self._credentials_file = credentials_file
+        self._scopes = scopes or self.AUTH_SCOPES
+        self._quota_project_id = quota_project_id
+        self._ssl_credentials = ssl_credentials
+        self._channel_pool_size = channel_pool_size
+        self._channel_pool_policy = channel_pool_policy
+        self._lock = threading.Lock()
+        self._grpc_channel = None  # type: Optional[grpc.Channel]
+        self._grpc_asyncio_channel = None  # type: Optional[aio.Channel]
+
+    @property
+    def credentials(self) -> credentials.Credentials:
+        """The credentials shared by the session's channels.
+
+        They are resolved on first use and cached; repeated calls return
+        the same credentials.
+        """
+        with self._lock:
+            return self._resolve_credentials()
+
+    @property
+    def grpc_channel(self) -> grpc.Channel:
+        """The channel shared by sync clients, opened on first use."""
+        with self._lock:
+            if self._grpc_channel is None:
+                self._grpc_channel = self._create_channel(
+                    ChannelPool, grpc_helpers.create_channel
+                )
+            return self._grpc_channel
+
+    @property
+    def grpc_asyncio_channel(self) -> aio.Channel:
+        """The channel shared by async clients, opened on first use."""
+        with self._lock:
+            if self._grpc_asyncio_channel is None:
+                self._grpc_asyncio_channel = self._create_channel(
+                    AsyncChannelPool, grpc_helpers_async.create_channel
+                )
+            return self._grpc_asyncio_channel
+
+    def transport(self, transport_class: type) -> Any:
+        """Return a transport of ``transport_class`` bound to the session.
+
+        Args:
+            transport_class (type): A gRPC or gRPC AsyncIO transport class
+                of any API version.
+
+        Returns:
+            The transport, sending calls over the session's channel.
+        """
+        # Every version names its AsyncIO transport
+        # ``AssetServiceGrpcAsyncIOTransport``.
+        if transport_class.__name__.endswith("GrpcAsyncIOTransport"):
+            return transport_class(host=self._host, channel=self.grpc_asyncio_channel)
+        return transport_class(host=self._host, channel=self.grpc_channel)
+
+    def client(self, client_class: type, **kwargs) -> Any:
+        """Return a client of ``client_class`` bound to the session.
+
+        Args:
+            client_class (type): A sync or async ``AssetServiceClient`` of
+                any API version.
+            kwargs: Further keyword arguments passed to ``client_class``.
+                The endpoint, credentials, scopes and quota project are
+                those of the session.
+
+        Returns:
+            The client, sending calls over the session's channel.
+
+        Raises:
+            ValueError: If ``kwargs`` give a transport or credentials, or
+                client options which differ from the session's.
+        """
+        for name in ("transport", "credentials"):
+            if kwargs.get(name) is not None:
+                raise ValueError(
+                    "The {} of a session's clients is the session's.".format(name)
+                )
+        self._check_client_options(kwargs.get("client_options"))
+        # Async clients use the AsyncIO transport, sync clients the gRPC one.
+        if client_class.__name__.endswith("AsyncClient"):
+            transport_name = "grpc_asyncio"
+        else:
+            transport_name = "grpc"
+        transport_class = client_class.get_transport_class(transport_name)
+        return client_class(transport=self.transport(transport_class), **kwargs)
+
+    def close(self) -> None:
+        """Close the sync channel, if it was opened."""
+        with self._lock:
+            channel, self._grpc_channel = self._grpc_channel, None
+        if channel is not None:
+            channel.close()
+
+    async def close_async(self) -> None:
+        """Close the AsyncIO channel, if it was opened."""
+        with self._lock:
+            channel, self._grpc_asyncio_channel = self._grpc_asyncio_channel, None
+        if channel is not None:
+            await channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_async()
+
+    def _resolve_credentials(self):
+        if self._credentials is None:
+            if self._credentials_file:
+                self._credentials, _ = auth.load_credentials_from_file(
+                    self._credentials_file,
+                    scopes=self._scopes,
+                    quota_project_id=self._quota_project_id,
+                )
+            else:
+                self._credentials, _ = auth.default(
+                    scopes=self._scopes, quota_project_id=self._quota_project_id
+                )
+        return self._credentials
+
+    def _check_client_options(self, client_options: Any) -> None:
+        # Client options are applied when a client creates its transport, so
+        # those which would configure it cannot be honoured by a session's
+        # client; reject them rather than ignore them.
+        if client_options is None:
+            return
+        if isinstance(client_options, dict):
+            client_options = client_options_lib.from_dict(client_options)
+        endpoint = client_options.api_endpoint
+        if endpoint is not None and ":" not in endpoint:
+            endpoint += ":443"
+        conflicts = [
+            name
+            for name, conflicting in (
+                ("api_endpoint", endpoint not in (None, self._host)),
+                (
+                    "quota_project_id",
+                    client_options.quota_project_id
+                    not in (None, self._quota_project_id),
+                ),
+                ("client_cert_source", client_options.client_cert_source),
+                ("credentials_file", client_options.credentials_file),
+                ("scopes", client_options.scopes),
+            )
+            if conflicting
+        ]
+        if conflicts:
+            raise ValueError(
+                "The client options {} conflict with the session; set them on "
+                "the session instead.".format(", ".join(conflicts))
+            )
+
+    def _create_channel(self, pool_class: type, factory: Any) -> Any:
+        return pool_class.create(
+            factory,
+            self._channel_pool_size,
+            self._host,
+            policy=self._channel_pool_policy,
+            credentials=self._resolve_credentials(),
+            scopes=self._scopes,
+            ssl_credentials=self._ssl_credentials,
+            quota_project_id=self._quota_project_id,
+        )
+
+
+__all__ = ("AssetServiceSession",)
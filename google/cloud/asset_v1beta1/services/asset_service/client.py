@@ -32,6 +32,10 @@ from google.oauth2 import service_account  # type: ignore
 
 from google.api_core import operation
 from google.api_core import operation_async
+from google.cloud.asset._client_utils.deadline import Deadline
+from google.cloud.asset._client_utils.executor import ClientExecutor
+from google.cloud.asset._client_utils.executor import future_method
+from google.cloud.asset._transport_utils import tracing
 from google.cloud.asset_v1beta1.types import asset_service
 from google.cloud.asset_v1beta1.types import assets
 
@@ -134,6 +138,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         credentials: credentials.Credentials = None,
         transport: Union[str, AssetServiceTransport] = None,
         client_options: ClientOptions = None,
+        executor: ClientExecutor = None,
     ) -> None:
         """Instantiate the asset service client.
 
@@ -159,6 +164,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 (2) The ``client_cert_source`` property is used to provide client
                 SSL credentials for mutual TLS transport. If not provided, the
                 default SSL credentials will be used if present.
+            executor (Optional[~.ClientExecutor]): The executor running
+                the calls of the ``*_future`` methods. A default executor,
+                shared by the clients given none, is used if not provided.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -218,6 +226,8 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 quota_project_id=client_options.quota_project_id,
             )
 
+        self._executor = executor
+
     def export_assets(
         self,
         request: asset_service.ExportAssetsRequest = None,
@@ -225,6 +235,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> operation.Operation:
         r"""Exports assets with time and resource types to a given Cloud
         Storage location. The output format is newline-delimited JSON.
@@ -241,6 +252,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request, the polls of the operation
+                and waiting on its ``result()``.
 
         Returns:
             ~.operation.Operation:
@@ -274,6 +288,11 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -284,6 +303,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             asset_service.ExportAssetsResponse,
             metadata_type=asset_service.ExportAssetsRequest,
         )
+        response = tracing.trace_operation(self._transport._tracer, response)
+        if deadline is not None:
+            response = deadline.bind_operation(response)
 
         # Done; return the response.
         return response
@@ -343,6 +365,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         # Done; return the response.
         return response
 
+    export_assets_future = future_method("export_assets", "operation")
+    batch_get_assets_history_future = future_method("batch_get_assets_history")
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
@@ -43,6 +43,12 @@ class AssetServiceTransport(abc.ABC):
 
     AUTH_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
 
+    # The tracer of the pagers and operations of clients using the transport.
+    _tracer = None
+
+    # Read-only methods which are safe to issue more than once.
+    _IDEMPOTENT_METHODS = ("batch_get_assets_history",)
+
     def __init__(
         self,
         *,
@@ -15,14 +15,46 @@
 # limitations under the License.
 #
 
-from .services.asset_service import AssetServiceClient
-from .types.asset_service import SearchAllIamPoliciesRequest
-from .types.asset_service import SearchAllIamPoliciesResponse
-from .types.asset_service import SearchAllResourcesRequest
-from .types.asset_service import SearchAllResourcesResponse
-from .types.assets import IamPolicySearchResult
-from .types.assets import Permissions
-from .types.assets import StandardResourceMetadata
+import importlib as _importlib
+import sys as _sys
+
+# The module defining each public name, imported on first access.
+_LAZY_ATTRIBUTES = {
+    "AssetServiceClient": ".services.asset_service",
+    "IamPolicySearchResult": ".types.assets",
+    "Permissions": ".types.assets",
+    "SearchAllIamPoliciesRequest": ".types.asset_service",
+    "SearchAllIamPoliciesResponse": ".types.asset_service",
+    "SearchAllResourcesRequest": ".types.asset_service",
+    "SearchAllResourcesResponse": ".types.asset_service",
+    "StandardResourceMetadata": ".types.assets",
+}
+
+# Subpackages the package used to import eagerly.
+_LAZY_SUBMODULES = ("services", "types")
+
+
+def __getattr__(name):
+    # Resolve public names lazily (PEP 562) to keep importing the package
+    # cheap; only the modules actually used get imported.
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        if name in _LAZY_SUBMODULES:
+            return _importlib.import_module("." + name, __name__)
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
+
+if _sys.version_info < (3, 7):  # pragma: NO COVER
+    # Module ``__getattr__`` requires Python 3.7; import eagerly instead.
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
 
 
 __all__ = (
@@ -18,7 +18,7 @@
 from collections import OrderedDict
 import functools
 import re
-from typing import Dict, Sequence, Tuple, Type, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Sequence, Tuple, Type, Union
 import pkg_resources
 
 import google.api_core.client_options as ClientOptions  # type: ignore
@@ -28,6 +28,8 @@ from google.api_core import retry as retries  # type: ignore
 from google.auth import credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.asset._client_utils import bulk
+from google.cloud.asset._client_utils.deadline import Deadline
 from google.cloud.asset_v1p1beta1.services.asset_service import pagers
 from google.cloud.asset_v1p1beta1.types import asset_service
 from google.cloud.asset_v1p1beta1.types import assets
@@ -103,6 +105,7 @@ class AssetServiceAsyncClient:
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllResourcesAsyncPager:
         r"""Searches all the resources under a given accessible
         CRM scope (project/folder/organization). This RPC gives
@@ -146,6 +149,10 @@ class AssetServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllResourcesAsyncPager:
@@ -198,6 +205,11 @@ class AssetServiceAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -205,6 +217,8 @@ class AssetServiceAsyncClient:
         # an `__aiter__` convenience method.
         response = pagers.SearchAllResourcesAsyncPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._client._transport._tracer,
+            deadline=deadline,
         )
 
         # Done; return the response.
@@ -219,6 +233,7 @@ class AssetServiceAsyncClient:
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllIamPoliciesAsyncPager:
         r"""Searches all the IAM policies under a given
         accessible CRM scope (project/folder/organization). This
@@ -258,6 +273,10 @@ class AssetServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllIamPoliciesAsyncPager:
@@ -308,6 +327,11 @@ class AssetServiceAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -315,11 +339,47 @@ class AssetServiceAsyncClient:
         # an `__aiter__` convenience method.
         response = pagers.SearchAllIamPoliciesAsyncPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._client._transport._tracer,
+            deadline=deadline,
         )
 
         # Done; return the response.
         return response
 
+    def gather(
+        self, method: str, requests: Iterable[Any], **kwargs
+    ) -> AsyncIterator[bulk.BulkResult]:
+        r"""Call one method for many requests, with bounded concurrency.
+
+        Requests are taken lazily, so that a generator of any number of
+        them can be given, and failures are reported per request:
+
+        .. code-block:: python
+
+            requests = ({"scope": "projects/{}".format(i)} for i in range(100000))
+            async for result in client.gather("search_all_resources", requests):
+                if not result.ok:
+                    print(result.index, result.error)
+
+        Args:
+            method (str): The name of the method of this client to call,
+                such as ``"search_all_resources"``. Paged methods only fetch the first
+                page of each request.
+            requests (Iterable[Any]): The request objects, or dicts, of
+                the calls.
+            kwargs: The ``concurrency``, ``ordered``, ``retry``,
+                ``timeout``, ``metadata`` and ``deadline`` options of
+                :func:`~google.cloud.asset._client_utils.bulk.gather_method`.
+
+        Returns:
+            AsyncIterator[~.BulkResult]: The result of every request sent,
+            holding the response or the error of the call.
+
+        Raises:
+            ValueError: If ``method`` is not a method of this client.
+        """
+        return bulk.gather_method(self, method, requests, **kwargs)
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
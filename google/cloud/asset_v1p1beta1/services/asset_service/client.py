@@ -30,6 +30,9 @@ from google.auth.transport import mtls  # type: ignore
 from google.auth.exceptions import MutualTLSChannelError  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.asset._client_utils.deadline import Deadline
+from google.cloud.asset._client_utils.executor import ClientExecutor
+from google.cloud.asset._client_utils.executor import future_method
 from google.cloud.asset_v1p1beta1.services.asset_service import pagers
 from google.cloud.asset_v1p1beta1.types import asset_service
 from google.cloud.asset_v1p1beta1.types import assets
@@ -133,6 +136,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         credentials: credentials.Credentials = None,
         transport: Union[str, AssetServiceTransport] = None,
         client_options: ClientOptions = None,
+        executor: ClientExecutor = None,
     ) -> None:
         """Instantiate the asset service client.
 
@@ -158,6 +162,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 (2) The ``client_cert_source`` property is used to provide client
                 SSL credentials for mutual TLS transport. If not provided, the
                 default SSL credentials will be used if present.
+            executor (Optional[~.ClientExecutor]): The executor running
+                the calls of the ``*_future`` methods. A default executor,
+                shared by the clients given none, is used if not provided.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -217,6 +224,8 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 quota_project_id=client_options.quota_project_id,
             )
 
+        self._executor = executor
+
     def search_all_resources(
         self,
         request: asset_service.SearchAllResourcesRequest = None,
@@ -227,6 +236,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllResourcesPager:
         r"""Searches all the resources under a given accessible
         CRM scope (project/folder/organization). This RPC gives
@@ -270,6 +280,10 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllResourcesPager:
@@ -316,6 +330,11 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -323,6 +342,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         # an `__iter__` convenience method.
         response = pagers.SearchAllResourcesPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._transport._tracer,
+            deadline=deadline,
+            executor=self._executor,
         )
 
         # Done; return the response.
@@ -337,6 +359,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> pagers.SearchAllIamPoliciesPager:
         r"""Searches all the IAM policies under a given
         accessible CRM scope (project/folder/organization). This
@@ -376,6 +399,10 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request and every further page
+                request. Iteration stops once it runs out, and the
+                pager's ``progress`` tells how far it got.
 
         Returns:
             ~.pagers.SearchAllIamPoliciesPager:
@@ -420,6 +447,11 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("scope", request.scope),)),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -427,11 +459,17 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         # an `__iter__` convenience method.
         response = pagers.SearchAllIamPoliciesPager(
             method=rpc, request=request, response=response, metadata=metadata,
+            tracer=self._transport._tracer,
+            deadline=deadline,
+            executor=self._executor,
         )
 
         # Done; return the response.
         return response
 
+    search_all_resources_future = future_method("search_all_resources", "pager")
+    search_all_iam_policies_future = future_method("search_all_iam_policies", "pager")
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
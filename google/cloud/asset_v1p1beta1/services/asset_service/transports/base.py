@@ -41,6 +41,12 @@ class AssetServiceTransport(abc.ABC):
 
     AUTH_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
 
+    # The tracer of the pagers and operations of clients using the transport.
+    _tracer = None
+
+    # Read-only methods which are safe to issue more than once.
+    _IDEMPOTENT_METHODS = ("search_all_resources", "search_all_iam_policies")
+
     def __init__(
         self,
         *,
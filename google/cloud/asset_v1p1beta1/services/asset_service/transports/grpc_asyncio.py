@@ -25,6 +25,27 @@ import grpc  # type: ignore
 from grpc.experimental import aio  # type: ignore
 
 from google.cloud.asset_v1p1beta1.types import asset_service
+from google.cloud.asset._transport_utils.compression import (
+    CompressionConfig,
+)
+from google.cloud.asset._transport_utils.concurrency_limiter import (
+    ConcurrencyLimiter,
+)
+from google.cloud.asset._transport_utils.hedging import (
+    HedgingPolicy,
+)
+from google.cloud.asset._transport_utils.metrics import (
+    MetricsRegistry,
+)
+from google.cloud.asset._transport_utils.passthrough import (
+    passthrough_deserializer,
+)
+from google.cloud.asset._transport_utils.retry_budget import (
+    RetryBudget,
+)
+from google.cloud.asset._transport_utils.tracing import (
+    Tracer,
+)
 
 from .base import AssetServiceTransport
 from .grpc import AssetServiceGrpcTransport
@@ -98,6 +119,13 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         api_mtls_endpoint: str = None,
         client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
         quota_project_id=None,
+        hedging_policy: HedgingPolicy = None,
+        concurrency_limiter: ConcurrencyLimiter = None,
+        metrics: MetricsRegistry = None,
+        tracer: Tracer = None,
+        compression: CompressionConfig = None,
+        retry_budget: RetryBudget = None,
+        passthrough: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -127,6 +155,29 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 is None.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            hedging_policy (Optional[~.HedgingPolicy]): If provided, slow calls
+                to the idempotent read methods are hedged with a duplicate
+                call according to this policy.
+            concurrency_limiter (Optional[~.ConcurrencyLimiter]): If provided,
+                unary calls wait for a slot of this adaptive limiter, which
+                shrinks on quota errors and grows back on success.
+            metrics (Optional[~.MetricsRegistry]): If provided, the latency,
+                message sizes, retries and pages of unary calls are recorded
+                in this registry.
+            tracer (Optional[~.Tracer]): If provided, unary calls, pages of
+                pagers and polls of long-running operations are traced with
+                this tracer.
+            compression (Optional[~.CompressionConfig]): If provided, the
+                per-method compression of the requests of unary calls.
+            retry_budget (Optional[~.RetryBudget]): If provided, retries of
+                unary calls draw tokens from this budget and fail with
+                ``RetryBudgetExhausted`` when it runs out.
+            passthrough (bool): Whether the responses of
+                ``search_all_resources`` and ``search_all_iam_policies`` are
+                left serialized, and returned as ``RawResponse`` objects holding
+                the bytes received and the ``next_page_token`` read from them.
+                Pagers then yield these from their ``pages``; iterating
+                their items raises AttributeError.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -134,6 +185,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        self._hedging_policy = hedging_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._metrics = metrics
+        self._tracer = tracer
+        self._compression = compression
+        self._retry_budget = retry_budget
+        self._passthrough = passthrough
+        self._quota_project_id = quota_project_id
+
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
@@ -168,6 +228,9 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
+        if hasattr(self, "_grpc_channel"):
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -192,10 +255,42 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
             self._grpc_channel = self.create_channel(
                 self._host, credentials=self._credentials,
             )
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
 
         # Return the channel from cache.
         return self._grpc_channel
 
+    def _wrap_channel(self, channel: aio.Channel) -> aio.Channel:
+        # Compress requests, record metrics, trace calls and apply the
+        # concurrency limiter and the retry budget, if configured.
+        if self._compression is not None:
+            channel = self._compression.wrap_async_channel(channel)
+        if self._metrics is not None:
+            channel = self._metrics.wrap_async_channel(channel)
+        if self._tracer is not None:
+            channel = self._tracer.wrap_async_channel(channel)
+        if self._concurrency_limiter is not None:
+            channel = self._concurrency_limiter.wrap_async_channel(
+                channel, self._quota_project_id
+            )
+        if self._retry_budget is not None:
+            channel = self._retry_budget.wrap_async_channel(channel)
+        return channel
+
+    def _wrap_stub(
+        self, name: str, stub: aio.UnaryUnaryMultiCallable
+    ) -> aio.UnaryUnaryMultiCallable:
+        # Hedge slow calls to the idempotent read methods.
+        if self._hedging_policy is None or name not in self._IDEMPOTENT_METHODS:
+            return stub
+        return self._hedging_policy.wrap_async_stub(name, stub)
+
+    def _response_deserializer(self, response_type):
+        # Leave the responses serialized in passthrough mode.
+        if self._passthrough:
+            return passthrough_deserializer(response_type)
+        return response_type.deserialize
+
     @property
     def search_all_resources(
         self,
@@ -224,10 +319,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "search_all_resources" not in self._stubs:
-            self._stubs["search_all_resources"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1p1beta1.AssetService/SearchAllResources",
-                request_serializer=asset_service.SearchAllResourcesRequest.serialize,
-                response_deserializer=asset_service.SearchAllResourcesResponse.deserialize,
+            self._stubs["search_all_resources"] = self._wrap_stub(
+                "search_all_resources",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1p1beta1.AssetService/SearchAllResources",
+                    request_serializer=asset_service.SearchAllResourcesRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.SearchAllResourcesResponse
+                    ),
+                ),
             )
         return self._stubs["search_all_resources"]
 
@@ -260,10 +360,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "search_all_iam_policies" not in self._stubs:
-            self._stubs["search_all_iam_policies"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1p1beta1.AssetService/SearchAllIamPolicies",
-                request_serializer=asset_service.SearchAllIamPoliciesRequest.serialize,
-                response_deserializer=asset_service.SearchAllIamPoliciesResponse.deserialize,
+            self._stubs["search_all_iam_policies"] = self._wrap_stub(
+                "search_all_iam_policies",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1p1beta1.AssetService/SearchAllIamPolicies",
+                    request_serializer=asset_service.SearchAllIamPoliciesRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.SearchAllIamPoliciesResponse
+                    ),
+                ),
             )
         return self._stubs["search_all_iam_policies"]
 
@@ -15,23 +15,55 @@
 # limitations under the License.
 #
 
-from .services.asset_service import AssetServiceClient
-from .types.asset_service import ContentType
-from .types.asset_service import CreateFeedRequest
-from .types.asset_service import DeleteFeedRequest
-from .types.asset_service import Feed
-from .types.asset_service import FeedOutputConfig
-from .types.asset_service import GcsDestination
-from .types.asset_service import GetFeedRequest
-from .types.asset_service import ListFeedsRequest
-from .types.asset_service import ListFeedsResponse
-from .types.asset_service import OutputConfig
-from .types.asset_service import PubsubDestination
-from .types.asset_service import UpdateFeedRequest
-from .types.assets import Asset
-from .types.assets import Resource
-from .types.assets import TemporalAsset
-from .types.assets import TimeWindow
+import importlib as _importlib
+import sys as _sys
+
+# The module defining each public name, imported on first access.
+_LAZY_ATTRIBUTES = {
+    "Asset": ".types.assets",
+    "AssetServiceClient": ".services.asset_service",
+    "ContentType": ".types.asset_service",
+    "CreateFeedRequest": ".types.asset_service",
+    "DeleteFeedRequest": ".types.asset_service",
+    "Feed": ".types.asset_service",
+    "FeedOutputConfig": ".types.asset_service",
+    "GcsDestination": ".types.asset_service",
+    "GetFeedRequest": ".types.asset_service",
+    "ListFeedsRequest": ".types.asset_service",
+    "ListFeedsResponse": ".types.asset_service",
+    "OutputConfig": ".types.asset_service",
+    "PubsubDestination": ".types.asset_service",
+    "Resource": ".types.assets",
+    "TemporalAsset": ".types.assets",
+    "TimeWindow": ".types.assets",
+    "UpdateFeedRequest": ".types.asset_service",
+}
+
+# Subpackages the package used to import eagerly.
+_LAZY_SUBMODULES = ("services", "types")
+
+
+def __getattr__(name):
+    # Resolve public names lazily (PEP 562) to keep importing the package
+    # cheap; only the modules actually used get imported.
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        if name in _LAZY_SUBMODULES:
+            return _importlib.import_module("." + name, __name__)
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
+
+if _sys.version_info < (3, 7):  # pragma: NO COVER
+    # Module ``__getattr__`` requires Python 3.7; import eagerly instead.
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
 
 
 __all__ = (
@@ -18,7 +18,7 @@
 from collections import OrderedDict
 import functools
 import re
-from typing import Dict, Sequence, Tuple, Type, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Sequence, Tuple, Type, Union
 import pkg_resources
 
 import google.api_core.client_options as ClientOptions  # type: ignore
@@ -28,6 +28,7 @@ from google.api_core import retry as retries  # type: ignore
 from google.auth import credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.asset._client_utils import bulk
 from google.cloud.asset_v1p2beta1.types import asset_service
 
 from .transports.base import AssetServiceTransport
@@ -496,6 +497,40 @@ class AssetServiceAsyncClient:
             request, retry=retry, timeout=timeout, metadata=metadata,
         )
 
+    def gather(
+        self, method: str, requests: Iterable[Any], **kwargs
+    ) -> AsyncIterator[bulk.BulkResult]:
+        r"""Call one method for many requests, with bounded concurrency.
+
+        Requests are taken lazily, so that a generator of any number of
+        them can be given, and failures are reported per request:
+
+        .. code-block:: python
+
+            requests = ({"name": "projects/p/feeds/{}".format(i)} for i in range(100000))
+            async for result in client.gather("get_feed", requests):
+                if not result.ok:
+                    print(result.index, result.error)
+
+        Args:
+            method (str): The name of the method of this client to call,
+                such as ``"get_feed"``. Paged methods only fetch the first
+                page of each request.
+            requests (Iterable[Any]): The request objects, or dicts, of
+                the calls.
+            kwargs: The ``concurrency``, ``ordered``, ``retry``,
+                ``timeout``, ``metadata`` and ``deadline`` options of
+                :func:`~google.cloud.asset._client_utils.bulk.gather_method`.
+
+        Returns:
+            AsyncIterator[~.BulkResult]: The result of every request sent,
+            holding the response or the error of the call.
+
+        Raises:
+            ValueError: If ``method`` is not a method of this client.
+        """
+        return bulk.gather_method(self, method, requests, **kwargs)
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
@@ -30,6 +30,8 @@ from google.auth.transport import mtls  # type: ignore
 from google.auth.exceptions import MutualTLSChannelError  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.asset._client_utils.executor import ClientExecutor
+from google.cloud.asset._client_utils.executor import future_method
 from google.cloud.asset_v1p2beta1.types import asset_service
 
 from .transports.base import AssetServiceTransport
@@ -142,6 +144,7 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
         credentials: credentials.Credentials = None,
         transport: Union[str, AssetServiceTransport] = None,
         client_options: ClientOptions = None,
+        executor: ClientExecutor = None,
     ) -> None:
         """Instantiate the asset service client.
 
@@ -167,6 +170,9 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 (2) The ``client_cert_source`` property is used to provide client
                 SSL credentials for mutual TLS transport. If not provided, the
                 default SSL credentials will be used if present.
+            executor (Optional[~.ClientExecutor]): The executor running
+                the calls of the ``*_future`` methods. A default executor,
+                shared by the clients given none, is used if not provided.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -226,6 +232,8 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
                 quota_project_id=client_options.quota_project_id,
             )
 
+        self._executor = executor
+
     def create_feed(
         self,
         request: asset_service.CreateFeedRequest = None,
@@ -615,6 +623,12 @@ class AssetServiceClient(metaclass=AssetServiceClientMeta):
             request, retry=retry, timeout=timeout, metadata=metadata,
         )
 
+    create_feed_future = future_method("create_feed")
+    get_feed_future = future_method("get_feed")
+    list_feeds_future = future_method("list_feeds")
+    update_feed_future = future_method("update_feed")
+    delete_feed_future = future_method("delete_feed")
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
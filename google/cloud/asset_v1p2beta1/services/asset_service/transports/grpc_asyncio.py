@@ -26,6 +26,24 @@ from grpc.experimental import aio  # type: ignore
 
 from google.cloud.asset_v1p2beta1.types import asset_service
 from google.protobuf import empty_pb2 as empty  # type: ignore
+from google.cloud.asset._transport_utils.compression import (
+    CompressionConfig,
+)
+from google.cloud.asset._transport_utils.concurrency_limiter import (
+    ConcurrencyLimiter,
+)
+from google.cloud.asset._transport_utils.hedging import (
+    HedgingPolicy,
+)
+from google.cloud.asset._transport_utils.metrics import (
+    MetricsRegistry,
+)
+from google.cloud.asset._transport_utils.retry_budget import (
+    RetryBudget,
+)
+from google.cloud.asset._transport_utils.tracing import (
+    Tracer,
+)
 
 from .base import AssetServiceTransport
 from .grpc import AssetServiceGrpcTransport
@@ -99,6 +117,12 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         api_mtls_endpoint: str = None,
         client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
         quota_project_id=None,
+        hedging_policy: HedgingPolicy = None,
+        concurrency_limiter: ConcurrencyLimiter = None,
+        metrics: MetricsRegistry = None,
+        tracer: Tracer = None,
+        compression: CompressionConfig = None,
+        retry_budget: RetryBudget = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -128,6 +152,23 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 is None.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            hedging_policy (Optional[~.HedgingPolicy]): If provided, slow calls
+                to the idempotent read methods are hedged with a duplicate
+                call according to this policy.
+            concurrency_limiter (Optional[~.ConcurrencyLimiter]): If provided,
+                unary calls wait for a slot of this adaptive limiter, which
+                shrinks on quota errors and grows back on success.
+            metrics (Optional[~.MetricsRegistry]): If provided, the latency,
+                message sizes, retries and pages of unary calls are recorded
+                in this registry.
+            tracer (Optional[~.Tracer]): If provided, unary calls, pages of
+                pagers and polls of long-running operations are traced with
+                this tracer.
+            compression (Optional[~.CompressionConfig]): If provided, the
+                per-method compression of the requests of unary calls.
+            retry_budget (Optional[~.RetryBudget]): If provided, retries of
+                unary calls draw tokens from this budget and fail with
+                ``RetryBudgetExhausted`` when it runs out.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -135,6 +176,14 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        self._hedging_policy = hedging_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._metrics = metrics
+        self._tracer = tracer
+        self._compression = compression
+        self._retry_budget = retry_budget
+        self._quota_project_id = quota_project_id
+
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
@@ -169,6 +218,9 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
+        if hasattr(self, "_grpc_channel"):
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
+
         # Run the base constructor.
         super().__init__(
             host=host,
@@ -193,10 +245,36 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
             self._grpc_channel = self.create_channel(
                 self._host, credentials=self._credentials,
             )
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
 
         # Return the channel from cache.
         return self._grpc_channel
 
+    def _wrap_channel(self, channel: aio.Channel) -> aio.Channel:
+        # Compress requests, record metrics, trace calls and apply the
+        # concurrency limiter and the retry budget, if configured.
+        if self._compression is not None:
+            channel = self._compression.wrap_async_channel(channel)
+        if self._metrics is not None:
+            channel = self._metrics.wrap_async_channel(channel)
+        if self._tracer is not None:
+            channel = self._tracer.wrap_async_channel(channel)
+        if self._concurrency_limiter is not None:
+            channel = self._concurrency_limiter.wrap_async_channel(
+                channel, self._quota_project_id
+            )
+        if self._retry_budget is not None:
+            channel = self._retry_budget.wrap_async_channel(channel)
+        return channel
+
+    def _wrap_stub(
+        self, name: str, stub: aio.UnaryUnaryMultiCallable
+    ) -> aio.UnaryUnaryMultiCallable:
+        # Hedge slow calls to the idempotent read methods.
+        if self._hedging_policy is None or name not in self._IDEMPOTENT_METHODS:
+            return stub
+        return self._hedging_policy.wrap_async_stub(name, stub)
+
     @property
     def create_feed(
         self,
@@ -244,10 +322,13 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "get_feed" not in self._stubs:
-            self._stubs["get_feed"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1p2beta1.AssetService/GetFeed",
-                request_serializer=asset_service.GetFeedRequest.serialize,
-                response_deserializer=asset_service.Feed.deserialize,
+            self._stubs["get_feed"] = self._wrap_stub(
+                "get_feed",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1p2beta1.AssetService/GetFeed",
+                    request_serializer=asset_service.GetFeedRequest.serialize,
+                    response_deserializer=asset_service.Feed.deserialize,
+                ),
             )
         return self._stubs["get_feed"]
 
@@ -273,10 +354,13 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "list_feeds" not in self._stubs:
-            self._stubs["list_feeds"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1p2beta1.AssetService/ListFeeds",
-                request_serializer=asset_service.ListFeedsRequest.serialize,
-                response_deserializer=asset_service.ListFeedsResponse.deserialize,
+            self._stubs["list_feeds"] = self._wrap_stub(
+                "list_feeds",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1p2beta1.AssetService/ListFeeds",
+                    request_serializer=asset_service.ListFeedsRequest.serialize,
+                    response_deserializer=asset_service.ListFeedsResponse.deserialize,
+                ),
             )
         return self._stubs["list_feeds"]
 
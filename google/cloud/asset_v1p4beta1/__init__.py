@@ -15,14 +15,46 @@
 # limitations under the License.
 #
 
-from .services.asset_service import AssetServiceClient
-from .types.asset_service import AnalyzeIamPolicyRequest
-from .types.asset_service import AnalyzeIamPolicyResponse
-from .types.asset_service import ExportIamPolicyAnalysisRequest
-from .types.asset_service import ExportIamPolicyAnalysisResponse
-from .types.asset_service import IamPolicyAnalysisOutputConfig
-from .types.asset_service import IamPolicyAnalysisQuery
-from .types.assets import IamPolicyAnalysisResult
+import importlib as _importlib
+import sys as _sys
+
+# The module defining each public name, imported on first access.
+_LAZY_ATTRIBUTES = {
+    "AnalyzeIamPolicyRequest": ".types.asset_service",
+    "AnalyzeIamPolicyResponse": ".types.asset_service",
+    "AssetServiceClient": ".services.asset_service",
+    "ExportIamPolicyAnalysisRequest": ".types.asset_service",
+    "ExportIamPolicyAnalysisResponse": ".types.asset_service",
+    "IamPolicyAnalysisOutputConfig": ".types.asset_service",
+    "IamPolicyAnalysisQuery": ".types.asset_service",
+    "IamPolicyAnalysisResult": ".types.assets",
+}
+
+# Subpackages the package used to import eagerly.
+_LAZY_SUBMODULES = ("services", "types")
+
+
+def __getattr__(name):
+    # Resolve public names lazily (PEP 562) to keep importing the package
+    # cheap; only the modules actually used get imported.
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        if name in _LAZY_SUBMODULES:
+            return _importlib.import_module("." + name, __name__)
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
+
+if _sys.version_info < (3, 7):  # pragma: NO COVER
+    # Module ``__getattr__`` requires Python 3.7; import eagerly instead.
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
 
 
 __all__ = (
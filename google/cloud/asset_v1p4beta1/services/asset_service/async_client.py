@@ -18,7 +18,7 @@
 from collections import OrderedDict
 import functools
 import re
-from typing import Dict, Sequence, Tuple, Type, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Sequence, Tuple, Type, Union
 import pkg_resources
 
 import google.api_core.client_options as ClientOptions  # type: ignore
@@ -30,6 +30,9 @@ from google.oauth2 import service_account  # type: ignore
 
 from google.api_core import operation
 from google.api_core import operation_async
+from google.cloud.asset._client_utils import bulk
+from google.cloud.asset._client_utils.deadline import Deadline
+from google.cloud.asset._transport_utils import tracing
 from google.cloud.asset_v1p4beta1.types import asset_service
 from google.cloud.asset_v1p4beta1.types import assets
 
@@ -163,6 +166,7 @@ class AssetServiceAsyncClient:
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        deadline: Union[float, Deadline] = None,
     ) -> operation_async.AsyncOperation:
         r"""Exports IAM policy analysis based on the specified request. This
         API implements the
@@ -180,6 +184,9 @@ class AssetServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            deadline (Union[float, ~.Deadline]): An overall time budget,
+                in seconds, for this request, the polls of the operation
+                and waiting on its ``result()``.
 
         Returns:
             ~.operation_async.AsyncOperation:
@@ -214,6 +221,11 @@ class AssetServiceAsyncClient:
             ),
         )
 
+        # Bound the request, and any further pages or polls, by the deadline.
+        deadline = Deadline.coerce(deadline)
+        if deadline is not None:
+            timeout = deadline.rpc_timeout(timeout)
+
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -224,10 +236,47 @@ class AssetServiceAsyncClient:
             asset_service.ExportIamPolicyAnalysisResponse,
             metadata_type=asset_service.ExportIamPolicyAnalysisRequest,
         )
+        response = tracing.trace_operation(self._client._transport._tracer, response)
+        if deadline is not None:
+            response = deadline.bind_operation(response)
 
         # Done; return the response.
         return response
 
+    def gather(
+        self, method: str, requests: Iterable[Any], **kwargs
+    ) -> AsyncIterator[bulk.BulkResult]:
+        r"""Call one method for many requests, with bounded concurrency.
+
+        Requests are taken lazily, so that a generator of any number of
+        them can be given, and failures are reported per request:
+
+        .. code-block:: python
+
+            requests = ({"analysis_query": {"parent": "projects/{}".format(i)}} for i in range(100000))
+            async for result in client.gather("analyze_iam_policy", requests):
+                if not result.ok:
+                    print(result.index, result.error)
+
+        Args:
+            method (str): The name of the method of this client to call,
+                such as ``"analyze_iam_policy"``. Paged methods only fetch the first
+                page of each request.
+            requests (Iterable[Any]): The request objects, or dicts, of
+                the calls.
+            kwargs: The ``concurrency``, ``ordered``, ``retry``,
+                ``timeout``, ``metadata`` and ``deadline`` options of
+                :func:`~google.cloud.asset._client_utils.bulk.gather_method`.
+
+        Returns:
+            AsyncIterator[~.BulkResult]: The result of every request sent,
+            holding the response or the error of the call.
+
+        Raises:
+            ValueError: If ``method`` is not a method of this client.
+        """
+        return bulk.gather_method(self, method, requests, **kwargs)
+
 
 try:
     _client_info = gapic_v1.client_info.ClientInfo(
@@ -27,6 +27,9 @@ from google.api_core import operations_v1  # type: ignore
 from google.auth import credentials  # type: ignore
 
 from google.cloud.asset_v1p4beta1.types import asset_service
+from google.cloud.asset._transport_utils.single_flight import (
+    SingleFlight,
+)
 from google.longrunning import operations_pb2 as operations  # type: ignore
 
 
@@ -43,6 +46,12 @@ class AssetServiceTransport(abc.ABC):
 
     AUTH_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
 
+    # The tracer of the pagers and operations of clients using the transport.
+    _tracer = None
+
+    # Read-only methods which are safe to coalesce or issue more than once.
+    _IDEMPOTENT_METHODS = ("analyze_iam_policy",)
+
     def __init__(
         self,
         *,
@@ -51,6 +60,7 @@ class AssetServiceTransport(abc.ABC):
         credentials_file: typing.Optional[str] = None,
         scopes: typing.Optional[typing.Sequence[str]] = AUTH_SCOPES,
         quota_project_id: typing.Optional[str] = None,
+        single_flight: bool = False,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -68,6 +78,9 @@ class AssetServiceTransport(abc.ABC):
             scope (Optional[Sequence[str]]): A list of scopes.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            single_flight (bool): Whether identical concurrent calls to the
+                idempotent read methods are coalesced into a single RPC
+                whose response is shared by every caller.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -94,6 +107,8 @@ class AssetServiceTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        self._single_flight = SingleFlight() if single_flight else None
+
         # Lifted into its own function so it can be stubbed out during tests.
         self._prep_wrapped_messages()
 
@@ -118,6 +133,14 @@ class AssetServiceTransport(abc.ABC):
             ),
         }
 
+        # Coalesce identical concurrent calls to the idempotent read methods.
+        if self._single_flight is not None:
+            for name in self._IDEMPOTENT_METHODS:
+                method = getattr(self, name)
+                self._wrapped_methods[method] = self._single_flight.wrap(
+                    name, self._wrapped_methods[method]
+                )
+
     @property
     def operations_client(self) -> operations_v1.OperationsClient:
         """Return the client designed to process long-running operations."""
@@ -28,6 +28,31 @@ from grpc.experimental import aio  # type: ignore
 from google.cloud.asset_v1p4beta1.types import asset_service
 from google.longrunning import operations_pb2 as operations  # type: ignore
 
+from google.cloud.asset._transport_utils.compression import (
+    CompressionConfig,
+)
+from google.cloud.asset._transport_utils.concurrency_limiter import (
+    ConcurrencyLimiter,
+)
+from google.cloud.asset._transport_utils.hedging import (
+    HedgingPolicy,
+)
+from google.cloud.asset._transport_utils.metrics import (
+    MetricsRegistry,
+)
+from google.cloud.asset._transport_utils.single_flight import (
+    AsyncSingleFlight,
+)
+from google.cloud.asset._transport_utils.passthrough import (
+    passthrough_deserializer,
+)
+from google.cloud.asset._transport_utils.retry_budget import (
+    RetryBudget,
+)
+from google.cloud.asset._transport_utils.tracing import (
+    Tracer,
+)
+
 from .base import AssetServiceTransport
 from .grpc import AssetServiceGrpcTransport
 
@@ -100,6 +125,14 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         api_mtls_endpoint: str = None,
         client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
         quota_project_id=None,
+        single_flight: bool = False,
+        hedging_policy: HedgingPolicy = None,
+        concurrency_limiter: ConcurrencyLimiter = None,
+        metrics: MetricsRegistry = None,
+        tracer: Tracer = None,
+        compression: CompressionConfig = None,
+        retry_budget: RetryBudget = None,
+        passthrough: bool = False,
     ) -> None:
         """Instantiate the transport.
 
@@ -129,6 +162,29 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 is None.
             quota_project_id (Optional[str]): An optional project to use for billing
                 and quota.
+            single_flight (bool): Whether identical concurrent calls to the
+                idempotent read methods are coalesced into a single RPC
+                whose response is shared by every caller.
+            hedging_policy (Optional[~.HedgingPolicy]): If provided, slow calls
+                to the idempotent read methods are hedged with a duplicate
+                call according to this policy.
+            concurrency_limiter (Optional[~.ConcurrencyLimiter]): If provided,
+                unary calls wait for a slot of this adaptive limiter, which
+                shrinks on quota errors and grows back on success.
+            metrics (Optional[~.MetricsRegistry]): If provided, the latency,
+                message sizes, retries and pages of unary calls are recorded
+                in this registry.
+            tracer (Optional[~.Tracer]): If provided, unary calls, pages of
+                pagers and polls of long-running operations are traced with
+                this tracer.
+            compression (Optional[~.CompressionConfig]): If provided, the
+                per-method compression of the requests of unary calls.
+            retry_budget (Optional[~.RetryBudget]): If provided, retries of
+                unary calls draw tokens from this budget and fail with
+                ``RetryBudgetExhausted`` when it runs out.
+            passthrough (bool): Whether the responses of ``analyze_iam_policy``
+                are left serialized, and returned as ``RawResponse`` objects
+                holding the bytes received.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -136,6 +192,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        self._hedging_policy = hedging_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._metrics = metrics
+        self._tracer = tracer
+        self._compression = compression
+        self._retry_budget = retry_budget
+        self._passthrough = passthrough
+        self._quota_project_id = quota_project_id
+
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
@@ -170,7 +235,13 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
                 quota_project_id=quota_project_id,
             )
 
-        # Run the base constructor.
+        if hasattr(self, "_grpc_channel"):
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
+
+        self._async_single_flight = AsyncSingleFlight() if single_flight else None
+
+        # Run the base constructor. The calls are coalesced by the stubs,
+        # not by the base class, whose wrappers only handle synchronous calls.
         super().__init__(
             host=host,
             credentials=credentials,
@@ -194,10 +265,47 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
             self._grpc_channel = self.create_channel(
                 self._host, credentials=self._credentials,
             )
+            self._grpc_channel = self._wrap_channel(self._grpc_channel)
 
         # Return the channel from cache.
         return self._grpc_channel
 
+    def _wrap_channel(self, channel: aio.Channel) -> aio.Channel:
+        # Compress requests, record metrics, trace calls and apply the
+        # concurrency limiter and the retry budget, if configured.
+        if self._compression is not None:
+            channel = self._compression.wrap_async_channel(channel)
+        if self._metrics is not None:
+            channel = self._metrics.wrap_async_channel(channel)
+        if self._tracer is not None:
+            channel = self._tracer.wrap_async_channel(channel)
+        if self._concurrency_limiter is not None:
+            channel = self._concurrency_limiter.wrap_async_channel(
+                channel, self._quota_project_id
+            )
+        if self._retry_budget is not None:
+            channel = self._retry_budget.wrap_async_channel(channel)
+        return channel
+
+    def _wrap_stub(
+        self, name: str, stub: aio.UnaryUnaryMultiCallable
+    ) -> aio.UnaryUnaryMultiCallable:
+        # Hedge slow calls to the idempotent read methods, then coalesce
+        # identical concurrent calls.
+        if name not in self._IDEMPOTENT_METHODS:
+            return stub
+        if self._hedging_policy is not None:
+            stub = self._hedging_policy.wrap_async_stub(name, stub)
+        if self._async_single_flight is not None:
+            stub = self._async_single_flight.wrap_stub(name, stub)
+        return stub
+
+    def _response_deserializer(self, response_type):
+        # Leave the responses serialized in passthrough mode.
+        if self._passthrough:
+            return passthrough_deserializer(response_type)
+        return response_type.deserialize
+
     @property
     def operations_client(self) -> operations_v1.OperationsAsyncClient:
         """Create the client designed to process long-running operations.
@@ -239,10 +347,15 @@ class AssetServiceGrpcAsyncIOTransport(AssetServiceTransport):
         # gRPC handles serialization and deserialization, so we just need
         # to pass in the functions for each.
         if "analyze_iam_policy" not in self._stubs:
-            self._stubs["analyze_iam_policy"] = self.grpc_channel.unary_unary(
-                "/google.cloud.asset.v1p4beta1.AssetService/AnalyzeIamPolicy",
-                request_serializer=asset_service.AnalyzeIamPolicyRequest.serialize,
-                response_deserializer=asset_service.AnalyzeIamPolicyResponse.deserialize,
+            self._stubs["analyze_iam_policy"] = self._wrap_stub(
+                "analyze_iam_policy",
+                self.grpc_channel.unary_unary(
+                    "/google.cloud.asset.v1p4beta1.AssetService/AnalyzeIamPolicy",
+                    request_serializer=asset_service.AnalyzeIamPolicyRequest.serialize,
+                    response_deserializer=self._response_deserializer(
+                        asset_service.AnalyzeIamPolicyResponse
+                    ),
+                ),
             )
         return self._stubs["analyze_iam_policy"]
 
@@ -15,8 +15,22 @@
 # limitations under the License.
 #
 
-from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Sequence, Tuple
-
+from concurrent import futures
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Iterator, Sequence, Tuple
+
+from google.cloud.asset._client_utils.deadline import (
+    Deadline,
+    PageProgress,
+)
+from google.cloud.asset._client_utils.executor import (
+    ClientExecutor,
+    default_executor,
+)
+from google.cloud.asset._transport_utils.tracing import (
+    Tracer,
+    trace_async_pages,
+    trace_pages,
+)
 from google.cloud.asset_v1p5beta1.types import asset_service
 from google.cloud.asset_v1p5beta1.types import assets
 
@@ -45,7 +59,10 @@ class ListAssetsPager:
         request: asset_service.ListAssetsRequest,
         response: asset_service.ListAssetsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        tracer: Tracer = None,
+        deadline: Deadline = None,
+        executor: ClientExecutor = None
     ):
         """Instantiate the pager.
 
@@ -58,17 +75,40 @@ class ListAssetsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            tracer (Optional[~.Tracer]): If provided, the fetch and
+                consumption of every page are traced with this tracer.
+            deadline (Optional[~.Deadline]): If provided, every further
+                page request gets the time remaining as its timeout, and
+                iteration stops once it runs out; ``progress`` then tells
+                how far it got.
+            executor (Optional[~.ClientExecutor]): The executor fetching
+                pages for ``page_futures()``; a default executor if not
+                provided.
         """
         self._method = method
         self._request = asset_service.ListAssetsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._tracer = tracer
+        self._deadline = deadline
+        self._executor = executor
+        self.progress = PageProgress()
+        if deadline is not None:
+            self._method = deadline.bind(method)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterable[asset_service.ListAssetsResponse]:
+        pages = self._pages()
+        if self._deadline is not None:
+            pages = self._deadline.pages(pages, self.progress)
+        if self._tracer is not None:
+            pages = trace_pages(self._tracer, "ListAssets", pages)
+        return pages
+
+    def _pages(self) -> Iterable[asset_service.ListAssetsResponse]:
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -79,6 +119,15 @@ class ListAssetsPager:
         for page in self.pages:
             yield from page.assets
 
+    def page_futures(self, prefetch: int = 1) -> Iterator[futures.Future]:
+        """Yield the futures of the pages, fetching each on the executor.
+
+        The next pages are fetched while the caller handles the current
+        one, at most ``prefetch`` pages ahead of the caller.
+        """
+        executor = self._executor or default_executor()
+        return executor.page_futures(self.pages, prefetch=prefetch)
+
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
@@ -107,7 +156,9 @@ class ListAssetsAsyncPager:
         request: asset_service.ListAssetsRequest,
         response: asset_service.ListAssetsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        tracer: Tracer = None,
+        deadline: Deadline = None
     ):
         """Instantiate the pager.
 
@@ -120,17 +171,36 @@ class ListAssetsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            tracer (Optional[~.Tracer]): If provided, the fetch and
+                consumption of every page are traced with this tracer.
+            deadline (Optional[~.Deadline]): If provided, every further
+                page request gets the time remaining as its timeout, and
+                iteration stops once it runs out; ``progress`` then tells
+                how far it got.
         """
         self._method = method
         self._request = asset_service.ListAssetsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._tracer = tracer
+        self._deadline = deadline
+        self.progress = PageProgress()
+        if deadline is not None:
+            self._method = deadline.bind(method)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
-    async def pages(self) -> AsyncIterable[asset_service.ListAssetsResponse]:
+    def pages(self) -> AsyncIterable[asset_service.ListAssetsResponse]:
+        pages = self._pages()
+        if self._deadline is not None:
+            pages = self._deadline.async_pages(pages, self.progress)
+        if self._tracer is not None:
+            pages = trace_async_pages(self._tracer, "ListAssets", pages)
+        return pages
+
+    async def _pages(self) -> AsyncIterable[asset_service.ListAssetsResponse]:
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
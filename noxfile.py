@@ -97,6 +97,19 @@ def unit(session):
     default(session)
 
 
+@nox.session(python=DEFAULT_PYTHON_VERSION)
+def benchmark(session):
+    """Run the client benchmarks.
+
+    Arguments after ``--`` are passed to the benchmark, for example
+    ``nox -s benchmark -- --output results.json`` to keep the results.
+    """
+    session.install("-e", ".")
+    session.run(
+        "python", os.path.join("benchmarks", "client_benchmark.py"), *session.posargs
+    )
+
+
 @nox.session(python=SYSTEM_TEST_PYTHON_VERSIONS)
 def system(session):
     """Run the system test suite."""
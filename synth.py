@@ -65,4 +65,24 @@ s.replace(
 # https://github.com/googleapis/gapic-generator-python/issues/525
 s.replace("noxfile.py", '[\"\']-W[\"\']', '# "-W"')
 
+# Add a session running the client benchmarks
+s.replace(
+    "noxfile.py",
+    r"(@nox\.session\(python=SYSTEM_TEST_PYTHON_VERSIONS\)\ndef system\(session\):)",
+    '''@nox.session(python=DEFAULT_PYTHON_VERSION)
+def benchmark(session):
+    """Run the client benchmarks.
+
+    Arguments after ``--`` are passed to the benchmark, for example
+    ``nox -s benchmark -- --output results.json`` to keep the results.
+    """
+    session.install("-e", ".")
+    session.run(
+        "python", os.path.join("benchmarks", "client_benchmark.py"), *session.posargs
+    )
+
+
+\\g<1>''',
+)
+
 s.shell.run(["nox", "-s", "blacken"], hide_output=False)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from google.cloud.asset._transport_utils.attempts import FailedAttempts
+from google.cloud.asset_v1.types import asset_service
+
+
+def test_failed_attempts():
+    failed = FailedAttempts(window=2)
+    first, second, third = (
+        asset_service.GetFeedRequest(name=name) for name in ("a", "b", "c")
+    )
+    error = Exception("unavailable")
+
+    failed.add(first, error)
+    # An equal request which is another object is not a retry.
+    assert failed.pop(asset_service.GetFeedRequest(name="a")) is None
+    assert failed.pop(first) is error
+    assert failed.pop(first) is None
+
+    # The oldest requests are forgotten past the window.
+    for request in (first, second, third):
+        failed.add(request, error)
+    assert failed.pop(first) is None
+    assert failed.pop(second) is error
+    assert failed.pop(third) is error
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.asset._client_utils import bulk
+from google.cloud.asset._client_utils.deadline import Deadline
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.types import asset_service
+
+
+class _Calls:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.taken = 0
+
+    def requests(self, count):
+        for i in range(count):
+            self.taken += 1
+            yield i
+
+    async def __call__(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later requests complete first.
+            await asyncio.sleep(0.001 * (request % 7))
+            if request % 5 == 0:
+                raise exceptions.NotFound("missing {}".format(request))
+            return request * 2
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_gather_bounds_concurrency():
+    calls = _Calls()
+    results = []
+    async for result in bulk.gather(calls, calls.requests(500), concurrency=8):
+        # Requests are only taken as calls complete.
+        assert calls.taken <= len(results) + 9
+        results.append(result)
+
+    assert calls.max_in_flight == 8
+    assert sorted(result.index for result in results) == list(range(500))
+    for result in results:
+        assert result.request == result.index
+        if result.index % 5 == 0:
+            assert not result.ok
+            assert isinstance(result.error, exceptions.NotFound)
+            with pytest.raises(exceptions.NotFound):
+                result.result()
+        else:
+            assert result.result() == result.index * 2
+
+
+@pytest.mark.asyncio
+async def test_gather_ordered():
+    calls = _Calls()
+    results = [
+        result
+        async for result in bulk.gather(
+            calls, calls.requests(100), concurrency=4, ordered=True
+        )
+    ]
+    assert [result.index for result in results] == list(range(100))
+    assert calls.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_gather_stops_early():
+    started = []
+
+    async def call(request):
+        started.append(request)
+        await asyncio.sleep(0 if request == 0 else 10)
+
+    results = bulk.gather(call, range(100000), concurrency=3)
+    async for result in results:
+        assert result.index == 0
+        break
+    await results.aclose()
+    assert started == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_gather_deadline():
+    now = [0.0]
+    deadline = Deadline(10, clock=lambda: now[0])
+
+    async def call(request):
+        now[0] += 4
+        return request
+
+    requests = iter(range(10))
+    results = [
+        result
+        async for result in bulk.gather(
+            call, requests, concurrency=1, deadline=deadline
+        )
+    ]
+    assert [result.response for result in results] == [0, 1, 2]
+    assert next(requests) == 3
+
+
+@pytest.fixture
+def server():
+    dataset = fake_server.FakeDataset(projects=2, assets_per_project=30)
+    with fake_server.FakeAssetServiceServer(dataset) as server:
+        yield server
+
+
+@pytest.mark.asyncio
+async def test_client_gather(server):
+    client = AssetServiceAsyncClient(
+        transport=transports.AssetServiceGrpcAsyncIOTransport(
+            channel=server.async_channel()
+        )
+    )
+    await client.create_feed(
+        request={"parent": "projects/p", "feed_id": "f0", "feed": {}}
+    )
+    names = ["projects/p/feeds/f{}".format(i) for i in range(3)]
+    results = [
+        result
+        async for result in client.gather(
+            "get_feed", ({"name": name} for name in names), ordered=True
+        )
+    ]
+    assert results[0].response.name == names[0]
+    assert [type(result.error) for result in results[1:]] == [exceptions.NotFound] * 2
+
+    scopes = ["projects/project-0", "projects/project-1"]
+    async for result in client.gather(
+        "search_all_resources",
+        [{"scope": scope, "page_size": 10} for scope in scopes],
+        concurrency=2,
+        deadline=60.0,
+    ):
+        assert isinstance(result.response, asset_service.SearchAllResourcesResponse)
+        assert len(result.response.results) == 10
+    # Only the first page of every search was fetched.
+    assert server.calls["search_all_resources"] == 2
+
+    with pytest.raises(ValueError):
+        client.gather("_client", [])
+    with pytest.raises(ValueError):
+        client.gather("gather", [])
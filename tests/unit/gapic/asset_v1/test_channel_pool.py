@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+
+import mock
+import pytest
+
+import grpc
+from grpc.experimental import aio
+
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.services.asset_service.transports import channel_pool
+
+
+def _channels(count, spec=grpc.Channel):
+    return [mock.Mock(spec=spec) for _ in range(count)]
+
+
+def test_round_robin():
+    channels = _channels(3)
+    pool = channel_pool.ChannelPool(channels)
+    stub = pool.unary_unary("/svc/Method")
+
+    for _ in range(6):
+        stub(b"request")
+
+    for channel in channels:
+        channel.unary_unary.assert_called_once_with("/svc/Method")
+        assert channel.unary_unary.return_value.call_count == 2
+    assert pool.in_flight == [0, 0, 0]
+
+
+def test_least_loaded():
+    channels = _channels(2)
+    pool = channel_pool.ChannelPool(channels, policy=channel_pool.LEAST_LOADED)
+    stub = pool.unary_unary("/svc/Method")
+    calls = [mock.Mock(), mock.Mock()]
+    for channel, call in zip(channels, calls):
+        channel.unary_unary.return_value.future.return_value = call
+
+    # The first future stays in flight, so every later call avoids channel 0.
+    stub.future(b"request")
+    assert pool.in_flight == [1, 0]
+    stub.future(b"request")
+    assert pool.in_flight == [1, 1]
+    done = calls[1].add_done_callback.call_args[0][0]
+    done(calls[1])
+    stub(b"request")
+    stub(b"request")
+
+    assert channels[1].unary_unary.return_value.call_count == 2
+    assert not channels[0].unary_unary.return_value.called
+    assert pool.in_flight == [1, 0]
+
+
+def test_invalid_pool():
+    with pytest.raises(ValueError):
+        channel_pool.ChannelPool([])
+    with pytest.raises(ValueError):
+        channel_pool.ChannelPool(_channels(1), policy="random")
+
+
+def test_create():
+    factory = mock.Mock(side_effect=lambda *args, **kwargs: mock.Mock())
+
+    single = channel_pool.ChannelPool.create(factory, 1, "host", credentials=None)
+    factory.assert_called_once_with("host", credentials=None)
+    assert not isinstance(single, channel_pool.ChannelPool)
+
+    factory.reset_mock()
+    pool = channel_pool.ChannelPool.create(
+        factory, 3, "host", options=[("a", 1)], policy=channel_pool.LEAST_LOADED
+    )
+    assert len(pool.channels) == 3
+    factory.assert_called_with(
+        "host", options=[("a", 1), channel_pool.LOCAL_SUBCHANNEL_POOL]
+    )
+
+
+def test_close():
+    channels = _channels(2)
+    with channel_pool.ChannelPool(channels):
+        pass
+    for channel in channels:
+        channel.close.assert_called_once_with()
+
+
+def test_transport_channel_pool():
+    with mock.patch.object(
+        transports.AssetServiceGrpcTransport, "create_channel", autospec=True
+    ) as create_channel:
+        transport = transports.AssetServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            channel_pool_size=4,
+            channel_pool_policy=channel_pool.LEAST_LOADED,
+        )
+        assert isinstance(transport.grpc_channel, channel_pool.ChannelPool)
+        assert len(transport.grpc_channel.channels) == 4
+        assert create_channel.call_count == 4
+
+
+def test_transport_channel_ignores_pool_size():
+    channel = grpc.insecure_channel("http://localhost/")
+    transport = transports.AssetServiceGrpcTransport(
+        channel=channel, channel_pool_size=4
+    )
+    assert transport.grpc_channel is channel
+
+
+def test_pool_against_local_server():
+    def echo(request, context):
+        return request
+
+    handler = grpc.method_handlers_generic_handler(
+        "test.Echo", {"Echo": grpc.unary_unary_rpc_method_handler(echo)}
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    try:
+        pool = channel_pool.ChannelPool.create(
+            grpc.insecure_channel, 2, "localhost:{}".format(port)
+        )
+        with pool:
+            stub = pool.unary_unary("/test.Echo/Echo")
+            assert [stub(b"ping") for _ in range(4)] == [b"ping"] * 4
+    finally:
+        server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_async_round_robin():
+    channels = _channels(2, spec=aio.Channel)
+    pool = channel_pool.AsyncChannelPool(channels)
+    stub = pool.unary_unary("/svc/Method")
+    assert isinstance(stub, aio.UnaryUnaryMultiCallable)
+
+    calls = [stub(b"request") for _ in range(4)]
+    for channel in channels:
+        assert channel.unary_unary.return_value.call_count == 2
+    assert pool.in_flight == [2, 2]
+
+    for call in calls:
+        done = call.add_done_callback.call_args[0][0]
+        done(call)
+    assert pool.in_flight == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_async_pool_state_and_close():
+    channels = _channels(2, spec=aio.Channel)
+    channels[0].get_state.return_value = grpc.ChannelConnectivity.READY
+    channels[1].get_state.return_value = grpc.ChannelConnectivity.CONNECTING
+    pool = channel_pool.AsyncChannelPool(channels)
+
+    assert pool.get_state() == grpc.ChannelConnectivity.CONNECTING
+    channels[1].get_state.return_value = grpc.ChannelConnectivity.READY
+    assert pool.get_state() == grpc.ChannelConnectivity.READY
+
+    for channel in channels:
+        channel.close = mock.AsyncMock()
+    await pool.close()
+    for channel in channels:
+        channel.close.assert_awaited_once_with(None)
+
+
+def test_async_transport_channel_pool():
+    with mock.patch.object(
+        transports.AssetServiceGrpcAsyncIOTransport, "create_channel"
+    ) as create_channel:
+        transport = transports.AssetServiceGrpcAsyncIOTransport(
+            credentials=credentials.AnonymousCredentials(),
+            channel_pool_size=2,
+        )
+        assert isinstance(transport.grpc_channel, channel_pool.AsyncChannelPool)
+        assert create_channel.call_count == 2
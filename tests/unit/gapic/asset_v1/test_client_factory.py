@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mock
+
+import pytest
+
+from google import auth
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.services.asset_service.client_factory import (
+    AssetServiceClientFactory,
+)
+
+
+def test_clients_share_transport():
+    factory = AssetServiceClientFactory()
+    creds = credentials.AnonymousCredentials()
+    first = factory.client(credentials=creds)
+    second = factory.client(credentials=creds)
+    assert isinstance(first, AssetServiceClient)
+    assert first is not second
+    assert first._transport is second._transport
+    assert first._transport._host == "cloudasset.googleapis.com:443"
+
+    other = factory.client(credentials=creds, quota_project_id="billing")
+    assert other._transport is not first._transport
+    assert other._transport._credentials is not None
+    assert (factory.hits, factory.misses, len(factory)) == (1, 2, 2)
+
+    endpoint = factory.client(credentials=creds, api_endpoint="localhost:1234")
+    assert endpoint._transport._host == "localhost:1234"
+
+
+def test_default_credentials_resolved_once():
+    creds = credentials.AnonymousCredentials()
+    with mock.patch.object(auth, "default", return_value=(creds, None)) as adc:
+        factory = AssetServiceClientFactory()
+        for _ in range(3):
+            factory.client()
+    adc.assert_called_once()
+
+
+def test_lru_eviction():
+    factory = AssetServiceClientFactory(max_size=2)
+    keys = [credentials.AnonymousCredentials() for _ in range(3)]
+    transports = [factory.transport(credentials=key) for key in keys]
+    assert len(factory) == 2 and factory.evictions == 1
+
+    # The first transport was least recently used and is rebuilt.
+    assert factory.transport(credentials=keys[2]) is transports[2]
+    assert factory.transport(credentials=keys[0]) is not transports[0]
+
+
+def test_idle_eviction():
+    now = [0.0]
+    factory = AssetServiceClientFactory(idle_timeout=10, clock=lambda: now[0])
+    creds = [credentials.AnonymousCredentials() for _ in range(2)]
+    transport = factory.transport(credentials=creds[0])
+    now[0] = 6
+    factory.transport(credentials=creds[1])
+    now[0] = 12
+    assert factory.evict_idle() == 1
+    assert len(factory) == 1
+
+    now[0] = 30
+    assert factory.transport(credentials=creds[0]) is not transport
+    assert len(factory) == 1
+    assert factory.evictions == 2
+    assert len(factory.clear()) == 1 and len(factory) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client():
+    factory = AssetServiceClientFactory(AssetServiceAsyncClient)
+    creds = credentials.AnonymousCredentials()
+    client = factory.client(credentials=creds)
+    assert isinstance(client, AssetServiceAsyncClient)
+    assert isinstance(
+        client._client._transport, transports.AssetServiceGrpcAsyncIOTransport
+    )
+    assert factory.client(credentials=creds)._client._transport is (
+        client._client._transport
+    )
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        AssetServiceClientFactory(max_size=0)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mock
+import pytest
+
+import grpc
+from grpc.experimental import aio
+
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import compression
+from google.cloud.asset_v1p2beta1.services.asset_service import (
+    transports as v1p2beta1_transports,
+)
+
+SEARCH = "/google.cloud.asset.v1.AssetService/SearchAllResources"
+CREATE_FEED = "/google.cloud.asset.v1.AssetService/CreateFeed"
+
+
+def test_for_method():
+    config = compression.CompressionConfig(
+        default=compression.GZIP,
+        methods={
+            "create_feed": compression.NONE,
+            "batch_get_assets_history": compression.DEFLATE,
+        },
+    )
+    assert config.for_method("search_all_resources") == grpc.Compression.Gzip
+    assert config.for_method(SEARCH) == grpc.Compression.Gzip
+    assert config.for_method(CREATE_FEED) == grpc.Compression.NoCompression
+    assert (
+        config.for_method("/google.cloud.asset.v1.AssetService/BatchGetAssetsHistory")
+        == grpc.Compression.Deflate
+    )
+    assert compression.CompressionConfig().for_method(SEARCH) is None
+
+
+def test_unsupported_algorithm():
+    with pytest.raises(ValueError):
+        compression.CompressionConfig(default="brotli")
+
+
+def test_compressed_channel():
+    config = compression.CompressionConfig(methods={"search_all_resources": "gzip"})
+    channel = mock.Mock(spec=grpc.Channel)
+    wrapped = config.wrap_channel(channel)
+
+    wrapped.unary_unary(SEARCH)(b"request", timeout=1.0)
+    channel.unary_unary.return_value.assert_called_once_with(
+        b"request", timeout=1.0, compression=grpc.Compression.Gzip
+    )
+
+    # An explicit compression of the caller wins.
+    wrapped.unary_unary(SEARCH).future(
+        b"request", compression=grpc.Compression.NoCompression
+    )
+    channel.unary_unary.return_value.future.assert_called_once_with(
+        b"request", compression=grpc.Compression.NoCompression
+    )
+
+    # Methods without a setting get the plain stub.
+    assert wrapped.unary_unary(CREATE_FEED) is channel.unary_unary.return_value
+
+
+def test_transport_compression():
+    config = compression.CompressionConfig(default=compression.GZIP)
+    transport = transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(), compression=config
+    )
+    assert isinstance(transport.grpc_channel, compression._CompressedChannel)
+    assert isinstance(
+        transport.create_feed, compression._CompressedUnaryUnaryMultiCallable
+    )
+
+    beta = v1p2beta1_transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(), compression=config
+    )
+    assert isinstance(beta.grpc_channel, compression._CompressedChannel)
+
+
+@pytest.mark.asyncio
+async def test_async_compressed_channel():
+    config = compression.CompressionConfig(default=compression.DEFLATE)
+    calls = []
+
+    async def stub(request, **kwargs):
+        calls.append(kwargs)
+        return request
+
+    channel = mock.Mock(spec=aio.Channel)
+    channel.unary_unary.return_value = stub
+    wrapped = config.wrap_async_channel(channel).unary_unary(SEARCH)
+    assert isinstance(wrapped, aio.UnaryUnaryMultiCallable)
+
+    assert await wrapped(b"request") == b"request"
+    assert calls == [{"compression": grpc.Compression.Deflate}]
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import threading
+
+import mock
+import pytest
+
+import grpc
+from grpc.experimental import aio
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import concurrency_limiter
+from google.cloud.asset_v1p4beta1.services.asset_service import (
+    transports as v1p4beta1_transports,
+)
+
+METHOD = "/google.cloud.asset.v1.AssetService/SearchAllResources"
+
+
+class _ThrottledError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def test_additive_increase():
+    limiter = concurrency_limiter.ConcurrencyLimiter(initial_limit=2)
+    key = (METHOD, None)
+    for _ in range(6):
+        limiter.release(key, limiter.acquire(key), latency=0.01)
+    assert limiter.limit(METHOD) == 4
+
+
+def test_multiplicative_decrease_once_per_round():
+    limiter = concurrency_limiter.ConcurrencyLimiter(initial_limit=16)
+    key = (METHOD, "project")
+    tokens = [limiter.acquire(key) for _ in range(8)]
+    for token in tokens:
+        limiter.release(key, token, throttled=True)
+
+    assert limiter.limit(METHOD, "project") == 8
+    assert limiter.limit(METHOD) == 16
+    assert limiter.stats()[key]["throttled"] == 8
+
+    limiter.release(key, limiter.acquire(key), throttled=True)
+    assert limiter.limit(METHOD, "project") == 4
+
+
+def test_latency_threshold_and_min_limit():
+    limiter = concurrency_limiter.ConcurrencyLimiter(
+        initial_limit=2, min_limit=1, latency_threshold=1.0
+    )
+    key = (METHOD, None)
+    for _ in range(3):
+        limiter.release(key, limiter.acquire(key), latency=2.0)
+    assert limiter.limit(METHOD) == 1
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        concurrency_limiter.ConcurrencyLimiter(min_limit=0)
+    with pytest.raises(ValueError):
+        concurrency_limiter.ConcurrencyLimiter(backoff_ratio=1.0)
+
+
+def test_waiters_get_freed_slots():
+    limiter = concurrency_limiter.ConcurrencyLimiter(initial_limit=1)
+    key = (METHOD, None)
+    token = limiter.acquire(key)
+    acquired = threading.Event()
+
+    def wait():
+        limiter.acquire(key)
+        acquired.set()
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    while not limiter.stats()[key]["waiting"]:
+        pass
+    assert not acquired.is_set()
+
+    limiter.release(key, token)
+    thread.join()
+    assert acquired.is_set()
+    assert limiter.stats()[key]["in_flight"] == 1
+
+
+def test_acquire_timeout():
+    limiter = concurrency_limiter.ConcurrencyLimiter(initial_limit=1)
+    key = (METHOD, None)
+    token = limiter.acquire(key)
+    with pytest.raises(exceptions.DeadlineExceeded):
+        limiter.acquire(key, timeout=0.01)
+    # The abandoned waiter does not take the next free slot.
+    assert limiter.stats()[key]["waiting"] == 0
+    limiter.release(key, token)
+    assert limiter.stats()[key]["in_flight"] == 0
+
+
+def test_limited_channel_waiting_uses_timeout():
+    now = [0.0]
+    limiter = concurrency_limiter.ConcurrencyLimiter(
+        initial_limit=1, clock=lambda: now[0]
+    )
+    channel = mock.Mock(spec=grpc.Channel)
+    stub = channel.unary_unary.return_value
+    limited = limiter.wrap_channel(channel).unary_unary(METHOD)
+
+    token = limiter.acquire((METHOD, None))
+    with pytest.raises(exceptions.DeadlineExceeded):
+        limited(b"request", timeout=0.01)
+    stub.assert_not_called()
+    limiter.release((METHOD, None), token)
+
+    acquire = limiter.acquire
+
+    def slow_acquire(key, timeout):
+        now[0] += 2.0
+        return acquire(key, timeout)
+
+    with mock.patch.object(limiter, "acquire", side_effect=slow_acquire):
+        limited(b"request", timeout=5.0)
+    stub.assert_called_once_with(b"request", timeout=3.0)
+
+
+@pytest.mark.asyncio
+async def test_async_acquire_timeout():
+    limiter = concurrency_limiter.ConcurrencyLimiter(initial_limit=1)
+    key = (METHOD, None)
+    token = await limiter.acquire_async(key)
+    with pytest.raises(exceptions.DeadlineExceeded):
+        await limiter.acquire_async(key, timeout=0.01)
+    assert limiter.stats()[key]["waiting"] == 0
+
+    waiting = asyncio.ensure_future(limiter.acquire_async(key, timeout=5.0))
+    await asyncio.sleep(0.01)
+    limiter.release(key, token)
+    await waiting
+    assert limiter.stats()[key]["in_flight"] == 1
+
+
+def test_limited_channel():
+    limiter = concurrency_limiter.ConcurrencyLimiter(initial_limit=4)
+    channel = mock.Mock(spec=grpc.Channel)
+    stub = channel.unary_unary.return_value
+    stub.side_effect = [b"ok", _ThrottledError()]
+
+    limited = limiter.wrap_channel(channel, "project").unary_unary(METHOD)
+    assert limited(b"request", timeout=1.0) == b"ok"
+    stub.assert_called_with(b"request", timeout=pytest.approx(1.0, abs=0.1))
+    with pytest.raises(grpc.RpcError):
+        limited(b"request")
+
+    stats = limiter.stats()[(METHOD, "project")]
+    assert stats == {"limit": 2, "in_flight": 0, "waiting": 0, "throttled": 1}
+
+
+def test_transport_concurrency_limiter():
+    limiter = concurrency_limiter.ConcurrencyLimiter()
+    channel = grpc.insecure_channel("localhost:1")
+    transport = transports.AssetServiceGrpcTransport(
+        channel=channel, concurrency_limiter=limiter
+    )
+    assert isinstance(transport.grpc_channel, concurrency_limiter._LimitedChannel)
+    assert isinstance(
+        transport.search_all_resources,
+        concurrency_limiter._LimitedUnaryUnaryMultiCallable,
+    )
+
+    lazy = v1p4beta1_transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(),
+        quota_project_id="project",
+        concurrency_limiter=limiter,
+    )
+    assert lazy.grpc_channel._quota_project_id == "project"
+    assert isinstance(lazy.grpc_channel, concurrency_limiter._LimitedChannel)
+
+
+@pytest.mark.asyncio
+async def test_async_limited_channel():
+    limiter = concurrency_limiter.ConcurrencyLimiter(initial_limit=1)
+    release = asyncio.Event()
+    started = []
+
+    async def stub(request, **kwargs):
+        started.append(request)
+        await release.wait()
+        return request
+
+    channel = mock.Mock(spec=aio.Channel)
+    channel.unary_unary.return_value = stub
+    limited = limiter.wrap_async_channel(channel).unary_unary(METHOD)
+    assert isinstance(limited, aio.UnaryUnaryMultiCallable)
+
+    calls = [asyncio.ensure_future(limited(i)) for i in range(3)]
+    await asyncio.sleep(0.01)
+    assert started == [0]
+
+    # A cancelled waiter gives up its place in the queue.
+    calls[1].cancel()
+    release.set()
+    assert await calls[0] == 0
+    assert await calls[2] == 2
+    assert started == [0, 2]
+    assert limiter.stats()[(METHOD, None)]["in_flight"] == 0
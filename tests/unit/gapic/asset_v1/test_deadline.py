@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import time
+
+import mock
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.asset._client_utils.deadline import Deadline
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service import pagers
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.types import asset_service
+
+
+def _response(token):
+    return asset_service.SearchAllResourcesResponse(next_page_token=token)
+
+
+def test_bind_passes_remaining_time():
+    now = [0.0]
+    deadline = Deadline(10, clock=lambda: now[0])
+    method = mock.Mock(return_value="response")
+    bound = deadline.bind(method)
+
+    now[0] = 4
+    assert bound("request", metadata=()) == "response"
+    timeout = method.call_args[1]["timeout"]
+    attempt = mock.Mock(return_value="attempt")
+
+    # Each attempt gets the time left when it starts.
+    assert timeout(attempt)("request") == "attempt"
+    attempt.assert_called_once_with("request", timeout=6)
+
+    # Attempts are not sent once the deadline has expired, and the error
+    # is not retried.
+    now[0] = 10
+    with pytest.raises(exceptions.RetryError):
+        timeout(attempt)("request")
+    assert attempt.call_count == 1
+
+
+def test_coerce():
+    deadline = Deadline(1)
+    assert Deadline.coerce(deadline) is deadline
+    assert Deadline.coerce(None) is None
+    assert 0 < Deadline.coerce(5).remaining() <= 5
+
+
+def test_pager_stops_at_deadline():
+    now = [0.0]
+    deadline = Deadline(10, clock=lambda: now[0])
+
+    def method(request, **kwargs):
+        now[0] += 4
+        return _response(str(int(request.page_token) + 1))
+
+    pager = pagers.SearchAllResourcesPager(
+        method=method,
+        request=asset_service.SearchAllResourcesRequest(),
+        response=_response("1"),
+        deadline=deadline,
+    )
+    # The page started with 2s left completes; no page starts after that.
+    assert len(list(pager.pages)) == 4
+    assert pager.progress.pages == 4
+    assert pager.progress.next_page_token == "4"
+    assert pager.progress.deadline_exceeded
+
+
+def test_pager_errors_before_deadline():
+    def method(request, **kwargs):
+        raise exceptions.DeadlineExceeded("slow page")
+
+    pager = pagers.SearchAllResourcesPager(
+        method=method,
+        request=asset_service.SearchAllResourcesRequest(),
+        response=_response("1"),
+        deadline=Deadline(60),
+    )
+    with pytest.raises(exceptions.DeadlineExceeded):
+        list(pager.pages)
+    assert not pager.progress.deadline_exceeded
+
+
+@pytest.mark.asyncio
+async def test_async_pager_stops_at_deadline():
+    now = [0.0]
+    deadline = Deadline(10, clock=lambda: now[0])
+    timeouts = []
+
+    async def method(request, **kwargs):
+        timeouts.append(kwargs["timeout"](lambda timeout: timeout)())
+        now[0] += 6
+        return _response("2")
+
+    pager = pagers.SearchAllResourcesAsyncPager(
+        method=method,
+        request=asset_service.SearchAllResourcesRequest(),
+        response=_response("1"),
+        deadline=deadline,
+    )
+    assert len([page async for page in pager.pages]) == 3
+    assert timeouts == [10, 4]
+    assert pager.progress.deadline_exceeded
+
+
+@pytest.fixture
+def server(tmp_path):
+    dataset = fake_server.FakeDataset(projects=1, assets_per_project=40)
+    with fake_server.FakeAssetServiceServer(
+        dataset, export_dir=str(tmp_path), export_delay=5
+    ) as server:
+        yield server
+
+
+def test_search_deadline(server):
+    server.set_fault("search_all_resources", fake_server.Fault(latency=0.05))
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=server.channel())
+    )
+    pager = client.search_all_resources(
+        request={"scope": "projects/project-0", "page_size": 4}, deadline=0.18
+    )
+    results = list(pager)
+    assert 4 <= len(results) < 40
+    assert pager.progress.deadline_exceeded
+    assert pager.progress.next_page_token == str(len(results))
+
+
+def test_export_deadline(server):
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=server.channel())
+    )
+    operation = client.export_assets(
+        request={
+            "parent": "projects/project-0",
+            "output_config": {"gcs_destination": {"uri": "gs://b/o"}},
+        },
+        deadline=0.3,
+    )
+    start = time.monotonic()
+    with pytest.raises(futures.TimeoutError):
+        operation.result(timeout=60)
+    assert time.monotonic() - start < 2
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+
+import pytest
+
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import decoding
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+from google.cloud.asset_v1p4beta1.types import asset_service as asset_service_v1p4beta1
+
+
+def test_project():
+    result = assets.ResourceSearchResult(
+        name="//compute.googleapis.com/projects/p/instances/i",
+        labels={"env": "prod"},
+        network_tags=["web"],
+        additional_attributes={"status": "RUNNING"},
+    )
+    item = assets.ResourceSearchResult.pb(result)
+    assert decoding.project(
+        item, ("name", "labels", "network_tags", "additional_attributes")
+    ) == {
+        "name": result.name,
+        "labels": {"env": "prod"},
+        "network_tags": ["web"],
+        "additional_attributes": {"status": "RUNNING"},
+    }
+
+
+@pytest.fixture
+def server():
+    dataset = fake_server.FakeDataset(projects=1, assets_per_project=50)
+    with fake_server.FakeAssetServiceServer(dataset) as server:
+        yield server
+
+
+def _pages(server):
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(
+            channel=server.channel(), passthrough=True
+        )
+    )
+    return client.search_all_resources(
+        request={"scope": "projects/project-0", "page_size": 8}
+    ).pages
+
+
+def test_decode(server):
+    with futures.ThreadPoolExecutor(4) as executor:
+        pipeline = decoding.DecodingPipeline(executor, max_pending=3)
+        pages = list(
+            pipeline.decode(
+                _pages(server),
+                asset_service.SearchAllResourcesResponse,
+                fields=("name", "labels"),
+                predicate=lambda item: item.asset_type.endswith("/Disk"),
+            )
+        )
+    assert len(pages) == 7
+    names = [item["name"] for page in pages for item in page]
+    assert names == [
+        asset.name
+        for asset in server.dataset.assets
+        if asset.asset_type.endswith("/Disk")
+    ]
+    assert all(set(item) == {"name", "labels"} for page in pages for item in page)
+
+
+def test_decode_validates_fields():
+    pipeline = decoding.DecodingPipeline(futures.ThreadPoolExecutor(1))
+    with pytest.raises(ValueError):
+        next(pipeline.decode([], asset_service.SearchAllResourcesResponse, ("nam",)))
+    with pytest.raises(ValueError):
+        next(pipeline.decode([], asset_service.Feed, ("name",)))
+
+    response = asset_service_v1p4beta1.AnalyzeIamPolicyResponse(
+        main_analysis={
+            "analysis_results": [
+                {"attached_resource_full_name": "//r/1", "iam_binding": {"role": "a"}},
+                {"attached_resource_full_name": "//r/2", "iam_binding": {"role": "b"}},
+            ]
+        }
+    )
+    data = asset_service_v1p4beta1.AnalyzeIamPolicyResponse.serialize(response)
+    assert list(
+        pipeline.decode(
+            [data],
+            asset_service_v1p4beta1.AnalyzeIamPolicyResponse,
+            ("attached_resource_full_name", "iam_binding.role"),
+        )
+    ) == [
+        [
+            {"attached_resource_full_name": "//r/1", "iam_binding.role": "a"},
+            {"attached_resource_full_name": "//r/2", "iam_binding.role": "b"},
+        ]
+    ]
+
+
+def test_decode_processes(server):
+    with decoding.DecodingPipeline(max_workers=2) as pipeline:
+        pages = list(
+            pipeline.decode(
+                _pages(server),
+                asset_service.SearchAllResourcesResponse,
+                fields=("name",),
+            )
+        )
+    assert [item["name"] for page in pages for item in page] == [
+        asset.name for asset in server.dataset.assets
+    ]
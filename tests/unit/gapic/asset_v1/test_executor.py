@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.asset._client_utils.executor import ClientExecutor
+from google.cloud.asset._client_utils.executor import RateLimiter
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service import pagers
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.types import asset_service
+
+
+def test_rate_limiter():
+    now = [0.0]
+    waits = []
+    limiter = RateLimiter(10, burst=2, clock=lambda: now[0], sleep=waits.append)
+
+    assert [limiter.acquire() for _ in range(4)] == [0, 0, 0.1, 0.2]
+    assert waits == [0.1, 0.2]
+
+    # The bucket refills with time, up to the burst.
+    now[0] = 10
+    assert [limiter.acquire() for _ in range(3)] == [0, 0, 0.1]
+
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+@pytest.fixture
+def server():
+    dataset = fake_server.FakeDataset(projects=1, assets_per_project=30)
+    with fake_server.FakeAssetServiceServer(dataset) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with ClientExecutor(
+        max_workers=4, rate_limiter=RateLimiter(1000, burst=10)
+    ) as executor:
+        yield AssetServiceClient(
+            transport=transports.AssetServiceGrpcTransport(channel=server.channel()),
+            executor=executor,
+        )
+
+
+def test_futures(client):
+    client.create_feed(request={"parent": "projects/p", "feed_id": "f", "feed": {}})
+    calls = [
+        client.get_feed_future(name="projects/p/feeds/{}".format(name))
+        for name in ("f", "g") * 10
+    ]
+    for i, future in enumerate(calls):
+        if i % 2:
+            assert isinstance(future.exception(), exceptions.NotFound)
+        else:
+            assert future.result().name == "projects/p/feeds/f"
+
+
+def test_page_futures(server, client):
+    pager = client.search_all_resources_future(
+        request={"scope": "projects/project-0", "page_size": 7}
+    ).result()
+    assert isinstance(pager, pagers.SearchAllResourcesPager)
+
+    page_futures = pager.page_futures()
+    first = next(page_futures)
+    assert first.done()
+    # The second page is requested before the caller asks for it.
+    second = next(page_futures)
+    assert len(second.result().results) == 7
+
+    pages = [first.result(), second.result()]
+    pages += [future.result() for future in page_futures]
+    assert [len(page.results) for page in pages] == [7, 7, 7, 7, 2]
+    assert server.calls["search_all_resources"] == 5
+
+
+def test_page_futures_prefetch():
+    requested = []
+
+    def method(request, **kwargs):
+        requested.append(request.page_token)
+        token = int(request.page_token) + 1
+        return asset_service.SearchAllResourcesResponse(
+            next_page_token=str(token) if token < 6 else ""
+        )
+
+    def pager():
+        return pagers.SearchAllResourcesPager(
+            method=method,
+            request=asset_service.SearchAllResourcesRequest(),
+            response=asset_service.SearchAllResourcesResponse(next_page_token="1"),
+            executor=executor,
+        )
+
+    with ClientExecutor(max_workers=1) as executor:
+        page_futures = pager().page_futures()
+        first = next(page_futures)
+        second = next(page_futures)
+        second.result()
+        # The caller holds the second page: only the third one is fetched.
+        executor.submit(lambda: None).result()
+        assert requested == ["1", "2"]
+
+        assert [future.result().next_page_token for future in page_futures] == [
+            "3",
+            "4",
+            "5",
+            "",
+        ]
+        assert first.result().next_page_token == "1"
+
+        del requested[:]
+        page_futures = pager().page_futures(prefetch=3)
+        next(page_futures)
+        next(page_futures).result()
+        while len(requested) < 4:
+            pass
+        executor.submit(lambda: None).result()
+        assert requested == ["1", "2", "3", "4"]
+        assert len(list(page_futures)) == 4
+
+        with pytest.raises(ValueError):
+            next(pager().page_futures(prefetch=0))
+
+
+def test_future_method():
+    assert AssetServiceClient.get_feed_future.__name__ == "get_feed_future"
+    assert ":meth:`get_feed`" in AssetServiceClient.get_feed_future.__doc__
+    assert "its pager" in AssetServiceClient.search_all_resources_future.__doc__
+
+
+def test_page_futures_error():
+    fetched = threading.Event()
+
+    def method(request, **kwargs):
+        if request.page_token == "2":
+            fetched.set()
+            raise exceptions.ServiceUnavailable("unavailable")
+        return asset_service.SearchAllResourcesResponse(
+            next_page_token=str(int(request.page_token) + 1)
+        )
+
+    with ClientExecutor(max_workers=1) as executor:
+        pager = pagers.SearchAllResourcesPager(
+            method=method,
+            request=asset_service.SearchAllResourcesRequest(),
+            response=asset_service.SearchAllResourcesResponse(next_page_token="1"),
+            executor=executor,
+        )
+        page_futures = list(pager.page_futures())
+
+    assert fetched.is_set()
+    assert len(page_futures) == 3
+    assert page_futures[1].result().next_page_token == "2"
+    assert isinstance(page_futures[2].exception(), exceptions.ServiceUnavailable)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.asset._transport_utils.passthrough import RawResponse
+from google.cloud.asset_v1.services.asset_service import facets
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+
+
+def _page(*results):
+    return asset_service.SearchAllResourcesResponse(results=list(results))
+
+
+def _result(name, asset_type, location="global", **kwargs):
+    return assets.ResourceSearchResult(
+        name=name, asset_type=asset_type, location=location, **kwargs
+    )
+
+
+PAGES = [
+    _page(
+        _result(
+            "a", "compute.googleapis.com/Instance", "us-west1", labels={"env": "prod"}
+        ),
+        _result(
+            "b", "compute.googleapis.com/Instance", "us-east1", labels={"env": "dev"}
+        ),
+    ),
+    _page(
+        _result(
+            "c", "storage.googleapis.com/Bucket", labels={"env": "prod", "team": "x"}
+        ),
+        _result("d", "compute.googleapis.com/Disk", network_tags=["web", "ssh"]),
+    ),
+]
+
+
+def test_exact_counts():
+    aggregator = facets.FacetAggregator(
+        ["asset_type", "labels", "labels.env", "network_tags"]
+    )
+    aggregator.consume_pages(PAGES)
+
+    assert aggregator.total == 4
+    assert aggregator.counts("asset_type", 1) == [
+        ("compute.googleapis.com/Instance", 2)
+    ]
+    assert dict(aggregator.counts("labels.env")) == {"prod": 2, "dev": 1}
+    assert dict(aggregator.counts("labels"))["team=x"] == 1
+    assert dict(aggregator.counts("network_tags")) == {"web": 1, "ssh": 1}
+
+
+def test_raw_pages():
+    aggregator = facets.FacetAggregator(["asset_type", "labels.env"])
+    aggregator.consume_pages(
+        RawResponse(asset_service.SearchAllResourcesResponse.serialize(page))
+        for page in PAGES
+    )
+    assert aggregator.total == 4
+    assert dict(aggregator.counts("labels.env")) == {"prod": 2, "dev": 1}
+
+    policies = facets.FacetAggregator(
+        ["resource"], result_type=assets.IamPolicySearchResult
+    )
+    policies.consume(
+        RawResponse(
+            asset_service.SearchAllIamPoliciesResponse.serialize(
+                {"results": [{"resource": "r"}, {"resource": "r"}]}
+            )
+        )
+    )
+    assert policies.counts("resource") == [("r", 2)]
+
+    other = facets.FacetAggregator(["name"], result_type=assets.Asset)
+    with pytest.raises(TypeError):
+        other.consume(RawResponse(b""))
+
+
+def test_merge_shards():
+    whole = facets.FacetAggregator(["location"], distinct=["name"])
+    whole.consume_pages(PAGES)
+
+    left = facets.FacetAggregator(["location"], distinct=["name"])
+    right = facets.FacetAggregator(["location"], distinct=["name"])
+    left.consume(PAGES[0])
+    right.consume(PAGES[1])
+    left.merge(right)
+
+    assert left.total == whole.total
+    assert left.counts("location") == whole.counts("location")
+    assert left.distinct("name") == whole.distinct("name") == 4
+
+    with pytest.raises(ValueError):
+        left.merge(facets.FacetAggregator(["project"]))
+
+
+def test_heavy_hitters():
+    aggregator = facets.FacetAggregator(["asset_type"], heavy_hitters=2)
+    aggregator.consume_pages(PAGES * 3)
+
+    top = aggregator.counts("asset_type", 1)
+    assert top == [("compute.googleapis.com/Instance", 6)]
+    assert len(aggregator.counts("asset_type")) == 2
+
+
+def test_space_saving_merge_and_error():
+    summary = facets.SpaceSaving(2)
+    for value in "aaab":
+        summary.add(value)
+    summary.add("c")
+    assert summary.most_common() == [("a", 3), ("c", 2)]
+    assert summary.error("c") == 1
+
+    other = facets.SpaceSaving(2)
+    other.add("c", 5)
+    summary.merge(other)
+    assert summary.most_common(1) == [("c", 7)]
+
+    with pytest.raises(ValueError):
+        facets.SpaceSaving(0)
+
+
+def test_space_saving_matches_scan():
+    # The heap finds the same least frequent counters as a full scan.
+    summary = facets.SpaceSaving(3)
+    counts = {}
+    errors = {}
+    for i in range(500):
+        value = "v%d" % ((i * i) % 17)
+        summary.add(value)
+        if value in counts:
+            counts[value] += 1
+        elif len(counts) < 3:
+            counts[value], errors[value] = 1, 0
+        else:
+            floor = min(counts.values())
+            evicted = min(v for v, c in counts.items() if c == floor)
+            del counts[evicted], errors[evicted]
+            counts[value], errors[value] = floor + 1, floor
+    assert dict(summary.most_common()) == counts
+    assert {value: summary.error(value) for value in counts} == errors
+    assert len(summary._heap) <= 6
+
+
+def test_invalid_facets():
+    for facet in ("unknown", "additional_attributes", "labels.", "name.x"):
+        with pytest.raises(ValueError):
+            facets.FacetAggregator([facet])
+    with pytest.raises(ValueError):
+        facets.FacetAggregator([], distinct=["update_time"])
+    facets.FacetAggregator(
+        ["resource", "project"],
+        result_type=assets.IamPolicySearchResult,
+    )
+    with pytest.raises(ValueError):
+        facets.FacetAggregator(["labels"], result_type=assets.IamPolicySearchResult)
+
+    exact = facets.FacetAggregator(["asset_type"])
+    with pytest.raises(ValueError):
+        exact.merge(facets.FacetAggregator(["asset_type"], heavy_hitters=2))
+
+
+def test_hyperloglog_estimate():
+    sketch = facets.HyperLogLog(precision=12)
+    for i in range(20000):
+        sketch.add("resource-%d" % (i % 10000))
+    assert abs(sketch.estimate() - 10000) < 500
+
+    other = facets.HyperLogLog(precision=12)
+    for i in range(10000, 20000):
+        other.add("resource-%d" % i)
+    sketch.merge(other)
+    assert abs(sketch.estimate() - 20000) < 1000
+
+    with pytest.raises(ValueError):
+        sketch.merge(facets.HyperLogLog(precision=10))
+    with pytest.raises(ValueError):
+        facets.HyperLogLog(precision=3)
+
+
+@pytest.mark.asyncio
+async def test_consume_async_pages():
+    async def pages():
+        for page in PAGES:
+            yield page
+
+    aggregator = facets.FacetAggregator(["asset_type"])
+    await aggregator.consume_async_pages(pages())
+    assert aggregator.total == 4
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+from unittest import mock
+
+import pytest
+
+import grpc
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.types import asset_service
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+
+
+@pytest.fixture
+def server(tmp_path):
+    dataset = fake_server.FakeDataset(projects=2, assets_per_project=30)
+    with fake_server.FakeAssetServiceServer(
+        dataset, export_dir=str(tmp_path)
+    ) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return AssetServiceClient(transport=server.transport())
+
+
+def test_search_all_resources_pages(server, client):
+    pager = client.search_all_resources(
+        request={"scope": "projects/project-0", "page_size": 7}
+    )
+    results = list(pager)
+    assert len(results) == 30
+    assert len(set(result.name for result in results)) == 30
+    assert server.calls["search_all_resources"] == 5
+
+    # Every project shares the organization.
+    assert len(list(client.search_all_resources(scope="organizations/123456"))) == 60
+
+    disks = client.search_all_resources(
+        scope="projects/project-1",
+        asset_types=["compute.googleapis.com/Disk"],
+        query="labels:env=prod",
+    )
+    names = [result.name for result in disks]
+    assert names and all("/disks/" in name for name in names)
+    assert all(result.labels["env"] == "prod" for result in disks)
+
+
+def test_search_all_iam_policies(client):
+    results = list(client.search_all_iam_policies(scope="projects/project-0"))
+    assert len(results) == 6
+    assert results[0].policy.bindings[0].role == "roles/viewer"
+
+
+def test_export_assets(tmp_path, client):
+    operation = client.export_assets(
+        request={
+            "parent": "projects/project-1",
+            "content_type": asset_service.ContentType.RESOURCE,
+            "output_config": {"gcs_destination": {"uri": "gs://bucket/dump.json"}},
+        }
+    )
+    response = operation.result(timeout=10)
+    assert response.output_config.gcs_destination.uri == "gs://bucket/dump.json"
+
+    lines = (tmp_path / "bucket" / "dump.json").read_text().splitlines()
+    assert len(lines) == 30
+    assert json.loads(lines[0])["name"].startswith("//compute.googleapis.com/")
+
+
+def test_export_assets_delay(tmp_path):
+    with fake_server.FakeAssetServiceServer(
+        fake_server.FakeDataset(projects=1, assets_per_project=3),
+        export_dir=str(tmp_path),
+        export_delay=0.2,
+    ) as server:
+        client = AssetServiceClient(transport=server.transport())
+        operation = client.export_assets(
+            request={
+                "parent": "projects/project-0",
+                "output_config": {"gcs_destination": {"uri_prefix": "gs://b/p"}},
+            }
+        )
+        assert not operation.done()
+        operation.result(timeout=10)
+        assert (tmp_path / "b" / "p" / "0").exists()
+
+
+def test_feeds(client):
+    parent = "projects/project-0"
+    feed = client.create_feed(
+        request={
+            "parent": parent,
+            "feed_id": "f",
+            "feed": {"asset_types": ["storage.googleapis.com/Bucket"]},
+        }
+    )
+    assert feed.name == parent + "/feeds/f"
+    with pytest.raises(exceptions.AlreadyExists):
+        client.create_feed(request={"parent": parent, "feed_id": "f"})
+
+    feed.asset_types = ["compute.googleapis.com/Disk"]
+    client.update_feed(
+        request={
+            "feed": feed,
+            "update_mask": field_mask.FieldMask(paths=["asset_types"]),
+        }
+    )
+    assert client.get_feed(name=feed.name).asset_types == feed.asset_types
+    assert [f.name for f in client.list_feeds(parent=parent).feeds] == [feed.name]
+
+    client.delete_feed(name=feed.name)
+    with pytest.raises(exceptions.NotFound):
+        client.get_feed(name=feed.name)
+
+
+def test_batch_get_assets_history(server, client):
+    name = server.dataset.assets[0].name
+    response = client.batch_get_assets_history(
+        request={
+            "parent": "projects/project-0",
+            "asset_names": [name, "//unknown"],
+            "content_type": asset_service.ContentType.RESOURCE,
+        }
+    )
+    assert [temporal.asset.name for temporal in response.assets] == [name] * 3
+    windows = [temporal.window for temporal in response.assets]
+    assert windows[0].end_time == windows[1].start_time
+
+
+def test_faults(server):
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=server.channel())
+    )
+    server.set_fault(
+        "get_feed", fake_server.Fault(error_rate=1, error_code=grpc.StatusCode.INTERNAL)
+    )
+    with pytest.raises(exceptions.InternalServerError):
+        client.get_feed(name="projects/p/feeds/f")
+
+    server.set_fault("get_feed", None)
+    server.set_fault("list_feeds", fake_server.Fault(qps_limit=2))
+    with pytest.raises(exceptions.ResourceExhausted):
+        for _ in range(10):
+            client.list_feeds(parent="projects/p")
+    assert server.rejected == {"get_feed": 1, "list_feeds": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_client(server):
+    client = AssetServiceAsyncClient(transport=server.async_transport())
+    pager = await client.search_all_resources(
+        request={"scope": "projects/project-1", "page_size": 10}
+    )
+    assert len([result async for result in pager]) == 30
+
+
+def test_api_endpoint(server):
+    client = AssetServiceClient(
+        credentials=transports.InsecureCredentials(),
+        client_options={"api_endpoint": server.address},
+    )
+    assert len(list(client.search_all_resources(scope="projects/project-0"))) == 30
+
+
+@pytest.mark.asyncio
+async def test_async_api_endpoint(server):
+    client = AssetServiceAsyncClient(
+        credentials=transports.InsecureCredentials(),
+        client_options={"api_endpoint": server.address},
+    )
+    pager = await client.search_all_resources(scope="projects/project-0")
+    assert len([result async for result in pager]) == 30
+
+
+def test_endpoint_not_insecure(server):
+    # Only clients given InsecureCredentials connect without TLS; other
+    # channels created for the server's address still use TLS.
+    transport = server.transport(passthrough=True)
+    assert transport._passthrough
+    with mock.patch.object(grpc, "insecure_channel") as insecure_channel:
+        transports.AssetServiceGrpcTransport.create_channel(
+            server.address, credentials=credentials.AnonymousCredentials()
+        )
+    insecure_channel.assert_not_called()
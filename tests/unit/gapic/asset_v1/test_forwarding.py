@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from unittest import mock
+
+import grpc  # type: ignore
+import pytest  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.cloud.asset._transport_utils import forwarding
+
+
+class _Wrapped:
+    def __init__(self, method, stub):
+        self.method = method
+        self.stub = stub
+
+
+class _WrappingChannel(forwarding.ForwardingChannel):
+    def _wrap_unary_unary(self, method, stub):
+        return _Wrapped(method, stub)
+
+
+def test_forwarding_channel():
+    inner = mock.Mock()
+    channel = forwarding.ForwardingChannel(inner)
+    assert isinstance(channel, grpc.Channel)
+
+    assert channel.unary_unary("/m", x=1) is inner.unary_unary.return_value
+    inner.unary_unary.assert_called_once_with("/m", x=1)
+    for name in ("unary_stream", "stream_unary", "stream_stream"):
+        assert getattr(channel, name)("/m") is getattr(inner, name).return_value
+        getattr(inner, name).assert_called_once_with("/m")
+
+    callback = mock.Mock()
+    channel.subscribe(callback, try_to_connect=True)
+    inner.subscribe.assert_called_once_with(callback, try_to_connect=True)
+    channel.unsubscribe(callback)
+    inner.unsubscribe.assert_called_once_with(callback)
+    with channel as entered:
+        assert entered is channel
+    inner.close.assert_called_once_with()
+
+
+def test_forwarding_channel_wraps_unary_unary():
+    inner = mock.Mock()
+    stub = _WrappingChannel(inner).unary_unary("/m")
+    assert isinstance(stub, _Wrapped)
+    assert stub.method == "/m"
+    assert stub.stub is inner.unary_unary.return_value
+
+    # Streaming stubs are never wrapped.
+    assert _WrappingChannel(inner).unary_stream("/m") is inner.unary_stream.return_value
+
+
+@pytest.mark.asyncio
+async def test_async_forwarding_channel():
+    inner = mock.Mock()
+    inner.close = mock.AsyncMock()
+    inner.wait_for_state_change = mock.AsyncMock()
+    inner.channel_ready = mock.AsyncMock()
+    channel = forwarding.AsyncForwardingChannel(inner)
+    assert isinstance(channel, aio.Channel)
+
+    assert channel.get_state(True) is inner.get_state.return_value
+    inner.get_state.assert_called_once_with(True)
+    await channel.wait_for_state_change(grpc.ChannelConnectivity.IDLE)
+    inner.wait_for_state_change.assert_awaited_once_with(grpc.ChannelConnectivity.IDLE)
+    await channel.channel_ready()
+    inner.channel_ready.assert_awaited_once_with()
+    async with channel as entered:
+        assert entered is channel
+    inner.close.assert_awaited_once_with(None)
+
+
+def test_async_unary_unary_wrapper():
+    assert issubclass(forwarding.AsyncUnaryUnaryWrapper, aio.UnaryUnaryMultiCallable)
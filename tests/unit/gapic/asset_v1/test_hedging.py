@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import threading
+from concurrent import futures
+
+import pytest
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import hedging
+from google.cloud.asset_v1p5beta1.services.asset_service import (
+    transports as v1p5beta1_transports,
+)
+
+
+class _Stub:
+    """A stub whose calls complete after the next delay of ``delays``."""
+
+    def __init__(self, delays, error=None):
+        self._delays = list(delays)
+        self._error = error
+        self.calls = []
+
+    def future(self, request, **kwargs):
+        future = futures.Future()
+        self.calls.append((future, kwargs))
+        delay = self._delays.pop(0)
+
+        def complete():
+            if future.set_running_or_notify_cancel():
+                if self._error is not None:
+                    future.set_exception(self._error)
+                else:
+                    future.set_result((request, len(self.calls)))
+
+        timer = threading.Timer(delay, complete)
+        timer.daemon = True
+        timer.start()
+        return future
+
+    def __call__(self, request, **kwargs):
+        return self.future(request, **kwargs).result()
+
+
+def _warm_policy(method="get_feed", latency=0.01, budget_ratio=1.0):
+    policy = hedging.HedgingPolicy(min_samples=5, budget_ratio=budget_ratio)
+    for _ in range(5):
+        policy.record(method, latency)
+    return policy
+
+
+def test_delay_from_percentile():
+    policy = hedging.HedgingPolicy(min_samples=10, percentile=90.0, max_delay=5.0)
+    for latency in range(1, 10):
+        policy.record("get_feed", latency / 10.0)
+    assert policy.delay("get_feed") is None
+
+    policy.record("get_feed", 1.0)
+    assert policy.delay("get_feed") == 1.0
+    assert policy.delay("list_feeds") is None
+
+    clamped = hedging.HedgingPolicy(min_samples=1, min_delay=0.5)
+    clamped.record("get_feed", 0.001)
+    assert clamped.delay("get_feed") == 0.5
+
+
+def test_invalid_percentile():
+    with pytest.raises(ValueError):
+        hedging.HedgingPolicy(percentile=0)
+
+
+def test_budget():
+    policy = hedging.HedgingPolicy(budget_ratio=0.5, max_budget=1.0)
+    assert not policy._withdraw()
+    policy._deposit()
+    policy._deposit()
+    policy._deposit()
+    assert policy._withdraw()
+    assert not policy._withdraw()
+    assert policy.stats()["hedges_sent"] == 1
+    assert policy.stats()["hedges_denied"] == 2
+
+
+def test_hedge_wins_and_loser_is_cancelled():
+    policy = _warm_policy()
+    stub = _Stub([5.0, 0.01])
+    hedged = policy.wrap_stub("get_feed", stub)
+
+    response = hedged("request", timeout=10.0)
+
+    assert response == ("request", 2)
+    assert len(stub.calls) == 2
+    assert stub.calls[0][0].cancelled()
+    # The hedge only gets the time left before the original deadline.
+    assert stub.calls[1][1]["timeout"] < 10.0
+    assert policy.hedges_sent == policy.hedges_won == 1
+
+
+def test_fast_call_is_not_hedged():
+    policy = _warm_policy(latency=1.0)
+    stub = _Stub([0.01])
+
+    assert policy.wrap_stub("get_feed", stub)("request") == ("request", 1)
+    assert len(stub.calls) == 1
+    assert policy.hedges_sent == 0
+
+
+def test_no_hedge_without_budget():
+    policy = _warm_policy(budget_ratio=0.0)
+    stub = _Stub([0.1])
+
+    assert policy.wrap_stub("get_feed", stub)("request") == ("request", 1)
+    assert len(stub.calls) == 1
+    assert policy.hedges_denied == 1
+
+
+def test_errors_when_every_call_fails():
+    policy = _warm_policy()
+    error = exceptions.ServiceUnavailable("down")
+    stub = _Stub([0.05, 0.01], error=error)
+
+    with pytest.raises(exceptions.ServiceUnavailable):
+        policy.wrap_stub("get_feed", stub)("request")
+    assert len(stub.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_wins_and_loser_is_cancelled():
+    policy = _warm_policy()
+    cancelled = []
+    delays = [5.0, 0.01]
+
+    async def stub(request, **kwargs):
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return delay
+
+    hedged = policy.wrap_async_stub("get_feed", stub)
+    assert await hedged("request", timeout=10.0) == 0.01
+    await asyncio.sleep(0)
+    assert cancelled == [5.0]
+    assert policy.hedges_won == 1
+
+
+@pytest.mark.asyncio
+async def test_async_unhedged_call_records_latency():
+    policy = hedging.HedgingPolicy(min_samples=1)
+
+    async def stub(request, **kwargs):
+        return request
+
+    assert await policy.wrap_async_stub("get_feed", stub)("request") == "request"
+    assert policy.delay("get_feed") is not None
+
+
+def test_transport_hedges_idempotent_methods():
+    policy = hedging.HedgingPolicy()
+    transport = transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(),
+        hedging_policy=policy,
+    )
+    assert isinstance(transport.get_feed, hedging._HedgingUnaryUnaryMultiCallable)
+    assert isinstance(
+        transport.search_all_resources, hedging._HedgingUnaryUnaryMultiCallable
+    )
+    assert not isinstance(
+        transport.create_feed, hedging._HedgingUnaryUnaryMultiCallable
+    )
+
+    v1p5beta1 = v1p5beta1_transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(),
+        hedging_policy=policy,
+    )
+    assert isinstance(v1p5beta1.list_assets, hedging._HedgingUnaryUnaryMultiCallable)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = (
+    "google.cloud.asset",
+    "google.cloud.asset_v1",
+    "google.cloud.asset_v1beta1",
+    "google.cloud.asset_v1p1beta1",
+    "google.cloud.asset_v1p2beta1",
+    "google.cloud.asset_v1p4beta1",
+    "google.cloud.asset_v1p5beta1",
+)
+
+
+def test_import_does_not_load_types_or_clients():
+    # A fresh interpreter, since other tests already imported everything.
+    script = (
+        "import sys\n"
+        "import google.cloud.asset, google.cloud.asset_v1p4beta1\n"
+        "print(sorted(m for m in sys.modules if '.types' in m or '.services' in m"
+        " or m.startswith(('google.cloud.orgpolicy', 'google.iam.v1'))))\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script])
+    assert output.strip() == b"[]"
+
+
+@pytest.mark.parametrize("name", PACKAGES)
+def test_public_names_resolve(name):
+    package = importlib.import_module(name)
+    for attribute in package.__all__:
+        assert getattr(package, attribute).__name__ == attribute
+        assert attribute in dir(package)
+
+    with pytest.raises(AttributeError):
+        package.NoSuchName
+    # The modules the package uses itself are not public names.
+    assert not {"importlib", "sys"} & set(dir(package))
+
+
+def test_lazy_names_match_defining_modules():
+    from google.cloud import asset
+    from google.cloud import asset_v1
+    from google.cloud.asset_v1.services.asset_service import client
+    from google.cloud.asset_v1.types import assets
+
+    assert asset.AssetServiceClient is client.AssetServiceClient
+    assert asset_v1.Asset is asset.Asset is assets.Asset
+    assert asset_v1.types.assets is assets
+    assert "services" in dir(asset_v1)
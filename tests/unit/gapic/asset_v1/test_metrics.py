@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mock
+import pytest
+
+import grpc
+from grpc.experimental import aio
+
+from google.api_core import exceptions
+from google.api_core import retry as retries
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import metrics
+from google.cloud.asset._transport_utils import passthrough
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1p1beta1.services.asset_service import (
+    transports as v1p1beta1_transports,
+)
+
+METHOD = "/google.cloud.asset.v1.AssetService/SearchAllResources"
+
+
+class _UnavailableError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+def _fake_channel(responses):
+    """A channel whose stub serializes, then returns the next response."""
+    channel = mock.Mock(spec=grpc.Channel)
+
+    def unary_unary(method, request_serializer, response_deserializer):
+        def stub(request, **kwargs):
+            request_serializer(request)
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response_deserializer(response)
+
+        return stub
+
+    channel.unary_unary.side_effect = unary_unary
+    return channel
+
+
+def test_histogram():
+    histogram = metrics.Histogram((1, 10, 100))
+    for value in (0.5, 5, 5, 50, 500):
+        histogram.record(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["counts"] == [1, 2, 1, 1]
+    assert snapshot["count"] == 5
+    assert snapshot["sum"] == 560.5
+    assert (snapshot["min"], snapshot["max"]) == (0.5, 500)
+    assert histogram.percentile(50) == 10
+    assert histogram.percentile(99) == 500
+    assert metrics.Histogram((1,)).percentile(50) is None
+
+
+def test_metered_channel_records_sizes_pages_and_retries():
+    registry = metrics.MetricsRegistry()
+    response = asset_service.SearchAllResourcesResponse(next_page_token="abc")
+    payload = asset_service.SearchAllResourcesResponse.serialize(response)
+    channel = registry.wrap_channel(
+        _fake_channel([_UnavailableError(), payload, payload])
+    )
+    stub = channel.unary_unary(
+        METHOD,
+        request_serializer=asset_service.SearchAllResourcesRequest.serialize,
+        response_deserializer=asset_service.SearchAllResourcesResponse.deserialize,
+    )
+
+    request = asset_service.SearchAllResourcesRequest(scope="projects/p")
+    with pytest.raises(grpc.RpcError):
+        stub(request)
+    # Sending the same request again after a failure is a retry.
+    assert stub(request).next_page_token == "abc"
+    assert stub(asset_service.SearchAllResourcesRequest()).next_page_token == "abc"
+
+    snapshot = registry.snapshot()[METHOD]
+    assert snapshot["attempts"] == 3
+    assert snapshot["retries"] == 1
+    assert snapshot["errors"] == {"UNAVAILABLE": 1}
+    assert snapshot["pages"] == 2
+    assert snapshot["latency"]["count"] == 3
+    assert snapshot["request_bytes"]["count"] == 3
+    assert snapshot["response_bytes"]["sum"] == 2 * len(payload)
+
+
+def test_metered_channel_pages_from_response_type():
+    registry = metrics.MetricsRegistry()
+    search = asset_service.SearchAllResourcesResponse.serialize(
+        asset_service.SearchAllResourcesResponse()
+    )
+    feed = asset_service.Feed.serialize(asset_service.Feed(name="f"))
+    channel = registry.wrap_channel(_fake_channel([search, feed, feed]))
+    get_feed = "/google.cloud.asset.v1.AssetService/GetFeed"
+
+    # Passthrough responses all have a next_page_token; only those of the
+    # paged methods are pages.
+    channel.unary_unary(
+        METHOD,
+        request_serializer=asset_service.SearchAllResourcesRequest.serialize,
+        response_deserializer=passthrough.passthrough_deserializer(
+            asset_service.SearchAllResourcesResponse
+        ),
+    )(asset_service.SearchAllResourcesRequest())
+    stub = channel.unary_unary(
+        get_feed,
+        request_serializer=asset_service.GetFeedRequest.serialize,
+        response_deserializer=passthrough.passthrough_deserializer(asset_service.Feed),
+    )
+    assert stub(asset_service.GetFeedRequest()).next_page_token == ""
+    channel.unary_unary(
+        get_feed,
+        request_serializer=asset_service.GetFeedRequest.serialize,
+        response_deserializer=asset_service.Feed.deserialize,
+    )(asset_service.GetFeedRequest())
+
+    snapshot = registry.snapshot()
+    assert snapshot[METHOD]["pages"] == 1
+    assert snapshot[get_feed]["pages"] == 0
+    assert snapshot[get_feed]["response_bytes"]["count"] == 2
+
+
+def test_retry_wrapper_counts_retries():
+    registry = metrics.MetricsRegistry()
+    channel = registry.wrap_channel(
+        _fake_channel([_UnavailableError(), _UnavailableError(), b""])
+    )
+    stub = channel.unary_unary(
+        METHOD,
+        request_serializer=asset_service.SearchAllResourcesRequest.serialize,
+        response_deserializer=asset_service.SearchAllResourcesResponse.deserialize,
+    )
+
+    def call(request):
+        try:
+            return stub(request)
+        except grpc.RpcError:
+            raise exceptions.ServiceUnavailable("unavailable")
+
+    retry = retries.Retry(
+        predicate=retries.if_exception_type(exceptions.ServiceUnavailable),
+        initial=0.0,
+    )
+    retry(call)(asset_service.SearchAllResourcesRequest())
+
+    snapshot = registry.snapshot()[METHOD]
+    assert (snapshot["attempts"], snapshot["retries"]) == (3, 2)
+
+
+def test_exporters_and_reset():
+    exporter = metrics.InMemoryExporter()
+    registry = metrics.MetricsRegistry(exporters=[exporter])
+    other = metrics.InMemoryExporter()
+    registry.add_exporter(other)
+    registry._method(METHOD).attempts += 1
+
+    snapshot = registry.export()
+    assert exporter.snapshots == other.snapshots == [snapshot]
+    assert snapshot[METHOD]["attempts"] == 1
+
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_transport_metrics():
+    registry = metrics.MetricsRegistry()
+    transport = transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(), metrics=registry
+    )
+    assert isinstance(transport.grpc_channel, metrics._MeteredChannel)
+    assert isinstance(transport.create_feed, metrics._MeteredUnaryUnaryMultiCallable)
+
+    plain = v1p1beta1_transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials()
+    )
+    assert not isinstance(plain.grpc_channel, metrics._MeteredChannel)
+
+
+@pytest.mark.asyncio
+async def test_async_metered_channel():
+    registry = metrics.MetricsRegistry()
+
+    async def stub(request, **kwargs):
+        if request == b"fail":
+            raise _UnavailableError()
+        return request
+
+    channel = mock.Mock(spec=aio.Channel)
+    channel.unary_unary.return_value = stub
+    metered = registry.wrap_async_channel(channel).unary_unary(METHOD)
+    assert isinstance(metered, aio.UnaryUnaryMultiCallable)
+
+    assert await metered(b"ok") == b"ok"
+    with pytest.raises(grpc.RpcError):
+        await metered(b"fail")
+
+    snapshot = registry.snapshot()[METHOD]
+    assert snapshot["attempts"] == 2
+    assert snapshot["errors"] == {"UNAVAILABLE": 1}
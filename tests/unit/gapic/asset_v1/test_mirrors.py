@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+import importlib
+import pickle
+
+import pytest
+
+from google.iam.v1 import policy_pb2
+from google.protobuf import descriptor_pb2
+from google.protobuf import descriptor_pool
+from google.protobuf import duration_pb2
+from google.protobuf import message_factory
+
+from google.cloud.asset_v1.services.asset_service import mirrors
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+from google.cloud.asset_v1p4beta1.types import assets as assets_v1p4beta1
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "google.cloud.asset_{}.types.{}".format(version, name)
+        for version in (
+            "v1",
+            "v1beta1",
+            "v1p1beta1",
+            "v1p2beta1",
+            "v1p4beta1",
+            "v1p5beta1",
+        )
+        for name in ("assets", "asset_service")
+    ],
+)
+def test_mirror_types(module):
+    module = importlib.import_module(module)
+    types = mirrors.mirror_types(module)
+    assert types
+    for name, cls in types.items():
+        message_type = getattr(module, name)
+        assert cls.full_name == message_type.pb().DESCRIPTOR.full_name
+        assert cls.from_message(message_type()).to_message() == message_type()
+
+
+def _asset():
+    return assets.Asset(
+        name="//compute.googleapis.com/projects/p/zones/z/instances/i",
+        asset_type="compute.googleapis.com/Instance",
+        update_time=datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc),
+        resource={
+            "version": "v1",
+            "data": {"status": "RUNNING", "disks": [{"boot": True}], "id": None},
+        },
+        iam_policy={
+            "version": 3,
+            "bindings": [
+                {"role": "roles/owner", "members": ["user:a", "user:b"]},
+                {"role": "roles/viewer", "condition": {"expression": "true"}},
+            ],
+        },
+        org_policy=[{"constraint": "c", "boolean_policy": {"enforced": True}}],
+        ancestors=["projects/1", "organizations/2"],
+    )
+
+
+def test_mirror():
+    Asset = mirrors.mirror_type(assets.Asset)
+    assert mirrors.mirror_type(assets.Asset) is Asset
+    asset = Asset.from_message(_asset())
+    assert asset.name == _asset().name
+    assert asset.update_time == _asset().update_time
+    assert asset.resource.data == {
+        "status": "RUNNING",
+        "disks": [{"boot": True}],
+        "id": None,
+    }
+    assert asset.iam_policy.bindings[0].members == ("user:a", "user:b")
+    assert asset.iam_policy.bindings[1].condition.expression == "true"
+    assert asset.org_policy[0].boolean_policy.enforced is True
+    assert asset.org_policy[0].list_policy is None
+    assert asset.access_policy is None
+    assert asset.ancestors == ("projects/1", "organizations/2")
+
+    assert asset.to_message() == _asset()
+    assert Asset.from_pb(asset.to_pb()) == asset
+    assert hash(asset) == hash(Asset.from_message(_asset()))
+    assert asset != Asset.from_message(assets.Asset(name=asset.name))
+    assert pickle.loads(pickle.dumps(asset)) == asset
+    assert Asset(name="n").to_message() == assets.Asset(name="n")
+    with pytest.raises(AttributeError):
+        asset.name = "other"
+    with pytest.raises(TypeError):
+        Asset("n")
+
+
+def test_mirror_oneofs():
+    Result = mirrors.mirror_type(assets_v1p4beta1.IamPolicyAnalysisResult)
+    result = assets_v1p4beta1.IamPolicyAnalysisResult(
+        access_control_lists=[
+            {"accesses": [{"role": "roles/owner"}, {"permission": "a.b.c"}]}
+        ]
+    )
+    first, second = Result.from_message(result).access_control_lists[0].accesses
+    assert (first.role, first.permission) == ("roles/owner", None)
+    assert (second.role, second.permission) == (None, "a.b.c")
+    assert Result.from_message(result).to_message() == result
+
+    Feed = mirrors.mirror_type(asset_service.Feed)
+    feed = asset_service.Feed(
+        name="feeds/f",
+        content_type=asset_service.ContentType.IAM_POLICY,
+        feed_output_config={"pubsub_destination": {"topic": "t"}},
+    )
+    mirror = Feed.from_message(feed)
+    assert mirror.content_type == asset_service.ContentType.IAM_POLICY
+    assert mirror.feed_output_config.pubsub_destination.topic == "t"
+    assert mirror.to_message() == feed
+
+
+def test_mirror_raw_types():
+    Policy = mirrors.mirror_type(policy_pb2.Policy)
+    policy = policy_pb2.Policy(bindings=[{"role": "roles/owner"}], etag=b"e")
+    mirror = Policy.from_message(policy)
+    assert mirror.bindings[0].role == "roles/owner"
+    assert mirror.to_message() == policy
+    assert pickle.loads(pickle.dumps(mirror.bindings[0])) == mirror.bindings[0]
+
+    Duration = mirrors.mirror_type(duration_pb2.Duration)
+    assert Duration.from_pb(duration_pb2.Duration(seconds=5)).seconds == 5
+
+
+def test_mirror_abstract():
+    with pytest.raises(TypeError):
+        mirrors.Mirror()
+
+
+def test_mirror_cache_per_type():
+    Asset = mirrors.mirror_type(assets.Asset)
+    RawAsset = mirrors.mirror_type(assets.Asset.pb())
+    assert RawAsset is not Asset
+    assert mirrors.mirror_type(assets.Asset.pb()) is RawAsset
+    assert isinstance(Asset(name="n").to_message(), assets.Asset)
+    assert RawAsset(name="n").to_message() == assets.Asset.pb()(name="n")
+    asset = RawAsset.from_message(_asset())
+    assert asset.org_policy[0].to_message() == assets.Asset.pb(_asset()).org_policy[0]
+    assert pickle.loads(pickle.dumps(asset)) == asset
+
+
+def _keyword_message():
+    # A message whose fields are named after Python keywords.
+    proto = descriptor_pb2.FileDescriptorProto(
+        name="test_mirrors_keywords.proto", package="test.mirrors"
+    )
+    message_proto = proto.message_type.add(name="Keywords")
+    message_proto.oneof_decl.add(name="lambda")
+    fields = descriptor_pb2.FieldDescriptorProto
+    for number, (name, label, type_, oneof) in enumerate(
+        [
+            ("from", fields.LABEL_OPTIONAL, fields.TYPE_STRING, False),
+            ("class", fields.LABEL_REPEATED, fields.TYPE_INT64, False),
+            ("import", fields.LABEL_OPTIONAL, fields.TYPE_STRING, True),
+            ("pass", fields.LABEL_OPTIONAL, fields.TYPE_BOOL, True),
+        ],
+        start=1,
+    ):
+        field = message_proto.field.add(
+            name=name, number=number, label=label, type=type_
+        )
+        if oneof:
+            field.oneof_index = 0
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(proto)
+    return message_factory.MessageFactory(pool).GetPrototype(
+        pool.FindMessageTypeByName("test.mirrors.Keywords")
+    )
+
+
+def test_mirror_keyword_fields():
+    Keywords = _keyword_message()
+    Mirror = mirrors.mirror_type(Keywords)
+    assert Mirror.__slots__ == ("from_", "class_", "import_", "pass_")
+    pb = Keywords(**{"from": "a", "class": [1, 2], "import": "b"})
+    mirror = Mirror.from_pb(pb)
+    assert (mirror.from_, mirror.class_, mirror.import_, mirror.pass_) == (
+        "a",
+        (1, 2),
+        "b",
+        None,
+    )
+    assert mirror.to_pb() == pb
+    assert Mirror(from_="a", class_=(1, 2), import_="b") == mirror
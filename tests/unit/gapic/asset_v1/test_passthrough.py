@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service.response_cache import ResponseCache
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import passthrough
+from google.cloud.asset._transport_utils import wire
+from google.cloud.asset_v1.types import asset_service
+
+
+def test_passthrough_deserializer():
+    response = asset_service.SearchAllResourcesResponse(
+        results=[
+            {"name": "//compute.googleapis.com/projects/p/instances/{}".format(i)}
+            for i in range(3)
+        ],
+        next_page_token="token-é",
+    )
+    data = asset_service.SearchAllResourcesResponse.serialize(response)
+    assert wire.read_string_field(data, 2) == "token-é"
+    assert wire.read_string_field(data, 7) == ""
+    assert wire.read_string_field(b"", 2) == ""
+    with pytest.raises(ValueError):
+        wire.read_string_field(data[:-3], 2)
+
+    deserialize = passthrough.passthrough_deserializer(
+        asset_service.SearchAllResourcesResponse
+    )
+    raw = deserialize(data)
+    assert raw.data is data
+    assert raw.next_page_token == "token-é"
+    assert raw.decode(asset_service.SearchAllResourcesResponse) == response
+
+    deserialize = passthrough.passthrough_deserializer(
+        asset_service.BatchGetAssetsHistoryResponse
+    )
+    assert deserialize(b"") == passthrough.RawResponse(b"")
+
+
+@pytest.fixture
+def server():
+    dataset = fake_server.FakeDataset(projects=1, assets_per_project=30)
+    with fake_server.FakeAssetServiceServer(dataset) as server:
+        yield server
+
+
+def test_passthrough(server):
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(
+            channel=server.channel(), passthrough=True
+        )
+    )
+    request = {"scope": "projects/project-0", "page_size": 7}
+    pages = list(client.search_all_resources(request=request).pages)
+    assert all(isinstance(page, passthrough.RawResponse) for page in pages)
+    assert [page.next_page_token for page in pages] == ["7", "14", "21", "28", ""]
+
+    decoded = [
+        result.name
+        for page in pages
+        for result in page.decode(asset_service.SearchAllResourcesResponse).results
+    ]
+    expected = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=server.channel())
+    )
+    assert decoded == [
+        result.name for result in expected.search_all_resources(request=request)
+    ]
+
+    history = client.batch_get_assets_history(
+        request={
+            "parent": "projects/project-0",
+            "asset_names": [server.dataset.assets[0].name],
+            "content_type": asset_service.ContentType.RESOURCE,
+        }
+    )
+    assert isinstance(history, passthrough.RawResponse)
+    response = history.decode(asset_service.BatchGetAssetsHistoryResponse)
+    assert response.assets[0].asset.name == server.dataset.assets[0].name
+
+    # Other methods are not affected.
+    assert client.list_feeds(parent="projects/p").feeds == []
+
+
+@pytest.mark.asyncio
+async def test_async_passthrough(server):
+    client = AssetServiceAsyncClient(
+        transport=transports.AssetServiceGrpcAsyncIOTransport(
+            channel=server.async_channel(), passthrough=True
+        )
+    )
+    pager = await client.search_all_iam_policies(
+        request={"scope": "projects/project-0", "page_size": 4}
+    )
+    pages = [page async for page in pager.pages]
+    assert [page.next_page_token for page in pages] == ["4", ""]
+    results = [
+        result
+        for page in pages
+        for result in page.decode(asset_service.SearchAllIamPoliciesResponse).results
+    ]
+    assert len(results) == 6
+
+
+def test_passthrough_iterating_items(server):
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(
+            channel=server.channel(), passthrough=True
+        )
+    )
+    pager = client.search_all_resources(request={"scope": "projects/project-0"})
+    with pytest.raises(AttributeError, match="passthrough"):
+        list(pager)
+
+
+def test_passthrough_response_cache(server):
+    cache = ResponseCache(ttl=60.0)
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(
+            channel=server.channel(), passthrough=True
+        ),
+        response_cache=cache,
+    )
+    request = {"scope": "projects/project-0", "page_size": 10}
+    first = list(client.search_all_resources(request=request).pages)
+    assert cache.stats()["misses"] == 3
+    second = list(client.search_all_resources(request=request).pages)
+    assert cache.stats()["hits"] == 3
+    assert all(isinstance(page, passthrough.RawResponse) for page in second)
+    assert second == first
+    assert [page.next_page_token for page in second] == ["10", "20", ""]
+
+    # Clients decoding their responses share the cached pages.
+    decoding_client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=server.channel()),
+        response_cache=cache,
+    )
+    results = list(decoding_client.search_all_resources(request=request))
+    assert cache.stats()["hits"] == 6
+    assert len(results) == 30
+
+
+@pytest.mark.asyncio
+async def test_async_passthrough_response_cache(server):
+    cache = ResponseCache(ttl=60.0)
+    client = AssetServiceAsyncClient(
+        transport=transports.AssetServiceGrpcAsyncIOTransport(
+            channel=server.async_channel(), passthrough=True
+        ),
+        response_cache=cache,
+    )
+    request = {"scope": "projects/project-0", "page_size": 4}
+    for _ in range(2):
+        pager = await client.search_all_iam_policies(request=request)
+        pages = [page async for page in pager.pages]
+        assert all(isinstance(page, passthrough.RawResponse) for page in pages)
+        assert [page.next_page_token for page in pages] == ["4", ""]
+    assert (cache.stats()["misses"], cache.stats()["hits"]) == (2, 2)
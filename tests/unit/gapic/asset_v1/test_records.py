@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pickle
+
+import pytest
+
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service import records
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import passthrough
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+from google.protobuf import struct_pb2 as struct
+
+
+def _result(index):
+    return assets.ResourceSearchResult(
+        name="//compute.googleapis.com/projects/p/instances/i-{}".format(index),
+        asset_type="compute.googleapis.com/Instance",
+        project="projects/123",
+        display_name="i-{}".format(index),
+        location="us-central1-a",
+        labels={"team": "infra", "env": "prod"},
+        network_tags=["web"],
+        additional_attributes={"status": "RUNNING"},
+    )
+
+
+def test_record():
+    result = _result(0)
+    record = records.ResourceRecord.from_message(result)
+    assert record.labels == (("env", "prod"), ("team", "infra"))
+    assert record.network_tags == ("web",)
+    assert record.additional_attributes["status"] == "RUNNING"
+    assert record.to_message() == result
+    assert records.ResourceRecord.from_pb(record.to_pb()) == record
+    assert record == records.ResourceRecord.from_message(_result(0))
+    assert hash(record) == hash(records.ResourceRecord.from_message(_result(0)))
+    assert record != records.ResourceRecord.from_message(_result(1))
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert records.ResourceRecord().to_message() == assets.ResourceSearchResult()
+    with pytest.raises(AttributeError):
+        record.name = "other"
+    with pytest.raises(AttributeError):
+        record.other = 1
+
+
+def test_records_share_values():
+    pool = records.InternPool()
+    first, second = (
+        records.ResourceRecord.from_message(_result(index), pool) for index in range(2)
+    )
+    assert first.asset_type is second.asset_type
+    assert first.labels is second.labels
+    assert first.network_tags is second.network_tags
+    assert first.name != second.name
+    assert len(pool) == 10
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_records_from_bytes():
+    result = _result(0)
+    response = asset_service.SearchAllResourcesResponse(
+        results=[result, {}], next_page_token="token"
+    )
+    data = asset_service.SearchAllResourcesResponse.serialize(response)
+    first, second = records.records([passthrough.RawResponse(data)])
+    assert first == records.ResourceRecord.from_message(result)
+    assert second == records.ResourceRecord()
+    with pytest.raises(ValueError):
+        list(records.records([passthrough.RawResponse(data[:-10])]))
+
+    # Equal structs serialized with their keys in another order.
+    attributes = struct.Struct()
+    attributes.update({"a": 1, "b": 2})
+    other = struct.Struct()
+    other.update({"b": 2, "a": 1})
+    assert attributes.SerializeToString() != other.SerializeToString()
+    assert records.ResourceRecord(
+        additional_attributes=attributes.SerializeToString()
+    ) == records.ResourceRecord(additional_attributes=other.SerializeToString())
+
+
+@pytest.fixture
+def server():
+    dataset = fake_server.FakeDataset(projects=2, assets_per_project=20)
+    with fake_server.FakeAssetServiceServer(dataset) as server:
+        yield server
+
+
+@pytest.mark.parametrize("passthrough", [False, True])
+def test_records_from_pages(server, passthrough):
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(
+            channel=server.channel(), passthrough=passthrough
+        )
+    )
+    request = {"scope": "projects/project-1", "page_size": 6}
+    pager = client.search_all_resources(request=request)
+    inventory = list(records.records(pager.pages))
+    expected = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=server.channel())
+    )
+    assert [record.to_message() for record in inventory] == list(
+        expected.search_all_resources(request=request)
+    )
+    assert len(inventory) == 20
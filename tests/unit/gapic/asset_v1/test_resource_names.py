@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.asset_v1.services.asset_service import mirrors
+from google.cloud.asset_v1.services.asset_service import resource_names
+from google.cloud.asset_v1.types import assets
+
+
+def test_parse():
+    name = resource_names.parse(
+        "//compute.googleapis.com/projects/p/zones/z/instances/i"
+    )
+    assert name.service == "compute.googleapis.com"
+    assert name.collections == (("projects", "p"), ("zones", "z"), ("instances", "i"))
+    assert (name.project, name.folder, name.organization) == ("p", None, None)
+    assert (name.collection, name.id) == ("instances", "i")
+    assert name.relative_name == "projects/p/zones/z/instances/i"
+
+    bucket = resource_names.parse("//storage.googleapis.com/my-bucket")
+    assert bucket.collections == (("", "my-bucket"),)
+    assert bucket.id == "my-bucket"
+
+    obj = resource_names.parse("//storage.googleapis.com/b/objects/o")
+    assert obj.collections == (("", "b"), ("objects", "o"))
+    assert (obj.collection, obj.id) == ("objects", "o")
+
+    namespace = resource_names.parse(
+        "//container.googleapis.com/projects/p/locations/l/clusters/c"
+        "/k8s/namespaces/ns"
+    )
+    assert namespace.collections == (
+        ("projects", "p"),
+        ("locations", "l"),
+        ("clusters", "c"),
+        ("k8s", ""),
+        ("namespaces", "ns"),
+    )
+
+    network = resource_names.parse(
+        "//compute.googleapis.com/projects/p/global/networks/n"
+    )
+    assert network.collections == (("projects", "p"), ("global", ""), ("networks", "n"))
+    location = resource_names.parse("projects/p/locations/global/buckets/b")
+    assert location.collections == (
+        ("projects", "p"),
+        ("locations", "global"),
+        ("buckets", "b"),
+    )
+
+    folder = resource_names.parse("folders/123")
+    assert folder.service == ""
+    assert folder.folder == "123"
+    assert folder.relative_name == "folders/123"
+
+    invalid_names = (
+        "",
+        "//s",
+        "//s/",
+        "///a/b",
+        "//s/a//b",
+        "projects/p/",
+        "/p",
+        "my-bucket",
+        "//compute.googleapis.com/projects/p/instances",
+        "//compute.googleapis.com/b/objects/o",
+    )
+    for invalid in invalid_names:
+        with pytest.raises(ValueError):
+            resource_names.parse(invalid)
+
+
+def test_parse_cache():
+    resource_names.parse.cache_clear()
+    first = resource_names.parse("//cloudresourcemanager.googleapis.com/projects/p")
+    assert resource_names.parse(first.name) is first
+    assert resource_names.parse.cache_info().hits == 1
+
+
+def test_parse_many():
+    names = ["organizations/1", "projects/p", "organizations/1"]
+    parsed = resource_names.parse_many(names)
+    assert [name.name for name in parsed] == names
+    assert parsed[0] is parsed[2]
+    assert resource_names.parse_many(names, cache=True) == parsed
+    with pytest.raises(ValueError):
+        resource_names.parse_many(["projects/p", "//"])
+
+
+def test_hierarchy():
+    asset = assets.Asset(
+        resource={"parent": "//cloudresourcemanager.googleapis.com/projects/123"},
+        ancestors=["projects/123", "folders/45", "folders/6", "organizations/7"],
+    )
+    expected = resource_names.Hierarchy("123", ("45", "6"), "7")
+    assert resource_names.hierarchy(asset) == expected
+    mirror = mirrors.mirror_type(assets.Asset).from_message(asset)
+    assert resource_names.hierarchy(mirror) == expected
+    assert resource_names.hierarchy(assets.Asset()) == (None, (), None)
+
+    assert resource_names.parent(asset.resource).project == "123"
+    assert resource_names.parent(assets.Resource()) is None
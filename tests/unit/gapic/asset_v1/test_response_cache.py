@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mock
+
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service.response_cache import ResponseCache
+from google.cloud.asset_v1.types import asset_service
+from google.cloud.asset_v1.types import assets
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pages():
+    return (
+        asset_service.SearchAllResourcesResponse(
+            results=[assets.ResourceSearchResult(name="a")],
+            next_page_token="abc",
+        ),
+        asset_service.SearchAllResourcesResponse(
+            results=[assets.ResourceSearchResult(name="b")],
+        ),
+    )
+
+
+def test_get_put_ttl():
+    clock = _Clock()
+    cache = ResponseCache(ttl=10.0, clock=clock)
+    cache.put(b"k", b"payload")
+
+    assert cache.get(b"k") == b"payload"
+    clock.now += 10.0
+    assert cache.get(b"k") is None
+    assert cache.stats() == {
+        "hits": 1,
+        "disk_hits": 0,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 0,
+        "bytes": 0,
+    }
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=10)
+    cache.put(b"a", b"12345")
+    cache.put(b"b", b"12345")
+    # Touch "a" so that "b" is the least recently used entry.
+    assert cache.get(b"a") == b"12345"
+    cache.put(b"c", b"12345")
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == b"12345"
+    assert cache.get(b"c") == b"12345"
+    assert cache.size == 10
+    assert cache.evictions == 1
+
+    # Payloads larger than the whole cache are never held in memory.
+    cache.put(b"d", b"x" * 11)
+    assert cache.get(b"d") is None
+
+
+def test_disk_tier(tmpdir):
+    clock = _Clock()
+    cache = ResponseCache(ttl=10.0, max_bytes=5, disk_dir=str(tmpdir), clock=clock)
+    cache.put(b"a", b"12345")
+    cache.put(b"b", b"12345")
+
+    # "a" was evicted from memory but is still on disk.
+    assert cache.get(b"a") == b"12345"
+    assert cache.disk_hits == 1
+
+    # A second cache over the same directory shares the entries.
+    other = ResponseCache(ttl=10.0, disk_dir=str(tmpdir), clock=clock)
+    assert other.get(b"b") == b"12345"
+
+    clock.now += 10.0
+    assert other.get(b"b") is None
+
+    cache.clear()
+    assert cache.get(b"a") is None
+    assert not [f for f in tmpdir.listdir() if f.ext == ".pb"]
+
+
+def test_disk_tier_corrupt_entries(tmpdir):
+    clock = _Clock()
+    cache = ResponseCache(ttl=10.0, max_bytes=0, disk_dir=str(tmpdir), clock=clock)
+    cache.put(b"a", b"12345")
+    (path,) = [f for f in tmpdir.listdir() if f.ext == ".pb"]
+    path.write_binary(b"\x00\x01")
+    assert cache.get(b"a") is None
+    assert cache.misses == 1
+    assert not path.exists()
+
+    # A payload which does not decode is a miss, and is dropped.
+    client = AssetServiceClient(
+        credentials=credentials.AnonymousCredentials,
+        response_cache=cache,
+    )
+    request = asset_service.SearchAllResourcesRequest(scope="projects/p")
+    key = cache._key(request)
+    cache.put(key, b"\xff\xff")
+    with mock.patch.object(
+        type(client._transport.search_all_resources), "__call__"
+    ) as call:
+        call.side_effect = _pages()
+        assert [r.name for r in client.search_all_resources(request)] == ["a", "b"]
+    assert call.call_count == 2
+    assert cache.get(key) != b"\xff\xff"
+
+
+def test_search_all_resources_pager_cached():
+    cache = ResponseCache()
+    client = AssetServiceClient(
+        credentials=credentials.AnonymousCredentials,
+        response_cache=cache,
+    )
+
+    with mock.patch.object(
+        type(client._transport.search_all_resources), "__call__"
+    ) as call:
+        call.side_effect = _pages()
+        first = [r.name for r in client.search_all_resources(scope="projects/p")]
+        second = [r.name for r in client.search_all_resources(scope="projects/p")]
+
+    assert first == second == ["a", "b"]
+    assert call.call_count == 2
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_search_all_resources_cache_keyed_on_request():
+    cache = ResponseCache()
+    client = AssetServiceClient(
+        credentials=credentials.AnonymousCredentials,
+        response_cache=cache,
+    )
+
+    with mock.patch.object(
+        type(client._transport.search_all_resources), "__call__"
+    ) as call:
+        call.side_effect = _pages()[1:] * 2
+        list(client.search_all_resources(scope="projects/p", query="a"))
+        list(client.search_all_resources(scope="projects/p", query="b"))
+
+    assert call.call_count == 2
+    assert cache.hits == 0
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mock
+import pytest
+
+import grpc
+from grpc.experimental import aio
+
+from google.api_core import exceptions
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import fake_server
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import retry_budget
+
+GET_FEED = "/google.cloud.asset.v1.AssetService/GetFeed"
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code=grpc.StatusCode.UNAVAILABLE):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def test_budget_tokens():
+    now = [0.0]
+    budget = retry_budget.RetryBudget(
+        ratio=0.5, min_retries_per_second=1, max_tokens=2, clock=lambda: now[0]
+    )
+    channel = mock.Mock(spec=grpc.Channel)
+    stub = budget.wrap_channel(channel).unary_unary(GET_FEED)
+    failing = channel.unary_unary.return_value
+    failing.side_effect = _RpcError()
+
+    request = object()
+    for _ in range(3):
+        with pytest.raises(_RpcError):
+            stub(request)
+    with pytest.raises(retry_budget.RetryBudgetExhausted) as exc_info:
+        stub(request)
+    assert isinstance(exc_info.value.errors[0], exceptions.GoogleAPICallError)
+    assert budget.stats() == {
+        "tokens": 0,
+        "retries": {GET_FEED: 2},
+        "denied": {GET_FEED: 1},
+    }
+
+    # First attempts are never held back, and successes deposit tokens.
+    failing.side_effect = None
+    stub(object())
+    stub(object())
+    assert budget.tokens == 1
+
+    now[0] = 10
+    assert budget.tokens == 2
+    assert budget.denied == 1
+
+
+def test_budget_skips_non_retryable_errors():
+    budget = retry_budget.RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=1)
+    channel = mock.Mock(spec=grpc.Channel)
+    stub = budget.wrap_channel(channel).unary_unary(GET_FEED)
+    failing = channel.unary_unary.return_value
+
+    # Sending a request again after INVALID_ARGUMENT is not a retry.
+    request = object()
+    failing.side_effect = _RpcError(grpc.StatusCode.INVALID_ARGUMENT)
+    for _ in range(3):
+        with pytest.raises(_RpcError):
+            stub(request)
+    assert budget.stats()["retries"] == {}
+
+    budget = retry_budget.RetryBudget(
+        ratio=0,
+        min_retries_per_second=0,
+        max_tokens=1,
+        retryable_codes=[grpc.StatusCode.INVALID_ARGUMENT],
+    )
+    stub = budget.wrap_channel(channel).unary_unary(GET_FEED)
+    for _ in range(2):
+        with pytest.raises(_RpcError):
+            stub(request)
+    assert budget.stats()["retries"] == {GET_FEED: 1}
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        retry_budget.RetryBudget(ratio=-1)
+    with pytest.raises(ValueError):
+        retry_budget.RetryBudget(max_tokens=0)
+
+
+@pytest.fixture
+def server():
+    with fake_server.FakeAssetServiceServer(
+        fault=fake_server.Fault(error_rate=1)
+    ) as server:
+        yield server
+
+
+def test_retries_share_budget(server):
+    budget = retry_budget.RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=2)
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(
+            channel=server.channel(), retry_budget=budget
+        )
+    )
+    with pytest.raises(retry_budget.RetryBudgetExhausted) as exc_info:
+        client.get_feed(name="projects/p/feeds/f")
+    assert isinstance(exc_info.value.__cause__, exceptions.ServiceUnavailable)
+    assert server.calls["get_feed"] == 3
+
+    # The budget is spent: the next call is not retried at all.
+    with pytest.raises(retry_budget.RetryBudgetExhausted):
+        client.list_feeds(parent="projects/p")
+    assert server.calls["list_feeds"] == 1
+    assert budget.stats()["denied"] == {
+        GET_FEED: 1,
+        "/google.cloud.asset.v1.AssetService/ListFeeds": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_budget():
+    budget = retry_budget.RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=1)
+    calls = []
+
+    async def stub(request, **kwargs):
+        calls.append(request)
+        raise _RpcError()
+
+    channel = mock.Mock(spec=aio.Channel)
+    channel.unary_unary.return_value = stub
+    wrapped = budget.wrap_async_channel(channel).unary_unary(GET_FEED)
+    assert isinstance(wrapped, aio.UnaryUnaryMultiCallable)
+
+    request = object()
+    for _ in range(2):
+        with pytest.raises(_RpcError):
+            await wrapped(request)
+    with pytest.raises(retry_budget.RetryBudgetExhausted):
+        await wrapped(request)
+    assert len(calls) == 2
+    assert budget.denied == 1
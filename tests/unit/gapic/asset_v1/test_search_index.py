@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.asset_v1.services.asset_service import search_index
+from google.cloud.asset_v1.types import assets
+
+
+def _index():
+    index = search_index.SearchIndex()
+    index.add_all(
+        [
+            assets.ResourceSearchResult(
+                name="//compute.googleapis.com/projects/p/zones/z/instances/web",
+                display_name="Important web server",
+                description="Serves traffic",
+                labels={"env": "prod"},
+                network_tags=["http-server"],
+            ),
+            assets.ResourceSearchResult(
+                name="//storage.googleapis.com/bucket-logs",
+                display_name="Logs",
+                description="Important archive",
+                labels={"env": "dev", "team": ""},
+                additional_attributes={"storageClass": "COLDLINE", "sizes": [1, 2]},
+            ),
+        ]
+    )
+    return index
+
+
+def _names(results):
+    return [result.name.rsplit("/", 1)[-1] for result in results]
+
+
+def test_tokenize_streams_across_chunks():
+    tokens = list(search_index._tokenize("Alpha beta-GAMMA delta", chunk_size=3))
+    assert tokens == ["alpha", "beta", "gamma", "delta"]
+
+
+def test_search_word():
+    index = _index()
+    assert _names(index.search("important")) == ["web", "bucket-logs"]
+    assert _names(index.search("IMPORTANT traffic")) == ["web"]
+    assert index.search("impor") == []
+
+
+def test_search_wildcards():
+    index = _index()
+    assert _names(index.search("Impor*")) == ["web", "bucket-logs"]
+    assert _names(index.search("*chiv*")) == ["bucket-logs"]
+    assert _names(index.search("*line")) == ["bucket-logs"]
+
+
+def test_search_field_restricted():
+    index = _index()
+    assert _names(index.search("displayName:Impor*")) == ["web"]
+    assert _names(index.search('description:"important archive"')) == ["bucket-logs"]
+    assert _names(index.search("networkTags:http")) == ["web"]
+    assert _names(index.search("additionalAttributes:coldline")) == ["bucket-logs"]
+    with pytest.raises(ValueError):
+        index.search("bogus:value")
+
+
+def test_search_labels():
+    index = _index()
+    assert _names(index.search("labels:prod")) == ["web"]
+    assert _names(index.search("labels.env:dev")) == ["bucket-logs"]
+    assert _names(index.search("labels.env:*")) == ["web", "bucket-logs"]
+    assert _names(index.search("labels.team:*")) == ["bucket-logs"]
+    assert index.search("labels.missing:*") == []
+
+
+def test_add_replaces_and_remove():
+    index = _index()
+    name = "//storage.googleapis.com/bucket-logs"
+    index.add(assets.ResourceSearchResult(name=name, display_name="Renamed"))
+
+    assert len(index) == 2
+    assert index.get(name).display_name == "Renamed"
+    assert _names(index.search("important")) == ["web"]
+    assert _names(index.search("renamed")) == ["bucket-logs"]
+
+    assert index.remove(name)
+    assert not index.remove(name)
+    assert name not in index
+    assert index.get(name) is None
+    assert index.search("renamed") == []
+    assert index.search("ren*") == []
+    assert "renamed" not in index._vocabulary
+
+
+def test_label_keys_differing_in_case():
+    index = search_index.SearchIndex()
+    name = "//storage.googleapis.com/mixed"
+    index.add(
+        assets.ResourceSearchResult(name=name, labels={"Env": "prod", "env": "prod"})
+    )
+    assert list(index._label_postings["env"]["prod"]) == [0]
+    assert _names(index.search("labels.env:prod")) == ["mixed"]
+
+    assert index.remove(name)
+    assert index._label_postings == {}
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mock
+import pytest
+
+from google import auth
+from google.api_core import exceptions
+from google.api_core.client_options import ClientOptions
+from google.api_core import grpc_helpers
+from google.auth import credentials
+from google.cloud import asset_v1
+from google.cloud import asset_v1p4beta1
+from google.cloud import asset_v1p5beta1
+from google.cloud.asset_v1p5beta1.services import asset_service as p5_services
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service.transports import channel_pool
+from google.cloud.asset_v1.services.asset_service.transports.session import (
+    AssetServiceSession,
+)
+
+
+def test_clients_share_channel_and_credentials():
+    creds = credentials.AnonymousCredentials()
+    with mock.patch.object(auth, "default", return_value=(creds, None)) as adc:
+        with mock.patch.object(grpc_helpers, "create_channel") as create_channel:
+            session = AssetServiceSession()
+            clients = [
+                session.client(asset_v1.AssetServiceClient),
+                session.client(asset_v1p4beta1.AssetServiceClient),
+                session.client(asset_v1p5beta1.AssetServiceClient),
+            ]
+
+    adc.assert_called_once_with(
+        scopes=AssetServiceSession.AUTH_SCOPES, quota_project_id=None
+    )
+    create_channel.assert_called_once_with(
+        "cloudasset.googleapis.com:443",
+        credentials=creds,
+        scopes=AssetServiceSession.AUTH_SCOPES,
+        ssl_credentials=None,
+        quota_project_id=None,
+    )
+    for client in clients:
+        assert client._transport.grpc_channel is create_channel.return_value
+    assert isinstance(
+        clients[1]._transport,
+        asset_v1p4beta1.AssetServiceClient.get_transport_class("grpc"),
+    )
+
+
+def test_session_channel_pool():
+    with mock.patch.object(grpc_helpers, "create_channel") as create_channel:
+        session = AssetServiceSession(
+            credentials=credentials.AnonymousCredentials(), channel_pool_size=3
+        )
+        client = session.client(asset_v1.AssetServiceClient)
+
+    assert isinstance(client._transport.grpc_channel, channel_pool.ChannelPool)
+    assert create_channel.call_count == 3
+
+    with session:
+        pass
+    assert create_channel.return_value.close.call_count == 3
+
+
+def test_session_client_conflicting_options():
+    session = AssetServiceSession(
+        host="localhost:1234",
+        credentials=credentials.AnonymousCredentials(),
+        quota_project_id="project",
+    )
+    for kwargs in (
+        {"client_options": {"api_endpoint": "cloudasset.googleapis.com"}},
+        {"client_options": {"quota_project_id": "other"}},
+        {"client_options": {"scopes": ["scope"]}},
+        {"credentials": credentials.AnonymousCredentials()},
+        {"transport": "grpc"},
+    ):
+        with pytest.raises(ValueError):
+            session.client(asset_v1.AssetServiceClient, **kwargs)
+
+    # Options matching the session are accepted.
+    client = session.client(
+        asset_v1.AssetServiceClient,
+        client_options=ClientOptions(
+            api_endpoint="localhost:1234", quota_project_id="project"
+        ),
+    )
+    assert client._transport.grpc_channel is session.grpc_channel
+
+
+def test_session_duplicate_credentials():
+    with pytest.raises(exceptions.DuplicateCredentialArgs):
+        AssetServiceSession(
+            credentials=credentials.AnonymousCredentials(),
+            credentials_file="credentials.json",
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_clients_share_channel():
+    async with AssetServiceSession(
+        credentials=credentials.AnonymousCredentials()
+    ) as session:
+        clients = [
+            session.client(AssetServiceAsyncClient),
+            session.client(p5_services.AssetServiceAsyncClient),
+        ]
+        channel = session.grpc_asyncio_channel
+        for client in clients:
+            assert client._client._transport.grpc_channel is channel
+        assert isinstance(
+            clients[1]._client._transport,
+            p5_services.AssetServiceAsyncClient.get_transport_class("grpc_asyncio"),
+        )
+    assert session._grpc_asyncio_channel is None
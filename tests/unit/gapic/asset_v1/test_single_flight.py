@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import threading
+
+import mock
+import pytest
+
+from grpc.experimental import aio
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import single_flight
+from google.cloud.asset_v1.types import asset_service
+
+
+def _run_concurrently(target, count):
+    results = [None] * count
+    errors = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as exc:
+            errors[index] = exc
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    group = single_flight.SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait()
+        return "response"
+
+    threads, results, errors = _run_concurrently(lambda: group.do("key", fn), 5)
+    while not group._calls:
+        pass
+    # Give followers a chance to join the in-flight call.
+    threading.Event().wait(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["response"] * 5
+    assert errors == [None] * 5
+    assert not group._calls
+
+
+def test_single_flight_shares_errors():
+    group = single_flight.SingleFlight()
+
+    def fn():
+        raise exceptions.NotFound("missing")
+
+    with pytest.raises(exceptions.NotFound):
+        group.do("key", fn)
+    assert not group._calls
+
+
+def test_request_key():
+    request = asset_service.GetFeedRequest(name="feeds/a")
+    key = single_flight.request_key("get_feed", request, [("k", "v")])
+    assert key == (
+        "get_feed",
+        asset_service.GetFeedRequest.serialize(request),
+        (("k", "v"),),
+    )
+    assert key != single_flight.request_key(
+        "get_feed", asset_service.GetFeedRequest(name="feeds/b"), [("k", "v")]
+    )
+
+
+def test_transport_single_flight_get_feed():
+    transport = transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(),
+        single_flight=True,
+    )
+    client = AssetServiceClient(transport=transport)
+    release = threading.Event()
+
+    def slow_get_feed(request, **kwargs):
+        release.wait()
+        return asset_service.Feed(name=request.name)
+
+    with mock.patch.object(type(transport.get_feed), "__call__") as call:
+        call.side_effect = slow_get_feed
+        threads, results, _ = _run_concurrently(
+            lambda: client.get_feed(name="projects/p/feeds/f"), 4
+        )
+        while not transport._single_flight._calls:
+            pass
+        threading.Event().wait(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert call.call_count == 1
+    assert [r.name for r in results] == ["projects/p/feeds/f"] * 4
+
+
+def test_transport_single_flight_skips_mutations():
+    transport = transports.AssetServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials(),
+        single_flight=True,
+    )
+    wrapped = transport._wrapped_methods
+    assert wrapped[transport.get_feed].__code__.co_name == "coalesced"
+    assert not hasattr(wrapped[transport.create_feed], "__code__")
+
+
+def test_async_transport_single_flight():
+    transport = transports.AssetServiceGrpcAsyncIOTransport(
+        channel=mock.Mock(spec=aio.Channel), single_flight=True
+    )
+    # The stubs coalesce the calls; the synchronous wrappers are not used.
+    assert transport._async_single_flight is not None
+    assert transport._single_flight is None
+    for wrapped in transport._wrapped_methods.values():
+        assert getattr(wrapped, "__code__", None) is None
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_coalesces_concurrent_calls():
+    group = single_flight.AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "response"
+
+    results = await asyncio.gather(*[group.do("key", fn) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert results == ["response"] * 5
+    assert not group._calls
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_wrap_stub():
+    group = single_flight.AsyncSingleFlight()
+    calls = []
+
+    async def stub(request, **kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        if request.name == "bad":
+            raise exceptions.NotFound("missing")
+        return asset_service.Feed(name=request.name)
+
+    wrapped = group.wrap_stub("get_feed", stub)
+    good = asset_service.GetFeedRequest(name="good")
+    results = await asyncio.gather(
+        wrapped(good, timeout=1.0, metadata=()), wrapped(good, metadata=())
+    )
+    assert [r.name for r in results] == ["good", "good"]
+    assert calls == [{"timeout": 1.0, "metadata": ()}]
+
+    bad = asset_service.GetFeedRequest(name="bad")
+    errors = await asyncio.gather(wrapped(bad), wrapped(bad), return_exceptions=True)
+    assert all(isinstance(e, exceptions.NotFound) for e in errors)
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_leader_cancelled():
+    group = single_flight.AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "response"
+
+    leader = asyncio.ensure_future(group.do("key", fn))
+    await asyncio.sleep(0)
+    followers = [asyncio.ensure_future(group.do("key", fn)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    # One follower takes over; the others share its call.
+    assert await asyncio.gather(*followers) == ["response"] * 3
+    assert leader.cancelled()
+    assert len(calls) == 2
+    assert not group._calls
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.protobuf import json_format
+
+from google.cloud.asset_v1.services.asset_service import structs
+from google.cloud.asset_v1.types import assets
+
+DATA = {
+    "name": "instance-1",
+    "status": "RUNNING",
+    "cpus": 8,
+    "deletionProtection": False,
+    "description": None,
+    "labels": {"env": "prod"},
+    "disks": [
+        {"deviceName": "boot", "boot": True, "licenses": ["debian-11"]},
+        {"deviceName": "data", "boot": False, "licenses": []},
+    ],
+}
+
+
+def test_struct_view():
+    resource = assets.Resource(data=DATA)
+    view = structs.struct_view(resource, "data")
+    assert len(view) == 7
+    assert view["status"] == "RUNNING"
+    assert view["cpus"] == 8.0
+    assert view["deletionProtection"] is False
+    assert view["description"] is None
+    assert view.get("zone") is None
+    with pytest.raises(KeyError):
+        view["zone"]
+    assert "zone" not in view
+    assert "zone" not in resource.data
+
+    assert isinstance(view["labels"], structs.StructView)
+    assert dict(view["labels"]) == {"env": "prod"}
+    disks = view["disks"]
+    assert isinstance(disks, structs.ListView)
+    assert len(disks) == 2
+    assert disks[-1]["deviceName"] == "data"
+    assert [disk["boot"] for disk in disks[:1]] == [True]
+    assert disks[0]["licenses"].to_list() == ["debian-11"]
+    assert view.to_dict() == dict(DATA, cpus=8.0)
+
+
+def test_struct_view_additional_attributes():
+    result = assets.ResourceSearchResult(additional_attributes={"state": "READY"})
+    view = structs.struct_view(result, "additional_attributes")
+    assert view == {"state": "READY"}
+    with pytest.raises(TypeError):
+        structs.struct_view(result, "labels")
+
+
+def test_struct_to_dict():
+    data = assets.Resource.pb(assets.Resource(data=DATA)).data
+    assert structs.struct_to_dict(data) == json_format.MessageToDict(data)
+    assert structs.struct_to_dict(assets.Resource.pb(assets.Resource()).data) == {}
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import mock
+import pytest
+
+import grpc
+from grpc.experimental import aio
+
+from google.api_core import operation
+from google.cloud.asset_v1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1.services.asset_service import transports
+from google.cloud.asset._transport_utils import tracing
+from google.cloud.asset_v1.types import asset_service
+from google.longrunning import operations_pb2 as operations
+
+RPC = "google.cloud.asset.v1.AssetService/SearchAllResources"
+
+
+def _tracer():
+    exporter = tracing.InMemorySpanExporter()
+    return tracing.RecordingTracer(exporter), exporter
+
+
+def _pages():
+    return [
+        asset_service.SearchAllResourcesResponse(next_page_token="next"),
+        asset_service.SearchAllResourcesResponse(),
+    ]
+
+
+def _by_name(spans):
+    named = {}
+    for span in spans:
+        named.setdefault(span.name, []).append(span)
+    return named
+
+
+def test_noop_tracer():
+    tracer = tracing.Tracer()
+    with tracer.span("outer") as span:
+        span.set_attribute("key", "value")
+        assert tracing.current_span() is span
+    assert tracing.current_span() is None
+
+
+def test_span_nesting_and_exceptions():
+    tracer, exporter = _tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("outer", {"key": 1}):
+            with tracer.span("inner"):
+                raise ValueError()
+
+    inner, outer = exporter.spans
+    assert inner.parent_id == outer.span_id
+    assert inner.trace_id == outer.trace_id == outer.span_id
+    assert isinstance(inner.exception, ValueError)
+    assert outer.attributes == {"key": 1}
+    assert outer.duration >= inner.duration
+
+    exporter.clear()
+    assert exporter.spans == []
+
+
+def test_thread_local_span_fallback():
+    current = tracing._ThreadLocalSpan()
+    outer, inner = tracing.Span(), tracing.Span()
+    assert current.get() is None
+    token = current.set(outer)
+    nested = current.set(inner)
+    assert current.get() is inner
+    current.reset(nested)
+    assert current.get() is outer
+    current.reset(token)
+    assert current.get() is None
+
+
+def test_pager_spans():
+    tracer, exporter = _tracer()
+    responses = _pages()
+    channel = mock.Mock(spec=grpc.Channel)
+    channel.unary_unary.return_value = lambda request, **kwargs: responses.pop(0)
+    client = AssetServiceClient(
+        transport=transports.AssetServiceGrpcTransport(channel=channel, tracer=tracer)
+    )
+
+    pages = list(client.search_all_resources(scope="projects/p").pages)
+
+    assert len(pages) == 2
+    spans = _by_name(exporter.spans)
+    first, second = spans[RPC]
+    assert first.parent_id is None
+    assert first.attributes["rpc.method"] == "SearchAllResources"
+    # Only the second page is fetched by the pager.
+    (fetch,) = spans["SearchAllResources.page.fetch"]
+    assert second.parent_id == fetch.span_id
+    assert fetch.attributes == {"page.index": 1}
+    consumed = spans["SearchAllResources.page.consume"]
+    assert [span.attributes["page.index"] for span in consumed] == [0, 1]
+
+
+def test_rpc_span_status():
+    class _Error(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.NOT_FOUND
+
+    tracer, exporter = _tracer()
+    channel = mock.Mock(spec=grpc.Channel)
+    channel.unary_unary.return_value.side_effect = _Error()
+    stub = tracer.wrap_channel(channel).unary_unary("/" + RPC)
+
+    with pytest.raises(grpc.RpcError):
+        stub(b"request")
+
+    (span,) = exporter.spans
+    assert span.attributes["rpc.grpc.status_code"] == "NOT_FOUND"
+    assert isinstance(span.exception, _Error)
+
+
+def test_operation_poll_spans():
+    tracer, exporter = _tracer()
+    running = operations.Operation(name="operations/export")
+    done = operations.Operation(name="operations/export", done=True)
+    refresh = mock.Mock(return_value=done)
+    lro = operation.Operation(
+        running, refresh, mock.Mock(), asset_service.ExportAssetsResponse
+    )
+
+    assert tracing.trace_operation(None, lro) is lro
+    assert tracing.trace_operation(tracer, lro) is lro
+    assert lro.done()
+
+    (span,) = exporter.spans
+    assert span.name == "operation.poll"
+    assert span.attributes == {
+        "operation.name": "operations/export",
+        "operation.done": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_client_propagates_context():
+    tracer, exporter = _tracer()
+    responses = _pages()
+
+    async def stub(request, **kwargs):
+        return responses.pop(0)
+
+    channel = mock.Mock(spec=aio.Channel)
+    channel.unary_unary.return_value = stub
+    client = AssetServiceAsyncClient(
+        transport=transports.AssetServiceGrpcAsyncIOTransport(
+            channel=channel, tracer=tracer
+        )
+    )
+
+    with tracer.span("crawl") as crawl:
+        pager = await client.search_all_resources(scope="projects/p")
+        pages = [page async for page in pager.pages]
+
+    assert len(pages) == 2
+    spans = _by_name(exporter.spans)
+    first, second = spans[RPC]
+    (fetch,) = spans["SearchAllResources.page.fetch"]
+    assert first.parent_id == crawl.span_id
+    assert fetch.parent_id == crawl.span_id
+    assert second.parent_id == fetch.span_id
+    assert {span.trace_id for span in exporter.spans} == {crawl.span_id}
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.asset._transport_utils import wire
+from google.cloud.asset_v1.types import asset_service
+
+
+def test_read_varint():
+    assert wire.read_varint(b"\x01", 0) == (1, 1)
+    assert wire.read_varint(b"\x00\xac\x02", 1) == (300, 3)
+    with pytest.raises(IndexError):
+        wire.read_varint(b"\xac", 0)
+
+
+def test_skip_field():
+    # A varint, a fixed64, a fixed32 and a 2 byte length-delimited value.
+    data = b"\xac\x02" + b"\x00" * 8 + b"\x00" * 4 + b"\x02ab"
+    position = wire.skip_field(data, 0, wire.VARINT)
+    assert position == 2
+    position = wire.skip_field(data, position, wire.FIXED64)
+    assert position == 10
+    position = wire.skip_field(data, position, wire.FIXED32)
+    assert position == 14
+    assert wire.skip_field(data, position, wire.LENGTH_DELIMITED) == len(data)
+    with pytest.raises(ValueError):
+        wire.skip_field(data, 0, 3)
+
+
+def test_read_string_field():
+    data = asset_service.SearchAllResourcesResponse.serialize(
+        asset_service.SearchAllResourcesResponse(
+            results=[{"name": "name", "location": "global"}], next_page_token="token"
+        )
+    )
+    assert wire.read_string_field(data, 2) == "token"
+    assert wire.read_string_field(data, 3) == ""
+    with pytest.raises(ValueError):
+        wire.read_string_field(b"\x0b", 1)
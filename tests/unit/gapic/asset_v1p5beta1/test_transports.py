@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import grpc
+from grpc.experimental import aio
+import mock
+import pytest
+
+from google.api_core import grpc_helpers_async
+from google.auth import credentials
+from google.cloud.asset._transport_utils import compression
+from google.cloud.asset._transport_utils import concurrency_limiter
+from google.cloud.asset._transport_utils import forwarding
+from google.cloud.asset._transport_utils import hedging
+from google.cloud.asset._transport_utils import metrics
+from google.cloud.asset._transport_utils import passthrough
+from google.cloud.asset._transport_utils import retry_budget
+from google.cloud.asset._transport_utils import tracing
+from google.cloud.asset_v1p5beta1.services.asset_service import AssetServiceAsyncClient
+from google.cloud.asset_v1p5beta1.services.asset_service import AssetServiceClient
+from google.cloud.asset_v1p5beta1.services.asset_service import transports
+from google.cloud.asset_v1p5beta1.types import asset_service
+
+
+def _options():
+    return {
+        "compression": compression.CompressionConfig(default=compression.GZIP),
+        "metrics": metrics.MetricsRegistry(),
+        "tracer": tracing.Tracer(),
+        "concurrency_limiter": concurrency_limiter.ConcurrencyLimiter(),
+        "retry_budget": retry_budget.RetryBudget(),
+    }
+
+
+def _layers(channel):
+    layers = []
+    while isinstance(
+        channel, (forwarding.ForwardingChannel, forwarding.AsyncForwardingChannel)
+    ):
+        layers.append(channel)
+        channel = channel._channel
+    return layers, channel
+
+
+def test_transport_wraps_channel():
+    channel = grpc.insecure_channel("localhost:1")
+    transport = transports.AssetServiceGrpcTransport(
+        channel=channel, quota_project_id="project", **_options()
+    )
+    layers, inner = _layers(transport.grpc_channel)
+    assert [type(layer) for layer in layers] == [
+        retry_budget._BudgetedChannel,
+        concurrency_limiter._LimitedChannel,
+        tracing._TracedChannel,
+        metrics._MeteredChannel,
+        compression._CompressedChannel,
+    ]
+    assert inner is channel
+    assert layers[1]._quota_project_id == "project"
+
+    plain = transports.AssetServiceGrpcTransport(channel=channel)
+    assert plain.grpc_channel is channel
+
+
+def test_transport_wraps_created_channel():
+    with mock.patch.object(
+        transports.AssetServiceGrpcTransport, "create_channel"
+    ) as create_channel:
+        transport = transports.AssetServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            metrics=metrics.MetricsRegistry(),
+        )
+        assert isinstance(transport.grpc_channel, metrics._MeteredChannel)
+    assert transport.grpc_channel._channel is create_channel.return_value
+
+
+def test_async_transport_wraps_channel():
+    channel = mock.Mock(spec=aio.Channel)
+    transport = transports.AssetServiceGrpcAsyncIOTransport(
+        channel=channel, quota_project_id="project", **_options()
+    )
+    layers, inner = _layers(transport.grpc_channel)
+    assert [type(layer) for layer in layers] == [
+        retry_budget._AsyncBudgetedChannel,
+        concurrency_limiter._AsyncLimitedChannel,
+        tracing._AsyncTracedChannel,
+        metrics._AsyncMeteredChannel,
+        compression._AsyncCompressedChannel,
+    ]
+    assert inner is channel
+    assert layers[1]._quota_project_id == "project"
+
+    plain = transports.AssetServiceGrpcAsyncIOTransport(channel=channel)
+    assert plain.grpc_channel is channel
+
+
+def test_transport_hedges_idempotent_methods():
+    channel = grpc.insecure_channel("localhost:1")
+    transport = transports.AssetServiceGrpcTransport(
+        channel=channel, hedging_policy=hedging.HedgingPolicy()
+    )
+    assert isinstance(transport.list_assets, hedging._HedgingUnaryUnaryMultiCallable)
+
+    plain = transports.AssetServiceGrpcTransport(channel=channel)
+    assert not isinstance(plain.list_assets, hedging._HedgingUnaryUnaryMultiCallable)
+
+
+def test_async_transport_hedges_idempotent_methods():
+    channel = mock.Mock(spec=aio.Channel)
+    transport = transports.AssetServiceGrpcAsyncIOTransport(
+        channel=channel, hedging_policy=hedging.HedgingPolicy()
+    )
+    assert isinstance(
+        transport.list_assets, hedging._AsyncHedgingUnaryUnaryMultiCallable
+    )
+
+    plain = transports.AssetServiceGrpcAsyncIOTransport(channel=channel)
+    assert plain.list_assets is channel.unary_unary.return_value
+
+
+def _response_deserializer(channel, rpc):
+    # The transport may create the stubs of every method; find the one of
+    # ``rpc``.
+    for args, kwargs in channel.unary_unary.call_args_list:
+        if args[0].endswith("/" + rpc):
+            return kwargs["response_deserializer"]
+
+
+@pytest.mark.parametrize(
+    "transport_class,channel_class",
+    [
+        (transports.AssetServiceGrpcTransport, grpc.Channel),
+        (transports.AssetServiceGrpcAsyncIOTransport, aio.Channel),
+    ],
+)
+def test_transport_passthrough(transport_class, channel_class):
+    data = asset_service.ListAssetsResponse.serialize(
+        asset_service.ListAssetsResponse(next_page_token="next")
+    )
+
+    channel = mock.Mock(spec=channel_class)
+    transport_class(channel=channel, passthrough=True).list_assets
+    deserialize = _response_deserializer(channel, "ListAssets")
+    response = deserialize(data)
+    assert isinstance(response, passthrough.RawResponse)
+    assert response.data == data
+    assert response.next_page_token == "next"
+
+    channel = mock.Mock(spec=channel_class)
+    transport_class(channel=channel).list_assets
+    deserialize = _response_deserializer(channel, "ListAssets")
+    assert deserialize(data) == asset_service.ListAssetsResponse(next_page_token="next")
+
+
+def test_client_future_methods_use_executor():
+    executor = mock.Mock()
+    client = AssetServiceClient(
+        credentials=credentials.AnonymousCredentials(), executor=executor
+    )
+    future = client.list_assets_future(request={})
+    executor.submit.assert_called_once_with(client.list_assets, request={})
+    assert future is executor.submit.return_value
+
+    client = AssetServiceClient(credentials=credentials.AnonymousCredentials())
+    with mock.patch(
+        "google.cloud.asset._client_utils.executor.default_executor"
+    ) as default_executor:
+        client.list_assets_future(request={})
+    default_executor.return_value.submit.assert_called_once_with(
+        client.list_assets, request={}
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_client_gather():
+    client = AssetServiceAsyncClient(credentials=credentials.AnonymousCredentials())
+    with mock.patch.object(
+        type(client._client._transport.list_assets), "__call__"
+    ) as call:
+        call.side_effect = lambda *args, **kwargs: (
+            grpc_helpers_async.FakeUnaryUnaryCall(
+                asset_service.ListAssetsResponse(next_page_token="next")
+            )
+        )
+        results = [
+            result
+            async for result in client.gather(
+                "list_assets", [{}, {}], ordered=True, deadline=60.0
+            )
+        ]
+    assert [result.index for result in results] == [0, 1]
+    assert [result.result() for result in results] == [
+        asset_service.ListAssetsResponse(next_page_token="next")
+    ] * 2
+    # Only the first page of each request was fetched.
+    assert call.call_count == 2